@@ -1,14 +1,26 @@
+import sys
+
+import gsz.client
+
+if __name__ == "__main__":
+    # 客户端模式在导入下面的模块之前就转发给常驻服务，见 gsz.serve
+    gsz.client.forward_if_connected("achievement", sys.argv[1:])
+
 import argparse
 import collections.abc
+import concurrent.futures
 import dataclasses
+import datetime
+import hashlib
 import itertools
+import logging
 import pathlib
-import sys
 import typing
 
 import httpx
 import pydantic
 
+import gsz.serve
 import gsz.sr.excel
 import gsz.sr.view
 
@@ -49,38 +61,128 @@ class CultivateAchievement(pydantic.BaseModel):
     achievement_list: tuple[Achievement, ...]
 
 
-def parse_arguments():
+class Snapshot(pydantic.BaseModel):
+    """上一次成功请求养成计算器的响应，用于缓存、离线使用"""
+
+    fetched_at: datetime.datetime
+    etag: str | None = None
+    last_modified: str | None = None
+    content: str
+
+
+def parse_arguments(argv: list[str] | None = None):
     @dataclasses.dataclass
     class Arguments:
         game: gsz.sr.GameData
         e_hkrpg_token: str
         series: gsz.sr.view.AchievementSeries | None
+        cache_dir: pathlib.Path
+        cache_ttl: datetime.timedelta
+        offline: bool
 
     parser = argparse.ArgumentParser()
     _ = parser.add_argument("--base", type=pathlib.Path)
     _ = parser.add_argument("--e-hkrpg-token")
     _ = parser.add_argument("--series")
-    arguments = parser.parse_args()
+    _ = parser.add_argument("--cache-dir", type=pathlib.Path, default=pathlib.Path.home() / ".cache" / "gsz")
+    _ = parser.add_argument("--cache-ttl", type=int, default=3600, help="缓存有效秒数，过期后向服务器确认是否有更新")
+    _ = parser.add_argument("--offline", action="store_true", help="不联网，直接使用上一次成功请求的结果")
+    arguments = parser.parse_args(argv)
     if arguments.e_hkrpg_token.startswith("@"):
         with open(arguments.e_hkrpg_token.removeprefix("@")) as secret:
             e_hkrpg_token = secret.read().strip()
     else:
         e_hkrpg_token: str = arguments.e_hkrpg_token
-    game = gsz.sr.GameData(arguments.base)
+    game = gsz.serve.GAMES.open(arguments.base)
+    if not isinstance(game, gsz.sr.GameData):
+        sys.exit(f"{arguments.base} 不是星穹铁道的数据目录")
     series: gsz.sr.view.AchievementSeries | None = None
     if arguments.series is not None:
         series = next((series for series in game.achievement_series() if series.title == arguments.series), None)
         if series is None:
             series_names = tuple(series.title for series in game.achievement_series())
             sys.exit(f"不存在成就系列：{series}，可能的成就系列为：{'、'.join(series_names)}")
-    return Arguments(game=game, e_hkrpg_token=e_hkrpg_token, series=series)
+    return Arguments(
+        game=game,
+        e_hkrpg_token=e_hkrpg_token,
+        series=series,
+        cache_dir=arguments.cache_dir,
+        cache_ttl=datetime.timedelta(seconds=arguments.cache_ttl),
+        offline=arguments.offline,
+    )
+
+
+def snapshot_path(cache_dir: pathlib.Path, e_hkrpg_token: str) -> pathlib.Path:
+    # 不同账号的成就完成情况不同，按 token 指纹区分缓存，避免把 token 本身写进文件名
+    fingerprint = hashlib.sha256(e_hkrpg_token.encode()).hexdigest()[:16]
+    return cache_dir / f"cultivate-achievement-{fingerprint}.json"
 
 
-def cultivate_achievement(e_hkrpg_token: str) -> tuple[Achievement, ...]:
+def load_snapshot(path: pathlib.Path) -> Snapshot | None:
+    if not path.exists():
+        return None
+    try:
+        return Snapshot.model_validate_json(path.read_bytes())
+    except pydantic.ValidationError:
+        logging.warning("缓存文件 %s 已损坏，忽略", path)
+        return None
+
+
+def save_snapshot(path: pathlib.Path, snapshot: Snapshot):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 先写临时文件再替换，避免中途退出留下半个文件
+    temporary = path.with_suffix(".tmp")
+    _ = temporary.write_text(snapshot.model_dump_json())
+    _ = temporary.replace(path)
+
+
+def cultivate_achievement(
+    e_hkrpg_token: str,
+    cache_dir: pathlib.Path | None = None,
+    cache_ttl: datetime.timedelta = datetime.timedelta(hours=1),
+    offline: bool = False,
+) -> tuple[Achievement, ...]:
     URL = "https://act-api-takumi.mihoyo.com/event/rpgcultivate/achievement/list"
-    res = httpx.get(URL, params={"show_hide": True, "page_size": 10000}, cookies={"e_hkrpg_token": e_hkrpg_token})
-    res = Data[CultivateAchievement].model_validate_json(res.content)
-    return res.data.achievement_list
+    path = snapshot_path(cache_dir, e_hkrpg_token) if cache_dir is not None else None
+    snapshot = load_snapshot(path) if path is not None else None
+    now = datetime.datetime.now().astimezone()
+    if offline:
+        if snapshot is None:
+            sys.exit("离线模式需要先联网成功运行一次")
+        return Data[CultivateAchievement].model_validate_json(snapshot.content).data.achievement_list
+    if snapshot is not None and now - snapshot.fetched_at < cache_ttl:
+        return Data[CultivateAchievement].model_validate_json(snapshot.content).data.achievement_list
+    headers: dict[str, str] = {}
+    if snapshot is not None and snapshot.etag is not None:
+        headers["if-none-match"] = snapshot.etag
+    if snapshot is not None and snapshot.last_modified is not None:
+        headers["if-modified-since"] = snapshot.last_modified
+    try:
+        res = httpx.get(
+            URL,
+            params={"show_hide": True, "page_size": 10000},
+            headers=headers,
+            cookies={"e_hkrpg_token": e_hkrpg_token},
+        )
+        if snapshot is not None and res.status_code == httpx.codes.NOT_MODIFIED:
+            content = snapshot.content
+        else:
+            content = res.raise_for_status().text
+        data = Data[CultivateAchievement].model_validate_json(content)
+    except (httpx.HTTPError, pydantic.ValidationError) as exc:
+        if snapshot is None:
+            raise
+        logging.warning("请求养成计算器失败（%s），使用 %s 的缓存", exc, snapshot.fetched_at)
+        return Data[CultivateAchievement].model_validate_json(snapshot.content).data.achievement_list
+    if path is not None:
+        snapshot = Snapshot(
+            fetched_at=now,
+            etag=res.headers.get("etag", snapshot.etag if snapshot is not None else None),
+            last_modified=res.headers.get("last-modified", snapshot.last_modified if snapshot is not None else None),
+            content=content,
+        )
+        save_snapshot(path, snapshot)
+    return data.data.achievement_list
 
 
 def achievement_title_descs(achievement: gsz.sr.view.AchievementData, formatter: gsz.format.Formatter):
@@ -143,11 +245,15 @@ def assemble_wikitext(
     wiki.append("隐藏=" + is_hidden)
     if achievement.series_id in (7, 8):
         # 战意奔涌、不屈者的荣光
-        relevant_avatars = [formatter.format(avatar.name) for avatar in avatars if avatar.name in achievement.desc]
+        # 一次扫描成就描述找出提到的所有角色、敌人，而不是逐个角色、敌人判断是否为子串
+        matcher = game.mention_matcher(("avatar", "monster"))
+        avatar_ids = {entity.id for entity in matcher.search(achievement.desc, "avatar")}
+        relevant_avatars = [formatter.format(avatar.name) for avatar in avatars if avatar.id in avatar_ids]
         if len(relevant_avatars) != 0:
             wiki.append("角色=" + "、".join(relevant_avatars))
+        monster_names = matcher.names(achievement.desc, "monster")
         relevant_monsters = [
-            formatter.format(monster.wiki_name) for monster in monsters if monster.name in achievement.desc
+            formatter.format(monster.wiki_name) for monster in monsters if monster.name in monster_names
         ]
         if len(relevant_monsters) != 0:
             wiki.append("敌人=" + "、".join(relevant_monsters))
@@ -156,12 +262,17 @@ def assemble_wikitext(
     return "{{" + "|".join(wiki) + "}}"
 
 
-def main():
-    arguments = parse_arguments()
-    sub_achievement_map = {
-        achv.id: tuple(sub.id for sub in itertools.chain((achv,), achv.sub_achievements))
-        for achv in cultivate_achievement(arguments.e_hkrpg_token)
-    }
+def main(argv: list[str] | None = None):
+    arguments = parse_arguments(argv)
+    # 网络请求放到后台线程，和下面加载本地数据表同时进行
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    cultivated = executor.submit(
+        cultivate_achievement,
+        arguments.e_hkrpg_token,
+        arguments.cache_dir,
+        arguments.cache_ttl,
+        arguments.offline,
+    )
     achievements = list(arguments.game.achievement_data())
     # 用于 BWIKI 主键（成就名）冲突提示
     achievements_titles: dict[str, AchievementData] = {
@@ -179,7 +290,13 @@ def main():
         for prototype in monster_prototypes
         if prototype.name != "" and prototype.name not in monster_name_dedup
     )
+    _ = arguments.game.mention_matcher(("avatar", "monster"))
 
+    sub_achievement_map = {
+        achv.id: tuple(sub.id for sub in itertools.chain((achv,), achv.sub_achievements))
+        for achv in cultivated.result()
+    }
+    executor.shutdown()
     for achievement in achievements:
         if achievement.id not in sub_achievement_map:
             continue
@@ -0,0 +1,158 @@
+"""
+性能基准
+
+每个用例是一个 setup 函数，接受 GameData，返回 (被计时的函数, 每次调用处理的项目数)
+计时用 timeit：先自动确定每轮调用次数（至少 0.2 秒），再重复多轮取中位数和最小值
+结果保存为 JSON，和另一次运行的结果比较时，中位数变慢超过阈值的用例视为性能回退
+
+用法：
+    python -m benchmarks --output results.json
+    python -m benchmarks --output results.json --baseline baseline.json --threshold 0.2
+"""
+
+import dataclasses
+import gc
+import json
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+import tracemalloc
+import typing
+
+if typing.TYPE_CHECKING:
+    import gsz
+
+Setup = typing.Callable[["gsz.SRGameData"], "tuple[typing.Callable[[], object], int] | Result"]
+
+REPEAT: typing.Final = 5
+THRESHOLD: typing.Final = 0.25
+"""默认阈值：中位数比基准慢 25% 以上视为回退"""
+
+
+class Case(typing.NamedTuple):
+    name: str
+    setup: Setup
+    threshold: float | None
+    """覆盖默认阈值，噪声大的用例（比如冷启动）可以放宽"""
+
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, *, threshold: float | None = None) -> typing.Callable[[Setup], Setup]:
+    def decorator(setup: Setup) -> Setup:
+        assert name not in CASES, f"duplicated benchmark {name}"
+        CASES[name] = Case(name, setup, threshold)
+        return setup
+
+    return decorator
+
+
+class Skip(Exception):
+    """数据中没有可用于该用例的项目，比如合成数据无法满足某些视图的业务约束"""
+
+
+@dataclasses.dataclass
+class Result:
+    median: float
+    """每次调用耗时的中位数（秒）"""
+    min: float
+    items: int
+    """每次调用处理的项目数"""
+    threshold: float | None = None
+    memory: float | None = None
+    """每个项目新分配并保留的内存（字节），只有统计内存的用例填写"""
+
+    @property
+    def per_item(self) -> float:
+        return self.median / max(self.items, 1)
+
+
+def allocated(fn: typing.Callable[[], object]) -> int:
+    """fn 返回值仍然引用着的新分配内存（字节），用 tracemalloc 统计"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def measure(fn: typing.Callable[[], object], items: int, *, repeat: int = REPEAT) -> Result:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    times = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return Result(median=statistics.median(times), min=min(times), items=items)
+
+
+def git_commit() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=pathlib.Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def metadata(**extra: object) -> dict[str, object]:
+    return {
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        **extra,
+    }
+
+
+def dump(path: pathlib.Path, meta: dict[str, object], results: dict[str, Result], skipped: dict[str, str]):
+    content = {
+        "meta": meta,
+        "results": {name: dataclasses.asdict(result) for name, result in results.items()},
+        "skipped": skipped,
+    }
+    _ = path.write_text(json.dumps(content, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def load(path: pathlib.Path) -> dict[str, Result]:
+    content = json.loads(path.read_bytes())
+    return {name: Result(**result) for name, result in content["results"].items()}
+
+
+class Regression(typing.NamedTuple):
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def compare(baseline: dict[str, Result], current: dict[str, Result], threshold: float = THRESHOLD) -> list[Regression]:
+    """
+    返回比基准慢超过阈值的用例，两边都有的用例才比较
+
+    比较每个项目的耗时而不是每次调用的耗时，数据规模不同时结果也可以对比
+    """
+    regressions: list[Regression] = []
+    for name, result in current.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        limit = result.threshold if result.threshold is not None else threshold
+        if result.per_item > base.per_item * (1 + limit):
+            regressions.append(Regression(name, base.per_item, result.per_item, limit))
+    return regressions
@@ -0,0 +1,77 @@
+import pathlib
+import sys
+import tempfile
+import time
+
+import fire
+
+import gsz.sr
+from gsz import synthetic
+
+from . import CASES, THRESHOLD, Result, Skip, cases, compare, dump, load, measure, metadata
+
+_ = cases  # 导入时注册用例
+
+
+def main(
+    output: str | None = None,
+    *,
+    base: str | None = None,
+    baseline: str | None = None,
+    threshold: float = THRESHOLD,
+    scale: float = 1.0,
+    seed: int = 0,
+    filter: str = "",
+):
+    """
+    运行所有用例
+
+    base 为数据目录，不提供时在临时目录生成合成数据（scale、seed 传给 gsz.synthetic.generate）
+    filter 只运行名字以此开头的用例
+    baseline 为之前某次运行的结果，有用例变慢超过阈值时以非零状态退出
+    """
+    with tempfile.TemporaryDirectory(prefix="gsz-bench-") as temp:
+        if base is None:
+            base = temp
+            report = synthetic.generate("sr", pathlib.Path(base), scale=scale, seed=seed)
+            print(f"synthetic data: {sum(report.rows.values())} rows, {report.texts} texts", file=sys.stderr)
+        meta = metadata(base=None if base == temp else base, scale=scale, seed=seed)
+        game = gsz.sr.GameData(base)
+        results: dict[str, Result] = {}
+        skipped: dict[str, str] = {}
+        for name, bench in CASES.items():
+            if not name.startswith(filter):
+                continue
+            start = time.perf_counter()
+            try:
+                prepared = bench.setup(game)
+            except Skip as exc:
+                skipped[name] = str(exc)
+                print(f"{name:<32} skipped: {exc}", file=sys.stderr)
+                continue
+            result = prepared if isinstance(prepared, Result) else measure(*prepared)
+            result.threshold = bench.threshold
+            results[name] = result
+            memory = "" if result.memory is None else f" {result.memory:8.1f} B/item"
+            print(
+                f"{name:<32} {result.median * 1e3:10.3f} ms/op {result.per_item * 1e6:10.2f} us/item"
+                f" × {result.items:<6}{memory} ({time.perf_counter() - start:.1f}s)",
+                file=sys.stderr,
+            )
+    if output is not None:
+        dump(pathlib.Path(output), meta, results, skipped)
+    if baseline is None:
+        return
+    regressions = compare(load(pathlib.Path(baseline)), results, threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.baseline * 1e6:.2f} → {regression.current * 1e6:.2f} us/item"
+            f" ({regression.ratio:.2f}×, threshold {1 + regression.threshold:.2f}×)",
+            file=sys.stderr,
+        )
+    if len(regressions) != 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    fire.Fire(main)  # pyright: ignore[reportUnknownMemberType]
@@ -0,0 +1,225 @@
+import collections.abc
+import json
+import statistics
+import subprocess
+import sys
+import typing
+
+import jinja2
+
+import gsz
+from gsz.format import Formatter, Syntax
+from gsz.sr import act
+from gsz.sr.excel.base import TextHash
+
+from . import REPEAT, Result, Skip, allocated, case, measure
+
+T = typing.TypeVar("T")
+
+# 有代表性的表：角色（字段多）、敌人（行多、嵌套多）、道具（行最多）、祝福（主次 ID）、短信（被大量引用）
+TABLES: typing.Final = ("avatar_config", "monster_config", "item_config", "rogue_buff", "message_item_config")
+TEXTS: typing.Final = 10000
+"""文本查询、格式化用例最多使用的条目数"""
+
+VIOLATIONS: typing.Final = (AssertionError, LookupError, StopIteration, jinja2.UndefinedError)
+"""合成数据违反视图中的业务约束时渲染抛出的异常：断言失败、找不到引用的行、模板缺少需要的项目"""
+
+COLD_SCRIPT: typing.Final = """
+import sys, time
+import gsz.sr
+
+game = gsz.sr.GameData(sys.argv[1])
+method = getattr(game, sys.argv[2])
+start = time.perf_counter()
+count = sum(1 for _ in method())
+print(time.perf_counter() - start, count)
+"""
+
+
+def renderable(items: collections.abc.Iterable[T], render: typing.Callable[[T], object]) -> list[T]:
+    """
+    只保留能正常渲染的项目，合成数据不一定满足视图中的业务约束
+    只跳过违反约束时抛出的异常，丢弃的项目数和第一个原因打印到 stderr，其他异常照常抛出
+    """
+    result: list[T] = []
+    dropped: list[BaseException] = []
+    for item in items:
+        try:
+            _ = render(item)
+        except VIOLATIONS as exc:  # noqa: PERF203
+            dropped.append(exc)
+            continue
+        result.append(item)
+    if len(result) == 0:
+        reason = f": {dropped[0]!r}" if len(dropped) != 0 else ""
+        raise Skip(f"no renderable items{reason}")
+    if len(dropped) != 0:
+        print(f"  dropped {len(dropped)} of {len(dropped) + len(result)} items: {dropped[0]!r}", file=sys.stderr)
+    return result
+
+
+def cold_load(game: gsz.SRGameData, table: str) -> Result:
+    """每次都在新进程中加载，和刚启动时一样不受进程内其他缓存的影响，只计加载本身的耗时"""
+    times: list[float] = []
+    count = 0
+    for _ in range(REPEAT):
+        output = subprocess.run(
+            [sys.executable, "-c", COLD_SCRIPT, str(game.base), table],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        elapsed, count = output.stdout.split()
+        times.append(float(elapsed))
+    if int(count) == 0:
+        raise Skip(f"{table} is empty")
+    return Result(median=statistics.median(times), min=min(times), items=int(count))
+
+
+def register_table(table: str):
+    @case(f"load.cold.{table}", threshold=0.5)
+    def _cold(game: gsz.SRGameData) -> Result:  # pyright: ignore[reportUnusedFunction]
+        return cold_load(game, table)
+
+    @case(f"load.warm.{table}")
+    def _warm(game: gsz.SRGameData) -> tuple[typing.Callable[[], object], int]:  # pyright: ignore[reportUnusedFunction]
+        method = getattr(game, table)
+        count = len(list(method()))
+        if count == 0:
+            raise Skip(f"{table} is empty")
+        return lambda: list(method()), count
+
+
+for table in TABLES:
+    register_table(table)
+
+
+def views_case(name: str, tables: collections.abc.Sequence[str], read: typing.Callable[[typing.Any], object]):
+    """
+    GameData 的方法每次调用都新建视图，这里用取出的行重新新建视图，不计按列存储的表还原行的开销
+    统计新建视图（以及 read 读取 cached_property）的耗时和每个视图占用的内存
+    """
+
+    @case(name)
+    def _views(game: gsz.SRGameData) -> Result:  # pyright: ignore[reportUnusedFunction]
+        rows = [(type(view), view._excel) for table in tables for view in getattr(game, table)()]  # pyright: ignore[reportPrivateUsage]
+        if len(rows) == 0:
+            raise Skip("no views")
+
+        def build() -> list[object]:
+            views = [view(game, excel) for view, excel in rows]
+            for view in views:
+                _ = read(view)
+            return views
+
+        _ = build()  # TextMap 等的加载不计入
+        result = measure(build, len(rows))
+        result.memory = allocated(build) / len(rows)
+        return result
+
+
+views_case("view.alloc", TABLES, lambda _: None)
+views_case("view.cached", ("monster_config", "item_config"), lambda view: view.name)
+
+
+@case("lookup.monster_config")
+def lookup(game: gsz.SRGameData) -> tuple[typing.Callable[[], object], int]:
+    ids = [monster._excel.id for monster in game.monster_config()]  # pyright: ignore[reportPrivateUsage]
+    if len(ids) == 0:
+        raise Skip("monster_config is empty")
+    return lambda: [game.monster_config(id) for id in ids], len(ids)
+
+
+def text_map_sample(game: gsz.SRGameData) -> dict[int, str]:
+    for name in ("TextMapCN.json", "TextMapCHS.json"):
+        path = game.base / "TextMap" / name
+        if path.exists():
+            text_map: dict[str, str] = json.loads(path.read_bytes())
+            return {int(key): val for key, val in sorted(text_map.items())[:TEXTS]}
+    raise Skip("TextMap not found")
+
+
+@case("text.lookup")
+def text(game: gsz.SRGameData) -> tuple[typing.Callable[[], object], int]:
+    hashes = [TextHash(hash=key) for key in text_map_sample(game)]
+    _ = game.text(hashes[0])  # TextMap 加载不计入
+    return lambda: [game.text(text_hash) for text_hash in hashes], len(hashes)
+
+
+def register_syntax(syntax: Syntax):
+    @case(f"format.{syntax.name.lower()}")
+    def _format(game: gsz.SRGameData) -> tuple[typing.Callable[[], object], int]:  # pyright: ignore[reportUnusedFunction]
+        formatter = Formatter(syntax=syntax, game=game)
+        texts = renderable(text_map_sample(game).values(), formatter.format)
+        return lambda: [formatter.format(text) for text in texts], len(texts)
+
+
+for syntax in Syntax:
+    register_syntax(syntax)
+
+
+def rogue_dialogues(game: gsz.SRGameData) -> list[act.Dialogue]:
+    dialogues: list[act.Dialogue] = []
+    for npc in game.rogue_npc():
+        try:
+            dialogues.extend(npc.dialogue_list())
+        except OSError:  # noqa: PERF203
+            continue
+    return dialogues
+
+
+@case("act.parse")
+def act_parse(game: gsz.SRGameData) -> tuple[typing.Callable[[], object], int]:
+    paths = {dialogue.dialogue_path for dialogue in rogue_dialogues(game)}
+    contents = [path.read_bytes() for path in sorted(paths) if path.is_file()]
+    if len(contents) == 0:
+        raise Skip("no act files")
+    return lambda: [act.model.Act.model_validate_json(content) for content in contents], len(contents)
+
+
+@case("act.dialogue_wiki")
+def dialogue_wiki(game: gsz.SRGameData) -> tuple[typing.Callable[[], object], int]:
+    dialogues = renderable(rogue_dialogues(game), lambda dialogue: dialogue.wiki())
+    models = [dialogue._dialogue for dialogue in dialogues]  # pyright: ignore[reportPrivateUsage]
+    # 每次都新建 Dialogue，剧情文件的读取和解析也计入
+    return lambda: [act.Dialogue(game, model).wiki() for model in models], len(models)
+
+
+def view_wiki(
+    name: str,
+    views: typing.Callable[[gsz.SRGameData], collections.abc.Iterable[typing.Any]],
+    render: typing.Callable[[typing.Any], str],
+    method: str,
+):
+    """
+    视图上的 wiki 缓存在 cached_property 中，每次都通过 ID 重新取出新的视图再渲染
+    GameData 上的缓存（比如 _monster_config_summoners）仍然是热的
+    """
+
+    @case(name)
+    def _wiki(game: gsz.SRGameData) -> tuple[typing.Callable[[], object], int]:  # pyright: ignore[reportUnusedFunction]
+        lookup = getattr(game, method)
+        items = renderable(views(game), render)
+        keys = [primary_key(item._excel) for item in items]
+        return lambda: [render(lookup(*key)) for key in keys], len(keys)
+
+
+def primary_key(excel: typing.Any) -> tuple[int, ...]:
+    return (excel.main_id, excel.sub_id) if hasattr(excel, "main_id") else (excel.id,)
+
+
+def monster_prototypes(game: gsz.SRGameData) -> list[typing.Any]:
+    prototypes = (monster.prototype() for monster in game.monster_config())
+    return list({prototype._excel.id: prototype for prototype in prototypes}.values())
+
+
+view_wiki("wiki.avatar", lambda game: game.avatar_config(), lambda avatar: avatar.wiki(), "avatar_config")
+view_wiki("wiki.monster", monster_prototypes, lambda monster: monster.wiki(), "monster_config")
+view_wiki("wiki.rogue_buff", lambda game: game.rogue_buff(), lambda buff: buff.wiki(), "rogue_buff")
+view_wiki("wiki.rogue_tourn_buff", lambda game: game.rogue_tourn_buff(), lambda buff: buff.wiki(), "rogue_tourn_buff")
+view_wiki(
+    "message.contacts_wiki",
+    lambda game: game.message_contacts_config(),
+    lambda contacts: contacts.wiki(),
+    "message_contacts_config",
+)
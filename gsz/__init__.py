@@ -1,6 +1,58 @@
-from gsz import format
-from gsz.gi import GameData as GIGameData
-from gsz.sr import GameData as SRGameData
-from gsz.zzz import GameData as ZZZGameData
+import importlib
+import typing
 
-__all__ = ("GIGameData", "SRGameData", "ZZZGameData", "format")
+if typing.TYPE_CHECKING:
+    from gsz import (
+        aio,
+        budget,
+        client,
+        columnar,
+        format,
+        instrument,
+        mention,
+        profiling,
+        query,
+        reload,
+        serve,
+        slotted,
+        synthetic,
+    )
+    from gsz.gi import GameData as GIGameData
+    from gsz.sr import GameData as SRGameData
+    from gsz.zzz import GameData as ZZZGameData
+
+__all__ = (
+    "GIGameData",
+    "SRGameData",
+    "ZZZGameData",
+    "aio",
+    "budget",
+    "client",
+    "columnar",
+    "format",
+    "instrument",
+    "mention",
+    "profiling",
+    "query",
+    "reload",
+    "serve",
+    "slotted",
+    "synthetic",
+)
+"""三个游戏的 GameData 和 gsz 下所有公开的模块，模块在第一次访问时才导入"""
+
+# 导入模型要花几百毫秒，按需导入，gsz.client 这样只用到标准库的模块不用等待
+LAZY: typing.Final = {
+    "GIGameData": ("gsz.gi", "GameData"),
+    "SRGameData": ("gsz.sr", "GameData"),
+    "ZZZGameData": ("gsz.zzz", "GameData"),
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in LAZY:
+        module, attribute = LAZY[name]
+        return getattr(importlib.import_module(module), attribute)
+    if name in __all__:
+        return importlib.import_module(f"gsz.{name}")
+    raise AttributeError(f"module 'gsz' has no attribute {name!r}")
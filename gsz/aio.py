@@ -0,0 +1,55 @@
+"""
+异步加载
+
+GameData 的表和 TextMap 第一次访问时要读文件、解析 JSON、校验，大表需要几百毫秒，
+在异步服务中直接调用会阻塞整个事件循环。GameData.aload、GameData.atext 用 aiofiles 读取文件，
+解析和校验放到线程池中执行，加载完成后写入和同步访问相同的缓存
+
+同一张表、同一种语言的 TextMap 同时有多个协程请求时只加载一次，其他协程等待同一个结果
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import aiofiles
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+    import pathlib
+
+T = typing.TypeVar("T")
+
+
+async def read_bytes(path: pathlib.Path) -> bytes:
+    async with aiofiles.open(path, "rb") as file:
+        return await file.read()
+
+
+class Coalescer:
+    """按键合并同时进行的加载，加载结束（包括失败）后移除，下一次请求重新加载"""
+
+    def __init__(self):
+        self.__tasks: dict[typing.Hashable, asyncio.Task[typing.Any]] = {}
+
+    async def run(self, key: typing.Hashable, load: typing.Callable[[], collections.abc.Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        task = self.__tasks.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = self.__tasks[key] = loop.create_task(load())  # pyright: ignore[reportArgumentType]
+
+            def done(finished: asyncio.Task[typing.Any]):
+                if self.__tasks.get(key) is finished:
+                    del self.__tasks[key]
+
+            task.add_done_callback(done)
+        # 某个等待的协程被取消时不影响其他协程等待的加载
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self.__tasks)
+
+
+COALESCER: typing.Final = Coalescer()
+"""进程级别的合并，表按 GameData 和访问方法名、TextMap 按 GameData 和语言区分，不同 GameData 的加载互不合并"""
@@ -1,5 +1,19 @@
 from . import bilibili
 from .client import Client
+from .media import Downloader
 from .model import StructuredContent
+from .post_store import PostStore, StoredPost
+from .session import Session
+from .title_matcher import TitleMatch, TitleMatcher
 
-__all__ = ("bilibili", "Client", "StructuredContent")
+__all__ = (
+    "bilibili",
+    "Client",
+    "Downloader",
+    "PostStore",
+    "Session",
+    "StoredPost",
+    "StructuredContent",
+    "TitleMatch",
+    "TitleMatcher",
+)
@@ -1,8 +1,10 @@
+import asyncio
 import collections.abc
 import contextlib
 import datetime
 import hashlib
 import itertools
+import math
 import pathlib
 import time
 import types
@@ -13,7 +15,7 @@ import fake_useragent
 import httpx
 import typing_extensions
 
-from . import exception, model
+from . import exception, model, session as session_
 
 MIXIN_KEY_ENC_TAB: bytes = (
     b"./\x12\x025\x08\x17 \x0f2\n\x1f:\x03-#\x1b+\x051!\t*\x13\x1d\x1c\x0e'\x0c&)\r"
@@ -21,12 +23,58 @@ MIXIN_KEY_ENC_TAB: bytes = (
 )
 
 
+class Throttle:
+    """
+    同一个 Client 下所有请求共享的并发上限，以及被限流时的重试策略
+    B 站限流时可能返回 HTTP 412，也可能返回 HTTP 200 但 code 为 -412、-799
+    """
+
+    RATE_LIMITED_STATUS: typing.ClassVar[frozenset[int]] = frozenset({412, 429})
+    RATE_LIMITED_CODE: typing.ClassVar[frozenset[int]] = frozenset({-412, -799})
+
+    def __init__(self, concurrency: int = 4, retries: int = 3, backoff: float = 1.0):
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        self.__retries = retries
+        self.__backoff = backoff
+
+    async def get(self, client: httpx.AsyncClient, url: str, **kwargs: typing.Any) -> typing.Any:
+        """返回解析后的 JSON，被限流时按指数退避重试，重试次数用尽后原样返回或抛出 HTTP 错误"""
+        for attempt in range(self.__retries):
+            async with self.__semaphore:
+                res = await client.get(url, **kwargs)
+            if res.status_code not in self.RATE_LIMITED_STATUS:
+                body = res.raise_for_status().json()
+                if not isinstance(body, dict) or body.get("code") not in self.RATE_LIMITED_CODE:
+                    return body
+            await asyncio.sleep(self.__backoff * 2**attempt)
+        async with self.__semaphore:
+            res = await client.get(url, **kwargs)
+        return res.raise_for_status().json()
+
+
 class Client(contextlib.AbstractAsyncContextManager["Client"]):
-    def __init__(self):
+    BUVID_TTL: typing.ClassVar[datetime.timedelta] = datetime.timedelta(days=7)
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 4,
+        retries: int = 3,
+        backoff: float = 1.0,
+        session: session_.Session | None = None,
+    ):
+        """
+        concurrency 为同时进行的请求数上限，所有 Space 的搜索共享
+        retries、backoff 为被限流时的重试次数和首次重试等待秒数（之后每次翻倍）
+        session 为和其他客户端共用的连接池和磁盘缓存，WBI key 和 buvid 会缓存到磁盘，避免每次启动都重新获取
+        """
         self.__client = httpx.AsyncClient(
             headers={"user-agent": fake_useragent.UserAgent(os=["Windows"]).random},
             event_hooks={"request": [self.sign]},
+            transport=session.transport if session is not None else None,
         )
+        self.__cache = session.cache if session is not None else None
+        self.__throttle = Throttle(concurrency, retries, backoff)
         self.__wbi_key = b""
         self.__wbi_key_date = datetime.datetime.now().astimezone().date()
         self.__mixin_key: bytes = b""
@@ -51,7 +99,12 @@ class Client(contextlib.AbstractAsyncContextManager["Client"]):
         await self.__client.aclose()
 
     async def wbi_key(self) -> bytes:
-        if self.__wbi_key != b"" and datetime.datetime.now().astimezone().date() == self.__wbi_key_date:
+        today = datetime.datetime.now().astimezone().date()
+        if self.__wbi_key != b"" and today == self.__wbi_key_date:
+            return self.__wbi_key
+        cached = self.__cache.get(f"bilibili:wbi_key:{today}") if self.__cache is not None else None
+        if isinstance(cached, str):
+            self.__wbi_key, self.__wbi_key_date = cached.encode(), today
             return self.__wbi_key
         res = await self.__client.get("https://api.bilibili.com/x/web-interface/nav")
         _ = res.raise_for_status()
@@ -59,7 +112,11 @@ class Client(contextlib.AbstractAsyncContextManager["Client"]):
         img = pathlib.PurePosixPath(nav.data.wbi_img.img_url.path or "").stem
         sub = pathlib.PurePosixPath(nav.data.wbi_img.sub_url.path or "").stem
         self.__wbi_key = (img + sub).encode()
-        self.__wbi_key_date = datetime.datetime.now().astimezone().date()
+        self.__wbi_key_date = today
+        if self.__cache is not None:
+            # WBI key 每天更新一次，缓存到次日零点
+            tomorrow = datetime.datetime.combine(today + datetime.timedelta(days=1), datetime.time()).astimezone()
+            self.__cache.set(f"bilibili:wbi_key:{today}", img + sub, tomorrow)
         return self.__wbi_key
 
     async def mixin_key(self) -> bytes:
@@ -82,24 +139,31 @@ class Client(contextlib.AbstractAsyncContextManager["Client"]):
 
     async def set_buvid(self):
         # 初始化一些 set-cookie
-        res = await self.__client.get("https://api.bilibili.com/x/frontend/finger/spi")
-        _ = res.raise_for_status()
-        res = model.bilibili.Response[model.bilibili.FingerSpi].model_validate_json(res.content)
-        self.__client.cookies.set("buvid3", res.data.b_3)
-        self.__client.cookies.set("buvid4", res.data.b_4, domain=".bilibili.com", path="/")
+        cached = self.__cache.get("bilibili:buvid") if self.__cache is not None else None
+        if isinstance(cached, dict):
+            spi = model.bilibili.FingerSpi.model_validate(cached)
+        else:
+            res = await self.__client.get("https://api.bilibili.com/x/frontend/finger/spi")
+            _ = res.raise_for_status()
+            spi = model.bilibili.Response[model.bilibili.FingerSpi].model_validate_json(res.content).data
+            if self.__cache is not None:
+                self.__cache.set("bilibili:buvid", spi.model_dump(), self.BUVID_TTL)
+        self.__client.cookies.set("buvid3", spi.b_3)
+        self.__client.cookies.set("buvid4", spi.b_4, domain=".bilibili.com", path="/")
 
     def space(self, mid: int) -> "Space":
-        return Space(self.__client, mid)
+        return Space(self.__client, self.__throttle, mid)
 
 
 class Space:
-    def __init__(self, client: httpx.AsyncClient, mid: int):
+    def __init__(self, client: httpx.AsyncClient, throttle: Throttle, mid: int):
         self.__client = client
+        self.__throttle = throttle
         self.__mid = mid
 
     def search(self, keyword: str = "") -> "SearchIterable":
         """查询投稿视频"""
-        return SearchIterable(self.__client, self.__mid, keyword)
+        return SearchIterable(self.__client, self.__throttle, self.__mid, keyword)
 
 
 class Video:
@@ -124,20 +188,28 @@ class Video:
 
 
 class SearchIterable(collections.abc.AsyncIterable[Video]):
-    def __init__(self, client: httpx.AsyncClient, mid: int, keyword: str):
+    def __init__(self, client: httpx.AsyncClient, throttle: Throttle, mid: int, keyword: str):
         self.__client = client
+        self.__throttle = throttle
         self.__mid = mid
         self.__keyword = keyword
 
     @typing_extensions.override
     def __aiter__(self) -> "SearchIterator":
-        return SearchIterator(self.__client, self.__mid, self.__keyword)
+        return SearchIterator(self.__client, self.__throttle, self.__mid, self.__keyword)
 
 
 class SearchIterator(collections.abc.AsyncIterator[Video]):
+    """
+    第一页返回后就知道了总数，剩下的页面会一次性并发请求（受 Throttle 并发上限约束）
+    迭代顺序仍然和逐页请求相同
+    """
+
     API: str = "https://api.bilibili.com/x/space/wbi/arc/search"
+    TTL: typing.ClassVar[datetime.timedelta] = datetime.timedelta(hours=1)
+    """搜索结果（视频标题、封面等）缓存一小时，新投稿最多晚一小时出现"""
 
-    def __init__(self, client: httpx.AsyncClient, mid: int, keyword: str):
+    def __init__(self, client: httpx.AsyncClient, throttle: Throttle, mid: int, keyword: str):
         class Params(typing.TypedDict):
             pn: int  # 页码
             ps: int  # 单页返回视频数量，后端限制的单次请求上限 50
@@ -145,37 +217,57 @@ class SearchIterator(collections.abc.AsyncIterator[Video]):
             keyword: str  # 搜索内容，留空为列出全部
 
         self.__client = client
-        self.__params = Params(pn=0, ps=50, mid=mid, keyword=keyword)
-        self.__videos: list[model.bilibili.Video] = []
+        self.__throttle = throttle
+        self.__params = Params(pn=1, ps=50, mid=mid, keyword=keyword)
+        self.__videos: tuple[model.bilibili.Video, ...] = ()
         self.__iter_index: int = 0
-        self.__count: int | None = None
+        # 第 2 页及之后的请求，第一页返回后才创建
+        self.__pages: list[asyncio.Task[model.bilibili.Search]] | None = None
+        self.__page_index: int = 0
 
     @typing_extensions.override
     def __aiter__(self) -> typing_extensions.Self:
         return self
 
-    @typing_extensions.override
-    async def __anext__(self) -> Video:
-        if (
-            self.__iter_index == len(self.__videos)
-            and self.__count is not None
-            and self.__params["pn"] * self.__params["ps"] >= self.__count
-        ):
-            raise StopAsyncIteration
-        if self.__iter_index != len(self.__videos):
-            self.__iter_index += 1
-            return Video(self.__videos[self.__iter_index - 1])
-        self.__params["pn"] += 1
-        res = await self.__client.get(
+    async def __fetch(self, pn: int) -> model.bilibili.Search:
+        params = {**self.__params, "pn": pn}
+        body = await self.__throttle.get(
+            self.__client,
             self.API,
             headers={"referer": f"https://space.bilibili.com/{self.__params['mid']}/upload/video"},
-            params=typing.cast(collections.abc.Mapping[str, int | str], self.__params),
+            params=params,
+            extensions={session_.CACHE_TTL: self.TTL},
         )
-        res = res.raise_for_status()
-        res = model.bilibili.Response[model.bilibili.Search].model_validate_json(res.content)
+        res = model.bilibili.Response[model.bilibili.Search].model_validate(body)
         if res.code != 0:
-            raise exception.APIException(self.API, self.__params, res.code, res.message)
-        self.__videos = res.data.list.vlist
-        self.__count = res.data.page.count
-        self.__iter_index = 0
-        return Video(self.__videos[0])
+            raise exception.APIException(self.API, params, res.code, res.message)
+        return res.data
+
+    @typing_extensions.override
+    async def __anext__(self) -> Video:
+        while self.__iter_index == len(self.__videos):
+            if self.__pages is None:
+                search = await self.__fetch(1)
+                pages = math.ceil(search.page.count / self.__params["ps"])
+                self.__pages = [asyncio.ensure_future(self.__fetch(pn)) for pn in range(2, pages + 1)]
+            elif self.__page_index < len(self.__pages):
+                try:
+                    search = await self.__pages[self.__page_index]
+                except BaseException:
+                    await self.aclose()
+                    raise
+                self.__page_index += 1
+            else:
+                raise StopAsyncIteration
+            self.__videos = search.list.vlist
+            self.__iter_index = 0
+        self.__iter_index += 1
+        return Video(self.__videos[self.__iter_index - 1])
+
+    async def aclose(self):
+        """提前结束迭代时取消还未完成的请求"""
+        if self.__pages is None:
+            return
+        for page in self.__pages[self.__page_index :]:
+            _ = page.cancel()
+        _ = await asyncio.gather(*self.__pages[self.__page_index :], return_exceptions=True)
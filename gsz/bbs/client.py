@@ -1,15 +1,17 @@
+import collections.abc
 import contextlib
 import types
 
 import httpx
 import typing_extensions
 
-from . import user_post_list
+from . import session as session_, user_post_list
 
 
 class Client(contextlib.AbstractAsyncContextManager["Client"]):
-    def __init__(self):
-        self.__client = httpx.AsyncClient()
+    def __init__(self, *, session: session_.Session | None = None):
+        """session 为和其他客户端共用的连接池和磁盘缓存，不提供时使用独立的连接"""
+        self.__client = httpx.AsyncClient(transport=session.transport if session is not None else None)
 
     @typing_extensions.override
     async def __aenter__(self):
@@ -28,5 +30,6 @@ class Client(contextlib.AbstractAsyncContextManager["Client"]):
     async def aclose(self):
         await self.__client.aclose()
 
-    def user_post_list(self, uid: int) -> user_post_list.UserPostList:
-        return user_post_list.UserPostList(self.__client, uid)
+    def user_post_list(self, uid: int, seen: collections.abc.Container[int] = ()) -> user_post_list.UserPostList:
+        """seen 为已抓取过的帖子 ID，遇到（非置顶的）已抓取帖子即停止翻页，用于增量抓取"""
+        return user_post_list.UserPostList(self.__client, uid, seen)
@@ -0,0 +1,150 @@
+import asyncio
+import collections.abc
+import contextlib
+import hashlib
+import json
+import pathlib
+import types
+import typing
+import urllib.parse
+
+import aiofiles
+import aiofiles.os
+import httpx
+import typing_extensions
+
+from . import session as session_
+
+
+class Downloader(contextlib.AbstractAsyncContextManager["Downloader"]):
+    """
+    图片、封面等媒体文件的并发下载
+
+    按 URL 和内容哈希去重：同一个 URL 只下载一次，内容相同的不同 URL 只保留一个文件
+    已下载过的 URL 记录在目录下的 index.json，再次运行时跳过；边下载边写入临时文件，完成后再改名
+    """
+
+    INDEX: typing.Final = "index.json"
+    CHUNK_SIZE: typing.Final = 1 << 16
+
+    def __init__(
+        self,
+        directory: pathlib.Path,
+        *,
+        concurrency: int = 4,
+        session: session_.Session | None = None,
+    ):
+        self.__directory = directory
+        self.__client = httpx.AsyncClient(
+            transport=session.transport if session is not None else None,
+            follow_redirects=True,
+        )
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        # URL → 文件名，内容 sha256 → 文件名
+        self.__urls: dict[str, str] = {}
+        self.__digests: dict[str, str] = {}
+        self.__names: set[str] = set()
+        self.__pending: dict[str, asyncio.Task[pathlib.Path]] = {}
+
+    @typing_extensions.override
+    async def __aenter__(self):
+        self.__client = await self.__client.__aenter__()
+        await aiofiles.os.makedirs(self.__directory, exist_ok=True)
+        index = self.__directory / self.INDEX
+        if await aiofiles.os.path.exists(index):
+            async with aiofiles.open(index, encoding="utf-8") as file:
+                content = json.loads(await file.read())
+            self.__urls = content["urls"]
+            self.__digests = content["digests"]
+            self.__names = set(self.__urls.values())
+        return self
+
+    @typing_extensions.override
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: types.TracebackType | None = None,
+    ):
+        try:
+            # 保存索引、关闭连接前先停下还在进行的下载，否则它们会在关闭后继续写文件
+            await self.__cancel(list(self.__pending.values()))
+            await self.save()
+        finally:
+            await self.__client.__aexit__(exc_type, exc_value, traceback)
+
+    async def save(self):
+        index = self.__directory / self.INDEX
+        temp = index.with_suffix(".tmp")
+        async with aiofiles.open(temp, "w", encoding="utf-8") as file:
+            _ = await file.write(json.dumps({"urls": self.__urls, "digests": self.__digests}, ensure_ascii=False))
+        await aiofiles.os.replace(temp, index)
+
+    async def download(self, urls: collections.abc.Iterable[str]) -> dict[str, pathlib.Path]:
+        """并发下载，返回 URL 到本地文件的映射，下载失败的 URL 会抛出异常"""
+        urls = list(dict.fromkeys(urls))
+        tasks = [asyncio.ensure_future(self.get(url)) for url in urls]
+        try:
+            paths = await asyncio.gather(*tasks)
+        except BaseException:
+            # gather 不会取消其余的下载，一个失败时取消其他的并等它们清理完临时文件
+            await self.__cancel(tasks)
+            raise
+        return dict(zip(urls, paths, strict=True))
+
+    @staticmethod
+    async def __cancel(tasks: list[asyncio.Future[pathlib.Path]]):
+        for task in tasks:
+            _ = task.cancel()
+        _ = await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get(self, url: str) -> pathlib.Path:
+        """下载单个 URL，同一个 URL 并发调用时只会下载一次"""
+        name = self.__urls.get(url)
+        if name is not None and await aiofiles.os.path.exists(self.__directory / name):
+            return self.__directory / name
+        task = self.__pending.get(url)
+        if task is None:
+            task = self.__pending[url] = asyncio.ensure_future(self.__fetch(url))
+            task.add_done_callback(lambda _: self.__pending.pop(url, None))
+        return await task
+
+    def __filename(self, url: str) -> str:
+        if url in self.__urls:  # 下载过但文件被删除了
+            return self.__urls[url]
+        name = pathlib.PurePosixPath(urllib.parse.urlparse(url).path).name
+        # 不同 URL 可能有相同的文件名，此时加上 URL 哈希前缀
+        if name in ("", self.INDEX) or name in self.__names:
+            name = f"{hashlib.sha256(url.encode()).hexdigest()[:16]}-{name}"
+        self.__names.add(name)
+        return name
+
+    async def __fetch(self, url: str) -> pathlib.Path:
+        name = self.__filename(url)
+        temp = self.__directory / f".{name}.part"
+        digest = hashlib.sha256()
+        try:
+            async with self.__semaphore, self.__client.stream("GET", url) as res:
+                _ = res.raise_for_status()
+                async with aiofiles.open(temp, "wb") as file:
+                    async for chunk in res.aiter_bytes(self.CHUNK_SIZE):
+                        digest.update(chunk)
+                        _ = await file.write(chunk)
+        except BaseException:
+            # 下载失败或被取消时不留下写了一半的临时文件，文件名也让出来
+            temp.unlink(missing_ok=True)
+            if url not in self.__urls:
+                self.__names.discard(name)
+            raise
+        # 检查、登记和改名之间不能有 await，否则并发下载相同内容时都会认为自己是第一个
+        existing = self.__digests.get(digest.hexdigest())
+        if existing is not None and existing != name and self.__directory.joinpath(existing).exists():
+            # 内容相同的文件已经存在，不再保留一份
+            self.__names.discard(name)
+            self.__urls[url] = existing
+            temp.unlink()
+            return self.__directory / existing
+        self.__digests[digest.hexdigest()] = name
+        self.__urls[url] = name
+        _ = temp.replace(self.__directory / name)
+        return self.__directory / name
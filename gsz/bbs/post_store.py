@@ -0,0 +1,61 @@
+import collections.abc
+import datetime
+import pathlib
+
+import aiofiles
+import aiofiles.os
+import typing_extensions
+
+from .model.base import Model
+
+
+class StoredPost(Model):
+    id: int
+    subject: str
+    created_at: datetime.datetime
+    category: str | None
+    """调用方给帖子划分的类别，不关心的帖子为 None，但仍然要记录下来，避免下次重复抓取"""
+    entry: str
+    """调用方渲染好的文本"""
+
+
+class PostStore(collections.abc.Mapping[int, StoredPost]):
+    """
+    已抓取帖子的本地存储，以帖子 ID 为键
+
+    落盘为 JSON Lines，新帖子只追加写入，不重写已有内容
+    配合 `Client.user_post_list(uid, seen=store)` 使用，遇到已抓取过的帖子即可停止翻页
+    """
+
+    def __init__(self, path: pathlib.Path, posts: collections.abc.Iterable[StoredPost] = ()):
+        self.__path = path
+        self.__posts = {post.id: post for post in posts}
+
+    @classmethod
+    async def open(cls, path: pathlib.Path) -> typing_extensions.Self:
+        if not await aiofiles.os.path.exists(path):
+            return cls(path)
+        async with aiofiles.open(path, encoding="utf-8") as file:
+            lines = await file.readlines()
+        return cls(path, (StoredPost.model_validate_json(line) for line in lines if line.strip() != ""))
+
+    @typing_extensions.override
+    def __getitem__(self, post_id: int) -> StoredPost:
+        return self.__posts[post_id]
+
+    @typing_extensions.override
+    def __iter__(self) -> collections.abc.Iterator[int]:
+        return iter(self.__posts)
+
+    @typing_extensions.override
+    def __len__(self) -> int:
+        return len(self.__posts)
+
+    async def extend(self, posts: collections.abc.Iterable[StoredPost]):
+        """追加并立即落盘，已存在的帖子会被忽略"""
+        posts = [post for post in posts if post.id not in self.__posts]
+        if len(posts) == 0:
+            return
+        async with aiofiles.open(self.__path, "a", encoding="utf-8") as file:
+            await file.writelines(post.model_dump_json() + "\n" for post in posts)
+        self.__posts.update((post.id, post) for post in posts)
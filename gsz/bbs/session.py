@@ -0,0 +1,191 @@
+import contextlib
+import datetime
+import hashlib
+import json
+import os
+import pathlib
+import types
+import typing
+
+import httpx
+import typing_extensions
+
+CACHE_TTL: typing.Final = "gsz.cache_ttl"
+"""请求的 extensions 中带上该键（值为 datetime.timedelta）时，响应会被缓存到磁盘"""
+
+# B 站 WBI 签名每次都会变化的参数，不参与缓存键
+UNSTABLE_PARAMS: typing.Final = frozenset({"w_rid", "wts"})
+ENCODING_HEADERS: typing.Final = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class DiskCache:
+    """
+    简单的磁盘键值缓存，每个键一个 JSON 文件，带过期时间
+
+    写入时先写临时文件再替换，多个进程同时运行也不会读到写了一半的文件
+    """
+
+    def __init__(self, directory: pathlib.Path):
+        self.__directory = directory
+
+    def __path(self, key: str) -> pathlib.Path:
+        return self.__directory / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.json"
+
+    def get(self, key: str, *, stale: bool = False) -> typing.Any:
+        """未命中或已过期返回 None，stale 为 True 时忽略过期时间（用于带校验头的重新验证）"""
+        try:
+            entry = json.loads(self.__path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not stale and datetime.datetime.fromisoformat(entry["expires"]) < datetime.datetime.now().astimezone():
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: typing.Any, expires: datetime.datetime | datetime.timedelta):
+        if isinstance(expires, datetime.timedelta):
+            expires = datetime.datetime.now().astimezone() + expires
+        path = self.__path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        _ = temp.write_text(json.dumps({"key": key, "expires": expires.isoformat(), "value": value}))
+        _ = temp.replace(path)
+
+
+def succeeded(content: bytes) -> bool:
+    """米游社的 retcode 或 B 站的 code 为 0 时请求才算成功"""
+    try:
+        body = json.loads(content)
+    except ValueError:
+        return False
+    return isinstance(body, dict) and body.get("retcode", body.get("code")) == 0
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """
+    只缓存显式要求缓存（extensions 带 CACHE_TTL）的 GET 请求
+    接口出错（比如被限流）时 HTTP 状态码仍可能是 200，只缓存 retcode / code 为 0 的响应
+
+    未过期时直接返回缓存，过期后带上 If-None-Match / If-Modified-Since 向服务器确认，304 时续期
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: DiskCache):
+        self.__transport = transport
+        self.__cache = cache
+
+    @staticmethod
+    def key(request: httpx.Request) -> str:
+        params = sorted((key, val) for key, val in request.url.params.multi_items() if key not in UNSTABLE_PARAMS)
+        return "http:" + str(request.url.copy_with(params=params))
+
+    @typing_extensions.override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        ttl = request.extensions.get(CACHE_TTL)
+        if request.method != "GET" or not isinstance(ttl, datetime.timedelta):
+            return await self.__transport.handle_async_request(request)
+        key = self.key(request)
+        cached = self.__cache.get(key)
+        if cached is not None:
+            return self.__response(request, cached)
+        cached = self.__cache.get(key, stale=True)
+        if cached is not None:
+            if "etag" in cached["headers"]:
+                request.headers["if-none-match"] = cached["headers"]["etag"]
+            if "last-modified" in cached["headers"]:
+                request.headers["if-modified-since"] = cached["headers"]["last-modified"]
+        response = await self.__transport.handle_async_request(request)
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            await response.aclose()
+            self.__cache.set(key, cached, ttl)
+            return self.__response(request, cached)
+        if response.status_code != httpx.codes.OK:
+            return response
+        content = await response.aread()
+        # aread 已经按 content-encoding 解压，重新构造响应时去掉相关头
+        rebuilt = httpx.Response(
+            response.status_code,
+            headers=[(name, val) for name, val in response.headers.multi_items() if name not in ENCODING_HEADERS],
+            content=content,
+            request=request,
+            extensions=response.extensions,
+        )
+        if not succeeded(content):
+            return rebuilt
+        headers = {
+            name: response.headers[name]
+            for name in ("content-type", "etag", "last-modified")
+            if name in response.headers
+        }
+        # 只用于 JSON 接口，按文本存储
+        entry = {"headers": headers, "content": content.decode()}
+        self.__cache.set(key, entry, ttl)
+        return rebuilt
+
+    @staticmethod
+    def __response(request: httpx.Request, cached: dict[str, typing.Any]) -> httpx.Response:
+        return httpx.Response(httpx.codes.OK, headers=cached["headers"], content=cached["content"], request=request)
+
+    @typing_extensions.override
+    async def aclose(self):
+        await self.__transport.aclose()
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """多个 httpx.AsyncClient 共用的连接池，客户端关闭时不关闭连接池，由 Session 负责关闭"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.__transport = transport
+
+    @typing_extensions.override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.__transport.handle_async_request(request)
+
+    @typing_extensions.override
+    async def aclose(self):
+        pass
+
+
+class Session(contextlib.AbstractAsyncContextManager["Session"]):
+    """
+    米游社和 B 站客户端共用的连接池和磁盘缓存
+
+    连接池保持长连接，http2 为 True 时使用 HTTP/2（需要另外安装 httpx[http2]）；cache_dir 为 None 时不使用磁盘缓存
+    用法：
+        async with Session(cache_dir) as session, gsz.bbs.Client(session=session) as miyoushe:
+            ...
+    """
+
+    def __init__(self, cache_dir: pathlib.Path | None = None, *, http2: bool = False):
+        self.__pool = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=30.0),
+        )
+        self.__cache = DiskCache(cache_dir / "bbs") if cache_dir is not None else None
+        transport: httpx.AsyncBaseTransport = self.__pool
+        if self.__cache is not None:
+            transport = CachingTransport(transport, self.__cache)
+        self.__transport = SharedTransport(transport)
+
+    @property
+    def cache(self) -> DiskCache | None:
+        return self.__cache
+
+    @property
+    def transport(self) -> httpx.AsyncBaseTransport:
+        return self.__transport
+
+    @typing_extensions.override
+    async def __aenter__(self):
+        _ = await self.__pool.__aenter__()
+        return self
+
+    @typing_extensions.override
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: types.TracebackType | None = None,
+    ):
+        await self.__pool.__aexit__(exc_type, exc_value, traceback)
+
+    async def aclose(self):
+        await self.__pool.aclose()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import collections
+import collections.abc
+import difflib
+import re
+import typing
+import unicodedata
+
+import typing_extensions
+
+T = typing.TypeVar("T")
+
+GAME_PREFIX: typing.Final = "《崩坏：星穹铁道》"
+CATEGORY_PREFIX: typing.Final = re.compile(r"^[^|丨]+[|丨]")
+WHITESPACE: typing.Final = re.compile(r"\s+")
+
+
+def normalize(title: str) -> str:
+    """
+    去掉游戏名前缀和「分类 | 」「分类丨」前缀，全角转半角，去掉所有空白并转小写
+
+    米游社和 B 站的标题经常只差在这些地方
+    """
+    title = title.strip().removeprefix(GAME_PREFIX)
+    title = unicodedata.normalize("NFKC", title)
+    title = title.removeprefix(unicodedata.normalize("NFKC", GAME_PREFIX))
+    title = CATEGORY_PREFIX.sub("", title)
+    return WHITESPACE.sub("", title).lower()
+
+
+def trigrams(title: str) -> set[str]:
+    """长度不足 3 的标题整体作为一个 gram"""
+    if len(title) < 3:  # noqa: PLR2004
+        return {title}
+    return {title[index : index + 3] for index in range(len(title) - 2)}
+
+
+class TitleMatch(typing_extensions.NamedTuple, typing.Generic[T]):
+    title: str
+    """原始标题"""
+    value: T
+    score: float
+    """归一化后标题的相似度，同 difflib.SequenceMatcher.ratio，1.0 为完全相同"""
+
+
+class TitleMatcher(typing.Generic[T]):
+    """
+    标题模糊匹配
+
+    对候选标题按字符三元组建立倒排索引，查询时先按共有三元组数量挑出少量候选，
+    再对这些候选计算 SequenceMatcher 相似度，避免和所有标题逐一比较
+    归一化后相同的标题只保留最后一个，和 dict 的行为一致
+    """
+
+    def __init__(self, titles: collections.abc.Iterable[tuple[str, T]]):
+        entries: dict[str, tuple[str, T]] = {}
+        for title, value in titles:
+            entries[normalize(title)] = (title, value)
+        self.__normalized = list(entries.keys())
+        self.__entries = list(entries.values())
+        self.__index: dict[str, list[int]] = collections.defaultdict(list)
+        for index, normalized in enumerate(self.__normalized):
+            for gram in trigrams(normalized):
+                self.__index[gram].append(index)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def match(self, title: str, n: int = 3, cutoff: float = 0.6, candidates: int = 8) -> list[TitleMatch[T]]:
+        """
+        返回相似度不低于 cutoff 的至多 n 个结果，按相似度从高到低排列
+
+        candidates 为按三元组初筛后参与精确比较的数量
+        """
+        normalized = normalize(title)
+        counter: collections.Counter[int] = collections.Counter()
+        for gram in trigrams(normalized):
+            counter.update(self.__index.get(gram, ()))
+        matcher = difflib.SequenceMatcher(b=normalized)
+        matches: list[TitleMatch[T]] = []
+        for index, _ in counter.most_common(candidates):
+            matcher.set_seq1(self.__normalized[index])
+            if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+                continue
+            score = matcher.ratio()
+            if score >= cutoff:
+                matches.append(TitleMatch(*self.__entries[index], score))
+        matches.sort(key=lambda match: match.score, reverse=True)
+        return matches[:n]
@@ -4,9 +4,11 @@ import datetime
 import httpx
 import typing_extensions
 
-from . import exception, model
+from . import exception, model, session
 
 API = "https://bbs-api.miyoushe.com/painter/wapi/userPostList"
+OLD_PAGE_TTL = datetime.timedelta(days=1)
+"""带 offset 的是翻页请求，旧帖子的内容基本不会变化，可以缓存"""
 
 
 class StructuredContent:
@@ -75,6 +77,11 @@ class Post:
     def created_at(self) -> datetime.datetime:
         return self.__post.post.created_at.astimezone()
 
+    @property
+    def is_top(self) -> bool:
+        """置顶帖，总是出现在列表最前面，不代表发帖时间"""
+        return self.__post.post.post_status.is_top
+
     def structured_content(self) -> collections.abc.Iterable[StructuredContent]:
         return (
             ()
@@ -84,9 +91,11 @@ class Post:
 
 
 class UserPost(collections.abc.AsyncIterator[Post]):
-    def __init__(self, client: httpx.AsyncClient, uid: int):
+    def __init__(self, client: httpx.AsyncClient, uid: int, seen: collections.abc.Container[int] = ()):
         self.__client = client
         self.__uid = uid
+        # 帖子按发布时间倒序返回，遇到已经抓取过的帖子，说明之后都抓取过了
+        self.__seen = seen
         # size=50 是后端限制的单次请求上限
         self.__params: dict[str, int] = {"size": 50, "uid": uid}
         self.__user_posts: list[model.user_post.UserPost] = []
@@ -99,12 +108,25 @@ class UserPost(collections.abc.AsyncIterator[Post]):
 
     @typing_extensions.override
     async def __anext__(self) -> Post:
+        while True:
+            post = await self.__next()
+            if post.id not in self.__seen:
+                return post
+            # 置顶帖不按时间排序，跳过而不是停止
+            if not post.is_top:
+                self.__is_last = True
+                self.__user_posts = []
+                self.__iter_index = 0
+                raise StopAsyncIteration
+
+    async def __next(self) -> Post:
         if self.__iter_index == len(self.__user_posts) and self.__is_last:
             raise StopAsyncIteration
         if self.__iter_index != len(self.__user_posts):
             self.__iter_index += 1
             return Post(self.__user_posts[self.__iter_index - 1])
-        res = await self.__client.get(API, params=self.__params)
+        extensions = {session.CACHE_TTL: OLD_PAGE_TTL} if "offset" in self.__params else None
+        res = await self.__client.get(API, params=self.__params, extensions=extensions)
         res = res.raise_for_status()
         res = model.Response[model.user_post.UserPostList].model_validate_json(res.content)
         if res.retcode != 0:
@@ -119,10 +141,11 @@ class UserPost(collections.abc.AsyncIterator[Post]):
 
 
 class UserPostList(collections.abc.AsyncIterable[Post]):
-    def __init__(self, client: httpx.AsyncClient, uid: int):
+    def __init__(self, client: httpx.AsyncClient, uid: int, seen: collections.abc.Container[int] = ()):
         self.__client = client
         self.__uid = uid
+        self.__seen = seen
 
     @typing_extensions.override
     def __aiter__(self) -> UserPost:
-        return UserPost(self.__client, self.__uid)
+        return UserPost(self.__client, self.__uid, self.__seen)
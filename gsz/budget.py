@@ -0,0 +1,225 @@
+"""
+内存预算
+
+GameData 加载过的表、TextMap 和 cached_property 索引默认一直保留，在一个进程里遍历整个数据集时内存只增不减
+用 gsz.budget.configure（或 `main.py serve --memory-budget`）设置预算后，这些缓存加载时按估计的大小登记，
+总和超过预算时丢弃最近最少使用的，之后访问时透明地重新加载
+
+剧情文件每次访问都重新读取，本来就不缓存；SQLite 导出的表和 TextMap 逐行查询，也不登记
+预算是进程级别的，所有 GameData 共用一个，未设置时不登记也不丢弃，设置之前已经加载的也不登记
+登记时按缓存所在对象（GameData）的弱引用和缓存名区分，预算不会让 GameData 无法回收，回收后它的登记也一并移除
+"""
+
+from __future__ import annotations
+
+import collections
+import collections.abc
+import contextlib
+import dataclasses
+import functools
+import sys
+import threading
+import types
+import typing
+import weakref
+
+import pydantic
+import typing_extensions
+
+from . import instrument
+
+T = typing.TypeVar("T")
+Owner = typing.TypeVar("Owner")
+
+
+@dataclasses.dataclass
+class BudgetStats:
+    limit: int | None
+    """预算（字节），None 为不限制"""
+    used: int
+    """已登记的缓存估计占用的内存（字节）"""
+    entries: int
+    evictions: int = 0
+    evicted: int = 0
+    """丢弃的缓存大小总和（字节）"""
+    reloads: int = 0
+    """丢弃后又重新加载的次数，和 evictions 接近时说明预算太小"""
+    names: dict[str, int] = dataclasses.field(default_factory=dict[str, int])
+    """各缓存（表的访问方法名、TextMap 语言、索引名）被丢弃的次数"""
+
+
+@dataclasses.dataclass
+class Entry:
+    name: str
+    size: int
+    evict: typing.Callable[[typing.Any], object]
+    """参数为缓存所在的对象"""
+
+
+def size_of(value: object, seen: set[int] | None = None) -> int:
+    """
+    估计缓存占用的内存，容器抽样估计，模型之外的对象（比如 AvatarStatCurves）递归计算 __dict__ 和 __slots__ 中的属性
+    seen 中的对象不计入，登记时传入缓存所在的 GameData，避免把属性引用的 GameData 也算进去
+    """
+    if seen is None:
+        seen = set()
+    if isinstance(value, collections.abc.Mapping | list | tuple):
+        return instrument.estimate(typing.cast("collections.abc.Mapping[typing.Any, typing.Any]", value))
+    fields = attributes(value)
+    if fields is None or id(value) in seen:
+        return instrument.sizeof(value, seen)
+    seen.add(id(value))
+    return sys.getsizeof(value) + sum(size_of(field, seen) for field in fields)
+
+
+def attributes(value: object) -> list[object] | None:
+    """普通对象 __dict__ 和 __slots__ 中的属性，pydantic 模型、类、函数等返回 None"""
+    if isinstance(value, pydantic.BaseModel | type | types.ModuleType | types.FunctionType | types.MethodType):
+        return None
+    fields: list[object] = []
+    for klass in type(value).__mro__:
+        slots = vars(klass).get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            member = vars(klass).get(name)
+            # 只读已经赋值的槽，Slotted 中 cached_property 的槽读取时会触发计算
+            if isinstance(member, types.MemberDescriptorType):
+                with contextlib.suppress(AttributeError):
+                    fields.append(member.__get__(value, klass))
+    namespace = getattr(value, "__dict__", None)
+    if isinstance(namespace, dict):
+        fields.extend(typing.cast("dict[str, object]", namespace).values())
+    elif len(fields) == 0:
+        return None
+    return fields
+
+
+class Budget:
+    def __init__(self, limit: int | None = None):
+        self.limit: int | None = limit
+        self.__entries: collections.OrderedDict[tuple[weakref.ref[typing.Any], str], Entry] = collections.OrderedDict()
+        self.__evicted: set[tuple[weakref.ref[typing.Any], str]] = set()
+        self.__stats: BudgetStats = BudgetStats(limit, 0, 0)
+        self.__lock: threading.RLock = threading.RLock()  # 丢弃时的回调会再调用 discard
+        self.__collected: bool = False  # 有登记过的对象被回收，下次加锁时清理
+
+    def configure(self, limit: int | None):
+        """设置预算，立即丢弃超出的部分，None 时不再登记，已登记的缓存也不再跟踪"""
+        with self.__lock:
+            self.limit = limit
+            if limit is None:
+                self.__entries.clear()
+                self.__evicted.clear()
+                self.__stats.used = 0
+            else:
+                self.__shrink()
+
+    def add(
+        self,
+        owner: Owner,
+        name: str,
+        value: object,
+        evict: typing.Callable[[Owner], object],
+        size: int | None = None,
+    ):
+        """
+        登记 owner 上刚加载的缓存 name，evict(owner) 丢弃这份缓存，size 默认抽样估计 value 的大小
+        evict 不能引用 owner，否则 owner 无法回收；最新登记的不会被丢弃，即使它本身就超过了预算
+        """
+        if self.limit is None:
+            return
+        size = size_of(value, {id(owner)}) if size is None else size
+        key = (weakref.ref(owner, self.__collect), name)
+        with self.__lock:
+            self.__sweep()
+            self.discard(owner, name)
+            if key in self.__evicted:
+                self.__evicted.discard(key)
+                self.__stats.reloads += 1
+            self.__entries[key] = Entry(name, size, evict)
+            self.__stats.used += size
+            self.__shrink()
+
+    def touch(self, owner: object, name: str):
+        """记录一次访问"""
+        if self.limit is None:
+            return
+        # 和登记、丢弃一样加锁，否则并发的 aload、serve 线程会弄乱最近使用的顺序
+        with self.__lock, contextlib.suppress(KeyError):  # 没有登记或者刚被丢弃
+            self.__entries.move_to_end((weakref.ref(owner), name))
+
+    def discard(self, owner: object, name: str):
+        """缓存被其他原因丢弃时（比如 GameData.invalidate）取消登记"""
+        with self.__lock:
+            entry = self.__entries.pop((weakref.ref(owner), name), None)
+            if entry is not None:
+                self.__stats.used -= entry.size
+
+    def stats(self) -> BudgetStats:
+        with self.__lock:
+            self.__sweep()
+            stats = dataclasses.replace(self.__stats, limit=self.limit, entries=len(self.__entries))
+            stats.names = dict(self.__stats.names)
+            return stats
+
+    def __collect(self, _: weakref.ref[typing.Any]):
+        # 回收时可能在任意线程、任意位置调用，这里不加锁，只做标记
+        self.__collected = True
+
+    def __sweep(self):
+        """移除已经回收的对象的登记"""
+        if not self.__collected:
+            return
+        self.__collected = False
+        for key in [key for key in self.__entries if key[0]() is None]:
+            self.__stats.used -= self.__entries.pop(key).size
+        self.__evicted = {key for key in self.__evicted if key[0]() is not None}
+
+    def __shrink(self):
+        assert self.limit is not None
+        while self.__stats.used > self.limit and len(self.__entries) > 1:
+            key, entry = self.__entries.popitem(last=False)
+            self.__evicted.add(key)
+            self.__stats.used -= entry.size
+            owner = key[0]()
+            if owner is None:  # 已经回收，不算作丢弃
+                continue
+            self.__stats.evictions += 1
+            self.__stats.evicted += entry.size
+            self.__stats.names[entry.name] = self.__stats.names.get(entry.name, 0) + 1
+            _ = entry.evict(owner)
+
+
+BUDGET: typing.Final = Budget()
+"""进程级别的预算"""
+
+
+def configure(limit: int | None):
+    """设置进程级别的预算（字节），None 为不限制，见 Budget.configure"""
+    BUDGET.configure(limit)
+
+
+def stats() -> BudgetStats:
+    """进程级别预算的使用和丢弃统计"""
+    return BUDGET.stats()
+
+
+class cached_property(functools.cached_property[T]):
+    """
+    同 functools.cached_property，设置预算后计算结果按大小登记，被丢弃后下次访问时重新计算
+    和 functools.cached_property 一样结果直接存在实例上，之后的访问不经过这里，没有额外开销，
+    代价是不知道最近有没有用过，索引按计算的先后丢弃
+    """
+
+    @typing.overload
+    def __get__(self, instance: None, owner: type[typing.Any] | None = None) -> typing_extensions.Self: ...
+    @typing.overload
+    def __get__(self, instance: object, owner: type[typing.Any] | None = None) -> T: ...
+    @typing_extensions.override
+    def __get__(self, instance: object | None, owner: type[typing.Any] | None = None) -> T | typing_extensions.Self:
+        if instance is None:
+            return self
+        name = self.attrname
+        assert name is not None
+        value = instance.__dict__[name] = self.func(instance)
+        BUDGET.add(instance, name, value, lambda owner: vars(owner).pop(name, None))
+        return value
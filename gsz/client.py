@@ -0,0 +1,106 @@
+"""
+常驻服务（gsz.serve）的客户端
+
+不导入 pydantic 和数据模型，main.py、achievement.py 的客户端模式在导入 gsz 的其他模块之前就转发命令，
+省掉导入模型的几秒，命令的耗时只剩服务端执行的时间
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import socket
+import sys
+import typing
+
+import typing_extensions
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+PARSE_ERROR: typing.Final = -32700
+INVALID_REQUEST: typing.Final = -32600
+METHOD_NOT_FOUND: typing.Final = -32601
+INVALID_PARAMS: typing.Final = -32602
+BUSY: typing.Final = -32000
+"""JSON-RPC 的错误码，BUSY 为服务端自定义"""
+
+
+class RemoteError(Exception):
+    """服务端返回的 JSON-RPC 错误"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"{message} ({code})")
+        self.code: int = code
+        self.message: str = message
+
+
+@dataclasses.dataclass
+class Result:
+    stdout: str
+    stderr: str
+    status: int
+    elapsed: float
+    """服务端执行命令的耗时（秒）"""
+
+
+class Client:
+    """同步的客户端，一个连接依次发送请求"""
+
+    def __init__(self, path: str | pathlib.Path, *, timeout: float | None = None):
+        self.__socket: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__socket.settimeout(timeout)
+        self.__socket.connect(str(path))
+        self.__file: typing.BinaryIO = self.__socket.makefile("rb")
+        self.__id: int = 0
+
+    def close(self):
+        self.__file.close()
+        self.__socket.close()
+
+    def __enter__(self) -> typing_extensions.Self:
+        return self
+
+    def __exit__(self, *_: object):
+        self.close()
+
+    def call(self, method: str, **params: typing.Any) -> typing.Any:
+        self.__id += 1
+        request = {"jsonrpc": "2.0", "id": self.__id, "method": method, "params": params}
+        self.__socket.sendall(json.dumps(request, ensure_ascii=False).encode() + b"\n")
+        line = self.__file.readline()
+        if len(line) == 0:
+            raise ConnectionError("server closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise RemoteError(response["error"]["code"], response["error"]["message"])
+        return response["result"]
+
+    def run(self, program: str, argv: list[str]) -> Result:
+        return Result(**self.call("run", program=program, argv=argv, cwd=os.getcwd()))
+
+
+def connect_argument(argv: list[str]) -> tuple[str | None, list[str]]:
+    """取出命令行开头的 --connect <socket>，没有时返回 None 和原参数"""
+    if len(argv) >= 2 and argv[0] == "--connect":
+        return argv[1], argv[2:]
+    if len(argv) >= 1 and argv[0].startswith("--connect="):
+        return argv[0].removeprefix("--connect="), argv[1:]
+    return None, argv
+
+
+def forward(path: str | pathlib.Path, program: str, argv: list[str]) -> int:
+    """客户端模式，把命令交给服务端执行，输出原样打印，返回退出码"""
+    with Client(path) as client:
+        result = client.run(program, argv)
+    _ = sys.stdout.write(result.stdout)
+    _ = sys.stderr.write(result.stderr)
+    return result.status
+
+
+def forward_if_connected(program: str, argv: list[str]):
+    """命令行以 --connect <socket> 开头时转发给服务端，并以命令的退出码退出"""
+    path, argv = connect_argument(argv)
+    if path is not None:
+        sys.exit(forward(path, program, argv))
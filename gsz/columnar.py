@@ -0,0 +1,345 @@
+"""
+按列存储的数据表
+
+每行一个 pydantic 模型时，每个模型都带有自己的 __dict__，行多的表（TalkSentenceConfig、MonsterConfig、ItemConfig）
+还没构建任何视图就要占用几百字节一行。这里把校验后的模型按字段拆成列：
+
+- 整数、浮点、布尔存入 array
+- 枚举存为成员序号
+- 只有一个数值字段的模型（TextHash、Value[float] 等）存为该字段的值，取值种类少时和其他值一样共享对象
+- 字符串驻留，其他可哈希的值（元组、冻结的模型）相同的只保留一份
+- 所有行都相同的列只存一个值
+
+可以为 None 的数值列额外用一个 bytearray 标记空值
+访问某一行时才用 model_construct 重新构造模型，不再校验，每次访问得到的都是新对象
+需要整表扫描时可以直接取出某一列，比较 array 而不用构造每一行的模型
+"""
+
+from __future__ import annotations
+
+import abc
+import array
+import bisect
+import collections.abc
+import enum
+import operator
+import sys
+import typing
+
+import pydantic
+import typing_extensions
+
+from . import instrument
+
+M = typing.TypeVar("M", bound=pydantic.BaseModel)
+
+INT64: typing.Final = range(-(2**63), 2**63)
+
+SHARE_RATIO: typing.Final = 4
+"""只有一个数值字段的模型，不同取值不到行数的四分之一时不拆成数值，直接共享相同的对象"""
+
+
+class Column(collections.abc.Sequence[typing.Any]):
+    """一列的值，按行号访问得到解码后的值"""
+
+    raw: collections.abc.Sequence[typing.Any]
+    """底层存储，数值列为 array，可以直接用于扫描"""
+
+    @typing.overload
+    def __getitem__(self, index: int) -> typing.Any: ...
+    @typing.overload
+    def __getitem__(self, index: slice) -> list[typing.Any]: ...
+    def __getitem__(self, index: int | slice) -> typing.Any:
+        if isinstance(index, slice):
+            return [self.get(row) for row in range(len(self))[index]]
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        return self.get(index % len(self))
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @abc.abstractmethod
+    def get(self, row: int) -> typing.Any: ...
+
+    def memory(self) -> int:
+        return sys.getsizeof(self.raw)
+
+
+class ConstColumn(Column):
+    """所有行都相同的列，比如旧版本才有、新版本全为默认值的字段"""
+
+    def __init__(self, value: typing.Any, rows: int):
+        self.value: typing.Any = value
+        self.__rows: int = rows
+
+    @property
+    def raw(self) -> list[typing.Any]:  # pyright: ignore[reportIncompatibleVariableOverride]
+        return [self.value] * self.__rows
+
+    @typing_extensions.override
+    def __len__(self) -> int:
+        return self.__rows
+
+    @typing_extensions.override
+    def get(self, row: int) -> typing.Any:  # noqa: ARG002 # pyright: ignore[reportUnusedParameter]
+        return self.value
+
+    @typing_extensions.override
+    def memory(self) -> int:
+        return 0
+
+
+class ArrayColumn(Column):
+    """
+    数值列，decode 把存储的数值还原为枚举成员、模型等，nulls 中非零表示该行为 None
+    encode 是 decode 的逆操作，用于查询时把比较的值转换为存储的数值
+    field 是拆开的单字段模型的字段名
+    """
+
+    def __init__(
+        self,
+        raw: array.array[typing.Any],
+        decode: typing.Callable[[typing.Any], typing.Any] | None = None,
+        nulls: bytearray | None = None,
+        *,
+        encode: typing.Callable[[typing.Any], typing.Any] | None = None,
+        field: str | None = None,
+    ):
+        self.raw = raw
+        self.decode: typing.Callable[[typing.Any], typing.Any] | None = decode
+        self.nulls: bytearray | None = nulls
+        self.encode: typing.Callable[[typing.Any], typing.Any] | None = encode
+        self.field: str | None = field
+
+    @typing_extensions.override
+    def get(self, row: int) -> typing.Any:
+        if self.nulls is not None and self.nulls[row]:
+            return None
+        value = self.raw[row]
+        return value if self.decode is None else self.decode(value)
+
+    @typing_extensions.override
+    def memory(self) -> int:
+        return sys.getsizeof(self.raw) + (sys.getsizeof(self.nulls) if self.nulls is not None else 0)
+
+
+class ObjectColumn(Column):
+    """其他值原样存放，相同的值共享同一个对象"""
+
+    def __init__(self, raw: list[typing.Any]):
+        self.raw = raw
+
+    @typing_extensions.override
+    def get(self, row: int) -> typing.Any:
+        return self.raw[row]
+
+    @typing_extensions.override
+    def memory(self) -> int:
+        return instrument.estimate(self.raw)
+
+
+def construct(model: type[M], fields: dict[str, typing.Any], fields_set: collections.abc.Set[str]) -> M:
+    """
+    和 model_construct 的结果相同，但跳过默认值和别名的处理，所有字段都已经给出
+    model_construct 每次都要遍历字段定义，构造一行的开销是这里的十几倍
+    """
+    obj = model.__new__(model)
+    object.__setattr__(obj, "__dict__", fields)
+    object.__setattr__(obj, "__pydantic_fields_set__", set(fields_set))
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
+
+
+def wrapped_field(values: collections.abc.Sequence[typing.Any]) -> str | None:
+    """所有值都是同一个只有一个字段的模型时，返回该字段名"""
+    model = type(values[0])
+    if not isinstance(values[0], pydantic.BaseModel) or len(model.model_fields) != 1:
+        return None
+    if any(type(value) is not model for value in values):
+        return None
+    fields_set = set(model.model_fields)
+    if any(value.model_fields_set != fields_set for value in values):
+        return None  # 重新构造时无法还原 fields_set
+    return next(iter(model.model_fields))
+
+
+def typecode(values: collections.abc.Sequence[typing.Any]) -> str | None:
+    """能放入 array 时返回 array 的类型码，values 要遍历两遍，不能是迭代器"""
+    kinds = {type(value) for value in values}
+    if kinds == {bool}:
+        return "b"
+    if kinds == {int}:
+        return "q" if all(value in INT64 for value in values) else None
+    if kinds == {float}:
+        return "d"
+    return None
+
+
+def build_array(values: list[typing.Any], code: str, nulls: bytearray | None) -> array.array[typing.Any]:
+    zero = 0.0 if code == "d" else 0
+    return array.array(code, (zero if value is None else value for value in values) if nulls is not None else values)
+
+
+def build_column(values: list[typing.Any]) -> Column:  # noqa: PLR0911
+    """根据一列的实际取值选择存储方式"""
+    if len(values) != 0 and constant(values):
+        return ConstColumn(values[0], len(values))
+    present = [value for value in values if value is not None]
+    nulls = bytearray(value is None for value in values) if len(present) != len(values) else None
+    if len(present) != 0:
+        first = present[0]
+        if isinstance(first, enum.Enum) and all(type(value) is type(first) for value in present):
+            members = list(type(first))
+            if len(members) <= 2**16:
+                codes = {member: code for code, member in enumerate(members)}
+                raw = array.array("H", (0 if value is None else codes[value] for value in values))
+                return ArrayColumn(raw, members.__getitem__, nulls, encode=codes.__getitem__)
+        code = typecode(present)
+        if code is not None:
+            return ArrayColumn(build_array(values, code, nulls), bool if code == "b" else None, nulls)
+        field = wrapped_field(present)
+        # 取值种类少的（比如各种倍率）共享对象更好，访问时不用重新构造模型
+        inner = [getattr(value, field) for value in present] if field is not None else []
+        if field is not None and len(set(inner)) * SHARE_RATIO > len(present):
+            model = type(first)
+            code = typecode(inner)
+            if code is not None:
+                unwrapped = [None if value is None else getattr(value, field) for value in values]
+
+                fields_set = frozenset((field,))
+
+                def decode(value: typing.Any) -> typing.Any:
+                    return construct(model, {field: value}, fields_set)
+
+                raw = build_array(unwrapped, code, nulls)
+                return ArrayColumn(raw, decode, nulls, encode=operator.attrgetter(field), field=field)
+    return ObjectColumn(share(values))
+
+
+def constant(values: list[typing.Any]) -> bool:
+    """所有值都相等且可哈希，可哈希是为了避免多行共享同一个可变对象"""
+    first = values[0]
+    try:
+        _ = hash(first)
+    except TypeError:
+        return False
+    return all(value is first or (type(value) is type(first) and value == first) for value in values)
+
+
+def share(values: list[typing.Any]) -> list[typing.Any]:
+    """字符串驻留，可哈希的值相同的只保留一份"""
+    shared: dict[tuple[type, typing.Any], typing.Any] = {}
+    result: list[typing.Any] = []
+    for value in values:
+        if isinstance(value, str):
+            result.append(sys.intern(value))
+            continue
+        try:
+            result.append(shared.setdefault((type(value), value), value))
+        except TypeError:  # 列表、字典等不可哈希的值
+            result.append(value)
+    return result
+
+
+class Table(collections.abc.Mapping[int, M]):
+    """
+    按列存储的 ID 到模型的映射，迭代顺序和构造时相同
+
+    ID 存为排序后的 array 并用二分查找，不再为每行保留一个字典项
+    indexes 声明需要索引的字段，第一次查询时才构建字段值到行号的索引
+    """
+
+    def __init__(
+        self, model: type[M], rows: collections.abc.Mapping[int, M], *, indexes: collections.abc.Iterable[str] = ()
+    ):
+        self.model: type[M] = model
+        self.indexes: frozenset[str] = frozenset(indexes)
+        self.__indexes: dict[str, dict[typing.Any, array.array[int]]] = {}
+        self.__keys: array.array[int] = array.array("q", rows.keys())
+        order = sorted(range(len(self.__keys)), key=self.__keys.__getitem__)
+        self.__sorted: array.array[int] = array.array("q", (self.__keys[position] for position in order))
+        # ID 本来就有序时（大多数表都是），行号就是二分查找的结果
+        self.__order: array.array[int] | None = None if order == list(range(len(order))) else array.array("L", order)
+        models = list(rows.values())
+        self.__columns: dict[str, Column] = {
+            name: build_column([row.__dict__[name] for row in models]) for name in model.model_fields
+        }
+        self.__fields_set: Column = build_column([frozenset(row.model_fields_set) for row in models])
+        self.__getters: list[tuple[str, typing.Callable[[int], typing.Any]]] = [
+            (name, column.get) for name, column in self.__columns.items()
+        ]
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __iter__(self) -> collections.abc.Iterator[int]:
+        return iter(self.__keys)
+
+    def __getitem__(self, key: int) -> M:
+        position = self.position(key)
+        if position is None:
+            raise KeyError(key)
+        return self.row(position)
+
+    @typing_extensions.override
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, int) and self.position(key) is not None
+
+    @typing_extensions.override
+    def values(self) -> collections.abc.ValuesView[M]:
+        return TableValues(self)
+
+    def position(self, key: int) -> int | None:
+        """ID 对应的行号"""
+        index = bisect.bisect_left(self.__sorted, key)
+        if index == len(self.__sorted) or self.__sorted[index] != key:
+            return None
+        return index if self.__order is None else self.__order[index]
+
+    def key(self, position: int) -> int:
+        return self.__keys[position]
+
+    def row(self, position: int) -> M:
+        """按行号构造模型"""
+        fields = {name: get(position) for name, get in self.__getters}
+        return construct(self.model, fields, self.__fields_set.get(position))
+
+    def column(self, name: str) -> Column:
+        """按字段名取出一列，用于整表扫描，行号和 row() 相同"""
+        return self.__columns[name]
+
+    def index(self, name: str) -> dict[typing.Any, array.array[int]]:
+        """声明过的字段的索引，字段值到按顺序排列的行号"""
+        if name not in self.indexes:
+            raise KeyError(name)
+        index = self.__indexes.get(name)
+        if index is None:
+            index = self.__indexes[name] = {}
+            for position, value in enumerate(self.__columns[name]):
+                if value in index:
+                    index[value].append(position)
+                else:
+                    index[value] = array.array("L", (position,))
+        return index
+
+    def memory(self) -> int:
+        """按列计算的内存占用，数值列按 array 大小，其他列抽样估计"""
+        size = sys.getsizeof(self.__keys) + sys.getsizeof(self.__sorted)
+        if self.__order is not None:
+            size += sys.getsizeof(self.__order)
+        return size + sum(column.memory() for column in self.__columns.values())
+
+
+class TableValues(collections.abc.ValuesView[M]):
+    """按存储顺序逐行构造，不经过 ID 查找"""
+
+    _mapping: Table[M]
+
+    def __init__(self, table: Table[M]):
+        super().__init__(table)
+
+    @typing_extensions.override
+    def __iter__(self) -> collections.abc.Iterator[M]:
+        return map(self._mapping.row, range(len(self._mapping)))
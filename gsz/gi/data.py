@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import collections
 import collections.abc
 import enum
 import functools
 import itertools
-import json
 import pathlib
 import typing
 
@@ -13,8 +13,9 @@ import jinja2
 import pydantic
 import xxhash
 
+from .. import aio, budget, instrument, reload
 from ..format import Formatter, Syntax
-from . import view
+from . import stream, view
 
 if typing.TYPE_CHECKING:
     from . import excel
@@ -55,6 +56,22 @@ def file_name_generator(method_name: str) -> str:
     return "".join(word.upper() if word in ABBR_WORDS else word.capitalize() for word in method_name.split("_"))
 
 
+RECORDER: typing.Final = instrument.Recorder()
+"""所有 GameData 共享的加载统计，是进程级别的，表的缓存在各个 GameData 上"""
+
+LOADERS: typing.Final[dict[str, typing.Callable[[GameData], collections.abc.Awaitable[None]]]] = {}
+"""访问方法名到异步加载整张表，由装饰器在定义时注册，用于 GameData.aload"""
+
+ACCESSORS: typing.Final[dict[str, reload.Accessor]] = {}
+"""访问方法名到装饰器，由装饰器在定义时注册，用于 GameData.invalidate 检查表名和 gsz.synthetic 生成数据"""
+
+
+def find_file(path: pathlib.Path, file_names: tuple[str, ...], suffix: str = "") -> pathlib.Path | None:
+    """第一个文件名加上 suffix 后缀，之后的按原样，按顺序返回第一个存在的"""
+    candidates = [path / f"{file_names[0]}{suffix}.json", *(path / f"{name}.json" for name in file_names[1:])]
+    return next((candidate for candidate in candidates if candidate.exists()), None)
+
+
 V = typing.TypeVar("V", bound="view.IView[excel.ModelID]")
 
 
@@ -75,11 +92,19 @@ class excel_bin_output(typing.Generic[V]):
     def __init__(self, typ: type[V], *file_names: str):
         self.__type = typ
         self.__file_names: tuple[str, ...] = file_names
-        self.__excel_output: dict[int, excel.ModelID] | None = None
+
+    @property
+    def model(self) -> type[excel.ModelID]:
+        return self.__type.ExcelBinOutput
+
+    @property
+    def path(self) -> str:
+        return f"ExcelBinOutput/{self.__file_names[0]}ExcelConfigData.json"
 
     def __call__(self, method: typing.Callable[..., None]) -> GameDataFunction[V]:
         if len(self.__file_names) == 0:
             self.__file_names = (file_name_generator(method.__name__),)
+        self.__stats = RECORDER.accessor(method.__name__)
 
         @typing.overload
         def fn(game: GameData) -> collections.abc.Iterable[V]: ...
@@ -90,38 +115,50 @@ class excel_bin_output(typing.Generic[V]):
         def fn(
             game: GameData, id: int | collections.abc.Iterable[int] | None = None
         ) -> V | collections.abc.Iterable[V] | None:
-            if self.__excel_output is None:
-                path = game.base / "ExcelBinOutput"
-                file_names = iter(self.__file_names)
-                file_path = path / (next(file_names) + "ExcelConfigData.json")
-                try:
-                    while not file_path.exists():
-                        file_path = path / (next(file_names) + ".json")
-                except StopIteration:
-                    self.__excel_output = {}
-                    return iter(()) if id is None or isinstance(id, collections.abc.Iterable) else None
-                finally:
-                    del self.__file_names  # 清理一下方便 GC
-                ExcelBinOutputList = pydantic.TypeAdapter(list[self.__type.ExcelBinOutput | None])
-                excels = json.loads(file_path.read_bytes())
-                try:
-                    excel_list = ExcelBinOutputList.validate_python(excels)
-                    self.__excel_output = {config.id: config for config in excel_list if config is not None}
-                except pydantic.ValidationError as exc:
-                    ExcelBinOutputDict = pydantic.TypeAdapter(dict[int, self.__type.ExcelBinOutput])
-                    try:
-                        self.__excel_output = ExcelBinOutputDict.validate_python(excels)
-                    except pydantic.ValidationError as former_structure_exc:
-                        raise former_structure_exc from exc
+            self.__stats.calls += 1
+            table = game._tables.get(self.__stats.name)
+            if table is None:
+                table = game._tables.store(self.__stats.name, self.__load(game))
+            excel_output = table.data
             if id is None:
-                return (self.__type(game, excel) for excel in self.__excel_output.values())
+                return (self.__type(game, excel) for excel in excel_output.values())
             if isinstance(id, collections.abc.Iterable):
-                return (self.__type(game, self.__excel_output[k]) for k in id)
-            excel = self.__excel_output.get(id)
+                return (self.__type(game, excel_output[k]) for k in id)
+            excel = excel_output.get(id)
             return None if excel is None else self.__type(game, excel)
 
+        LOADERS[method.__name__] = self.aload
+        ACCESSORS[method.__name__] = self
         return fn
 
+    def __load(self, game: GameData) -> reload.Table[dict[int, excel.ModelID]]:
+        file_path = find_file(game.base / "ExcelBinOutput", self.__file_names, "ExcelConfigData")
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        excel_output: dict[int, excel.ModelID]
+        if stream.is_array(file_path):
+            excel_list = stream.load(self.__type.ExcelBinOutput, file_path, self.__stats)
+            excel_output = {config.id: config for config in excel_list if config is not None}
+        else:
+            timer = instrument.Timer()
+            content = file_path.read_bytes()
+            self.__stats.decode += timer()
+            ExcelBinOutputDict = pydantic.TypeAdapter(dict[int, self.__type.ExcelBinOutput])
+            excel_output = ExcelBinOutputDict.validate_json(content)
+            self.__stats.validate += timer()
+        self.__stats.add_table(file_path, file_path.stat().st_size, excel_output)
+        return reload.Table(excel_output, source)
+
+    async def aload(self, game: GameData):
+        """
+        异步加载整张表，见 gsz.aio
+        大文件按流读取以限制内存，整个读取和校验都放在线程池中执行
+        """
+        if game._tables.get(self.__stats.name) is None:
+            table = await aio.COALESCER.run((game, self.__stats.name), lambda: asyncio.to_thread(self.__load, game))
+            _ = game._tables.store(self.__stats.name, table)
+
 
 class GameDataStringMethod(typing.Protocol[T_co]):
     @typing.overload
@@ -183,39 +220,58 @@ class excel_output_string(typing.Generic[VS]):
     def __init__(self, typ: type[VS], *file_names: str):
         self.__type = typ
         self.__file_names: tuple[str, ...] = file_names
-        self.__excel_output: dict[str, excel.ModelStringID] | None = None
+
+    @property
+    def model(self) -> type[excel.ModelStringID]:
+        return self.__type.ExcelBinOutput
+
+    @property
+    def path(self) -> str:
+        return f"ExcelBinOutput/{self.__file_names[0]}.json"
 
     def __call__(self, method: typing.Callable[..., None]) -> GameDataStringFunction[VS]:
         if len(self.__file_names) == 0:
             self.__file_names = (file_name_generator(method.__name__),)
+        self.__stats = RECORDER.accessor(method.__name__)
 
         @typing.overload
         def fn(game: GameData) -> collections.abc.Iterable[VS]: ...
         @typing.overload
         def fn(game: GameData, id: str) -> VS | None: ...
         def fn(game: GameData, id: str | None = None) -> VS | collections.abc.Iterable[VS] | None:
-            if self.__excel_output is None:
-                path = game.base / "ExcelBinOutput"
-                file_names = iter(self.__file_names)
-                file_path = path / (next(file_names) + ".json")
-                try:
-                    while not file_path.exists():
-                        file_path = path / (next(file_names) + ".json")
-                except StopIteration:
-                    self.__excel_output = {}
-                    return None
-                finally:
-                    del self.__file_names  # 清理一下方便 GC
-                ExcelBinOutputList = pydantic.TypeAdapter(list[self.__type.ExcelBinOutput])
-                excels = json.loads(file_path.read_bytes())
-                self.__excel_output = {config.id: config for config in ExcelBinOutputList.validate_python(excels)}
+            self.__stats.calls += 1
+            table = game._tables.get(self.__stats.name)
+            if table is None:
+                table = game._tables.store(self.__stats.name, self.__load(game))
+            excel_output = table.data
             if id is None:
-                return (self.__type(game, excel) for excel in self.__excel_output.values())
-            excel = self.__excel_output.get(id)
+                return (self.__type(game, excel) for excel in excel_output.values())
+            excel = excel_output.get(id)
             return None if excel is None else self.__type(game, excel)
 
+        LOADERS[method.__name__] = self.aload
+        ACCESSORS[method.__name__] = self
         return fn
 
+    def __load(self, game: GameData) -> reload.Table[dict[str, excel.ModelStringID]]:
+        file_path = find_file(game.base / "ExcelBinOutput", self.__file_names)
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        excel_list = filter(None, stream.load(self.__type.ExcelBinOutput, file_path, self.__stats))
+        excel_output = {config.id: config for config in excel_list}
+        self.__stats.add_table(file_path, file_path.stat().st_size, excel_output)
+        return reload.Table(excel_output, source)
+
+    async def aload(self, game: GameData):
+        """
+        异步加载整张表，见 gsz.aio
+        大文件按流读取以限制内存，整个读取和校验都放在线程池中执行
+        """
+        if game._tables.get(self.__stats.name) is None:
+            table = await aio.COALESCER.run((game, self.__stats.name), lambda: asyncio.to_thread(self.__load, game))
+            _ = game._tables.store(self.__stats.name, table)
+
 
 class GameDataMainSubMethod(typing.Protocol[T_co]):
     @typing.overload
@@ -288,11 +344,19 @@ class excel_output_main_sub(typing.Generic[MSV]):
     def __init__(self, typ: type[MSV], *file_names: str):
         self.__type = typ
         self.__file_names: tuple[str, ...] = file_names
-        self.__excel_output: dict[int, list[excel.ModelMainSubID]] | None = None
+
+    @property
+    def model(self) -> type[excel.ModelMainSubID]:
+        return self.__type.ExcelBinOutput
+
+    @property
+    def path(self) -> str:
+        return f"ExcelBinOutput/{self.__file_names[0]}.json"
 
     def __call__(self, method: typing.Callable[..., None]) -> GameDataMainSubFunction[MSV]:
         if len(self.__file_names) == 0:
             self.__file_names = (file_name_generator(method.__name__),)
+        self.__stats = RECORDER.accessor(method.__name__)
 
         @typing.overload
         def fn(game: GameData) -> collections.abc.Iterable[MSV]: ...
@@ -303,50 +367,59 @@ class excel_output_main_sub(typing.Generic[MSV]):
         def fn(
             game: GameData, main_id: int | None = None, sub_id: int | None = None
         ) -> MSV | collections.abc.Iterable[MSV] | None:
-            if self.__excel_output is None:
-                path = game.base / "ExcelBinOutput"
-                file_names = iter(self.__file_names)
-                file_path = path / (next(file_names) + ".json")
-                try:
-                    while not file_path.exists():
-                        file_path = path / (next(file_names) + ".json")
-                except StopIteration:
-                    self.__excel_output = {}
-                    return iter(()) if main_id is None or sub_id is None else None
-                finally:
-                    del self.__file_names  # 清理一下方便 GC
-                ExcelBinOutputList = pydantic.TypeAdapter(list[self.__type.ExcelBinOutput | None])
-                excels = json.loads(file_path.read_bytes())
-                try:
-                    excel_list = ExcelBinOutputList.validate_python(excels)
-                    self.__excel_output = collections.defaultdict(list)
-                    for excel in filter(None, excel_list):
-                        self.__excel_output[excel.main_id].append(excel)
-                except pydantic.ValidationError as exc:
-                    ExcelBinOutputDict = pydantic.TypeAdapter(dict[int, dict[int, self.__type.ExcelBinOutput]])
-                    try:
-                        excel_dict = ExcelBinOutputDict.validate_python(excels)
-                    except pydantic.ValidationError as former_structure_exc:
-                        raise former_structure_exc from exc
-                    self.__excel_output = {main_id: list(excel.values()) for main_id, excel in excel_dict.items()}
+            self.__stats.calls += 1
+            table = game._tables.get(self.__stats.name)
+            if table is None:
+                table = game._tables.store(self.__stats.name, self.__load(game))
+            excel_output = table.data
             match main_id, sub_id:
                 case None, None:
-                    excels = self.__excel_output.values()
+                    excels = excel_output.values()
                     return (self.__type(game, excel) for excel in itertools.chain.from_iterable(excels))
                 case main_id, None:
-                    return (self.__type(game, excel) for excel in self.__excel_output.get(main_id, ()))
+                    return (self.__type(game, excel) for excel in excel_output.get(main_id, ()))
                 case None, sub_id:
                     raise ValueError("main_id cannot be none when sub_id is not None")
                 case main_id, sub_id:
                     gen = (
-                        self.__type(game, excel)
-                        for excel in self.__excel_output.get(main_id, ())
-                        if excel.sub_id == sub_id
+                        self.__type(game, excel) for excel in excel_output.get(main_id, ()) if excel.sub_id == sub_id
                     )
                     return next(gen, None)
 
+        LOADERS[method.__name__] = self.aload
+        ACCESSORS[method.__name__] = self
         return fn
 
+    def __load(self, game: GameData) -> reload.Table[dict[int, list[excel.ModelMainSubID]]]:
+        file_path = find_file(game.base / "ExcelBinOutput", self.__file_names)
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        excel_output: dict[int, list[excel.ModelMainSubID]]
+        if stream.is_array(file_path):
+            excel_output = collections.defaultdict(list)
+            for excel in filter(None, stream.load(self.__type.ExcelBinOutput, file_path, self.__stats)):
+                excel_output[excel.main_id].append(excel)
+        else:
+            timer = instrument.Timer()
+            content = file_path.read_bytes()
+            self.__stats.decode += timer()
+            ExcelBinOutputDict = pydantic.TypeAdapter(dict[int, dict[int, self.__type.ExcelBinOutput]])
+            excel_dict = ExcelBinOutputDict.validate_json(content)
+            excel_output = {main_id: list(excel.values()) for main_id, excel in excel_dict.items()}
+            self.__stats.validate += timer()
+        self.__stats.add_table(file_path, file_path.stat().st_size, excel_output, sum(map(len, excel_output.values())))
+        return reload.Table(excel_output, source)
+
+    async def aload(self, game: GameData):
+        """
+        异步加载整张表，见 gsz.aio
+        大文件按流读取以限制内存，整个读取和校验都放在线程池中执行
+        """
+        if game._tables.get(self.__stats.name) is None:
+            table = await aio.COALESCER.run((game, self.__stats.name), lambda: asyncio.to_thread(self.__load, game))
+            _ = game._tables.store(self.__stats.name, table)
+
 
 NE_co = typing.TypeVar("NE_co", bound="excel.ModelID | excel.ModelMainSubID", covariant=True)
 
@@ -379,19 +452,20 @@ class excel_output_name(typing.Generic[NV]):
     def __init__(self, typ: type[NV], method: GameDataFunction[NV] | GameDataMainSubFunction[NV]):
         self.__type = typ
         self.__method = method
-        self.__excel_output: dict[str, list[excel.ModelID | excel.ModelMainSubID]] | None = None
 
-    def __call__(self, _method: typing.Callable[..., None]) -> typing.Callable[[GameData, str], list[NV]]:
+    def __call__(self, method: typing.Callable[..., None]) -> typing.Callable[[GameData, str], list[NV]]:
         def fn(game: GameData, name: str) -> list[NV]:
-            if self.__excel_output is None:
-                self.__excel_output = {}
+            index = game._indexes.get(method.__name__)
+            if index is None:
+                excel_output: dict[str, list[excel.ModelID | excel.ModelMainSubID]] = {}
                 for view in self.__method(game):
                     excel = view._excel  # pyright: ignore[reportPrivateUsage]
-                    if view.name in self.__excel_output:
-                        self.__excel_output[view.name].append(excel)
+                    if view.name in excel_output:
+                        excel_output[view.name].append(excel)
                     else:
-                        self.__excel_output[view.name] = [excel]
-            excel_list = self.__excel_output.get(name)
+                        excel_output[view.name] = [excel]
+                index = game._indexes.store(method.__name__, reload.Table(excel_output))
+            excel_list = index.data.get(name)
             return [] if excel_list is None else [self.__type(game, excel) for excel in excel_list]
 
         return fn
@@ -435,38 +509,135 @@ class GameData:
     def __init__(self, base: str | pathlib.Path, *, language: Language = Language.CHS):
         self.base: pathlib.Path = pathlib.Path(base)
         self.__default_language: Language = language
-        self.__text_map: dict[Language, dict[int, str]] = {}
-
-    def __load_text_map(self, language: Language) -> dict[int, str]:
+        self.__text_map: dict[Language, tuple[dict[int, str], instrument.TableStats]] = {}
+        self._tables: reload.Tables = reload.Tables()
+        """装饰器加载的表，按访问方法名存放"""
+        self._indexes: reload.Tables = reload.Tables()
+        """由表计算出的索引（比如按名字查找），表或 TextMap 变化时全部丢弃"""
+        # 已经加载的 TextMap 和加载时的文件状态，用于 watch
+        self.__text_map_files: dict[Language, tuple[pathlib.Path, reload.Signature | None]] = {}
+
+    def __text_map_path(self, language: Language) -> pathlib.Path:
         candidates = iter(language.candidates())
         text_map_path = self.base / "TextMap" / f"TextMap{next(candidates)}.json"
         while not text_map_path.exists():
             text_map_path: pathlib.Path = self.base / "TextMap" / f"TextMap{next(candidates)}.json"
-        text_map = text_map_path.read_bytes()
-        return pydantic.TypeAdapter(dict[int, str]).validate_json(text_map)
+        return text_map_path
+
+    @staticmethod
+    def __parse_text_map(text_map_path: pathlib.Path, content: bytes, stats: instrument.TableStats) -> dict[int, str]:
+        timer = instrument.Timer()
+        text_map = pydantic.TypeAdapter(dict[int, str]).validate_json(content)
+        stats.validate += timer()
+        stats.add_table(text_map_path, len(content), text_map)
+        return text_map
+
+    def __load_text_map(self, language: Language) -> tuple[dict[int, str], instrument.TableStats]:
+        text_map_path = self.__text_map_path(language)
+        self.__text_map_files[language] = text_map_path, reload.signature(text_map_path)
+        stats = RECORDER.table(f"TextMap{language.name}")
+        timer = instrument.Timer()
+        content = text_map_path.read_bytes()
+        stats.decode += timer()
+        return self.__parse_text_map(text_map_path, content, stats), stats
+
+    async def __aload_text_map(self, language: Language) -> tuple[dict[int, str], instrument.TableStats]:
+        text_map_path = self.__text_map_path(language)
+        self.__text_map_files[language] = text_map_path, reload.signature(text_map_path)
+        stats = RECORDER.table(f"TextMap{language.name}")
+        timer = instrument.Timer()
+        content = await aio.read_bytes(text_map_path)
+        stats.decode += timer()
+        return await asyncio.to_thread(self.__parse_text_map, text_map_path, content, stats), stats
+
+    def load_stats(self) -> list[instrument.TableStats]:
+        """
+        各表、各语言 TextMap 的加载统计，按加载耗时从高到低排序
+        统计是进程级别的，包含所有 GI GameData 的加载
+        """
+        return RECORDER.snapshot()
+
+    def watched_files(self) -> dict[pathlib.Path, reload.Signature | None]:
+        """已经加载的表、TextMap 和加载时的文件状态，供 watch 轮询"""
+        files = self._tables.sources()
+        files.update(list(self.__text_map_files.values()))
+        return files
+
+    def invalidate(
+        self, paths: collections.abc.Iterable[str | pathlib.Path] = (), tables: collections.abc.Iterable[str] = ()
+    ) -> list[str]:
+        """
+        丢弃从 paths（相对路径相对于 base）加载的表和 TextMap，以及 tables（访问方法名）中的表
+        有缓存被丢弃时由它们计算出的索引也一并丢弃，下次访问时重新加载，返回丢弃的缓存，见 gsz.reload
+        """
+        changed = {self.base.joinpath(path).resolve() for path in paths}
+        invalidated = self._tables.invalidate(ACCESSORS.keys(), changed, tables)
+        for language, (path, _) in list(self.__text_map_files.items()):
+            if path.resolve() in changed:
+                _ = self.__text_map.pop(language, None)
+                del self.__text_map_files[language]
+                budget.BUDGET.discard(self, f"TextMap{language.name}")
+                invalidated.append(f"TextMap{language.name}")
+        if len(invalidated) != 0:
+            reload.drop_cached_properties(self)
+            _ = self._indexes.clear()
+        return invalidated
+
+    def watch(self, interval: float = 1.0) -> reload.Watcher:
+        """在后台线程中每 interval 秒检查一次已经加载的文件，有变化时调用 invalidate，用返回值 stop"""
+        return reload.Watcher(self, interval).start()
+
+    async def aload(self, table: str) -> list[typing.Any]:
+        """异步加载整张表并返回全部行，table 为访问方法名，见 gsz.aio"""
+        loader = LOADERS.get(table)
+        if loader is None:
+            raise ValueError(f"unknown table {table!r}")
+        await loader(self)
+        return list(getattr(self, table)())
+
+    async def atext(self, key: Text, *, language: Language | None = None) -> str:
+        """同 text，TextMap 未加载时异步加载"""
+        language = language or Language.CHS
+        if language not in self.__text_map:
+            loaded = await aio.COALESCER.run((self, language), lambda: self.__aload_text_map(language))
+            _ = self.__store_text_map(language, loaded)
+        return self.text(key, language=language)
+
+    def __store_text_map(
+        self, language: Language, loaded: tuple[dict[int, str], instrument.TableStats]
+    ) -> tuple[dict[int, str], instrument.TableStats]:
+        loaded = self.__text_map.setdefault(language, loaded)
+        budget.BUDGET.add(self, f"TextMap{language.name}", loaded[0], lambda game: game.__evict_text_map(language))
+        return loaded
+
+    def __evict_text_map(self, language: Language):
+        _ = self.__text_map.pop(language, None)
+        _ = self.__text_map_files.pop(language, None)
 
     def text(self, key: Text, *, language: Language | None = None) -> str:
         language = language or Language.CHS
-        if language not in self.__text_map:
-            text_map = self.__load_text_map(language)
-            self.__text_map[language] = text_map
+        loaded = self.__text_map.get(language)
+        if loaded is None:
+            loaded = self.__store_text_map(language, self.__load_text_map(language))
         else:
-            text_map = self.__text_map[language]
+            budget.BUDGET.touch(self, f"TextMap{language.name}")
+        text_map, stats = loaded
+        stats.calls += 1
         return text_map.get(key, "")
 
-    @functools.cached_property
+    @budget.cached_property
     def _plain_formatter(self) -> Formatter:
         return Formatter(game=self)
 
-    @functools.cached_property
+    @budget.cached_property
     def _mw_formatter(self) -> Formatter:
         return Formatter(syntax=Syntax.MediaWiki, game=self)
 
-    @functools.cached_property
+    @budget.cached_property
     def _mw_pretty_formatter(self) -> Formatter:
         return Formatter(syntax=Syntax.MediaWikiPretty, game=self)
 
-    @functools.cached_property
+    @budget.cached_property
     def _template_environment(self) -> jinja2.Environment:
         self_path = pathlib.Path(__file__)
         templates_path = self_path.parent / "templates"
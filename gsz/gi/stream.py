@@ -0,0 +1,129 @@
+"""
+ExcelBinOutput 流式读取
+
+部分 ExcelConfigData 有几百 MB，一次性 json.loads 会把所有字段都变成 Python 对象
+这里按块读取文件，逐项解析顶层数组，只保留模型声明过的字段并立即校验，峰值内存只和保留下来的数据量有关
+"""
+
+import codecs
+import collections.abc
+import functools
+import json
+import pathlib
+import typing
+
+import pydantic
+
+from .. import instrument
+
+CHUNK_SIZE: typing.Final = 1 << 20
+WHITESPACE: typing.Final = " \t\n\r"
+
+M = typing.TypeVar("M", bound=pydantic.BaseModel)
+
+
+@functools.cache
+def projected_keys(model: type[pydantic.BaseModel]) -> frozenset[str]:
+    """模型校验时可能读取的所有顶层键：字段名、alias、validation_alias（AliasPath 取第一段）"""
+    keys: set[str] = set()
+    for name, info in model.model_fields.items():
+        keys.add(name)
+        if info.alias is not None:
+            keys.add(info.alias)
+        aliases = info.validation_alias
+        choices = aliases.choices if isinstance(aliases, pydantic.AliasChoices) else [aliases]
+        for choice in choices:
+            if isinstance(choice, str):
+                keys.add(choice)
+            elif isinstance(choice, pydantic.AliasPath) and isinstance(choice.path[0], str):
+                keys.add(choice.path[0])
+    return frozenset(keys)
+
+
+def is_array(path: pathlib.Path) -> bool:
+    """2.3 及之前的文件顶层是 Object，之后是 Array"""
+    with path.open("rb") as file:
+        head = file.read(64).lstrip()
+    return head.startswith(b"[")
+
+
+def iter_array(file: typing.BinaryIO, chunk_size: int = CHUNK_SIZE) -> collections.abc.Iterator[typing.Any]:
+    """逐项返回顶层 JSON Array 中的元素，每次只在内存中保留一块文件内容"""
+    decoder = json.JSONDecoder()
+    reader = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer, pos, eof = "", 0, False
+
+    def fill() -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = file.read(chunk_size)
+        eof = len(chunk) == 0
+        buffer = buffer[pos:] + reader.decode(chunk, final=eof)
+        pos = 0
+        return not eof or len(buffer) != 0
+
+    def skip() -> str:
+        """跳过空白，返回下一个字符，文件结束时返回空串"""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return buffer[pos : pos + 1]
+
+    if skip() != "[":
+        raise ValueError("top-level JSON value is not an array")
+    pos += 1
+    if skip() == "]":
+        return
+    while True:
+        _ = skip()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # 可能只是这一项还没读完，读完整个文件仍然失败才是格式错误
+                if eof:
+                    raise
+                _ = fill()
+                continue
+            # 数字可能恰好被块边界截断（比如 -4. 被解析成 -4），要看到后面的分隔符才能确认
+            rest = end
+            while rest < len(buffer) and buffer[rest] in WHITESPACE:
+                rest += 1
+            if not eof and (rest == len(buffer) or buffer[rest] not in ",]"):
+                _ = fill()
+                continue
+            break
+        pos = end
+        yield value
+        separator = skip()
+        pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"expect ',' or ']' in JSON array, got {separator!r}")
+
+
+def load(
+    model: type[M], path: pathlib.Path, stats: instrument.TableStats | None = None
+) -> collections.abc.Iterator[M | None]:
+    """
+    流式读取文件，每一项只保留模型需要的字段后立即校验，null 项原样返回 None
+    传入 stats 时分别累计解码（含读取文件）和校验的耗时，不含调用方处理每一项的时间
+    """
+    keys = projected_keys(model)
+    adapter = pydantic.TypeAdapter(model | None)
+    with path.open("rb") as file:
+        timer = instrument.Timer()
+        for row in iter_array(file):
+            if isinstance(row, dict):
+                row = {key: val for key, val in row.items() if key in keys}  # noqa: PLW2901
+            decoded = timer()
+            item = adapter.validate_python(row)
+            if stats is not None:
+                stats.decode += decoded
+                stats.validate += timer()
+            yield item
+            _ = timer()
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from ..excel import Element, avatar
 from .base import View
@@ -18,11 +18,11 @@ class Avatar(View[excel.Avatar]):
     def id(self) -> int:
         return self._excel.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name_text_map_hash)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.desc_text_map_hash)
 
@@ -42,7 +42,7 @@ class Avatar(View[excel.Avatar]):
     def is_playable(self) -> bool:
         return self._excel.use_type is avatar.UseType.Formal and not self.name.endswith("(试用)")
 
-    @functools.cached_property
+    @slotted.cached_property
     def element(self) -> Element | None:  # 目前看只有主角是 None
         skill = self.__skill_depot.energy_skill()
         if skill is None:
@@ -51,7 +51,7 @@ class Avatar(View[excel.Avatar]):
             return None
         return skill._excel.cost_elem_type
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skill_depot(self) -> AvatarSkillDepot:
         skill_depot = self._game.avatar_skill_depot(self._excel.skill_depot_id)
         assert skill_depot is not None
@@ -64,11 +64,11 @@ class Avatar(View[excel.Avatar]):
 class AvatarSkill(View[excel.AvatarSkill]):
     ExcelBinOutput: typing.Final = excel.AvatarSkill
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name_text_map_hash)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.desc_text_map_hash)
 
@@ -76,14 +76,14 @@ class AvatarSkill(View[excel.AvatarSkill]):
 class AvatarSkillDepot(View[excel.AvatarSkillDepot]):
     ExcelBinOutput: typing.Final = excel.AvatarSkillDepot
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skills(self) -> tuple[AvatarSkill, ...]:
         return tuple(self._game.avatar_skill(filter(None, self._excel.skills)))
 
     def skills(self) -> collections.abc.Iterable[AvatarSkill]:
         return (AvatarSkill(self._game, skill._excel) for skill in self.__skills)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __energy_skill(self) -> AvatarSkill | None:  # 只有测试数据和主角是 None
         return self._game.avatar_skill(self._excel.energy_skill)
 
@@ -1,5 +1,6 @@
 import typing
 
+from ... import slotted
 from ..excel import ModelID, ModelMainSubID, ModelStringID
 
 if typing.TYPE_CHECKING:
@@ -15,7 +16,9 @@ class IView(typing.Protocol[E_co]):  # pyright: ignore[reportInvalidTypeVarUse]
     def __init__(self, game: "GameData", excel: E_co): ...
 
 
-class View(typing.Generic[E_co]):
+class View(slotted.Slotted, typing.Generic[E_co]):
+    __slots__ = ("_game", "_excel")
+
     def __init__(self, game: "GameData", excel: E_co):
         self._game: GameData = game
         self._excel: E_co = excel
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import functools
 import typing
 
 from gsz.gi.view import avatar
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -19,7 +19,7 @@ class Npc(View[excel.Npc]):
     def id(self) -> int:
         return self._excel.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def __avatar(self) -> avatar.Avatar | None:
         if self._excel.avatar_id == 0:
             return None
@@ -32,6 +32,6 @@ class Npc(View[excel.Npc]):
 
         return Avatar(self._game, self.__avatar._excel) if self.__avatar is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name_text_map_hash)
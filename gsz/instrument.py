@@ -0,0 +1,201 @@
+"""
+加载统计
+
+记录每张表（ExcelOutput、ExcelBinOutput、FileCfg）、每种语言的 TextMap、每类剧情文件的加载开销：
+文件大小、行数、解码耗时、校验耗时、大致占用的内存，以及访问次数
+
+解码指读取文件并解析 JSON；pydantic 直接 validate_json 时解析和校验无法拆开，解码只计读取文件的耗时
+内存是抽样若干行递归计算 sys.getsizeof 再按行数放大得到的估计值，行间共享的对象（如驻留的字符串）会被重复计算
+表被 budget 淘汰或者 invalidate 后重新加载时，行数和内存取最后一次加载的值，耗时和文件大小累加，另外记录加载次数
+
+统计是进程级别的，同一个游戏的多个 GameData 共享一份统计，表的缓存则在各个 GameData 上
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import dataclasses
+import enum
+import itertools
+import sys
+import time
+import typing
+
+import pydantic
+
+from . import columnar  # columnar 也导入了 instrument，两边都只在函数中用到对方
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+M = typing.TypeVar("M", bound=pydantic.BaseModel)
+
+SAMPLE: typing.Final = 32
+"""估计内存时抽样的行数"""
+
+
+@dataclasses.dataclass
+class TableStats:
+    name: str
+    """访问方法名，TextMap 为 TextMap 文件名，剧情文件为模型名"""
+    path: pathlib.Path | None = None
+    """最后一次加载的文件"""
+    files: int = 0
+    """读取的文件数，重新加载时累加"""
+    size: int = 0
+    """读取的文件大小（字节），多个文件和重新加载时为总和"""
+    loads: int = 0
+    """整表加载的次数，被 budget 淘汰或者 invalidate 后重新加载时增加"""
+    rows: int = 0
+    """最后一次整表加载的行数，剧情文件为读取的文件数"""
+    decode: float = 0.0
+    """读取和解析 JSON 的耗时（秒）"""
+    validate: float = 0.0
+    """pydantic 校验的耗时（秒）"""
+    memory: int = 0
+    """最后一次整表加载大致占用的内存（字节），重新加载时替换而不是累加"""
+    calls: int = 0
+    """访问次数"""
+
+    @property
+    def elapsed(self) -> float:
+        return self.decode + self.validate
+
+    def add_file(self, path: pathlib.Path, size: int):
+        self.path = path
+        self.files += 1
+        self.size += size
+
+    def add_table(
+        self,
+        path: pathlib.Path,
+        size: int,
+        table: collections.abc.Mapping[typing.Any, typing.Any],
+        rows: int | None = None,
+    ):
+        """记录一次整表加载，rows 默认为表的长度"""
+        self.add_file(path, size)
+        self.loaded(len(table) if rows is None else rows, estimate(table))
+
+    def loaded(self, rows: int, memory: int):
+        """记录一次整表加载完成，行数和内存替换为这次加载的值"""
+        self.loads += 1
+        self.rows = rows
+        self.memory = memory
+
+
+class Recorder:
+    """一个游戏的所有加载统计"""
+
+    def __init__(self):
+        self.__tables: dict[str, TableStats] = {}
+        self.__accessors: list[str] = []
+
+    def table(self, name: str) -> TableStats:
+        stats = self.__tables.get(name)
+        if stats is None:
+            stats = self.__tables[name] = TableStats(name)
+        return stats
+
+    def accessor(self, name: str) -> TableStats:
+        """表访问方法的统计，由 GameData 上的装饰器在定义时注册"""
+        self.__accessors.append(name)
+        return self.table(name)
+
+    def accessors(self) -> tuple[str, ...]:
+        """所有注册过的表访问方法名，可以用来加载所有表"""
+        return tuple(self.__accessors)
+
+    def snapshot(self) -> list[TableStats]:
+        """所有被访问或加载过的统计的副本，按加载耗时从高到低排序"""
+        tables = (dataclasses.replace(stats) for stats in self.__tables.values() if stats.calls or stats.files)
+        return sorted(tables, key=lambda stats: stats.elapsed, reverse=True)
+
+    def load_json(self, model: type[M], path: pathlib.Path) -> M:
+        """
+        读取并校验一个 JSON 文件，按模型名汇总统计，用于剧情之类数量很多的小文件
+        这些文件读取后大多不会常驻内存，不估计内存
+        """
+        stats = self.table(model.__name__)
+        stats.calls += 1
+        timer = Timer()
+        content = path.read_bytes()
+        stats.decode += timer()
+        result = model.model_validate_json(content)
+        stats.validate += timer()
+        stats.add_file(path, len(content))
+        stats.rows += 1
+        return result
+
+
+def sizeof(obj: object, seen: set[int] | None = None) -> int:
+    """递归计算对象占用的内存，None、布尔值和枚举成员是全局共享的，不计入"""
+    if obj is None or isinstance(obj, bool | enum.Enum):
+        return 0
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, pydantic.BaseModel):
+        size += sizeof(obj.__dict__, seen)
+    elif isinstance(obj, dict):
+        obj = typing.cast("dict[object, object]", obj)
+        size += sum(sizeof(key, seen) + sizeof(val, seen) for key, val in obj.items())
+    elif isinstance(obj, list | tuple | set | frozenset):
+        obj = typing.cast("collections.abc.Collection[object]", obj)
+        size += sum(sizeof(item, seen) for item in obj)
+    return size
+
+
+def estimate(container: collections.abc.Mapping[typing.Any, typing.Any] | collections.abc.Sequence[typing.Any]) -> int:
+    """抽样估计容器及其内容占用的内存，字典抽样键值对，列表抽样元素，按列存储的表按列计算"""
+    if isinstance(container, columnar.Table):
+        return container.memory()
+    if len(container) == 0:
+        return sys.getsizeof(container)
+    step = max(len(container) // SAMPLE, 1)
+    seen: set[int] = set()
+    if isinstance(container, collections.abc.Mapping):
+        sample = list(itertools.islice(container.items(), 0, step * SAMPLE, step))
+        sampled = sum(sizeof(key, seen) + sizeof(val, seen) for key, val in sample)
+    else:
+        sample = list(itertools.islice(container, 0, step * SAMPLE, step))
+        sampled = sum(sizeof(item, seen) for item in sample)
+    return sys.getsizeof(container) + sampled * len(container) // len(sample)
+
+
+class Timer:
+    """分段计时，每次调用返回距上次调用经过的秒数"""
+
+    def __init__(self):
+        self.__last = time.perf_counter()
+
+    def __call__(self) -> float:
+        now = time.perf_counter()
+        elapsed, self.__last = now - self.__last, now
+        return elapsed
+
+
+def report(tables: collections.abc.Iterable[TableStats], *, top: int | None = None) -> str:
+    """格式化为文本表格，按加载耗时从高到低"""
+    tables = sorted(tables, key=lambda stats: stats.elapsed, reverse=True)[:top]
+    lines = [
+        f"{'name':<40} {'files':>6} {'size':>10} {'loads':>6} {'rows':>8} {'decode':>9} {'validate':>9} {'memory':>10} {'calls':>8}"
+    ]
+    lines.extend(
+        f"{stats.name:<40} {stats.files:>6} {human_size(stats.size):>10} {stats.loads:>6} {stats.rows:>8} "
+        f"{stats.decode * 1e3:>7.1f}ms {stats.validate * 1e3:>7.1f}ms {human_size(stats.memory) if stats.memory else '-':>10} {stats.calls:>8}"
+        for stats in tables
+    )
+    return "\n".join(lines)
+
+
+def human_size(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}GiB"
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import collections
+import collections.abc
+import typing
+
+
+class Entity(typing.NamedTuple):
+    kind: str
+    """实体类型，如 avatar、monster、item、aeon"""
+    id: int | str
+    """实体 ID，没有 ID 的实体（如星神）使用名字"""
+
+
+class Mention(typing.NamedTuple):
+    start: int
+    end: int
+    name: str
+    entities: tuple[Entity, ...]
+    """同名实体可能不止一个，比如同名不同 ID 的敌人"""
+
+
+class EntityMatcher:
+    """
+    实体提及匹配
+
+    用 Aho–Corasick 自动机一次性扫描文本，找出其中出现的所有实体名（角色、敌人、道具、星神等）
+    构建代价和所有实体名总长度成正比，扫描代价和文本长度加命中数量成正比，与实体数量无关
+    """
+
+    def __init__(self, entities: collections.abc.Iterable[tuple[Entity, str]]):
+        # 每个结点：子结点、失配指针、以该结点结尾的名字（已合并失配链上的名字）
+        self.__goto: list[dict[str, int]] = [{}]
+        self.__fail: list[int] = [0]
+        self.__output: list[tuple[str, ...]] = [()]
+        self.__entities: dict[str, list[Entity]] = {}
+        for entity, name in entities:
+            if name == "":
+                continue
+            if name in self.__entities:
+                if entity not in self.__entities[name]:
+                    self.__entities[name].append(entity)
+                continue
+            self.__entities[name] = [entity]
+            self.__insert(name)
+        self.__build()
+
+    def __insert(self, name: str):
+        node = 0
+        for char in name:
+            next_node = self.__goto[node].get(char)
+            if next_node is None:
+                next_node = len(self.__goto)
+                self.__goto[node][char] = next_node
+                self.__goto.append({})
+                self.__fail.append(0)
+                self.__output.append(())
+            node = next_node
+        self.__output[node] = (name,)
+
+    def __build(self):
+        queue = collections.deque(self.__goto[0].values())
+        while len(queue) != 0:
+            node = queue.popleft()
+            for char, child in self.__goto[node].items():
+                queue.append(child)
+                fail = self.__fail[node]
+                while fail != 0 and char not in self.__goto[fail]:
+                    fail = self.__fail[fail]
+                self.__fail[child] = self.__goto[fail].get(char, 0)
+                if len(self.__output[self.__fail[child]]) != 0:
+                    self.__output[child] += self.__output[self.__fail[child]]
+
+    def __len__(self) -> int:
+        return len(self.__entities)
+
+    def entities(self, name: str) -> tuple[Entity, ...]:
+        return tuple(self.__entities.get(name, ()))
+
+    def finditer(self, text: str) -> collections.abc.Iterator[Mention]:
+        """按结束位置顺序返回所有提及，包括相互重叠、嵌套的名字"""
+        goto, fail, output = self.__goto, self.__fail, self.__output
+        node = 0
+        for index, char in enumerate(text):
+            while node != 0 and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for name in output[node]:
+                yield Mention(index + 1 - len(name), index + 1, name, tuple(self.__entities[name]))
+
+    def search(self, text: str, kind: str | None = None) -> set[Entity]:
+        """文本中提到的所有实体，可以按实体类型过滤"""
+        return {
+            entity
+            for mention in self.finditer(text)
+            for entity in mention.entities
+            if kind is None or entity.kind == kind
+        }
+
+    def names(self, text: str, kind: str | None = None) -> set[str]:
+        """文本中提到的所有实体名，可以按实体类型过滤"""
+        return {
+            mention.name
+            for mention in self.finditer(text)
+            if kind is None or any(entity.kind == kind for entity in mention.entities)
+        }
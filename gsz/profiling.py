@@ -0,0 +1,220 @@
+"""
+性能剖析钩子
+
+启用后替换各视图的 wiki()、Formatter.format、jinja2 模板渲染以及 GameData 上的数据访问方法，
+记录每一层调用的耗时和嵌套关系，一个页面的耗时可以拆成数据访问、格式化、模板渲染几部分
+未启用时不替换任何方法，没有额外开销
+
+结果可以导出为火焰图工具（flamegraph.pl、speedscope 等）使用的 collapsed stack 格式：
+每行是分号分隔的调用栈和该栈自身（不含子调用）的耗时，单位为微秒
+
+只支持单线程，嵌套关系按调用顺序记录
+"""
+
+from __future__ import annotations
+
+import collections
+import collections.abc
+import contextlib
+import dataclasses
+import functools
+import importlib
+import inspect
+import pkgutil
+import time
+import typing
+
+import jinja2
+
+from . import gi, sr, zzz
+from .format import Formatter
+from .sr import act
+
+if typing.TYPE_CHECKING:
+    import pathlib
+    import types
+
+
+class Hook(typing.NamedTuple):
+    owner: type
+    attr: str
+    name: str | typing.Callable[..., str]
+    """栈帧名，可以是根据调用参数生成栈帧名的函数"""
+
+
+HookProvider = typing.Callable[[], collections.abc.Iterable[Hook]]
+
+PROVIDERS: list[HookProvider] = []
+"""启用时从这里收集所有需要替换的方法"""
+
+
+def register(provider: HookProvider) -> HookProvider:
+    PROVIDERS.append(provider)
+    return provider
+
+
+@dataclasses.dataclass
+class Total:
+    calls: int = 0
+    inclusive: float = 0.0
+    """含子调用的耗时，递归调用只计最外层"""
+    exclusive: float = 0.0
+    """不含子调用的耗时"""
+
+
+class Profiler:
+    def __init__(self):
+        # 每一层：栈帧名、开始时间、子调用耗时
+        self.__frames: list[list[typing.Any]] = []
+        self.__active: collections.Counter[str] = collections.Counter()
+        self.__stacks: dict[tuple[str, ...], float] = {}
+        self.__totals: dict[str, Total] = {}
+
+    def enter(self, name: str):
+        self.__frames.append([name, time.perf_counter(), 0.0])
+        self.__active[name] += 1
+
+    def exit(self):
+        end = time.perf_counter()
+        name, start, children = self.__frames.pop()
+        elapsed = end - start
+        stack = (*(frame[0] for frame in self.__frames), name)
+        self.__stacks[stack] = self.__stacks.get(stack, 0.0) + elapsed - children
+        if len(self.__frames) != 0:
+            self.__frames[-1][2] += elapsed
+        self.__active[name] -= 1
+        total = self.__totals.get(name)
+        if total is None:
+            total = self.__totals[name] = Total()
+        total.calls += 1
+        total.exclusive += elapsed - children
+        if self.__active[name] == 0:
+            total.inclusive += elapsed
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> collections.abc.Iterator[None]:
+        """手动标记一段代码，比如一次批量导出"""
+        self.enter(name)
+        try:
+            yield
+        finally:
+            self.exit()
+
+    def wrap(self, fn: typing.Callable[..., typing.Any], name: str | typing.Callable[..., str]) -> typing.Any:
+        @functools.wraps(fn)
+        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            self.enter(name if isinstance(name, str) else name(*args, **kwargs))
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.exit()
+
+        return wrapper
+
+    def totals(self) -> dict[str, Total]:
+        return {name: dataclasses.replace(total) for name, total in self.__totals.items()}
+
+    def collapsed(self) -> collections.abc.Iterator[str]:
+        """collapsed stack 格式，每个调用栈一行，耗时单位为微秒"""
+        for stack, elapsed in sorted(self.__stacks.items()):
+            yield f"{';'.join(stack)} {round(elapsed * 1e6)}"
+
+    def dump(self, path: pathlib.Path):
+        _ = path.write_text("".join(line + "\n" for line in self.collapsed()), encoding="utf-8")
+
+    def summary(self, top: int | None = None) -> str:
+        """按含子调用耗时从高到低的文本表格"""
+        totals = sorted(self.__totals.items(), key=lambda item: item[1].inclusive, reverse=True)[:top]
+        lines = [f"{'name':<48} {'calls':>8} {'total':>10} {'self':>10}"]
+        lines.extend(
+            f"{name:<48} {total.calls:>8} {total.inclusive * 1e3:>8.1f}ms {total.exclusive * 1e3:>8.1f}ms"
+            for name, total in totals
+        )
+        return "\n".join(lines)
+
+
+_profiler: Profiler | None = None
+_originals: list[tuple[type, str, typing.Any]] = []
+
+
+def enable() -> Profiler:
+    """替换所有注册的方法并开始记录，已经启用时返回正在使用的 Profiler"""
+    global _profiler  # noqa: PLW0603
+    if _profiler is not None:
+        return _profiler
+    profiler = _profiler = Profiler()
+    for provider in PROVIDERS:
+        for hook in provider():
+            original = vars(hook.owner)[hook.attr]
+            _originals.append((hook.owner, hook.attr, original))
+            setattr(hook.owner, hook.attr, profiler.wrap(original, hook.name))
+    return profiler
+
+
+def disable() -> Profiler | None:
+    """还原所有被替换的方法，返回之前使用的 Profiler"""
+    global _profiler  # noqa: PLW0603
+    profiler, _profiler = _profiler, None
+    while len(_originals) != 0:
+        owner, attr, original = _originals.pop()
+        setattr(owner, attr, original)
+    return profiler
+
+
+def submodules(
+    package: types.ModuleType, *, exclude: tuple[str, ...] = ()
+) -> collections.abc.Iterator[types.ModuleType]:
+    yield package
+    for module in pkgutil.walk_packages(package.__path__, package.__name__ + "."):
+        if not module.name.startswith(exclude):
+            yield importlib.import_module(module.name)
+
+
+def wiki_frame(view: object, *_args: object, **_kwargs: object) -> str:
+    return f"wiki:{type(view).__qualname__}"
+
+
+@register
+def views() -> collections.abc.Iterable[Hook]:
+    """各视图和剧情的 wiki()，剧情的数据模型（act.model）调用次数多、开销小，不计入"""
+    packages = (
+        submodules(sr.view),
+        submodules(act, exclude=(act.model.__name__,)),
+        submodules(gi.view),
+        submodules(zzz.view),
+    )
+    seen: set[type] = set()
+    for module in (module for modules in packages for module in modules):
+        for cls in vars(module).values():
+            if inspect.isclass(cls) and cls not in seen and inspect.isfunction(vars(cls).get("wiki")):
+                seen.add(cls)
+                yield Hook(cls, "wiki", wiki_frame)
+
+
+@register
+def formatter() -> collections.abc.Iterable[Hook]:
+    yield Hook(Formatter, "format", "format")
+
+
+def template_frame(template: jinja2.Template, *_args: object, **_kwargs: object) -> str:
+    return f"template:{template.name}"
+
+
+@register
+def templates() -> collections.abc.Iterable[Hook]:
+    yield Hook(jinja2.Template, "render", template_frame)
+
+
+def load_json_frame(_game: object, model: type, *_args: object, **_kwargs: object) -> str:
+    return f"data:{model.__name__}"
+
+
+@register
+def data_access() -> collections.abc.Iterable[Hook]:
+    """GameData 上的表访问方法、TextMap 查询、剧情文件读取，首次访问时的加载也计入"""
+    for module in (sr.data, gi.data, zzz.data):
+        game = module.GameData
+        yield from (Hook(game, accessor, f"data:{accessor}") for accessor in module.RECORDER.accessors())
+        yield Hook(game, "text", "data:text")
+        if "load_json" in vars(game):
+            yield Hook(game, "load_json", load_json_frame)
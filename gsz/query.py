@@ -0,0 +1,211 @@
+"""
+数据表查询
+
+在按列存储的表（gsz.columnar.Table）上按字段过滤、取值、计数，不用为每一行构造视图再逐个读属性：
+
+    game.query("monster_config").where(stance_weak_list__contains=Element.Fire, hp_modify_ratio__value__gt=1.5)
+    game.query("item_config").count_by("rarity", "item_main_type")
+
+where 的参数名为字段路径加上可选的运算符，用双下划线分隔，比如 hp_modify_ratio__value__gt
+多个条件、多次 where 之间都是且的关系
+
+数值、布尔、枚举列和拆开的单字段模型（TextHash、Value）直接在 array 上用 map 批量比较，
+声明了索引的字段做等值查询时只看索引中的行，其他列逐行取出字段值再比较，只有 rows() 才构造模型
+
+字段为 None 的行不满足任何比较，只能用 isnull 或者 eq=None、ne=None 匹配
+"""
+
+from __future__ import annotations
+
+import collections
+import collections.abc
+import dataclasses
+import itertools
+import operator
+import typing
+
+from . import columnar
+
+if typing.TYPE_CHECKING:
+    import pydantic
+
+M = typing.TypeVar("M", bound="pydantic.BaseModel")
+
+OPERATORS: typing.Final[dict[str, typing.Callable[[typing.Any, typing.Any], bool]]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "in": lambda value, values: value in values,
+    "contains": operator.contains,
+}
+"""运算符名到比较函数，比较函数的第一个参数是字段值"""
+
+ORDERED: typing.Final = frozenset(("lt", "le", "gt", "ge"))
+
+
+@dataclasses.dataclass(frozen=True)
+class Condition:
+    path: tuple[str, ...]
+    """字段名和子字段名"""
+    op: str
+    """运算符名，或者 isnull"""
+    value: typing.Any
+
+    @classmethod
+    def parse(cls, key: str, value: typing.Any, fields: collections.abc.Container[str]) -> Condition:
+        *path, op = key.split("__")
+        if op not in OPERATORS and op != "isnull":
+            path.append(op)
+            op = "eq"
+        if len(path) == 0 or path[0] not in fields:
+            raise ValueError(f"unknown field in condition {key!r}")
+        if op == "in":
+            value = frozenset(value)
+        if value is None and op in {"eq", "ne"}:
+            op, value = "isnull", op == "eq"
+        return cls(tuple(path), op, value)
+
+
+def getter(path: tuple[str, ...]) -> typing.Callable[[typing.Any], typing.Any]:
+    """按子字段路径取值，中间遇到 None 时结果为 None"""
+
+    def get(value: typing.Any) -> typing.Any:
+        for name in path:
+            if value is None:
+                return None
+            value = getattr(value, name)
+        return value
+
+    return get
+
+
+def column_values(
+    column: columnar.Column, positions: collections.abc.Sequence[int]
+) -> collections.abc.Iterable[typing.Any]:
+    if isinstance(column, columnar.ObjectColumn):
+        # 原样存放的值，不用经过 get
+        return column.raw if isinstance(positions, range) else map(column.raw.__getitem__, positions)
+    return map(column.get, positions)
+
+
+class Query(typing.Generic[M]):
+    """不可变的查询，where 返回新的查询，结果在第一次取用时计算并缓存"""
+
+    def __init__(self, table: columnar.Table[M], conditions: tuple[Condition, ...] = ()):
+        self.__table: columnar.Table[M] = table
+        self.__conditions: tuple[Condition, ...] = conditions
+        self.__positions: list[int] | None = None
+
+    def where(self, **conditions: typing.Any) -> Query[M]:
+        fields = self.__table.model.model_fields
+        parsed = tuple(Condition.parse(key, value, fields) for key, value in conditions.items())
+        return Query(self.__table, self.__conditions + parsed)
+
+    def positions(self) -> list[int]:
+        """满足条件的行号，按表中的顺序排列"""
+        if self.__positions is not None:
+            return self.__positions
+        conditions = list(self.__conditions)
+        positions: collections.abc.Sequence[int] = range(len(self.__table))
+        # 先用索引缩小范围，多个可以用索引的条件时取第一个，剩下的逐个过滤
+        for condition in conditions:
+            if len(condition.path) == 1 and condition.path[0] in self.__table.indexes and condition.op in {"eq", "in"}:
+                positions = self.__indexed(condition)
+                conditions.remove(condition)
+                break
+        for condition in conditions:
+            positions = self.__filter(condition, positions)
+        self.__positions = list(positions)
+        return self.__positions
+
+    def __indexed(self, condition: Condition) -> list[int]:
+        index = self.__table.index(condition.path[0])
+        if condition.op == "eq":
+            return list(index.get(condition.value, ()))
+        return sorted(itertools.chain.from_iterable(index.get(value, ()) for value in condition.value))
+
+    def __filter(self, condition: Condition, positions: collections.abc.Sequence[int]) -> list[int]:
+        column = self.__table.column(condition.path[0])
+        if isinstance(column, columnar.ConstColumn):
+            # 整列只有一个值，比较一次就知道全部满足还是全部不满足
+            value = getter(condition.path[1:])(column.value) if len(condition.path) > 1 else column.value
+            return list(positions) if self.__match([value], condition)[0] else []
+        if isinstance(column, columnar.ArrayColumn):
+            matched = self.__match_array(column, condition, positions)
+            if matched is not None:
+                return matched
+        values = column_values(column, positions)
+        if len(condition.path) > 1:
+            values = map(getter(condition.path[1:]), values)
+        return list(itertools.compress(positions, self.__match(values, condition)))
+
+    @staticmethod
+    def __match(values: collections.abc.Iterable[typing.Any], condition: Condition) -> list[bool]:
+        if condition.op == "isnull":
+            return [(value is None) == condition.value for value in values]
+        compare, operand = OPERATORS[condition.op], condition.value
+        return [value is not None and compare(value, operand) for value in values]
+
+    @staticmethod
+    def __match_array(  # noqa: PLR0911
+        column: columnar.ArrayColumn, condition: Condition, positions: collections.abc.Sequence[int]
+    ) -> list[int] | None:
+        """能在 array 上直接比较时返回结果，否则返回 None"""
+        if condition.op == "isnull":
+            if column.nulls is None:
+                return [] if condition.value else list(positions)
+            nulls = map(column.nulls.__getitem__, positions)
+            return list(itertools.compress(positions, (bool(null) == condition.value for null in nulls)))
+        value = condition.value
+        if condition.op == "contains":
+            return None
+        if len(condition.path) == 2 and column.field == condition.path[1]:
+            pass  # 拆开的单字段模型的字段，存储的就是字段值
+        elif len(condition.path) != 1:
+            return None
+        elif column.encode is not None:
+            if condition.op in ORDERED:
+                return None  # 枚举、模型没有大小关系
+            try:
+                value = frozenset(map(column.encode, value)) if condition.op == "in" else column.encode(value)
+            except (AttributeError, KeyError):
+                return None  # 不是该枚举的成员或者该模型，逐行比较
+        raw = column.raw if isinstance(positions, range) else map(column.raw.__getitem__, positions)
+        if condition.op == "in":
+            flags = map(value.__contains__, raw)
+        else:
+            flags = map(OPERATORS[condition.op], raw, itertools.repeat(value))
+        if column.nulls is not None:
+            # 空值在 array 中存为 0，需要排除
+            present = map(operator.not_, map(column.nulls.__getitem__, positions))
+            flags = map(operator.and_, flags, present)
+        return list(itertools.compress(positions, flags))
+
+    def __iter__(self) -> collections.abc.Iterator[M]:
+        return iter(self.rows())
+
+    def rows(self) -> list[M]:
+        """满足条件的行的模型"""
+        return [self.__table.row(position) for position in self.positions()]
+
+    def select(self, *fields: str) -> list[tuple[typing.Any, ...]]:
+        """满足条件的行的若干字段，字段路径和 where 一样用双下划线分隔子字段"""
+        if len(fields) == 0:
+            raise ValueError("select requires at least one field")
+        positions = self.positions()
+        return list(zip(*(self.__values(field, positions) for field in fields), strict=True))
+
+    def __values(self, field: str, positions: list[int]) -> list[typing.Any]:
+        name, *path = field.split("__")
+        values = column_values(self.__table.column(name), positions)
+        return list(map(getter(tuple(path)), values) if len(path) != 0 else values)
+
+    def count(self) -> int:
+        return len(self.positions())
+
+    def count_by(self, *fields: str) -> collections.Counter[tuple[typing.Any, ...]]:
+        """按若干字段分组计数"""
+        return collections.Counter(self.select(*fields))
@@ -0,0 +1,175 @@
+"""
+数据目录的热更新
+
+常驻进程（比如 gsz.serve）中，GameData 上的表、TextMap 和各种 functools.cached_property 索引都不会刷新
+GameData.invalidate(paths=..., tables=...) 丢弃指定文件或表对应的缓存，下次访问时重新加载
+GameData.watch() 在后台线程定时轮询已经加载过的文件，发现修改时间或大小变化就调用 invalidate
+
+只检查已经加载过的文件，没加载过的下次访问时本来就会读到新内容，所以数据目录再大轮询也只是几百次 stat
+GameData 上的索引由哪些表计算得出没有记录，任意表、TextMap 或剧情文件变化时全部丢弃，重建只需要遍历已经缓存的表
+表和索引都缓存在各自的 GameData 上（见 Tables），同一个游戏不同数据目录的 GameData 互不影响
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import threading
+import typing
+
+import typing_extensions
+
+from . import budget
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+    import pathlib
+
+    import pydantic
+
+T = typing.TypeVar("T")
+
+Signature = tuple[int, int]
+"""文件的修改时间（纳秒）和大小，文件不存在时为 None"""
+
+
+def signature(path: pathlib.Path) -> Signature | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class Accessor(typing.Protocol):
+    """data 中访问整张表的装饰器，定义时按访问方法名注册到各游戏 data 模块的 ACCESSORS"""
+
+    @property
+    def model(self) -> type[pydantic.BaseModel]:
+        """表中每一行的模型"""
+        ...
+
+    @property
+    def path(self) -> str:
+        """表文件相对数据目录的路径，有多个候选文件名时为第一个"""
+        ...
+
+
+@dataclasses.dataclass
+class Table(typing.Generic[T]):
+    data: T
+    source: tuple[pathlib.Path, Signature | None] | None = None
+    """加载的文件和读取前的文件状态，没有找到文件时为 None"""
+    columns: typing.Any = None
+    """按列存储的整表，用于 GameData.query，第一次查询时转换"""
+
+
+class Tables:
+    """
+    一个 GameData 已经加载的表（或由表计算出的索引），按访问方法名存放
+    加载后登记到内存预算（见 gsz.budget），被丢弃后下次访问时重新加载
+    """
+
+    def __init__(self):
+        self.__tables: dict[str, Table[typing.Any]] = {}
+
+    def get(self, name: str) -> Table[typing.Any] | None:
+        """已经加载的表，同时记录一次访问"""
+        table = self.__tables.get(name)  # 可能被 watch 的线程同时丢弃
+        if table is not None:
+            budget.BUDGET.touch(self, name)
+        return table
+
+    def store(self, name: str, table: Table[T]) -> Table[T]:
+        """保存刚加载的表，同一张表并发加载时以先保存的为准"""
+        stored = self.__tables.setdefault(name, table)
+        if stored is table:
+            budget.BUDGET.add(self, name, table.data, lambda tables: tables.pop(name))
+        return stored
+
+    def pop(self, name: str) -> Table[typing.Any] | None:
+        budget.BUDGET.discard(self, name)
+        return self.__tables.pop(name, None)
+
+    def clear(self) -> list[str]:
+        """丢弃所有表，返回丢弃的表名"""
+        names = list(self.__tables)
+        for name in names:
+            _ = self.pop(name)
+        return names
+
+    def sources(self) -> dict[pathlib.Path, Signature | None]:
+        """已经加载的表的文件和加载时的文件状态"""
+        tables = list(self.__tables.values())
+        return {table.source[0]: table.source[1] for table in tables if table.source is not None}
+
+    def invalidate(
+        self,
+        known: collections.abc.Set[str],
+        paths: collections.abc.Set[pathlib.Path],
+        names: collections.abc.Iterable[str],
+    ) -> list[str]:
+        """丢弃 names 中以及从 paths（已经 resolve）中加载的表，返回丢弃的表名，known 为所有的表名"""
+        invalidated = set(names)
+        unknown = invalidated - known
+        if unknown:
+            raise ValueError(f"unknown tables {sorted(unknown)!r}")
+        for name, table in list(self.__tables.items()):
+            if table.source is not None and table.source[0].resolve() in paths:
+                invalidated.add(name)
+        for name in invalidated:
+            _ = self.pop(name)
+        return sorted(invalidated)
+
+
+class Watchable(typing.Protocol):
+    def watched_files(self) -> dict[pathlib.Path, Signature | None]: ...
+
+    def invalidate(
+        self, paths: collections.abc.Iterable[str | pathlib.Path] = (), tables: collections.abc.Iterable[str] = ()
+    ) -> list[str]: ...
+
+
+def drop_cached_properties(obj: object):
+    """丢弃对象上所有已经计算过的 functools.cached_property"""
+    for klass in type(obj).__mro__:
+        for attribute in vars(klass).values():
+            if isinstance(attribute, functools.cached_property) and attribute.attrname is not None:
+                _ = vars(obj).pop(attribute.attrname, None)
+                budget.BUDGET.discard(obj, attribute.attrname)
+
+
+class Watcher:
+    """定时轮询 GameData 已经加载过的文件，用 GameData.watch 创建"""
+
+    def __init__(self, game: Watchable, interval: float = 1.0):
+        self.__game: Watchable = game
+        self.__interval: float = interval
+        self.__stopped: threading.Event = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def poll(self) -> list[str]:
+        """检查一次，返回丢弃的缓存"""
+        changed = [path for path, loaded in self.__game.watched_files().items() if signature(path) != loaded]
+        return self.__game.invalidate(paths=changed) if changed else []
+
+    def start(self) -> typing_extensions.Self:
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__run, name="gsz-watch", daemon=True)
+            self.__thread.start()
+        return self
+
+    def stop(self):
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __run(self):
+        while not self.__stopped.wait(self.__interval):
+            _ = self.poll()
+
+    def __enter__(self) -> typing_extensions.Self:
+        return self.start()
+
+    def __exit__(self, *_: object):
+        self.stop()
@@ -0,0 +1,266 @@
+"""
+常驻的数据服务
+
+每次运行 main.py 都要重新导入模型、加载 TextMap、校验数据表，同样的命令反复运行时大部分时间花在这里
+`main.py serve` 在一个进程中常驻，已经加载的 GameData 按数据目录缓存，之后的命令都在这个进程中执行：
+
+    python3 main.py serve /tmp/gsz.sock
+    python3 main.py --connect /tmp/gsz.sock --base ../TurnBasedGameData monster --name 卡芙卡
+    python3 achievement.py --connect /tmp/gsz.sock --base ../TurnBasedGameData --e-hkrpg-token @token
+
+协议为 Unix socket 上按行分隔的 JSON-RPC 2.0，一个连接可以依次发送多个请求（客户端见 gsz.client），方法有：
+
+- run(program, argv, cwd)：在 cwd 下运行命令，返回 stdout、stderr 和退出码
+- status()：运行时间、已处理的请求数、正在运行和排队的命令、已经加载的 GameData、内存预算的统计
+- cache(base=None)：各 GameData 的加载统计，同 GameData.load_stats
+- shutdown()：处理完正在运行的命令后退出
+
+命令依次执行：数据表的缓存不是线程安全的，命令之间也要切换工作目录和重定向输出，
+而且命令都是 CPU 密集的，有 GIL 在并行执行也不会更快
+排队的命令超过 max_pending 时直接返回错误，status 和 cache 不用排队，命令运行时也能立即返回
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import io
+import json
+import os
+import pathlib
+import socket
+import sys
+import threading
+import time
+import traceback
+import typing
+
+from . import budget, gi, reload, sr, zzz
+from .client import BUSY, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR, RemoteError, Result
+from .sr import sqlite
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+GameData = gi.GameData | sr.GameData | zzz.GameData
+
+Program = typing.Callable[[list[str]], object]
+"""运行一条命令，参数为命令行参数（不含程序名）"""
+
+
+def open_game(base: pathlib.Path) -> GameData | None:
+    """根据数据目录的结构判断是哪个游戏，base 是文件时为 gsz.sr.sqlite 导出的文件"""
+    if base.is_file():
+        return sqlite.GameData(base)
+    if base.joinpath("FileCfg").exists():
+        return zzz.GameData(base)
+    if base.joinpath("ExcelOutput").exists():
+        return sr.GameData(base)
+    if base.joinpath("ExcelBinOutput").exists():  # Genshin Impact
+        return gi.GameData(base)
+    return None
+
+
+class Games:
+    """按数据目录缓存 GameData，服务模式下同一目录的命令共用已经加载的表、TextMap 和各种索引"""
+
+    def __init__(self):
+        self.__games: dict[pathlib.Path, GameData | None] = {}
+        self.__lock: threading.Lock = threading.Lock()
+        self.__interval: float = 0.0
+        self.__watchers: list[reload.Watcher] = []
+
+    def open(self, base: str | pathlib.Path) -> GameData | None:
+        key = pathlib.Path(base).resolve()
+        with self.__lock:
+            if key not in self.__games:
+                game = self.__games[key] = open_game(key)
+                if game is not None and self.__interval > 0:
+                    self.__watchers.append(game.watch(self.__interval))
+            return self.__games[key]
+
+    def watch(self, interval: float):
+        """之后打开的 GameData 都每 interval 秒检查一次数据文件，有变化时丢弃对应的缓存，见 gsz.reload"""
+        with self.__lock:
+            self.__interval = interval
+            self.__watchers.extend(game.watch(interval) for game in self.__games.values() if game is not None)
+
+    def stop(self):
+        """停止所有 watch 的线程"""
+        with self.__lock:
+            for watcher in self.__watchers:
+                watcher.stop()
+            self.__watchers.clear()
+
+    def items(self, base: str | pathlib.Path | None = None) -> list[tuple[pathlib.Path, GameData]]:
+        """已经打开的 GameData，指定 base 时只返回该目录的"""
+        key = None if base is None else pathlib.Path(base).resolve()
+        with self.__lock:
+            return [(path, game) for path, game in self.__games.items() if game is not None and key in (None, path)]
+
+
+GAMES: typing.Final = Games()
+"""进程级别的 GameData 缓存，main.py 和 achievement.py 都从这里打开数据目录"""
+
+
+def execute(program: Program, argv: list[str], cwd: str) -> Result:
+    """在 cwd 下运行命令并收集输出，SystemExit 转为退出码，其他异常打印到 stderr"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    status = 0
+    start = time.perf_counter()
+    previous = os.getcwd()
+    try:
+        os.chdir(cwd)
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                _ = program(argv)
+            except SystemExit as exc:
+                if isinstance(exc.code, str):
+                    print(exc.code, file=sys.stderr)
+                    status = 1
+                else:
+                    status = exc.code or 0
+            except Exception:  # noqa: BLE001
+                traceback.print_exc()
+                status = 1
+    finally:
+        os.chdir(previous)
+    return Result(stdout.getvalue(), stderr.getvalue(), status, time.perf_counter() - start)
+
+
+class Server:
+    def __init__(
+        self,
+        path: str | pathlib.Path,
+        programs: collections.abc.Mapping[str, Program],
+        *,
+        games: Games = GAMES,
+        max_pending: int = 16,
+    ):
+        self.path: pathlib.Path = pathlib.Path(path)
+        self.__programs: collections.abc.Mapping[str, Program] = programs
+        self.__games: Games = games
+        self.__max_pending: int = max_pending
+        self.__pending: int = 0
+        """正在运行和排队的命令数"""
+        self.__requests: int = 0
+        self.__started: float = time.monotonic()
+        self.__lock: asyncio.Lock | None = None
+        self.__stopped: asyncio.Event | None = None
+
+    async def serve(self, ready: typing.Callable[[], object] | None = None):
+        """监听 socket 直到收到 shutdown，ready 在开始监听后调用"""
+        self.__lock, self.__stopped = asyncio.Lock(), asyncio.Event()
+        if self.path.exists():
+            if connectable(self.path):
+                raise FileExistsError(f"another server is listening on {self.path}")
+            self.path.unlink()  # 上次异常退出留下的 socket 文件
+        server = await asyncio.start_unix_server(self.__handle, path=self.path)
+        self.path.chmod(0o600)
+        try:
+            async with server:
+                if ready is not None:
+                    _ = ready()
+                _ = await self.__stopped.wait()
+        finally:
+            self.path.unlink(missing_ok=True)
+
+    async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                response = await self.__dispatch(line)
+                writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def __dispatch(self, line: bytes) -> dict[str, typing.Any]:  # noqa: PLR0911
+        self.__requests += 1
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            return error(None, PARSE_ERROR, str(exc))
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return error(None, INVALID_REQUEST, "invalid request")
+        request = typing.cast("dict[str, typing.Any]", request)
+        id_ = request.get("id")
+        params = request.get("params", {})
+        if not isinstance(params, dict):
+            return error(id_, INVALID_PARAMS, "params must be an object")
+        match request["method"]:
+            case "run":
+                method = self.run
+            case "status":
+                method = self.status
+            case "cache":
+                method = self.cache
+            case "shutdown":
+                method = self.shutdown
+            case name:
+                return error(id_, METHOD_NOT_FOUND, f"unknown method {name!r}")
+        try:
+            result = await method(**params)
+        except TypeError as exc:
+            return error(id_, INVALID_PARAMS, str(exc))
+        except RemoteError as exc:
+            return error(id_, exc.code, exc.message)
+        return {"jsonrpc": "2.0", "id": id_, "result": result}
+
+    async def run(self, program: str, argv: list[str], cwd: str) -> dict[str, typing.Any]:
+        runner = self.__programs.get(program)
+        if runner is None:
+            raise RemoteError(INVALID_PARAMS, f"unknown program {program!r}")
+        if self.__pending >= self.__max_pending:
+            raise RemoteError(BUSY, f"server busy, {self.__pending} commands pending")
+        assert self.__lock is not None
+        self.__pending += 1
+        try:
+            async with self.__lock:
+                result = await asyncio.get_running_loop().run_in_executor(None, execute, runner, argv, cwd)
+        finally:
+            self.__pending -= 1
+        return dataclasses.asdict(result)
+
+    async def status(self) -> dict[str, typing.Any]:
+        return {
+            "pid": os.getpid(),
+            "uptime": time.monotonic() - self.__started,
+            "requests": self.__requests,
+            "pending": self.__pending,
+            "running": self.__lock is not None and self.__lock.locked(),
+            "max_pending": self.__max_pending,
+            "games": [{"base": str(base), "game": type(game).__module__} for base, game in self.__games.items()],
+            "budget": dataclasses.asdict(budget.stats()),
+        }
+
+    async def cache(self, base: str | None = None) -> list[dict[str, typing.Any]]:
+        return [
+            {
+                "base": str(path),
+                "tables": [
+                    dataclasses.asdict(table) | {"path": None if table.path is None else str(table.path)}
+                    for table in game.load_stats()
+                ],
+            }
+            for path, game in self.__games.items(base)
+        ]
+
+    async def shutdown(self) -> None:
+        assert self.__stopped is not None
+        self.__stopped.set()
+
+
+def error(id_: typing.Any, code: int, message: str) -> dict[str, typing.Any]:
+    return {"jsonrpc": "2.0", "id": id_, "error": {"code": code, "message": message}}
+
+
+def connectable(path: pathlib.Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(path))
+        except OSError:
+            return False
+        return True
@@ -0,0 +1,82 @@
+"""
+带 __slots__ 的视图
+
+视图每次访问 GameData 的方法时都会新建，批量处理时会创建大量短命的对象
+普通类的实例都带一个 __dict__，存放 _game、_excel 和所有 cached_property 的结果
+Meta 在创建类时把类中的 cached_property 换成同名的槽，和类中声明的 __slots__ 合并，实例不再带有 __dict__
+
+cached_property 的结果存在同名的槽中，Meta 用 Cached 包装槽的描述符，之后的访问只多一层描述符调用
+槽还没有赋值时计算并写入槽，和 functools.cached_property 一样每个实例只计算一次；计算中抛出的 AttributeError 原样传出
+覆盖基类的 cached_property 时和基类共用一个槽，super() 读取基类的 cached_property 时槽未赋值则只计算不写入槽
+子类需要其他实例属性时要在类中声明 __slots__；多继承时只能有一个基类带有非空的 __slots__，另一个基类不带 __slots__ 时实例仍有 __dict__
+"""
+
+from __future__ import annotations
+
+import functools
+import typing
+
+T = typing.TypeVar("T")
+
+
+class cached_property(functools.cached_property[T]):
+    """同 functools.cached_property，用在 Slotted 的子类中，结果存在同名的槽中"""
+
+
+class Cached:
+    """包装槽的描述符，槽未赋值时计算 cached_property 并写入槽"""
+
+    def __init__(self, name: str, member: typing.Any, func: typing.Callable[[typing.Any], typing.Any]):
+        self.name: str = name
+        self.member: typing.Any = member
+        """槽本身的描述符，覆盖基类的 cached_property 时是基类的槽"""
+        self.func: typing.Callable[[typing.Any], typing.Any] = func
+        self.__doc__: str | None = func.__doc__
+
+    def __get__(self, instance: typing.Any, owner: type | None = None) -> typing.Any:
+        if instance is None:
+            return self
+        try:
+            return self.member.__get__(instance, owner)
+        except AttributeError:
+            pass  # 只捕获读槽的异常，不吞掉 func 中的 AttributeError
+        value = self.func(instance)
+        # 通过 super() 读取被覆盖的 cached_property 时不能占用子类的槽
+        if inherited((type(instance),), self.name) is self:
+            self.member.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: typing.Any, value: typing.Any):
+        self.member.__set__(instance, value)
+
+    def __delete__(self, instance: typing.Any):
+        self.member.__delete__(instance)
+
+
+class Meta(type):
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, typing.Any], **kwargs: typing.Any):
+        cached = {key: value for key, value in namespace.items() if isinstance(value, cached_property)}
+        slots: dict[str, str | None] = dict.fromkeys(namespace.get("__slots__", ()))
+        for key, value in cached.items():
+            del namespace[key]
+            # 覆盖基类的 cached_property 时沿用基类的槽
+            if not isinstance(inherited(bases, key), Cached):
+                slots[key] = value.__doc__
+        namespace["__slots__"] = slots
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        for key, value in cached.items():
+            member = vars(cls)[key] if key in slots else typing.cast("Cached", inherited(bases, key)).member
+            setattr(cls, key, Cached(key, member, value.func))
+        return cls
+
+
+def inherited(bases: tuple[type, ...], name: str) -> object:
+    for base in bases:
+        for klass in base.__mro__:
+            if name in vars(klass):
+                return vars(klass)[name]
+    return None
+
+
+class Slotted(metaclass=Meta):
+    __slots__ = ()
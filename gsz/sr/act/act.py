@@ -20,11 +20,7 @@ if typing.TYPE_CHECKING:
 class Act(Dialogue):
     def __init__(self, game: GameData, act: pathlib.Path | model.Act):
         self._game: GameData = game
-        self._act: model.Act = (
-            act
-            if isinstance(act, model.Act)
-            else model.Act.model_validate_json(game.base.joinpath(act).read_bytes())
-        )
+        self._act: model.Act = act if isinstance(act, model.Act) else game.load_json(model.Act, act)
 
     @functools.cached_property
     def __tasks(self) -> list[model.Task]:
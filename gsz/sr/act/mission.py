@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import functools
-import pathlib
 import typing
 
 from . import act, model
 
 if typing.TYPE_CHECKING:
+    import pathlib
+
     from ..data import GameData
 
 
@@ -14,9 +15,7 @@ class MissionInfo:
     def __init__(self, game: GameData, mission: model.MissionInfo | pathlib.Path):
         self._game: GameData = game
         self._mission: model.MissionInfo = (
-            mission
-            if isinstance(mission, model.MissionInfo)
-            else model.MissionInfo.model_validate_json(game.base.joinpath(mission).read_bytes())
+            mission if isinstance(mission, model.MissionInfo) else game.load_json(model.MissionInfo, mission)
         )
 
     def sub_missions(self) -> list[SubMission]:
@@ -32,8 +31,7 @@ class SubMission:
     def __act(self) -> model.act.Act | None:
         if self._mission.mission_json_path is None:
             return None
-        path = pathlib.Path(self._game.base.joinpath(self._mission.mission_json_path))
-        return model.act.Act.model_validate_json(path.read_bytes())
+        return self._game.load_json(model.act.Act, self._mission.mission_json_path)
 
     def act(self) -> act.Act | None:
         return None if self.__act is None else act.Act(self._game, self.__act)
@@ -35,7 +35,7 @@ class Dialogue(wiki.Dialogue):
 
     @functools.cached_property
     def __dialogue(self) -> model.Act:
-        return model.Act.model_validate_json(self.dialogue_path.read_bytes())
+        return self._game.load_json(model.Act, self.dialogue_path)
 
     def dialogue(self) -> Act:
         from .act import Act
@@ -50,7 +50,7 @@ class Dialogue(wiki.Dialogue):
     def __opt(self) -> model.Opt | None:
         if self.option_path is None:
             return None
-        return model.Opt.model_validate_json(self.option_path.read_bytes())
+        return self._game.load_json(model.Opt, self.option_path)
 
     @functools.cached_property
     def __options(self) -> list[Option]:
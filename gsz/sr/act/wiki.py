@@ -16,6 +16,31 @@ if typing.TYPE_CHECKING:
     from .task import Task
 
 
+AEON_NAMES: frozenset[str] = frozenset(
+    {
+        "阿基维利",
+        "纳努克",
+        "岚",
+        "博识尊",
+        "希佩",
+        "Ⅸ",
+        "克里珀",
+        "药师",
+        "奥博洛斯",
+        "阿哈",
+        "浮黎",
+        "伊德莉拉",
+        "塔伊兹育罗斯",
+        "迷思",
+        "互",
+        "末王",
+        "太一",
+        "龙",
+    }
+)
+"""星神名，对话中说话人是星神时 WIKI 模板需要额外标注"""
+
+
 class Dialogue(abc.ABC):
     _game: GameData
 
@@ -93,27 +118,6 @@ class Dialogue(abc.ABC):
     def _next_custom_string(self, custom_string: str) -> Sequence | None:
         return next((seq for seq in self._sequences if seq.wait_custom_string == custom_string), None)
 
-    __AEON_NAMES = {
-        "阿基维利",
-        "纳努克",
-        "岚",
-        "博识尊",
-        "希佩",
-        "Ⅸ",
-        "克里珀",
-        "药师",
-        "奥博洛斯",
-        "阿哈",
-        "浮黎",
-        "伊德莉拉",
-        "塔伊兹育罗斯",
-        "迷思",
-        "互",
-        "末王",
-        "太一",
-        "龙",
-    }
-
     @property
     def _formatter(self):
         return self._game._mw_formatter  # pyright: ignore[reportPrivateUsage]
@@ -134,7 +138,7 @@ class Dialogue(abc.ABC):
                 _ = wiki.write(indent)
                 _ = wiki.write("{{事件|")
                 name = self._formatter.format(talk.name)
-                if task.is_(model.task.PlayAeonTalk) or name in self.__AEON_NAMES:
+                if task.is_(model.task.PlayAeonTalk) or name in AEON_NAMES:
                     _ = wiki.write("星神|")
                 _ = wiki.write(name)
                 _ = wiki.write("|")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import collections
 import collections.abc
 import enum
@@ -13,15 +14,19 @@ import jinja2
 import pydantic
 import xxhash
 
+from .. import aio, budget, columnar, instrument, query, reload
 from ..format import Formatter, Syntax
-from . import view
+from ..mention import Entity, EntityMatcher
+from . import stat, view
+from .act.wiki import AEON_NAMES
 
 if typing.TYPE_CHECKING:
-    from . import excel
+    from . import excel, sqlite
     from .excel import Text
 
 
 T_co = typing.TypeVar("T_co", covariant=True)
+M = typing.TypeVar("M", bound=pydantic.BaseModel)
 
 
 class GameDataMethod(typing.Protocol[T_co]):
@@ -55,6 +60,27 @@ def file_name_generator(method_name: str) -> str:
     return "".join(word.upper() if word in ABBR_WORDS else word.capitalize() for word in method_name.split("_"))
 
 
+MENTION_KINDS: typing.Final = frozenset(("avatar", "monster", "item", "aeon"))
+"""GameData.mention_matcher 支持的实体类型"""
+
+RECORDER: typing.Final = instrument.Recorder()
+"""所有 GameData 共享的加载统计，是进程级别的，表的缓存在各个 GameData 上"""
+
+TABLES: typing.Final[dict[str, typing.Callable[[GameData], columnar.Table[typing.Any]]]] = {}
+"""访问方法名到按列存储的整表，由装饰器在定义时注册，用于 GameData.query"""
+
+LOADERS: typing.Final[dict[str, typing.Callable[[GameData], collections.abc.Awaitable[None]]]] = {}
+"""访问方法名到异步加载整张表，由装饰器在定义时注册，用于 GameData.aload"""
+
+ACCESSORS: typing.Final[dict[str, reload.Accessor]] = {}
+"""访问方法名到装饰器，由装饰器在定义时注册，用于 GameData.invalidate 检查表名和 gsz.synthetic 生成数据"""
+
+
+def find_file(path: pathlib.Path, file_names: tuple[str, ...]) -> pathlib.Path | None:
+    """按顺序返回第一个存在的 <file_name>.json"""
+    return next((path / f"{name}.json" for name in file_names if path.joinpath(f"{name}.json").exists()), None)
+
+
 V = typing.TypeVar("V", bound="view.IView[excel.ModelID]")
 
 
@@ -90,16 +116,43 @@ class excel_output(typing.Generic[V]):
         "1011": {"ID": 1011, "Attr": ""}
     }
     ```
+
+    columnar 为真时整表校验后转为按列存储（见 gsz.columnar），用于行数多的大表，按 ID 或整表访问时才构造模型
+    indexes 为 GameData.query 中等值查询常用的字段，第一次查询时建立索引
     """
 
-    def __init__(self, typ: type[V], *file_names: str):
+    def __init__(self, typ: type[V], *file_names: str, columnar: bool = False, indexes: tuple[str, ...] = ()):
         self.__type = typ
         self.__file_names: tuple[str, ...] = file_names
-        self.__excel_output: dict[int, excel.ModelID] | None = None
+        self.__columnar: bool = columnar
+        self.__indexes: tuple[str, ...] = indexes
+        self.__name: str = ""
+
+    @property
+    def model(self) -> type[excel.ModelID]:
+        return self.__type.ExcelOutput
+
+    @property
+    def path(self) -> str:
+        return f"ExcelOutput/{self.__file_names[0]}.json"
+
+    def columns(self, game: GameData) -> columnar.Table[excel.ModelID]:
+        """按列存储的整表，本来就按列存储的表直接返回，否则第一次查询时转换并缓存"""
+        if game._database is not None:
+            return game._database.columns(self.__name, self.__type.ExcelOutput, self.__indexes)
+        table = self.__table(game)
+        if table.columns is None:
+            if isinstance(table.data, columnar.Table):
+                table.columns = table.data
+            else:
+                table.columns = columnar.Table(self.__type.ExcelOutput, table.data, indexes=self.__indexes)
+        return table.columns
 
     def __call__(self, method: typing.Callable[..., None]) -> GameDataFunction[V]:
         if len(self.__file_names) == 0:
             self.__file_names = (file_name_generator(method.__name__),)
+        self.__name = method.__name__
+        self.__stats = RECORDER.accessor(method.__name__)
 
         @typing.overload
         def fn(game: GameData) -> collections.abc.Iterable[V]: ...
@@ -110,40 +163,85 @@ class excel_output(typing.Generic[V]):
         def fn(
             game: GameData, id: int | collections.abc.Iterable[int] | None = None
         ) -> V | collections.abc.Iterable[V] | None:
-            if self.__excel_output is None:
-                path = game.base / "ExcelOutput"
-                file_names = iter(self.__file_names)
-                file_path = path / (next(file_names) + ".json")
-                try:
-                    while not file_path.exists():
-                        file_path = path / (next(file_names) + ".json")
-                except StopIteration:
-                    self.__excel_output = {}
-                    return iter(()) if id is None or isinstance(id, collections.abc.Iterable) else None
-                finally:
-                    del self.__file_names  # 清理一下方便 GC
-                # ItemConfigAvatarSkin.json 由于内容仍未上线而数据文件已经存在（尽管之前一直为空）
-                # 可能是清理测试数据缺漏导致出现大量 null（此前 2.3 之前无，可能和修改数据格式有关），额外过滤一下
-                ExcelOutputList = pydantic.TypeAdapter(list[self.__type.ExcelOutput | None])
-                excels = json.loads(file_path.read_bytes())
-                try:
-                    excel_list = ExcelOutputList.validate_python(excels)
-                    self.__excel_output = {config.id: config for config in excel_list if config is not None}
-                except pydantic.ValidationError as exc:
-                    ExcelOutputDict = pydantic.TypeAdapter(dict[int, self.__type.ExcelOutput])
-                    try:
-                        self.__excel_output = ExcelOutputDict.validate_python(excels)
-                    except pydantic.ValidationError as former_structure_exc:
-                        raise former_structure_exc from exc
-            if id is None:
-                return (self.__type(game, excel) for excel in self.__excel_output.values())
-            if isinstance(id, collections.abc.Iterable):
-                return (self.__type(game, self.__excel_output[k]) for k in id)
-            excel = self.__excel_output.get(id)
-            return None if excel is None else self.__type(game, excel)
-
+            self.__stats.calls += 1
+            if game._database is not None:
+                return self.__views(game, game._database.excel_output(method.__name__, self.__type.ExcelOutput), id)
+            return self.__views(game, self.__table(game).data, id)
+
+        TABLES[method.__name__] = self.columns
+        LOADERS[method.__name__] = self.aload
+        ACCESSORS[method.__name__] = self
         return fn
 
+    def __table(self, game: GameData) -> reload.Table[collections.abc.Mapping[int, excel.ModelID]]:
+        table = game._tables.get(self.__name)
+        return game._tables.store(self.__name, self.__load(game)) if table is None else table
+
+    def __load(self, game: GameData) -> reload.Table[collections.abc.Mapping[int, excel.ModelID]]:
+        file_path = find_file(game.base / "ExcelOutput", self.__file_names)
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        timer = instrument.Timer()
+        content = file_path.read_bytes()
+        self.__stats.decode += timer()
+        return reload.Table(self.__parse(file_path, content), source)
+
+    async def aload(self, game: GameData):
+        """异步加载整张表，见 gsz.aio"""
+        if game._database is not None:
+            rows = game._database.excel_output(self.__name, self.__type.ExcelOutput)
+            _ = await aio.COALESCER.run((game._database, self.__name), lambda: asyncio.to_thread(rows.values))
+        elif game._tables.get(self.__name) is None:
+            table = await aio.COALESCER.run((game, self.__name), lambda: self.__aload(game))
+            _ = game._tables.store(self.__name, table)
+
+    async def __aload(self, game: GameData) -> reload.Table[collections.abc.Mapping[int, excel.ModelID]]:
+        file_path = find_file(game.base / "ExcelOutput", self.__file_names)
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        timer = instrument.Timer()
+        content = await aio.read_bytes(file_path)
+        self.__stats.decode += timer()
+        return reload.Table(await asyncio.to_thread(self.__parse, file_path, content), source)
+
+    def __parse(self, file_path: pathlib.Path, content: bytes) -> collections.abc.Mapping[int, excel.ModelID]:
+        # ItemConfigAvatarSkin.json 由于内容仍未上线而数据文件已经存在（尽管之前一直为空）
+        # 可能是清理测试数据缺漏导致出现大量 null（此前 2.3 之前无，可能和修改数据格式有关），额外过滤一下
+        timer = instrument.Timer()
+        excels = json.loads(content)
+        self.__stats.decode += timer()
+        excel_output: collections.abc.Mapping[int, excel.ModelID]
+        ExcelOutputList = pydantic.TypeAdapter(list[self.__type.ExcelOutput | None])
+        try:
+            excel_list = ExcelOutputList.validate_python(excels)
+            excel_output = {config.id: config for config in excel_list if config is not None}
+        except pydantic.ValidationError as exc:
+            ExcelOutputDict = pydantic.TypeAdapter(dict[int, self.__type.ExcelOutput])
+            try:
+                excel_output = ExcelOutputDict.validate_python(excels)
+            except pydantic.ValidationError as former_structure_exc:
+                raise former_structure_exc from exc
+        if self.__columnar:
+            excel_output = columnar.Table(self.__type.ExcelOutput, excel_output, indexes=self.__indexes)
+        self.__stats.validate += timer()
+        self.__stats.add_table(file_path, len(content), excel_output)
+        return excel_output
+
+    def __views(
+        self,
+        game: GameData,
+        excel_output: collections.abc.Mapping[int, excel.ModelID],
+        id: int | collections.abc.Iterable[int] | None,
+    ) -> V | collections.abc.Iterable[V] | None:
+        if id is None:
+            return (self.__type(game, excel) for excel in excel_output.values())
+        if isinstance(id, collections.abc.Iterable):
+            return (self.__type(game, excel_output[k]) for k in id)
+        excel = excel_output.get(id)
+        return None if excel is None else self.__type(game, excel)
+
 
 class GameDataStringMethod(typing.Protocol[T_co]):
     @typing.overload
@@ -205,39 +303,98 @@ class excel_output_string(typing.Generic[VS]):
     def __init__(self, typ: type[VS], *file_names: str):
         self.__type = typ
         self.__file_names: tuple[str, ...] = file_names
-        self.__excel_output: dict[str, excel.ModelStringID] | None = None
+        self.__name: str = ""
+
+    @property
+    def model(self) -> type[excel.ModelStringID]:
+        return self.__type.ExcelOutput
+
+    @property
+    def path(self) -> str:
+        return f"ExcelOutput/{self.__file_names[0]}.json"
+
+    def columns(self, game: GameData) -> columnar.Table[excel.ModelStringID]:
+        """按列存储的整表，ID 不是整数，按行号存储"""
+        if game._database is not None:
+            return game._database.columns(self.__name, self.__type.ExcelOutput)
+        table = self.__table(game)
+        if table.columns is None:
+            rows = dict(enumerate(table.data.values()))
+            table.columns = columnar.Table(self.__type.ExcelOutput, rows)
+        return table.columns
 
     def __call__(self, method: typing.Callable[..., None]) -> GameDataStringFunction[VS]:
         if len(self.__file_names) == 0:
             self.__file_names = (file_name_generator(method.__name__),)
+        self.__name = method.__name__
+        self.__stats = RECORDER.accessor(method.__name__)
 
         @typing.overload
         def fn(game: GameData) -> collections.abc.Iterable[VS]: ...
         @typing.overload
         def fn(game: GameData, id: str) -> VS | None: ...
         def fn(game: GameData, id: str | None = None) -> VS | collections.abc.Iterable[VS] | None:
-            if self.__excel_output is None:
-                path = game.base / "ExcelOutput"
-                file_names = iter(self.__file_names)
-                file_path = path / (next(file_names) + ".json")
-                try:
-                    while not file_path.exists():
-                        file_path = path / (next(file_names) + ".json")
-                except StopIteration:
-                    self.__excel_output = {}
-                    return None
-                finally:
-                    del self.__file_names  # 清理一下方便 GC
-                ExcelOutputList = pydantic.TypeAdapter(list[self.__type.ExcelOutput])
-                excels = json.loads(file_path.read_bytes())
-                self.__excel_output = {config.id: config for config in ExcelOutputList.validate_python(excels)}
-            if id is None:
-                return (self.__type(game, excel) for excel in self.__excel_output.values())
-            excel = self.__excel_output.get(id)
-            return None if excel is None else self.__type(game, excel)
-
+            self.__stats.calls += 1
+            if game._database is not None:
+                return self.__views(game, game._database.excel_output(method.__name__, self.__type.ExcelOutput), id)
+            return self.__views(game, self.__table(game).data, id)
+
+        TABLES[method.__name__] = self.columns
+        LOADERS[method.__name__] = self.aload
+        ACCESSORS[method.__name__] = self
         return fn
 
+    def __table(self, game: GameData) -> reload.Table[dict[str, excel.ModelStringID]]:
+        table = game._tables.get(self.__name)
+        return game._tables.store(self.__name, self.__load(game)) if table is None else table
+
+    def __load(self, game: GameData) -> reload.Table[dict[str, excel.ModelStringID]]:
+        file_path = find_file(game.base / "ExcelOutput", self.__file_names)
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        timer = instrument.Timer()
+        content = file_path.read_bytes()
+        self.__stats.decode += timer()
+        return reload.Table(self.__parse(file_path, content), source)
+
+    async def aload(self, game: GameData):
+        """异步加载整张表，见 gsz.aio"""
+        if game._database is not None:
+            rows = game._database.excel_output(self.__name, self.__type.ExcelOutput)
+            _ = await aio.COALESCER.run((game._database, self.__name), lambda: asyncio.to_thread(rows.values))
+        elif game._tables.get(self.__name) is None:
+            table = await aio.COALESCER.run((game, self.__name), lambda: self.__aload(game))
+            _ = game._tables.store(self.__name, table)
+
+    async def __aload(self, game: GameData) -> reload.Table[dict[str, excel.ModelStringID]]:
+        file_path = find_file(game.base / "ExcelOutput", self.__file_names)
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        timer = instrument.Timer()
+        content = await aio.read_bytes(file_path)
+        self.__stats.decode += timer()
+        return reload.Table(await asyncio.to_thread(self.__parse, file_path, content), source)
+
+    def __parse(self, file_path: pathlib.Path, content: bytes) -> dict[str, excel.ModelStringID]:
+        timer = instrument.Timer()
+        excels = json.loads(content)
+        self.__stats.decode += timer()
+        ExcelOutputList = pydantic.TypeAdapter(list[self.__type.ExcelOutput])
+        excel_output = {config.id: config for config in ExcelOutputList.validate_python(excels)}
+        self.__stats.validate += timer()
+        self.__stats.add_table(file_path, len(content), excel_output)
+        return excel_output
+
+    def __views(
+        self, game: GameData, excel_output: collections.abc.Mapping[str, excel.ModelStringID], id: str | None
+    ) -> VS | collections.abc.Iterable[VS] | None:
+        if id is None:
+            return (self.__type(game, excel) for excel in excel_output.values())
+        excel = excel_output.get(id)
+        return None if excel is None else self.__type(game, excel)
+
 
 class GameDataMainSubMethod(typing.Protocol[T_co]):
     @typing.overload
@@ -310,11 +467,31 @@ class excel_output_main_sub(typing.Generic[MSV]):
     def __init__(self, typ: type[MSV], *file_names: str):
         self.__type = typ
         self.__file_names: tuple[str, ...] = file_names
-        self.__excel_output: dict[int, list[excel.ModelMainSubID]] | None = None
+        self.__name: str = ""
+
+    @property
+    def model(self) -> type[excel.ModelMainSubID]:
+        return self.__type.ExcelOutput
+
+    @property
+    def path(self) -> str:
+        return f"ExcelOutput/{self.__file_names[0]}.json"
+
+    def columns(self, game: GameData) -> columnar.Table[excel.ModelMainSubID]:
+        """按列存储的整表，ID 是二元组，按行号存储"""
+        if game._database is not None:
+            return game._database.columns(self.__name, self.__type.ExcelOutput)
+        table = self.__table(game)
+        if table.columns is None:
+            rows = dict(enumerate(itertools.chain.from_iterable(table.data.values())))
+            table.columns = columnar.Table(self.__type.ExcelOutput, rows)
+        return table.columns
 
     def __call__(self, method: typing.Callable[..., None]) -> GameDataMainSubFunction[MSV]:
         if len(self.__file_names) == 0:
             self.__file_names = (file_name_generator(method.__name__),)
+        self.__name = method.__name__
+        self.__stats = RECORDER.accessor(method.__name__)
 
         @typing.overload
         def fn(game: GameData) -> collections.abc.Iterable[MSV]: ...
@@ -325,50 +502,91 @@ class excel_output_main_sub(typing.Generic[MSV]):
         def fn(
             game: GameData, main_id: int | None = None, sub_id: int | None = None
         ) -> MSV | collections.abc.Iterable[MSV] | None:
-            if self.__excel_output is None:
-                path = game.base / "ExcelOutput"
-                file_names = iter(self.__file_names)
-                file_path = path / (next(file_names) + ".json")
-                try:
-                    while not file_path.exists():
-                        file_path = path / (next(file_names) + ".json")
-                except StopIteration:
-                    self.__excel_output = {}
-                    return iter(()) if main_id is None or sub_id is None else None
-                finally:
-                    del self.__file_names  # 清理一下方便 GC
-                ExcelOutputList = pydantic.TypeAdapter(list[self.__type.ExcelOutput | None])
-                excels = json.loads(file_path.read_bytes())
-                try:
-                    excel_list = ExcelOutputList.validate_python(excels)
-                    self.__excel_output = collections.defaultdict(list)
-                    for excel in filter(None, excel_list):
-                        self.__excel_output[excel.main_id].append(excel)
-                except pydantic.ValidationError as exc:
-                    ExcelOutputDict = pydantic.TypeAdapter(dict[int, dict[int, self.__type.ExcelOutput]])
-                    try:
-                        excel_dict = ExcelOutputDict.validate_python(excels)
-                    except pydantic.ValidationError as former_structure_exc:
-                        raise former_structure_exc from exc
-                    self.__excel_output = {main_id: list(excel.values()) for main_id, excel in excel_dict.items()}
-            match main_id, sub_id:
-                case None, None:
-                    excels = self.__excel_output.values()
-                    return (self.__type(game, excel) for excel in itertools.chain.from_iterable(excels))
-                case main_id, None:
-                    return (self.__type(game, excel) for excel in self.__excel_output.get(main_id, ()))
-                case None, sub_id:
-                    raise ValueError("main_id cannot be none when sub_id is not None")
-                case main_id, sub_id:
-                    gen = (
-                        self.__type(game, excel)
-                        for excel in self.__excel_output.get(main_id, ())
-                        if excel.sub_id == sub_id
-                    )
-                    return next(gen, None)
-
+            self.__stats.calls += 1
+            if game._database is not None:
+                excel_output = game._database.excel_output_main_sub(method.__name__, self.__type.ExcelOutput)
+                return self.__views(game, excel_output, main_id, sub_id)
+            return self.__views(game, self.__table(game).data, main_id, sub_id)
+
+        TABLES[method.__name__] = self.columns
+        LOADERS[method.__name__] = self.aload
+        ACCESSORS[method.__name__] = self
         return fn
 
+    def __table(self, game: GameData) -> reload.Table[dict[int, list[excel.ModelMainSubID]]]:
+        table = game._tables.get(self.__name)
+        return game._tables.store(self.__name, self.__load(game)) if table is None else table
+
+    def __load(self, game: GameData) -> reload.Table[dict[int, list[excel.ModelMainSubID]]]:
+        file_path = find_file(game.base / "ExcelOutput", self.__file_names)
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        timer = instrument.Timer()
+        content = file_path.read_bytes()
+        self.__stats.decode += timer()
+        return reload.Table(self.__parse(file_path, content), source)
+
+    async def aload(self, game: GameData):
+        """异步加载整张表，见 gsz.aio"""
+        if game._database is not None:
+            rows = game._database.excel_output_main_sub(self.__name, self.__type.ExcelOutput)
+            _ = await aio.COALESCER.run((game._database, self.__name), lambda: asyncio.to_thread(rows.values))
+        elif game._tables.get(self.__name) is None:
+            table = await aio.COALESCER.run((game, self.__name), lambda: self.__aload(game))
+            _ = game._tables.store(self.__name, table)
+
+    async def __aload(self, game: GameData) -> reload.Table[dict[int, list[excel.ModelMainSubID]]]:
+        file_path = find_file(game.base / "ExcelOutput", self.__file_names)
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        timer = instrument.Timer()
+        content = await aio.read_bytes(file_path)
+        self.__stats.decode += timer()
+        return reload.Table(await asyncio.to_thread(self.__parse, file_path, content), source)
+
+    def __parse(self, file_path: pathlib.Path, content: bytes) -> dict[int, list[excel.ModelMainSubID]]:
+        timer = instrument.Timer()
+        excels = json.loads(content)
+        self.__stats.decode += timer()
+        excel_output: dict[int, list[excel.ModelMainSubID]]
+        ExcelOutputList = pydantic.TypeAdapter(list[self.__type.ExcelOutput | None])
+        try:
+            excel_list = ExcelOutputList.validate_python(excels)
+            excel_output = collections.defaultdict(list)
+            for excel in filter(None, excel_list):
+                excel_output[excel.main_id].append(excel)
+        except pydantic.ValidationError as exc:
+            ExcelOutputDict = pydantic.TypeAdapter(dict[int, dict[int, self.__type.ExcelOutput]])
+            try:
+                excel_dict = ExcelOutputDict.validate_python(excels)
+            except pydantic.ValidationError as former_structure_exc:
+                raise former_structure_exc from exc
+            excel_output = {main_id: list(excel.values()) for main_id, excel in excel_dict.items()}
+        self.__stats.validate += timer()
+        self.__stats.add_table(file_path, len(content), excel_output, sum(map(len, excel_output.values())))
+        return excel_output
+
+    def __views(
+        self,
+        game: GameData,
+        excel_output: collections.abc.Mapping[int, list[excel.ModelMainSubID]],
+        main_id: int | None,
+        sub_id: int | None,
+    ) -> MSV | collections.abc.Iterable[MSV] | None:
+        match main_id, sub_id:
+            case None, None:
+                excels = excel_output.values()
+                return (self.__type(game, excel) for excel in itertools.chain.from_iterable(excels))
+            case main_id, None:
+                return (self.__type(game, excel) for excel in excel_output.get(main_id, ()))
+            case None, sub_id:
+                raise ValueError("main_id cannot be none when sub_id is not None")
+            case main_id, sub_id:
+                gen = (self.__type(game, excel) for excel in excel_output.get(main_id, ()) if excel.sub_id == sub_id)
+                return next(gen, None)
+
 
 NE_co = typing.TypeVar("NE_co", bound="excel.ModelID | excel.ModelMainSubID", covariant=True)
 
@@ -401,19 +619,20 @@ class excel_output_name(typing.Generic[NV]):
     def __init__(self, typ: type[NV], method: GameDataFunction[NV] | GameDataMainSubFunction[NV]):
         self.__type = typ
         self.__method = method
-        self.__excel_output: dict[str, list[excel.ModelID | excel.ModelMainSubID]] | None = None
 
-    def __call__(self, _method: typing.Callable[..., None]) -> typing.Callable[[GameData, str], list[NV]]:
+    def __call__(self, method: typing.Callable[..., None]) -> typing.Callable[[GameData, str], list[NV]]:
         def fn(game: GameData, name: str) -> list[NV]:
-            if self.__excel_output is None:
-                self.__excel_output = {}
+            index = game._indexes.get(method.__name__)
+            if index is None:
+                excel_output: dict[str, list[excel.ModelID | excel.ModelMainSubID]] = {}
                 for view in self.__method(game):
                     excel = view._excel  # pyright: ignore[reportPrivateUsage]
-                    if view.name in self.__excel_output:
-                        self.__excel_output[view.name].append(excel)
+                    if view.name in excel_output:
+                        excel_output[view.name].append(excel)
                     else:
-                        self.__excel_output[view.name] = [excel]
-            excel_list = self.__excel_output.get(name)
+                        excel_output[view.name] = [excel]
+                index = game._indexes.store(method.__name__, reload.Table(excel_output))
+            excel_list = index.data.get(name)
             return [] if excel_list is None else [self.__type(game, excel) for excel in excel_list]
 
         return fn
@@ -457,20 +676,132 @@ class GameData:
     def __init__(self, base: str | pathlib.Path, *, language: Language = Language.CHS):
         self.base: pathlib.Path = pathlib.Path(base)
         self.__default_language: Language = language
-        self.__text_map: dict[Language, dict[int, str]] = {}
-
-    def __load_text_map(self, language: Language) -> dict[int, str]:
-        text_map: dict[int, str] = {}
+        self.__text_map: dict[Language, tuple[collections.abc.Mapping[int, str], instrument.TableStats]] = {}
+        self.__mention_matchers: dict[tuple[Language, frozenset[str]], EntityMatcher] = {}
+        self._database: sqlite.Database | None = None
+        """从 SQLite 读取时（见 gsz.sr.sqlite）装饰器不再读取 ExcelOutput，改为从这里查询"""
+        self._tables: reload.Tables = reload.Tables()
+        """装饰器加载的表，按访问方法名存放"""
+        self._indexes: reload.Tables = reload.Tables()
+        """由表计算出的索引（比如按名字查找），表或 TextMap 变化时全部丢弃"""
+        # 已经加载的 TextMap、剧情文件和加载时的文件状态，用于 watch
+        self.__text_map_files: dict[Language, dict[pathlib.Path, reload.Signature | None]] = {}
+        self.__json_files: dict[pathlib.Path, reload.Signature | None] = {}
+
+    def __text_map_paths(self, language: Language) -> list[pathlib.Path]:
+        """按合并顺序排列的 TextMap 文件，所有文件都存在的候选都要合并，比如 TextMapCN 和 TextMapCHS"""
+        paths: list[pathlib.Path] = []
         for candidate in language.candidates():
             if len(candidate) == 0:
                 continue
-            if not all(self.base.joinpath("TextMap", f"TextMap{part}.json").exists() for part in candidate):
-                continue
-            for part in candidate:
-                path = self.base / "TextMap" / f"TextMap{part}.json"
-                text_map.update(pydantic.TypeAdapter(dict[int, str]).validate_json(path.read_bytes()))
+            parts = [self.base / "TextMap" / f"TextMap{part}.json" for part in candidate]
+            if all(path.exists() for path in parts):
+                paths.extend(parts)
+        return paths
+
+    @staticmethod
+    def __parse_text_map(contents: list[tuple[pathlib.Path, bytes]], stats: instrument.TableStats) -> dict[int, str]:
+        text_map: dict[int, str] = {}
+        for path, content in contents:
+            timer = instrument.Timer()
+            text_map.update(pydantic.TypeAdapter(dict[int, str]).validate_json(content))
+            stats.validate += timer()
+            stats.add_file(path, len(content))
+        stats.loaded(len(text_map), instrument.estimate(text_map))
         return text_map
 
+    def _load_text_map(self, language: Language) -> tuple[collections.abc.Mapping[int, str], instrument.TableStats]:
+        stats = RECORDER.table(f"TextMap{language.name}")
+        contents: list[tuple[pathlib.Path, bytes]] = []
+        paths = self.__text_map_paths(language)
+        self.__text_map_files[language] = {path: reload.signature(path) for path in paths}
+        for path in paths:
+            timer = instrument.Timer()
+            contents.append((path, path.read_bytes()))
+            stats.decode += timer()
+        return self.__parse_text_map(contents, stats), stats
+
+    async def _aload_text_map(
+        self, language: Language
+    ) -> tuple[collections.abc.Mapping[int, str], instrument.TableStats]:
+        stats = RECORDER.table(f"TextMap{language.name}")
+        contents: list[tuple[pathlib.Path, bytes]] = []
+        paths = self.__text_map_paths(language)
+        self.__text_map_files[language] = {path: reload.signature(path) for path in paths}
+        for path in paths:
+            timer = instrument.Timer()
+            contents.append((path, await aio.read_bytes(path)))
+            stats.decode += timer()
+        return await asyncio.to_thread(self.__parse_text_map, contents, stats), stats
+
+    def load_stats(self) -> list[instrument.TableStats]:
+        """
+        各表、各语言 TextMap、各类剧情文件的加载统计，按加载耗时从高到低排序
+        统计是进程级别的，包含所有 SR GameData 的加载
+        """
+        return RECORDER.snapshot()
+
+    def load_json(self, model: type[M], path: str | pathlib.Path) -> M:
+        """读取 base 下的 JSON 文件（剧情文件等）并校验，计入加载统计"""
+        path = self.base.joinpath(path)
+        self.__json_files[path] = reload.signature(path)
+        return RECORDER.load_json(model, path)
+
+    def watched_files(self) -> dict[pathlib.Path, reload.Signature | None]:
+        """已经加载的表、TextMap、剧情文件（SQLite 导出时为导出的文件）和加载时的文件状态，供 watch 轮询"""
+        files = self._tables.sources()
+        for text_map_files in list(self.__text_map_files.values()):
+            files.update(text_map_files)
+        files.update(self.__json_files)
+        if self._database is not None:
+            files[self._database.path] = self._database.signature
+        return files
+
+    def invalidate(
+        self, paths: collections.abc.Iterable[str | pathlib.Path] = (), tables: collections.abc.Iterable[str] = ()
+    ) -> list[str]:
+        """
+        丢弃从 paths（相对路径相对于 base）加载的表、TextMap 和剧情文件，以及 tables（访问方法名）中的表
+        有缓存被丢弃时由它们计算出的索引也一并丢弃，下次访问时重新加载，返回丢弃的缓存，见 gsz.reload
+        """
+        changed = {self.base.joinpath(path).resolve() for path in paths}
+        invalidated = self._tables.invalidate(ACCESSORS.keys(), changed, tables)
+        if self._database is not None and self._database.path.resolve() in changed:
+            self._database = type(self._database)(self._database.path)
+            invalidated.append(self._database.path.name)
+            for language in list(self.__text_map):
+                del self.__text_map[language]
+                budget.BUDGET.discard(self, f"TextMap{language.name}")
+                invalidated.append(f"TextMap{language.name}")
+        for language, files in list(self.__text_map_files.items()):
+            if any(path.resolve() in changed for path in files):
+                _ = self.__text_map.pop(language, None)
+                del self.__text_map_files[language]
+                budget.BUDGET.discard(self, f"TextMap{language.name}")
+                invalidated.append(f"TextMap{language.name}")
+        for path in [path for path in list(self.__json_files) if path.resolve() in changed]:
+            del self.__json_files[path]
+            invalidated.append(path.relative_to(self.base).as_posix() if path.is_relative_to(self.base) else str(path))
+        if len(invalidated) != 0:
+            reload.drop_cached_properties(self)
+            self.__mention_matchers.clear()
+            _ = self._indexes.clear()
+        return invalidated
+
+    def watch(self, interval: float = 1.0) -> reload.Watcher:
+        """在后台线程中每 interval 秒检查一次已经加载的文件，有变化时调用 invalidate，用返回值 stop"""
+        return reload.Watcher(self, interval).start()
+
+    def query(self, table: str) -> query.Query[typing.Any]:
+        """
+        按字段查询整张表，table 为访问方法名，比如 monster_config，用法见 gsz.query
+        不是按列存储的表第一次查询时会额外转换出一份按列存储的数据
+        """
+        columns = TABLES.get(table)
+        if columns is None:
+            raise ValueError(f"unknown table {table!r}")
+        return query.Query(columns(self))
+
     @staticmethod
     def __int32(integer: int) -> int:
         return (integer & 0xFFFFFFFF ^ 0x80000000) - 0x80000000
@@ -482,32 +813,115 @@ class GameData:
             hashes[index & 1] = GameData.__int32(hashes[index & 1] << 5) + hashes[index & 1] ^ ord(char)
         return GameData.__int32(hashes[0] + hashes[1] * 1566083941)
 
-    def text(self, key: Text, *, language: Language | None = None) -> str:
+    def __text_map_of(self, language: Language) -> tuple[collections.abc.Mapping[int, str], instrument.TableStats]:
+        loaded = self.__text_map.get(language)
+        if loaded is None:
+            return self.__store_text_map(language, self._load_text_map(language))
+        budget.BUDGET.touch(self, f"TextMap{language.name}")
+        return loaded
+
+    def __store_text_map(
+        self, language: Language, loaded: tuple[collections.abc.Mapping[int, str], instrument.TableStats]
+    ) -> tuple[collections.abc.Mapping[int, str], instrument.TableStats]:
+        loaded = self.__text_map.setdefault(language, loaded)
+        if self._database is None:  # SQLite 导出的 TextMap 逐条查询，不登记
+            name = f"TextMap{language.name}"
+            budget.BUDGET.add(self, name, loaded[0], lambda game: game.__evict_text_map(language))
+        return loaded
+
+    def __evict_text_map(self, language: Language):
+        _ = self.__text_map.pop(language, None)
+        _ = self.__text_map_files.pop(language, None)
+
+    def text_map(self, language: Language | None = None) -> collections.abc.Mapping[int, str]:
+        """某一语言的完整 TextMap，哈希到文本，数据中没有该语言时为空"""
+        return self.__text_map_of(language or self.__default_language)[0]
+
+    async def aload(self, table: str) -> list[typing.Any]:
+        """
+        异步加载整张表并返回全部行，table 为访问方法名，见 gsz.aio
+        加载完成后同步的访问方法直接读缓存
+        """
+        loader = LOADERS.get(table)
+        if loader is None:
+            raise ValueError(f"unknown table {table!r}")
+        await loader(self)
+        return list(getattr(self, table)())
+
+    async def atext(self, key: Text, *, language: Language | None = None) -> str:
+        """同 text，TextMap 未加载时异步加载"""
         language = language or self.__default_language
         if language not in self.__text_map:
-            text_map = self.__load_text_map(language)
-            self.__text_map[language] = text_map
-        else:
-            text_map = self.__text_map[language]
+            loaded = await aio.COALESCER.run((self, language), lambda: self._aload_text_map(language))
+            _ = self.__store_text_map(language, loaded)
+        return self.text(key, language=language)
+
+    def text(self, key: Text, *, language: Language | None = None) -> str:
+        language = language or self.__default_language
+        text_map, stats = self.__text_map_of(language)
+        stats.calls += 1
         if isinstance(key, str):
             # 老版本使用 xxh32，后面改成 xxh64 了，为了兼容两个都试一下
             xxh64 = xxhash.xxh64_intdigest(key)
             return text_map.get(xxh64) or text_map.get(self.__stable_hash(key), "")
         return text_map.get(key.hash, "")
 
-    @functools.cached_property
+    def __mention_entities(
+        self, language: Language, kinds: frozenset[str]
+    ) -> collections.abc.Iterable[tuple[Entity, str]]:
+        # 只加载需要的实体类型的表
+        if "avatar" in kinds:
+            for avatar in itertools.chain(self.avatar_config(), self.avatar_config_ld()):
+                name = self.text(avatar._excel.avatar_name, language=language)  # pyright: ignore[reportPrivateUsage]
+                yield Entity("avatar", avatar.id), name
+        if "monster" in kinds:
+            for monster in self.monster_config():
+                name = self.text(monster._excel.monster_name, language=language)  # pyright: ignore[reportPrivateUsage]
+                yield Entity("monster", monster.id), name
+        if "item" in kinds:
+            for item in itertools.chain(self.item_config(), self.item_config_equipment(), self.item_config_relic()):
+                model = item._excel  # pyright: ignore[reportPrivateUsage]
+                if model.item_name is not None:
+                    yield Entity("item", item.id), self.text(model.item_name, language=language)
+        # 星神没有对应的数据表，只有手动维护的中文名
+        if "aeon" in kinds and language is Language.CHS:
+            yield from ((Entity("aeon", name), name) for name in sorted(AEON_NAMES))
+
+    def mention_matcher(
+        self,
+        kinds: collections.abc.Iterable[str] = MENTION_KINDS,
+        *,
+        language: Language | None = None,
+    ) -> EntityMatcher:
+        """
+        提及匹配，kinds 为要匹配的实体类型（avatar、monster、item、aeon），只加载这些类型的表
+        每种语言、每组实体类型只构建一次
+        名字是未经 Formatter 处理的原文，所以被扫描的文本也应当是原文
+        """
+        language = language or self.__default_language
+        key = (language, frozenset(kinds))
+        if not key[1] <= MENTION_KINDS:
+            raise ValueError(f"unknown entity kinds {sorted(key[1] - MENTION_KINDS)!r}")
+        if key not in self.__mention_matchers:
+            matcher = EntityMatcher(self.__mention_entities(*key))
+            self.__mention_matchers[key] = matcher
+        else:
+            matcher = self.__mention_matchers[key]
+        return matcher
+
+    @budget.cached_property
     def _plain_formatter(self) -> Formatter:
         return Formatter(game=self)
 
-    @functools.cached_property
+    @budget.cached_property
     def _mw_formatter(self) -> Formatter:
         return Formatter(syntax=Syntax.MediaWiki, game=self)
 
-    @functools.cached_property
+    @budget.cached_property
     def _mw_pretty_formatter(self) -> Formatter:
         return Formatter(syntax=Syntax.MediaWikiPretty, game=self)
 
-    @functools.cached_property
+    @budget.cached_property
     def _template_environment(self) -> jinja2.Environment:
         self_path = pathlib.Path(__file__)
         templates_path = self_path.parent / "templates"
@@ -537,7 +951,7 @@ class GameData:
     def achievement_series(self):
         """成就系列"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _achievement_series_achievements(self) -> dict[int, list[view.AchievementData]]:
         mappings: dict[int, list[view.AchievementData]] = {}
         for achievement in self.achievement_data():
@@ -553,7 +967,7 @@ class GameData:
     def atlas_avatar_change_info(self):
         """角色阵营变更，如完成对应任务后，黄泉从巡海游侠变为自灭者，星期日从匹诺康尼变为银河"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _atlas_change_info_avatar_config(self) -> dict[int, excel.AtlasAvatarChangeInfo]:
         return {change._excel.avatar_id: change._excel for change in self.atlas_avatar_change_info()}  # pyright: ignore[reportPrivateUsage]
 
@@ -616,7 +1030,7 @@ class GameData:
     def avatar_skill_tree_config_ld(self):
         """联动角色详情页的技能树状图"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _avatar_config_to_player_icon(self) -> dict[int, excel.AvatarPlayerIcon]:
         avatars: dict[int, excel.AvatarPlayerIcon] = {}
         for icon in self.avatar_player_icon():
@@ -624,7 +1038,7 @@ class GameData:
             avatars[model.avatar_id] = model
         return avatars
 
-    @functools.cached_property
+    @budget.cached_property
     def _avatar_config_skill_trees(self) -> dict[int, list[excel.AvatarSkillTreeConfig]]:
         skills: dict[int, list[excel.AvatarSkillTreeConfig]] = {}
         for skill in itertools.chain(self.avatar_skill_tree_config(), self.avatar_skill_tree_config_ld()):
@@ -635,6 +1049,26 @@ class GameData:
                 skills[model.avatar_id].append(model)
         return skills
 
+    @budget.cached_property
+    def _avatar_stat_curves(self) -> stat.AvatarStatCurves:
+        ld_avatar_id = view.avatar._LD_AVATAR_ID  # pyright: ignore[reportPrivateUsage]
+        promotions: dict[int, list[excel.AvatarPromotionConfig]] = {}
+        # 联动角色只看 LD 表，其他角色只看普通表，和 AvatarConfig.promotions 一致
+        for ld, table in ((False, self.avatar_promotion_config()), (True, self.avatar_promotion_config_ld())):
+            for promotion in table:
+                model = promotion._excel  # pyright: ignore[reportPrivateUsage]
+                if (model.avatar_id in ld_avatar_id) is not ld:
+                    continue
+                if model.avatar_id in promotions:
+                    promotions[model.avatar_id].append(model)
+                else:
+                    promotions[model.avatar_id] = [model]
+        return stat.AvatarStatCurves(promotions.items())
+
+    def avatar_stat_curves(self) -> stat.AvatarStatCurves:
+        """所有角色（包括联动角色）1~80 级基础属性曲线，只在第一次调用时计算"""
+        return self._avatar_stat_curves
+
     @excel_output_main_sub(view.StoryAtlas)
     def story_atlas(self):
         """角色故事"""
@@ -665,7 +1099,7 @@ class GameData:
     def localbook_config(self):
         """每一卷阅读物"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _book_series_localbook(self) -> dict[int, list[excel.LocalbookConfig]]:
         book_series: dict[int, list[excel.LocalbookConfig]] = {}
         for book in self.localbook_config():
@@ -689,7 +1123,7 @@ class GameData:
     def challenge_boss_group_config(self):
         """末日幻影单期"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _challenge_group_mazes(self) -> dict[int, list[excel.ChallengeMazeConfig]]:
         """同属一期逐光捡金的层"""
         mazes: dict[int, list[excel.ChallengeMazeConfig]] = {}
@@ -829,7 +1263,7 @@ class GameData:
     def activity_item_config_avatar(self):
         """不清楚，看起来是活动试用角色？但是只有开拓者和三月七"""
 
-    @excel_output(view.ItemConfig)
+    @excel_output(view.ItemConfig, columnar=True, indexes=("item_main_type", "item_sub_type", "rarity"))
     def item_config(self):
         """道具"""
 
@@ -861,7 +1295,7 @@ class GameData:
     def item_config_equipment(self):
         """光锥"""
 
-    @excel_output(view.ItemConfig)
+    @excel_output(view.ItemConfig, columnar=True)
     def item_config_relic(self):
         """遗器"""
 
@@ -968,7 +1402,7 @@ class GameData:
     def message_section_config(self):
         """一次聊天"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _message_section_config_items(self) -> dict[int, list[excel.MessageItemConfig]]:
         items: dict[int, list[excel.MessageItemConfig]] = {}
         for item in self.message_item_config():
@@ -981,7 +1415,17 @@ class GameData:
                 items[item.section_id] = [model]
         return items
 
-    @functools.cached_property
+    def message_section_duplicates(self) -> list[list[view.MessageSectionConfig]]:
+        """内容和结构完全相同的短信按摘要分组，只返回有重复的组，每个对话只计算一次摘要"""
+        groups: dict[bytes, list[view.MessageSectionConfig]] = {}
+        for section in self.message_section_config():
+            if section.digest in groups:
+                groups[section.digest].append(section)
+            else:
+                groups[section.digest] = [section]
+        return [group for group in groups.values() if len(group) > 1]
+
+    @budget.cached_property
     def _message_contact_sections(self) -> dict[int, list[excel.MessageSectionConfig]]:
         result: dict[int, list[excel.MessageSectionConfig]] = {}
         for group in self.message_group_config():
@@ -996,7 +1440,7 @@ class GameData:
                 result[model.message_contacts_id] = sections
         return result
 
-    @functools.cached_property
+    @budget.cached_property
     def _message_section_contacts(self) -> dict[int, excel.MessageContactsConfig]:
         result: dict[int, excel.MessageContactsConfig] = {}
         for group in self.message_group_config():
@@ -1014,7 +1458,7 @@ class GameData:
     def extra_effect_config(self):
         """效果说明"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _extra_effect_config_names(self) -> set[str]:
         return {effect.name for effect in self.extra_effect_config()}
 
@@ -1075,7 +1519,7 @@ class GameData:
     def monster_camp(self):
         """敌人阵营"""
 
-    @excel_output(view.MonsterConfig)
+    @excel_output(view.MonsterConfig, columnar=True, indexes=("monster_template_id",))
     def monster_config(self):
         """敌人详情"""
 
@@ -1083,7 +1527,7 @@ class GameData:
     def monster_config_name(self):
         """敌人详情"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _monster_config_summoners(self) -> dict[int, list[excel.MonsterConfig]]:
         summoners: dict[int, list[excel.MonsterConfig]] = {}
         for monster in self.monster_config():
@@ -1109,7 +1553,7 @@ class GameData:
     def monster_template_unique_config(self):
         """敌人模板（不清楚和不带 unique 的什么区别，不过有时候两个都要查）"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _monster_template_monster(self) -> dict[int, list[excel.MonsterConfig]]:
         monster_dict: dict[int, list[excel.MonsterConfig]] = {}
         for monster in self.monster_config():
@@ -1120,7 +1564,7 @@ class GameData:
                 monster_dict[model.monster_template_id] = [model]
         return monster_dict
 
-    @functools.cached_property
+    @budget.cached_property
     def _monster_template_group(self) -> dict[int, list[excel.MonsterTemplateConfig]]:
         template_groups: dict[int, list[excel.MonsterTemplateConfig]] = {}
         for template in self.monster_template_config():
@@ -1286,7 +1730,7 @@ class GameData:
     def rogue_buff_group(self):
         """模拟宇宙祝福组，似乎是按 DLC 分类的"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _rogue_buff_tag_groups(self) -> collections.defaultdict[int, list[excel.RogueBuffGroup]]:
         tag_to_group: collections.defaultdict[int, list[excel.RogueBuffGroup]] = collections.defaultdict(list)
         for group in self.rogue_buff_group():
@@ -1294,7 +1738,7 @@ class GameData:
                 tag_to_group[tag].append(group._excel)  # pyright: ignore[reportPrivateUsage]
         return tag_to_group
 
-    @functools.cached_property
+    @budget.cached_property
     def _rogue_buff_tag_buff(self) -> dict[int, excel.RogueBuff]:
         tag_to_buff: dict[int, excel.RogueBuff] = {}
         for buff in self.rogue_buff():
@@ -1338,7 +1782,7 @@ class GameData:
     def rogue_handbook_miracle_name(self):
         """模拟宇宙图鉴奇物（如「绝对失败处方」、「塔奥牌」等有不同效果的奇物故事等会出现于此）"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _rogue_handbook_miracle_miracles(self) -> dict[int, list[excel.RogueMiracle]]:
         miracles: dict[int, list[excel.RogueMiracle]] = {}
         for miracle in itertools.chain(self.rogue_miracle(), self.rogue_magic_miracle()):
@@ -1423,7 +1867,7 @@ class GameData:
     def rogue_tourn_buff_group(self):
         """差分宇宙祝福组，似乎是按 TournMode 分类的"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _rogue_tourn_buff_tag_groups(self) -> dict[int, list[excel.RogueTournBuffGroup]]:
         tag_to_group: dict[int, list[excel.RogueTournBuffGroup]] = {}
         for group in self.rogue_tourn_buff_group():
@@ -1435,7 +1879,7 @@ class GameData:
                     tag_to_group[tag] = [model]
         return tag_to_group
 
-    @functools.cached_property
+    @budget.cached_property
     def _rogue_tourn_buff_tag_buff(self) -> dict[int, excel.RogueTournBuff]:
         tag_to_buff: dict[int, excel.RogueTournBuff] = {}
         for buff in self.rogue_tourn_buff():
@@ -1475,7 +1919,7 @@ class GameData:
     def rogue_tourn_handbook_miracle_name(self):
         """差分宇宙图鉴奇物（如「绝对失败处方」、「塔奥牌」等有不同效果的奇物故事等会出现于此）"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _rogue_tourn_handbook_miracle_miracles(self) -> dict[int, list[excel.RogueTournMiracle]]:
         miracles: dict[int, list[excel.RogueTournMiracle]] = {}
         for miracle in self.rogue_tourn_miracle():
@@ -1540,7 +1984,7 @@ class GameData:
     def voice_config(self):
         """语音"""
 
-    @excel_output(view.TalkSentenceConfig)
+    @excel_output(view.TalkSentenceConfig, columnar=True)
     def talk_sentence_config(self):
         """各种对话，包括剧情、模拟宇宙事件等"""
 
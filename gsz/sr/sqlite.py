@@ -0,0 +1,395 @@
+"""
+导出到 SQLite
+
+把一份数据目录中所有 ExcelOutput 表和各语言的 TextMap 编译为一个 SQLite 文件：
+
+- 每个访问方法一张表，表名为访问方法名（如 monster_config），列为模型 model_dump 得到的字段
+- 整数、浮点、布尔、字符串存为原生的列，嵌套的模型、列表，以及出现过 null 的字段存为 JSON 文本
+- 没有在原文件中出现的字段存为 NULL，读取时跳过，重新校验后 model_fields_set 和从 JSON 加载的相同
+  （自定义了 model_serializer 的 RewardData 序列化时会去掉 null，只有值相同）
+- 主键列 _id（或 _main_id、_sub_id）和以 _id 结尾的整数列建立索引
+- TextMap 存入 text_map 表，按 (language, hash) 索引
+
+sqlite.GameData 从导出的文件读取，访问视图的方式和 gsz.sr.GameData 相同，
+只在按 ID 访问时查询对应的行并校验，整表访问时才读取整张表，TextMap 也只按哈希逐条查询
+剧情、模拟宇宙等不在 ExcelOutput 中的文件仍然从导出时记录的数据目录读取
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import itertools
+import json
+import pathlib
+import sqlite3
+import threading
+import typing
+
+import pydantic
+import typing_extensions
+
+from .. import columnar, instrument, reload
+from . import data
+from .data import Language
+from .excel.base import ModelID, ModelMainSubID, ModelStringID
+
+M = typing.TypeVar("M", bound=pydantic.BaseModel)
+K = typing.TypeVar("K", int, str)
+
+SCHEMA: typing.Final = 1
+"""导出格式的版本，读取时不一致直接报错"""
+
+INT64: typing.Final = range(-(2**63), 2**63)
+
+TYPES: typing.Final = {"int": "INTEGER", "float": "REAL", "bool": "INTEGER", "str": "TEXT", "json": "TEXT"}
+"""列的种类到 SQLite 类型，JSON 不能声明为 JSON 类型，否则按 NUMERIC 亲和性会把 "1" 这样的文本转成整数"""
+
+
+def quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def column_kind(values: list[typing.Any]) -> str:
+    """一列的种类，出现 None 的列存为 JSON，以区分字段为 null 和字段不存在"""
+    kinds = {type(value) for value in values}
+    if kinds == {bool}:
+        return "bool"
+    if kinds == {int} and all(value in INT64 for value in values):
+        return "int"
+    if kinds == {float}:
+        return "float"
+    if kinds == {str}:
+        return "str"
+    return "json"
+
+
+def encode(value: typing.Any, kind: str) -> typing.Any:
+    if value is Missing:
+        return None
+    if kind == "json":
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return value
+
+
+def decode(value: typing.Any, kind: str) -> typing.Any:
+    if kind == "json":
+        return json.loads(value)
+    if kind == "bool":
+        return bool(value)
+    return value
+
+
+class MissingType:
+    """原文件中没有该字段"""
+
+
+Missing: typing.Final = MissingType()
+
+
+def key_columns(row: pydantic.BaseModel) -> tuple[str, dict[str, str]]:
+    """表的种类和主键列，与 data 中三种装饰器对应"""
+    if isinstance(row, ModelMainSubID):
+        return "main_sub", {"_main_id": "INTEGER", "_sub_id": "INTEGER"}
+    if isinstance(row, ModelStringID):
+        return "string", {"_id": "TEXT"}
+    assert isinstance(row, ModelID)
+    return "id", {"_id": "INTEGER"}
+
+
+def keys(row: typing.Any, kind: str) -> tuple[typing.Any, ...]:
+    return (row.main_id, row.sub_id) if kind == "main_sub" else (row.id,)
+
+
+def write_table(connection: sqlite3.Connection, name: str, rows: list[pydantic.BaseModel]):
+    kind, key_types = key_columns(rows[0])
+    dumps = [row.model_dump(mode="json", exclude_unset=True) for row in rows]
+    names = list(dict.fromkeys(itertools.chain.from_iterable(dumps)))
+    kinds = {field: column_kind([dump[field] for dump in dumps if field in dump]) for field in names}
+    definitions = [f"{quote(key)} {type_}" for key, type_ in key_types.items()]
+    definitions += [f"{quote(field)} {TYPES[kinds[field]]}" for field in names]
+    _ = connection.execute(f"CREATE TABLE {quote(name)} ({', '.join(definitions)})")
+    placeholders = ", ".join("?" * (len(key_types) + len(names)))
+    _ = connection.executemany(
+        f"INSERT INTO {quote(name)} VALUES ({placeholders})",  # noqa: S608
+        (
+            (*keys(row, kind), *(encode(dump.get(field, Missing), kinds[field]) for field in names))
+            for row, dump in zip(rows, dumps, strict=True)
+        ),
+    )
+    _ = connection.execute(
+        f"CREATE INDEX {quote(f'{name}__key')} ON {quote(name)} ({', '.join(map(quote, key_types))})"
+    )
+    for field in names:
+        if kinds[field] == "int" and field.endswith("_id"):
+            _ = connection.execute(f"CREATE INDEX {quote(f'{name}__{field}')} ON {quote(name)} ({quote(field)})")
+    _ = connection.execute("INSERT INTO gsz_tables VALUES (?, ?)", (name, kind))
+    _ = connection.executemany(
+        "INSERT INTO gsz_columns VALUES (?, ?, ?, ?)",
+        ((name, position, field, kinds[field]) for position, field in enumerate(names)),
+    )
+
+
+def export(game: data.GameData, path: str | pathlib.Path) -> pathlib.Path:
+    """
+    把 game 的所有 ExcelOutput 表和所有语言的 TextMap 导出到 path，已存在的文件会被覆盖
+    先写入临时文件再替换，导出失败时不会留下不完整的文件
+    """
+    path = pathlib.Path(path)
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.unlink(missing_ok=True)
+    connection = sqlite3.connect(temporary)
+    try:
+        _ = connection.execute("PRAGMA journal_mode = OFF")
+        _ = connection.execute("PRAGMA synchronous = OFF")
+        with connection:
+            _ = connection.execute("CREATE TABLE gsz_meta (key TEXT PRIMARY KEY, value TEXT)")
+            _ = connection.execute("CREATE TABLE gsz_tables (name TEXT PRIMARY KEY, kind TEXT)")
+            _ = connection.execute(
+                "CREATE TABLE gsz_columns (table_name TEXT, position INTEGER, name TEXT, kind TEXT, "
+                "PRIMARY KEY (table_name, position))"
+            )
+            _ = connection.execute(
+                "CREATE TABLE text_map (language TEXT, hash INTEGER, text TEXT, PRIMARY KEY (language, hash)) "
+                "WITHOUT ROWID"
+            )
+            meta = {"schema": str(SCHEMA), "base": str(game.base.resolve())}
+            _ = connection.executemany("INSERT INTO gsz_meta VALUES (?, ?)", meta.items())
+            for name in sorted(data.TABLES):
+                rows: list[pydantic.BaseModel] = [view._excel for view in getattr(game, name)()]  # pyright: ignore[reportPrivateUsage]
+                if len(rows) != 0:
+                    write_table(connection, name, rows)
+            for language in Language:
+                text_map = game.text_map(language)
+                _ = connection.executemany(
+                    "INSERT INTO text_map VALUES (?, ?, ?)",
+                    ((language.name, hash_, text) for hash_, text in text_map.items()),
+                )
+        connection.close()
+    except BaseException:
+        connection.close()
+        temporary.unlink(missing_ok=True)
+        raise
+    return temporary.replace(path)
+
+
+class Database:
+    """只读打开导出的文件，按表缓存读取出的模型"""
+
+    def __init__(self, path: str | pathlib.Path):
+        self.path: pathlib.Path = pathlib.Path(path)
+        if not self.path.is_file():
+            raise FileNotFoundError(self.path)
+        self.signature: reload.Signature | None = reload.signature(self.path)
+        """打开时的文件状态，文件被重新导出时 GameData.watch 重新打开"""
+        # GameData.aload 在线程池中读取整表，连接跨线程使用，查询时加锁
+        uri = self.path.resolve().as_uri() + "?mode=ro"
+        self.__connection: sqlite3.Connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self.__lock: threading.Lock = threading.Lock()
+        meta = dict(self.__fetch("SELECT key, value FROM gsz_meta"))
+        if meta.get("schema") != str(SCHEMA):
+            raise ValueError(f"unsupported schema {meta.get('schema')!r} in {self.path}, export again")
+        self.base: pathlib.Path = pathlib.Path(meta["base"])
+        """导出时的数据目录"""
+        self.__tables: dict[str, str] = dict(self.__fetch("SELECT name, kind FROM gsz_tables"))
+        self.__columns: dict[str, list[tuple[str, str]]] = {name: [] for name in self.__tables}
+        for table, name, kind in self.__fetch(
+            "SELECT table_name, name, kind FROM gsz_columns ORDER BY table_name, position"
+        ):
+            self.__columns[table].append((name, kind))
+        self.__rows: dict[str, typing.Any] = {}
+        self.__column_tables: dict[str, columnar.Table[typing.Any]] = {}
+
+    def close(self):
+        self.__connection.close()
+
+    def __fetch(self, sql: str, parameters: tuple[typing.Any, ...] = ()) -> list[typing.Any]:
+        with self.__lock:
+            return self.__connection.execute(sql, parameters).fetchall()
+
+    def select(self, table: str, model: type[M], where: str = "", parameters: tuple[typing.Any, ...] = ()) -> list[M]:
+        """按 where 条件读取并校验若干行，按导出时的顺序排列"""
+        columns = self.__columns[table]
+        names = ", ".join(quote(name) for name, _ in columns) or "NULL"
+        sql = f"SELECT {names} FROM {quote(table)} {where} ORDER BY rowid"  # noqa: S608
+        rows: list[M] = []
+        for values in self.__fetch(sql, parameters):
+            fields = {
+                name: decode(value, kind)
+                for (name, kind), value in zip(columns, values, strict=False)
+                if value is not None
+            }
+            rows.append(model.model_validate(fields))
+        return rows
+
+    def keys(self, table: str) -> list[typing.Any]:
+        return [key for (key,) in self.__fetch(f"SELECT _id FROM {quote(table)} ORDER BY rowid")]  # noqa: S608
+
+    def excel_output(self, table: str, model: type[M]) -> collections.abc.Mapping[typing.Any, M]:
+        """excel_output 和 excel_output_string 的表，ID 到模型"""
+        rows = self.__rows.get(table)
+        if rows is None:
+            rows = self.__rows[table] = Rows(self, table, model) if table in self.__tables else {}
+        return rows
+
+    def excel_output_main_sub(self, table: str, model: type[M]) -> collections.abc.Mapping[int, list[M]]:
+        """excel_output_main_sub 的表，主 ID 到按导出顺序排列的模型"""
+        rows = self.__rows.get(table)
+        if rows is None:
+            rows = self.__rows[table] = GroupedRows(self, table, model) if table in self.__tables else {}
+        return rows
+
+    def columns(self, table: str, model: type[M], indexes: collections.abc.Iterable[str] = ()) -> columnar.Table[M]:
+        """供 GameData.query 使用的按列存储的整表，和 data 中一样，只有整数 ID 的表以 ID 为键"""
+        columns = self.__column_tables.get(table)
+        if columns is None:
+            if self.__tables.get(table) == "id":
+                # values() 一次读出整表，dict(...) 会先取键再逐行查询
+                rows = {row.id: row for row in self.excel_output(table, model).values()}  # pyright: ignore[reportAttributeAccessIssue]
+            else:
+                rows = dict(enumerate(self.select(table, model) if table in self.__tables else ()))
+            columns = self.__column_tables[table] = columnar.Table(model, rows, indexes=indexes)
+        return columns
+
+    def text(self, language: Language, hash_: int) -> str | None:
+        rows = self.__fetch("SELECT text FROM text_map WHERE language = ? AND hash = ?", (language.name, hash_))
+        return rows[0][0] if rows else None
+
+    def text_count(self, language: Language) -> int:
+        return self.__fetch("SELECT count(*) FROM text_map WHERE language = ?", (language.name,))[0][0]
+
+    def text_hashes(self, language: Language) -> collections.abc.Iterator[int]:
+        rows = self.__fetch("SELECT hash FROM text_map WHERE language = ?", (language.name,))
+        return (hash_ for (hash_,) in rows)
+
+
+class Rows(collections.abc.Mapping[K, M]):
+    """按 ID 逐行查询，整表访问时一次读出全部，读过的行缓存"""
+
+    def __init__(self, database: Database, table: str, model: type[M]):
+        self.__database: Database = database
+        self.__table: str = table
+        self.__model: type[M] = model
+        self.__rows: dict[K, M | None] = {}
+        self.__complete: bool = False
+
+    def __load(self):
+        if not self.__complete:
+            self.__rows = {typing.cast("K", row.id): row for row in self.__database.select(self.__table, self.__model)}  # pyright: ignore[reportAttributeAccessIssue]
+            self.__complete = True
+
+    def __getitem__(self, key: K) -> M:
+        if key not in self.__rows and not self.__complete:
+            rows = self.__database.select(self.__table, self.__model, "WHERE _id = ?", (key,))
+            self.__rows[key] = rows[0] if len(rows) != 0 else None
+        row = self.__rows.get(key)
+        if row is None:
+            raise KeyError(key)
+        return row
+
+    def __iter__(self) -> collections.abc.Iterator[K]:
+        if self.__complete:
+            return iter(typing.cast("dict[K, M]", self.__rows))
+        return iter(self.__database.keys(self.__table))
+
+    def __len__(self) -> int:
+        self.__load()
+        return len(self.__rows)
+
+    @typing_extensions.override
+    def values(self) -> collections.abc.ValuesView[M]:
+        self.__load()
+        return typing.cast("dict[K, M]", self.__rows).values()
+
+
+class GroupedRows(collections.abc.Mapping[int, list[M]]):
+    """按主 ID 查询同一组的所有行"""
+
+    def __init__(self, database: Database, table: str, model: type[M]):
+        self.__database: Database = database
+        self.__table: str = table
+        self.__model: type[M] = model
+        self.__groups: dict[int, list[M]] = {}
+        self.__complete: bool = False
+
+    def __load(self):
+        if not self.__complete:
+            groups: dict[int, list[M]] = {}
+            for row in self.__database.select(self.__table, self.__model):
+                groups.setdefault(row.main_id, []).append(row)  # pyright: ignore[reportAttributeAccessIssue]
+            self.__groups = groups
+            self.__complete = True
+
+    def __getitem__(self, main_id: int) -> list[M]:
+        group = self.__groups.get(main_id)
+        if group is None and not self.__complete:
+            group = self.__groups[main_id] = self.__database.select(
+                self.__table, self.__model, "WHERE _main_id = ?", (main_id,)
+            )
+        if not group:
+            raise KeyError(main_id)
+        return group
+
+    def __iter__(self) -> collections.abc.Iterator[int]:
+        self.__load()
+        return iter(self.__groups)
+
+    def __len__(self) -> int:
+        self.__load()
+        return len(self.__groups)
+
+    @typing_extensions.override
+    def values(self) -> collections.abc.ValuesView[list[M]]:
+        self.__load()
+        return self.__groups.values()
+
+
+class TextMap(collections.abc.Mapping[int, str]):
+    """按哈希逐条查询 TextMap，查过的缓存"""
+
+    def __init__(self, database: Database, language: Language):
+        self.__database: Database = database
+        self.__language: Language = language
+        self.__texts: dict[int, str | None] = {}
+
+    def __getitem__(self, hash_: int) -> str:
+        text = self.__texts.get(hash_, Missing)
+        if text is Missing:
+            text = self.__texts[hash_] = self.__database.text(self.__language, hash_)
+        if text is None:
+            raise KeyError(hash_)
+        return typing.cast("str", text)
+
+    def __iter__(self) -> collections.abc.Iterator[int]:
+        return self.__database.text_hashes(self.__language)
+
+    def __len__(self) -> int:
+        return self.__database.text_count(self.__language)
+
+
+class GameData(data.GameData):
+    """
+    从 export 导出的文件读取 ExcelOutput 和 TextMap 的 GameData，打开文件即可使用，不用解析 JSON
+    base 默认为导出时的数据目录，用于读取剧情等其他文件
+    和 gsz.sr.GameData 一样缓存只属于这个实例，但不存在 reload.Tables 中：读取出的行和 query 用的按列存储的表缓存在
+    实例自己打开的 Database 上，不登记到 budget；导出的文件变化时 invalidate 重新打开文件，这些缓存一并丢弃
+    """
+
+    def __init__(
+        self, path: str | pathlib.Path, *, base: str | pathlib.Path | None = None, language: Language = Language.CHS
+    ):
+        database = Database(path)
+        super().__init__(database.base if base is None else base, language=language)
+        self._database = database
+
+    @typing_extensions.override
+    def _load_text_map(self, language: Language) -> tuple[collections.abc.Mapping[int, str], instrument.TableStats]:
+        assert self._database is not None
+        stats = data.RECORDER.table(f"TextMap{language.name}")
+        stats.add_file(self._database.path, 0)
+        return TextMap(self._database, language), stats
+
+    @typing_extensions.override
+    async def _aload_text_map(
+        self, language: Language
+    ) -> tuple[collections.abc.Mapping[int, str], instrument.TableStats]:
+        return self._load_text_map(language)  # 逐条查询，不用预先加载
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import array
+import csv
+import json
+import math
+import typing
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+    from . import excel
+
+MAX_LEVEL: typing.Final = 80
+"""角色等级上限"""
+
+
+class AvatarStatRow(typing.NamedTuple):
+    avatar_id: int
+    level: int
+    ascended: bool
+    hp: float
+    attack: float
+    defence: float
+    speed: float
+
+
+class AvatarStatCurves:
+    """
+    所有角色 1~80 级的基础属性曲线，由 AvatarPromotionConfig 一次性计算得到
+
+    每个角色每个等级有「未突破」和「已突破」两个值，仅在突破等级（20、30、……、70）上两者不同
+    数据平铺存储在 array 中，第 k 个角色的 (level, ascended) 位于 k * 160 + (level - 1) * 2 + ascended
+    80 级已突破不存在，存储为 NaN
+    """
+
+    __STRIDE: typing.Final = MAX_LEVEL * 2
+
+    def __init__(
+        self, promotions: collections.abc.Iterable[tuple[int, collections.abc.Sequence[excel.AvatarPromotionConfig]]]
+    ):
+        self.__offsets: dict[int, int] = {}
+        self.__hp = array.array("d")
+        self.__attack = array.array("d")
+        self.__defence = array.array("d")
+        self.__speed = array.array("d")
+        for avatar_id, avatar_promotions in promotions:
+            if len(avatar_promotions) == 0:
+                continue
+            self.__offsets[avatar_id] = len(self.__hp)
+            self.__extend(avatar_promotions)
+
+    def __extend(self, promotions: collections.abc.Sequence[excel.AvatarPromotionConfig]):
+        # 每一段突破之前累计的成长值，以及每一段的起始等级（即上一段的等级上限）
+        floors = [0, *(promotion.max_level for promotion in promotions[:-1])]
+        hp_acc, attack_acc, defence_acc = [0.0], [0.0], [0.0]
+        for floor, promotion in zip(floors, promotions, strict=True):
+            hp_acc.append(hp_acc[-1] + (promotion.max_level - floor) * promotion.hp_add.value)
+            attack_acc.append(attack_acc[-1] + (promotion.max_level - floor) * promotion.attack_add.value)
+            defence_acc.append(defence_acc[-1] + (promotion.max_level - floor) * promotion.defence_add.value)
+        index = 0
+        for level in range(1, MAX_LEVEL + 1):
+            for ascended in (False, True):
+                # 未突破时落在等级上限不小于 level 的一段，已突破时落在等级上限大于 level 的一段
+                while index < len(promotions) and (
+                    level > promotions[index].max_level or ascended and level >= promotions[index].max_level
+                ):
+                    index += 1
+                if index == len(promotions):
+                    self.__hp.append(math.nan)
+                    self.__attack.append(math.nan)
+                    self.__defence.append(math.nan)
+                    self.__speed.append(math.nan)
+                    continue
+                promotion = promotions[index]
+                steps = level - floors[index] - 1
+                self.__hp.append(promotion.hp_base.value + hp_acc[index] + steps * promotion.hp_add.value)
+                self.__attack.append(
+                    promotion.attack_base.value + attack_acc[index] + steps * promotion.attack_add.value
+                )
+                self.__defence.append(
+                    promotion.defence_base.value + defence_acc[index] + steps * promotion.defence_add.value
+                )
+                self.__speed.append(promotion.speed_base.value)
+            # 本等级已突破所在的段，恰好就是下一等级未突破所在的段，所以 index 不需要回退
+
+    def __contains__(self, avatar_id: int) -> bool:
+        return avatar_id in self.__offsets
+
+    def __len__(self) -> int:
+        return len(self.__offsets)
+
+    def avatar_ids(self) -> collections.abc.KeysView[int]:
+        return self.__offsets.keys()
+
+    def __index(self, avatar_id: int, level: int, ascended: bool) -> int:
+        if not 0 < level < MAX_LEVEL and not (level == MAX_LEVEL and not ascended):
+            raise ValueError(f"角色等级不能超过 {MAX_LEVEL} 级")
+        return self.__offsets[avatar_id] + (level - 1) * 2 + ascended
+
+    def hp(self, avatar_id: int, level: int, ascended: bool = False) -> float:
+        return self.__hp[self.__index(avatar_id, level, ascended)]
+
+    def attack(self, avatar_id: int, level: int, ascended: bool = False) -> float:
+        return self.__attack[self.__index(avatar_id, level, ascended)]
+
+    def defence(self, avatar_id: int, level: int, ascended: bool = False) -> float:
+        return self.__defence[self.__index(avatar_id, level, ascended)]
+
+    def speed(self, avatar_id: int, level: int, ascended: bool = False) -> float:
+        return self.__speed[self.__index(avatar_id, level, ascended)]
+
+    def curve(self, avatar_id: int) -> tuple[memoryview, memoryview, memoryview, memoryview]:
+        """返回角色 (hp, attack, defence, speed) 四条曲线的只读视图，不复制数据，布局同上"""
+        offset = self.__offsets[avatar_id]
+        window = slice(offset, offset + self.__STRIDE)
+        return (
+            memoryview(self.__hp).toreadonly()[window],
+            memoryview(self.__attack).toreadonly()[window],
+            memoryview(self.__defence).toreadonly()[window],
+            memoryview(self.__speed).toreadonly()[window],
+        )
+
+    def rows(self) -> collections.abc.Iterable[AvatarStatRow]:
+        for avatar_id, offset in self.__offsets.items():
+            for slot in range(self.__STRIDE - 1):  # 跳过 80 级已突破
+                index = offset + slot
+                yield AvatarStatRow(
+                    avatar_id,
+                    slot // 2 + 1,
+                    bool(slot & 1),
+                    self.__hp[index],
+                    self.__attack[index],
+                    self.__defence[index],
+                    self.__speed[index],
+                )
+
+    def to_csv(self, file: typing.TextIO):
+        writer = csv.writer(file, lineterminator="\n")
+        writer.writerow(AvatarStatRow._fields)
+        writer.writerows((*row[:2], int(row.ascended), *row[3:]) for row in self.rows())
+
+    def to_jsonl(self, file: typing.TextIO):
+        for row in self.rows():
+            _ = file.write(json.dumps(row._asdict(), ensure_ascii=False))
+            _ = file.write("\n")
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -17,19 +17,19 @@ class AchievementData(View[excel.AchievementData]):
     def id(self) -> int:
         return self._excel.achievement_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.achievement_title)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.achievement_desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def params(self) -> tuple[float, ...]:
         return tuple(param.value for param in self._excel.param_list)
 
-    @functools.cached_property
+    @slotted.cached_property
     def hide_desc(self) -> str | None:
         return self._game.text(self._excel.hide_achievement_desc) if self._excel.hide_achievement_desc else None
 
@@ -37,7 +37,7 @@ class AchievementData(View[excel.AchievementData]):
     def series_id(self) -> int:
         return self._excel.series_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def __series(self) -> AchievementSeries:
         series = self._game.achievement_series(self._excel.series_id)
         assert series is not None
@@ -70,6 +70,6 @@ class AchievementSeries(View[excel.AchievementSeries]):
     def id(self) -> int:
         return self._excel.series_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.series_title)
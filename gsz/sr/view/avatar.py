@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import functools
 import itertools
 import typing
 
+from ... import slotted
 from .. import excel
 from ..excel import avatar
 from .base import View
@@ -21,7 +21,7 @@ _LD_AVATAR_ID: tuple[int, ...] = (1014, 1015)
 class AtlasAvatarChangeInfo(View[excel.AtlasAvatarChangeInfo]):
     ExcelOutput: typing.Final = excel.AtlasAvatarChangeInfo
 
-    @functools.cached_property
+    @slotted.cached_property
     def __camp(self) -> AvatarCamp:
         camp = self._game.avatar_camp(self._excel.camp_id)
         assert camp is not None
@@ -34,23 +34,23 @@ class AtlasAvatarChangeInfo(View[excel.AtlasAvatarChangeInfo]):
 class AvatarAtlas(View[excel.AvatarAtlas]):
     ExcelOutput: typing.Final = excel.AvatarAtlas
 
-    @functools.cached_property
+    @slotted.cached_property
     def cv_cn(self) -> str:
         return self._game.text(self._excel.cv_cn)
 
-    @functools.cached_property
+    @slotted.cached_property
     def cv_jp(self) -> str:
         return self._game.text(self._excel.cv_jp)
 
-    @functools.cached_property
+    @slotted.cached_property
     def cv_en(self) -> str | None:
         return self._game.text(self._excel.cv_en) if self._excel.cv_en is not None else ""
 
-    @functools.cached_property
+    @slotted.cached_property
     def cv_kr(self) -> str | None:
         return self._game.text(self._excel.cv_kr)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __camp(self) -> AvatarCamp:
         camp = self._game.avatar_camp(self._excel.camp_id)
         assert camp is not None
@@ -63,7 +63,7 @@ class AvatarAtlas(View[excel.AvatarAtlas]):
 class AvatarCamp(View[excel.AvatarCamp]):
     ExcelOutput: typing.Final = excel.AvatarCamp
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -75,15 +75,15 @@ class AvatarConfig(View[excel.AvatarConfig]):
     def id(self) -> int:
         return self._excel.avatar_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.avatar_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def full_name(self) -> str:
         return self._game.text(self._excel.avatar_full_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def english_name(self) -> str:
         from ..data import Language
 
@@ -98,10 +98,9 @@ class AvatarConfig(View[excel.AvatarConfig]):
             case avatar.Rarity.Type5:
                 return 5
 
-    @functools.cached_property
+    @slotted.cached_property
     def __manikin(self) -> avatar.ManikinCharacterConfig:
-        path = self._game.base / self._excel.manikin_json_path
-        return avatar.ManikinCharacterConfig.model_validate_json(path.read_bytes())
+        return self._game.load_json(avatar.ManikinCharacterConfig, self._excel.manikin_json_path)
 
     @property
     def is_male(self) -> bool:
@@ -119,7 +118,7 @@ class AvatarConfig(View[excel.AvatarConfig]):
     def damage_type(self) -> Element:
         return self._excel.damage_type
 
-    @functools.cached_property
+    @slotted.cached_property
     def __ranks(self) -> tuple[AvatarRankConfig, ...]:
         method = self._game.avatar_rank_config
         if self._excel.avatar_id in _LD_AVATAR_ID:
@@ -129,33 +128,33 @@ class AvatarConfig(View[excel.AvatarConfig]):
     def ranks(self) -> collections.abc.Iterable[AvatarRankConfig]:
         return (AvatarRankConfig(self._game, rank._excel) for rank in self.__ranks)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __atlas(self) -> AvatarAtlas | None:
         return self._game.avatar_atlas(self._excel.avatar_id)
 
     def atlas(self) -> AvatarAtlas | None:
         return AvatarAtlas(self._game, self.__atlas._excel) if self.__atlas is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def __camp(self) -> AvatarCamp | None:
         return self.__atlas.camp() if self.__atlas is not None else None
 
     def camp(self) -> AvatarCamp | None:
         return AvatarCamp(self._game, self.__camp._excel) if self.__camp is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def __atlas_change_info(self) -> AtlasAvatarChangeInfo | None:
         change = self._game._atlas_change_info_avatar_config.get(self._excel.avatar_id)  # pyright: ignore[reportPrivateUsage]
         return AtlasAvatarChangeInfo(self._game, change) if change is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def __player_icon(self) -> AvatarPlayerIcon:
         return AvatarPlayerIcon(self._game, self._game._avatar_config_to_player_icon[self._excel.avatar_id])  # pyright: ignore[reportPrivateUsage]
 
     def player_icon(self) -> AvatarPlayerIcon:
         return AvatarPlayerIcon(self._game, self.__player_icon._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skill_tree(self) -> tuple[AvatarSkillTreeConfig, ...]:
         return tuple(
             AvatarSkillTreeConfig(self._game, skill)
@@ -165,32 +164,32 @@ class AvatarConfig(View[excel.AvatarConfig]):
     def skill_tree(self) -> collections.abc.Iterable[AvatarSkillTreeConfig]:
         return (AvatarSkillTreeConfig(self._game, skill._excel) for skill in self.__skill_tree)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __normal_skill_tree(self) -> tuple[AvatarSkillTreeConfig, ...]:
         """普攻"""
         return tuple(point for point in self.__skill_tree if point._excel.anchor_type is avatar.AnchorType.Point01)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __bp_skill_tree(self) -> tuple[AvatarSkillTreeConfig, ...]:
         """战技"""
         return tuple(point for point in self.__skill_tree if point._excel.anchor_type is avatar.AnchorType.Point02)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __ultra_skill_tree(self) -> tuple[AvatarSkillTreeConfig, ...]:
         """终结技"""
         return tuple(point for point in self.__skill_tree if point._excel.anchor_type is avatar.AnchorType.Point03)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __passive_skill_tree(self) -> tuple[AvatarSkillTreeConfig, ...]:
         """被动"""
         return tuple(point for point in self.__skill_tree if point._excel.anchor_type is avatar.AnchorType.Point04)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __maze_skill_tree(self) -> tuple[AvatarSkillTreeConfig, ...]:
         """秘技"""
         return tuple(point for point in self.__skill_tree if point._excel.anchor_type is avatar.AnchorType.Point05)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __promotions(self) -> tuple[AvatarPromotionConfig, ...]:
         method = self._game.avatar_promotion_config
         if self._excel.avatar_id in _LD_AVATAR_ID:
@@ -200,7 +199,7 @@ class AvatarConfig(View[excel.AvatarConfig]):
     def promotions(self) -> collections.abc.Iterable[AvatarPromotionConfig]:
         return (AvatarPromotionConfig(self._game, promotion._excel) for promotion in self.__promotions)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __item(self) -> ItemConfig:
         item = self._game.item_config_avatar(self._excel.avatar_id)
         assert item is not None
@@ -211,7 +210,7 @@ class AvatarConfig(View[excel.AvatarConfig]):
 
         return ItemConfig(self._game, self.__item._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __stories(self) -> tuple[StoryAtlas, ...]:
         return tuple(self._game.story_atlas(self._excel.avatar_id))
 
@@ -253,7 +252,7 @@ class AvatarConfig(View[excel.AvatarConfig]):
 
     def __path_material_wiki_category_name(self) -> str:
         # skill 是无序的，所以直接找升到最高级需要的材料，顺序肯定不会混乱
-        points = sorted(self.__skill_tree, key=lambda skill: (skill._excel.level))
+        points = sorted(self.__skill_tree, key=lambda skill: skill._excel.level)
         material = points[-1].path_material()
         assert material is not None
         return self.__PATH_MATERIAL_CATEGORY[material._excel.id_]
@@ -284,51 +283,19 @@ class AvatarConfig(View[excel.AvatarConfig]):
 
     # 其实所有角色的系数是固定的，可以直接计算，不需要用到所有 promotion
     # https://nga.178.com/read.php?tid=35573789&rand=370
-    # 但这里还是按照文件里的记录来逐个计算吧
+    # 但这里还是按照文件里的记录来计算，整张表由 GameData 统一计算一次并缓存
 
     def hp(self, level: int, promotion: bool = False) -> float:
         assert 0 < level < 80 or level == 80 and not promotion, "角色等级不能超过 80 级"
-        assert level
-        index = 0
-        max_level = 0
-        hp = 0
-        while level > self.__promotions[index].max_level or promotion and level >= self.__promotions[index].max_level:
-            hp += (self.__promotions[index].max_level - max_level) * self.__promotions[index].hp_add
-            max_level = self.__promotions[index].max_level
-            index += 1
-        return self.__promotions[index].hp_base + hp + (level - max_level - 1) * self.__promotions[index].hp_add
+        return self._game._avatar_stat_curves.hp(self._excel.avatar_id, level, promotion)  # pyright: ignore[reportPrivateUsage]
 
     def attack(self, level: int, promotion: bool = False) -> float:
         assert 0 < level < 80 or level == 80 and not promotion, "角色等级不能超过 80 级"
-        assert level
-        index = 0
-        max_level = 0
-        attack = 0
-        while level > self.__promotions[index].max_level or promotion and level >= self.__promotions[index].max_level:
-            attack += (self.__promotions[index].max_level - max_level) * self.__promotions[index].attack_add
-            max_level = self.__promotions[index].max_level
-            index += 1
-        return (
-            self.__promotions[index].attack_base
-            + attack
-            + (level - max_level - 1) * self.__promotions[index].attack_add
-        )
+        return self._game._avatar_stat_curves.attack(self._excel.avatar_id, level, promotion)  # pyright: ignore[reportPrivateUsage]
 
     def defence(self, level: int, promotion: bool = False) -> float:
         assert 0 < level < 80 or level == 80 and not promotion, "角色等级不能超过 80 级"
-        assert level
-        index = 0
-        max_level = 0
-        defence = 0
-        while level > self.__promotions[index].max_level or promotion and level >= self.__promotions[index].max_level:
-            defence += (self.__promotions[index].max_level - max_level) * self.__promotions[index].defence_add
-            max_level = self.__promotions[index].max_level
-            index += 1
-        return (
-            self.__promotions[index].defence_base
-            + defence
-            + (level - max_level - 1) * self.__promotions[index].defence_add
-        )
+        return self._game._avatar_stat_curves.defence(self._excel.avatar_id, level, promotion)  # pyright: ignore[reportPrivateUsage]
 
     # TODO: 忆灵技和欢愉技
     def wiki(self) -> str:
@@ -418,7 +385,7 @@ class AvatarConfig(View[excel.AvatarConfig]):
 class AvatarPlayerIcon(View[excel.AvatarPlayerIcon]):
     ExcelOutput: typing.Final = excel.AvatarPlayerIcon
 
-    @functools.cached_property
+    @slotted.cached_property
     def __item(self) -> ItemConfig:
         item = self._game.item_config_avatar_player_icon(self._excel.id_)
         assert item is not None
@@ -465,7 +432,7 @@ class AvatarPromotionConfig(View[excel.AvatarPromotionConfig]):
     def defence_add(self) -> float:
         return self._excel.defence_add.value
 
-    @functools.cached_property
+    @slotted.cached_property
     def __materials(self) -> list[ItemConfig]:
         materials: list[ItemConfig] = []
         for pair in self._excel.promotion_cost_list:
@@ -474,7 +441,7 @@ class AvatarPromotionConfig(View[excel.AvatarPromotionConfig]):
             materials.append(item)
         return materials
 
-    @functools.cached_property
+    @slotted.cached_property
     def __loot_material(self) -> ItemConfig | None:
         return next(material for material in self.__materials if material._excel.purpose_type == 7)
 
@@ -484,7 +451,7 @@ class AvatarPromotionConfig(View[excel.AvatarPromotionConfig]):
 
         return ItemConfig(self._game, self.__loot_material._excel) if self.__loot_material is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def __promotion_material(self) -> ItemConfig | None:
         return next((material for material in self.__materials if material._excel.purpose_type == 2), None)
 
@@ -500,15 +467,15 @@ class AvatarPromotionConfig(View[excel.AvatarPromotionConfig]):
 class AvatarRankConfig(View[excel.AvatarRankConfig]):
     ExcelOutput: typing.Final = excel.AvatarRankConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def param(self) -> tuple[float, ...]:
         return tuple(param.value for param in self._excel.param)
 
@@ -519,15 +486,15 @@ class AvatarRankConfig(View[excel.AvatarRankConfig]):
 class AvatarSkillConfig(View[excel.AvatarSkillConfig]):
     ExcelOutput: typing.Final = excel.AvatarSkillConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.skill_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def tag(self) -> str:
         return self._game.text(self._excel.skill_tag)
 
-    @functools.cached_property
+    @slotted.cached_property
     def type_desc(self) -> str:
         return self._game.text(self._excel.skill_type_desc)
 
@@ -554,7 +521,7 @@ class AvatarSkillConfig(View[excel.AvatarSkillConfig]):
     def stance_damage_display(self) -> int | None:
         return self._excel.stance_damage_display
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rated_skill_tree(self) -> list[AvatarSkillTreeConfig]:
         method = self._game.avatar_skill_tree_config
         if self._excel.skill_id // 100 in _LD_AVATAR_ID:
@@ -569,7 +536,7 @@ class AvatarSkillConfig(View[excel.AvatarSkillConfig]):
     def rated_skill_tree(self) -> collections.abc.Iterable[AvatarSkillTreeConfig]:
         return (AvatarSkillTreeConfig(self._game, point._excel) for point in self.__rated_skill_tree)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rated_ranks(self) -> list[AvatarRankConfig]:
         method = self._game.avatar_rank_config
         if self._excel.skill_id // 100 in _LD_AVATAR_ID:
@@ -588,15 +555,15 @@ class AvatarSkillConfig(View[excel.AvatarSkillConfig]):
 class AvatarSkillTreeConfig(View[excel.AvatarSkillTreeConfig]):
     ExcelOutput: typing.Final = excel.AvatarSkillTreeConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.point_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.point_desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def param_list(self) -> tuple[float, ...]:
         return tuple(param.value for param in self._excel.param_list)
 
@@ -604,7 +571,7 @@ class AvatarSkillTreeConfig(View[excel.AvatarSkillTreeConfig]):
     def level(self) -> int:
         return self._excel.level
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skills(self) -> list[AvatarSkillConfig]:
         method = self._game.avatar_skill_config
         if self._excel.avatar_id in _LD_AVATAR_ID:
@@ -622,7 +589,7 @@ class AvatarSkillTreeConfig(View[excel.AvatarSkillTreeConfig]):
     def status_add_list(self) -> list[tuple[avatar.PropertyType, float]]:
         return [(add.property_type, add.value.value) for add in self._excel.status_add_list]
 
-    @functools.cached_property
+    @slotted.cached_property
     def __materials(self):
         result: list[tuple[ItemConfig, int]] = []
         for item_pair in self._excel.material_list:
@@ -631,7 +598,7 @@ class AvatarSkillTreeConfig(View[excel.AvatarSkillTreeConfig]):
             result.append((item, item_pair.item_num or 1))
         return result
 
-    @functools.cached_property
+    @slotted.cached_property
     def __path_material(self) -> ItemConfig | None:
         return next((material for material, _num in self.__materials if material._excel.purpose_type == 3), None)
 
@@ -641,7 +608,7 @@ class AvatarSkillTreeConfig(View[excel.AvatarSkillTreeConfig]):
 
         return ItemConfig(self._game, self.__path_material._excel) if self.__path_material is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def __loot_material(self) -> ItemConfig | None:
         return next((material for material, _num in self.__materials if material._excel.purpose_type == 7), None)
 
@@ -651,7 +618,7 @@ class AvatarSkillTreeConfig(View[excel.AvatarSkillTreeConfig]):
 
         return ItemConfig(self._game, self.__loot_material._excel) if self.__loot_material is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def __weekly_material(self) -> ItemConfig | None:
         return next((material for material, _num in self.__materials if material._excel.purpose_type == 4), None)
 
@@ -676,7 +643,7 @@ class AvatarSkillTreeConfig(View[excel.AvatarSkillTreeConfig]):
 class StoryAtlas(View[excel.StoryAtlas]):
     ExcelOutput: typing.Final = excel.StoryAtlas
 
-    @functools.cached_property
+    @slotted.cached_property
     def story(self) -> str:
         return self._game.text(self._excel.story)
 
@@ -684,27 +651,27 @@ class StoryAtlas(View[excel.StoryAtlas]):
 class VoiceAtlas(View[excel.VoiceAtlas]):
     ExcelOutput: typing.Final = excel.VoiceAtlas
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.voice_title)
 
-    @functools.cached_property
+    @slotted.cached_property
     def chinese(self) -> str:
         return self._game.text(self._excel.voice_m)
 
-    @functools.cached_property
+    @slotted.cached_property
     def japanese(self) -> str:
         from ..data import Language
 
         return self._game.text(self._excel.voice_m, language=Language.JP)
 
-    @functools.cached_property
+    @slotted.cached_property
     def english(self) -> str:
         from ..data import Language
 
         return self._game.text(self._excel.voice_m, language=Language.EN)
 
-    @functools.cached_property
+    @slotted.cached_property
     def korean(self) -> str:
         from ..data import Language
 
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -17,7 +17,7 @@ class BookDisplayType(View[excel.BookDisplayType]):
 class BookSeriesConfig(View[excel.BookSeriesConfig]):
     ExcelOutput: typing.Final = excel.BookSeriesConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.book_series)
 
@@ -25,13 +25,13 @@ class BookSeriesConfig(View[excel.BookSeriesConfig]):
     def id(self) -> int:
         return self._excel.id
 
-    @functools.cached_property
+    @slotted.cached_property
     def comments(self) -> str | None:
         if self._excel.book_series_comments is None:
             return None
         return self._game.text(self._excel.book_series_comments)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __world(self) -> BookSeriesWorld:
         world = self._game.book_series_world(self._excel.book_series_world)
         assert world is not None
@@ -40,7 +40,7 @@ class BookSeriesConfig(View[excel.BookSeriesConfig]):
     def world(self) -> BookSeriesWorld:
         return BookSeriesWorld(self._game, self.__world._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __books(self) -> list[LocalbookConfig]:
         books = self._game._book_series_localbook.get(self.id, ())  # pyright: ignore[reportPrivateUsage]
         return [LocalbookConfig(self._game, excel) for excel in books]
@@ -56,7 +56,7 @@ class BookSeriesConfig(View[excel.BookSeriesConfig]):
     def num(self) -> int:
         return self._excel.book_series_num
 
-    @functools.cached_property
+    @slotted.cached_property
     def series_type(self) -> str:  # noqa: PLR0911, PLR0912
         item = self._game.item_config_book(self.__books[0].id)
         if item is None:
@@ -113,7 +113,7 @@ class BookSeriesWorld(View[excel.BookSeriesWorld]):
     def id(self) -> int:
         return self._excel.book_series_world
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.book_series_world_textmap_id)
 
@@ -121,7 +121,7 @@ class BookSeriesWorld(View[excel.BookSeriesWorld]):
 class LocalbookConfig(View[excel.LocalbookConfig]):
     ExcelOutput: typing.Final = excel.LocalbookConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.book_inside_name)
 
@@ -129,13 +129,13 @@ class LocalbookConfig(View[excel.LocalbookConfig]):
     def id(self) -> int:
         return self._excel.id
 
-    @functools.cached_property
+    @slotted.cached_property
     def series(self) -> BookSeriesConfig:
         series = self._game.book_series_config(self._excel.book_series_id)
         assert series is not None
         return series
 
-    @functools.cached_property
+    @slotted.cached_property
     def content(self) -> str:
         return self._game.text(self._excel.book_content)
 
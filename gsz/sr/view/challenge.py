@@ -3,6 +3,7 @@ from __future__ import annotations
 import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from ..excel import Element, challenge
 from .base import View
@@ -143,7 +144,7 @@ class ChallengeGroupConfig(View[excel.ChallengeGroupConfig]):
     def id(self) -> int:
         return self._excel.id
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.group_name)
 
@@ -176,7 +177,7 @@ class ChallengeGroupConfig(View[excel.ChallengeGroupConfig]):
             case challenge.Type.Boss:
                 return self.id - 3000
 
-    @functools.cached_property
+    @slotted.cached_property
     def __schedule(self) -> ScheduleData | None:
         if self._excel.schedule_data_id is None:
             return None
@@ -196,7 +197,7 @@ class ChallengeGroupConfig(View[excel.ChallengeGroupConfig]):
 
         return None if self.__schedule is None else ScheduleData(self._game, self.__schedule._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __extra(self) -> ChallengeGroupExtra | ChallengeStoryGroupExtra | ChallengeBossGroupExtra:
         match self._excel.challenge_group_type:
             case challenge.Type.Memory:
@@ -218,7 +219,7 @@ class ChallengeGroupConfig(View[excel.ChallengeGroupConfig]):
             case ChallengeBossGroupExtra():
                 return ChallengeBossGroupExtra(self._game, self.__extra._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __maze_buff(self) -> MazeBuff | None:
         if self._excel.maze_buff_id is None:
             return None
@@ -231,7 +232,7 @@ class ChallengeGroupConfig(View[excel.ChallengeGroupConfig]):
 
         return None if self.__maze_buff is None else MazeBuff(self._game, self.__maze_buff._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __mazes(self) -> list[ChallengeMazeConfig]:
         mazes = self._game._challenge_group_mazes.get(self._excel.group_id)  # pyright: ignore[reportPrivateUsage]
         if mazes is None:
@@ -376,7 +377,7 @@ class ChallengeStoryGroupExtra(View[excel.ChallengeStoryGroupExtra]):
     def type(self) -> challenge.StoryType:
         return self._excel.story_type
 
-    @functools.cached_property
+    @slotted.cached_property
     def __sub_maze_buffs(self) -> list[MazeBuff] | None:
         assert self._excel.sub_maze_buff_list is not None, "虚构叙事固定存在战意机制"
         assert len(self._excel.sub_maze_buff_list) == 3, "虚构叙事固定 3 个战意机制"
@@ -392,7 +393,7 @@ class ChallengeStoryGroupExtra(View[excel.ChallengeStoryGroupExtra]):
             return None
         return (MazeBuff(self._game, buff._excel) for buff in self.__sub_maze_buffs)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __buffs(self) -> list[MazeBuff]:
         assert len(self._excel.buff_list) == 3, "虚构叙事固定 3 个荒腔走板"
         maze_buffs = [self._game.maze_buff(buff, 1) for buff in self._excel.buff_list]
@@ -409,7 +410,7 @@ class ChallengeStoryGroupExtra(View[excel.ChallengeStoryGroupExtra]):
 class ChallengeBossGroupExtra(View[excel.ChallengeBossGroupExtra]):
     ExcelOutput: typing.Final = excel.ChallengeBossGroupExtra
 
-    @functools.cached_property
+    @slotted.cached_property
     def __buffs_1(self) -> list[MazeBuff]:
         buffs: list[MazeBuff] = []
         for buff_id in self._excel.buff_list_1:
@@ -423,7 +424,7 @@ class ChallengeBossGroupExtra(View[excel.ChallengeBossGroupExtra]):
 
         return (MazeBuff(self._game, buff._excel) for buff in self.__buffs_1)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __buffs_2(self) -> list[MazeBuff]:
         buffs: list[MazeBuff] = []
         for buff_id in self._excel.buff_list_2:
@@ -445,7 +446,7 @@ class ChallengeMazeConfig(View[excel.ChallengeMazeConfig]):
     def id(self) -> int:
         return self._excel.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -453,7 +454,7 @@ class ChallengeMazeConfig(View[excel.ChallengeMazeConfig]):
     def floor(self) -> int | None:
         return self._excel.floor
 
-    @functools.cached_property
+    @slotted.cached_property
     def __group(self) -> ChallengeGroupConfig:
         group = (
             None
@@ -467,7 +468,7 @@ class ChallengeMazeConfig(View[excel.ChallengeMazeConfig]):
     def group(self) -> ChallengeGroupConfig:
         return ChallengeGroupConfig(self._game, self.__group._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __extra(self) -> ChallengeStoryMazeExtra | ChallengeBossMazeExtra | None:
         match self.__group.type:
             case challenge.Type.Memory:
@@ -495,7 +496,7 @@ class ChallengeMazeConfig(View[excel.ChallengeMazeConfig]):
     def damage_type_2(self) -> list[Element]:
         return list(self._excel.damage_type_2)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __events_1(self) -> list[StageConfig]:
         return list(self._game.stage_config(self._excel.event_id_list_1))
 
@@ -509,7 +510,7 @@ class ChallengeMazeConfig(View[excel.ChallengeMazeConfig]):
 
         return StageConfig(self._game, self.__events_1[0]._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __events_2(self) -> list[StageConfig]:
         return list(self._game.stage_config(self._excel.event_id_list_2))
 
@@ -523,7 +524,7 @@ class ChallengeMazeConfig(View[excel.ChallengeMazeConfig]):
 
         return StageConfig(self._game, self.__events_2[0]._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __maze_buff(self) -> MazeBuff:
         maze_buff = self._game.maze_buff(self._excel.maze_buff_id, 1)
         assert maze_buff is not None
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -34,7 +34,7 @@ class FateBuff(View[excel.FateBuff]):
     def class_trait_id(self) -> int:
         return self._excel.class_trait_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def __class_trait(self) -> FateTrait:
         trait = self._game.fate_trait(self._excel.class_trait_id)
         assert trait is not None
@@ -44,7 +44,7 @@ class FateBuff(View[excel.FateBuff]):
     def skill_trait_id(self) -> int:
         return self._excel.skill_trait_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skill_trait(self) -> FateTrait:
         trait = self._game.fate_trait(self._excel.skill_trait_id)
         assert trait is not None
@@ -53,7 +53,7 @@ class FateBuff(View[excel.FateBuff]):
     def traits(self) -> tuple[FateTrait, FateTrait]:
         return (self.__class_trait, self.__skill_trait)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __maze_buff(self) -> tuple[MazeBuff, ...]:
         return tuple(self._game.fate_maze_buff(self._excel.maze_buff))
 
@@ -96,19 +96,19 @@ class FateHandbookMaster(View[excel.FateHandbookMaster]):
         """宝具"""
         return self._excel.noble_phantasm
 
-    @functools.cached_property
+    @slotted.cached_property
     def hougu_name(self) -> str:
         return self._game.text(self._excel.hougu_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def skill_comment(self) -> str:
         return self._game.text(self._excel.skill_comment)
 
-    @functools.cached_property
+    @slotted.cached_property
     def story(self) -> str:
         return self._game.text(self._excel.story)
 
-    @functools.cached_property
+    @slotted.cached_property
     def wish(self) -> str:
         return self._game.text(self._excel.wish)
 
@@ -116,7 +116,7 @@ class FateHandbookMaster(View[excel.FateHandbookMaster]):
 class FateMaster(View[excel.FateMaster]):
     ExcelOutput: typing.Final = excel.FateMaster
 
-    @functools.cached_property
+    @slotted.cached_property
     def __avatar(self) -> AvatarConfig:
         avatar = self._game.avatar_config(self._excel.id_)
         assert avatar is not None
@@ -127,7 +127,7 @@ class FateMaster(View[excel.FateMaster]):
 
         return AvatarConfig(self._game, self.__avatar._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __handbook(self) -> FateHandbookMaster:
         handbook = self._game.fate_handbook_master(self._excel.id_)
         assert handbook is not None
@@ -144,11 +144,11 @@ class FateMaster(View[excel.FateMaster]):
     def class_(self) -> str:
         return self._excel.class_.value
 
-    @functools.cached_property
+    @slotted.cached_property
     def skill_name(self) -> str:
         return self._game.text(self._excel.skill_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def skill_desc(self) -> str:
         return self._game.text(self._excel.skill_desc)
 
@@ -164,7 +164,7 @@ class FateMasterTalk(View[excel.FateMasterTalk]):
     def when(self) -> fate.TalkWhen:
         return self._excel.when
 
-    @functools.cached_property
+    @slotted.cached_property
     def __this_avatar(self) -> AvatarConfig:
         avatar = self._game.avatar_config(self._excel.this_avatar_id)
         assert avatar is not None
@@ -175,11 +175,11 @@ class FateMasterTalk(View[excel.FateMasterTalk]):
 
         return AvatarConfig(self._game, self.__this_avatar._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def this_talk(self) -> str:
         return self._game.text(self._excel.this_avatar_talk)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __that_avatar(self) -> AvatarConfig | None:
         if self._excel.that_avatar_id is None:
             return None
@@ -192,7 +192,7 @@ class FateMasterTalk(View[excel.FateMasterTalk]):
 
         return AvatarConfig(self._game, self.__that_avatar._excel) if self.__that_avatar is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def that_talk(self) -> str:
         return self._game.text(self._excel.that_avatar_talk) if self._excel.that_avatar_talk is not None else ""
 
@@ -204,7 +204,7 @@ class FateReiju(View[excel.FateReiju]):
     def id(self) -> int:
         return self._excel.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -220,15 +220,15 @@ class FateReiju(View[excel.FateReiju]):
     def category(self) -> fate.ReijuCategory:
         return self._excel.category
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc_simple(self) -> str:
         return self._game.text(self._excel.desc_simple)
 
-    @functools.cached_property
+    @slotted.cached_property
     def params(self) -> tuple[float, ...]:
         return tuple(param.value for param in self._excel.params)
 
@@ -240,23 +240,23 @@ class FateTrait(View[excel.FateTrait]):
     def id(self) -> int:
         return self._excel.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def params(self) -> tuple[float, ...]:
         return tuple(param.value for param in self._excel.params)
 
-    @functools.cached_property
+    @slotted.cached_property
     def tag_1(self) -> str:
         return self._game.text(self._excel.tag_1)
 
-    @functools.cached_property
+    @slotted.cached_property
     def tag_2(self) -> str | None:
         return self._game.text(self._excel.tag_2) if self._excel.tag_2 is not None else None
 
@@ -276,10 +276,10 @@ class FateTraitBuff(View[excel.FateTraitBuff]):
     def require(self) -> int:
         return self._excel.require
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def params(self) -> tuple[float, ...]:
         return tuple(param.value for param in self._excel.params)
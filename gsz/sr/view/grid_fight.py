@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -16,11 +16,11 @@ if typing.TYPE_CHECKING:
 class GridFightAugment(View[excel.GridFightAugment]):
     ExcelOutput: typing.Final = excel.GridFightAugment
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.hex_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.hex_desc)
 
@@ -36,11 +36,11 @@ class GridFightAugment(View[excel.GridFightAugment]):
 class GridFightBackRoleRank(View[excel.GridFightBackRoleRank]):
     ExcelOutput: typing.Final = excel.GridFightBackRoleRank
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.desc)
 
@@ -52,11 +52,11 @@ class GridFightBackRoleRank(View[excel.GridFightBackRoleRank]):
 class GridFightFrontSkill(View[excel.GridFightFrontSkill]):
     ExcelOutput: typing.Final = excel.GridFightFrontSkill
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str | None:
         return self._game.text(self._excel.skill_name) if self._excel.skill_name is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str | None:
         return self._game.text(self._excel.skill_desc) if self._excel.skill_desc is not None else None
 
@@ -84,7 +84,7 @@ class GridFightRoleBasicInfo(View[excel.GridFightRoleBasicInfo]):
     def front_back_type(self) -> FrontBackType | None:
         return self._excel.front_back_type
 
-    @functools.cached_property
+    @slotted.cached_property
     def __avatar(self) -> AvatarConfig:
         avatar = self._game.avatar_config(self._excel.avatar_id)
         if avatar is None:
@@ -97,11 +97,11 @@ class GridFightRoleBasicInfo(View[excel.GridFightRoleBasicInfo]):
 
         return AvatarConfig(self._game, self.__avatar._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skill_display(self) -> tuple[GridFightRoleSkillDisplay, ...]:
         return tuple(self._game.grid_fight_role_skill_display(self._excel.id_))
 
-    @functools.cached_property
+    @slotted.cached_property
     def tags(self) -> tuple[str, ...]:
         tags: set[str] = set[str]()
         for skill_display in self.__skill_display:
@@ -111,14 +111,14 @@ class GridFightRoleBasicInfo(View[excel.GridFightRoleBasicInfo]):
                 tags.add(tag.desc)
         return tuple(tags)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __traits(self) -> tuple[GridFightTraitBasicInfo, ...]:
         return tuple(self._game.grid_fight_trait_basic_info(self._excel.trait_list))
 
     def traits(self) -> collections.abc.Iterable[GridFightTraitBasicInfo]:
         return (GridFightTraitBasicInfo(self._game, trait._excel) for trait in self.__traits)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __backend_ranks(self) -> tuple[GridFightBackRoleRank, ...]:
         return tuple(self._game.grid_fight_back_role_rank(self._excel.backend_rank_list))
 
@@ -129,7 +129,7 @@ class GridFightRoleBasicInfo(View[excel.GridFightRoleBasicInfo]):
 class GridFightRoleSkillDisplay(View[excel.GridFightRoleSkillDisplay]):
     ExcelOutput: typing.Final = excel.GridFightRoleSkillDisplay
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -141,7 +141,7 @@ class GridFightRoleStar(View[excel.GridFightRoleStar]):
     def star(self) -> int:
         return self._excel.star
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skill_overrides(self) -> list[tuple[AvatarSkillConfig | None, GridFightFrontSkill]]:
         skill_pairs: list[tuple[AvatarSkillConfig | None, GridFightFrontSkill]] = []
         for src_id, dst_id in zip(self._excel.skill_override_src, self._excel.skill_override_dest, strict=True):
@@ -169,7 +169,7 @@ class GridFightRoleStar(View[excel.GridFightRoleStar]):
 class GridFightRoleTagInfo(View[excel.GridFightRoleTagInfo]):
     ExcelOutput: typing.Final = excel.GridFightRoleTagInfo
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.tag_desc)
 
@@ -181,11 +181,11 @@ class GridFightTraitBasicInfo(View[excel.GridFightTraitBasicInfo]):
     def id(self) -> int:
         return self._excel.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.trait_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def base_desc(self) -> str:
         return self._game.text(self._excel.trait_base_desc)
 
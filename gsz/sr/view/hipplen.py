@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -10,7 +10,7 @@ from .base import View
 class ActivityHipplenTrait(View[excel.ActivityHipplenTrait]):
     ExcelOutput: typing.Final = excel.ActivityHipplenTrait
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.trait_title)
 
@@ -18,7 +18,7 @@ class ActivityHipplenTrait(View[excel.ActivityHipplenTrait]):
     def rarity(self) -> int:
         return self._excel.rarity
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.trait_desc)
 
@@ -26,7 +26,7 @@ class ActivityHipplenTrait(View[excel.ActivityHipplenTrait]):
     def desc_param(self) -> tuple[int, ...]:
         return self._excel.trait_desc_param
 
-    @functools.cached_property
+    @slotted.cached_property
     def unlock_desc(self) -> str:
         return self._game.text(self._excel.trait_unlock_desc)
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import functools
 import io
 import typing
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -23,27 +23,27 @@ class ItemConfig(View[excel.ItemConfig]):
     def id(self) -> int:
         return self._excel.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         if self._excel.item_name is None:
             return ""
         return self._game.text(self._excel.item_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def wiki_name(self) -> str:
         return self._game._plain_formatter.format(self.name)  # pyright: ignore[reportPrivateUsage]
 
-    @functools.cached_property
+    @slotted.cached_property
     def icon_path(self) -> str:
         return self._excel.item_figure_icon_path
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         if self._excel.item_desc is None:
             return ""
         return self._game.text(self._excel.item_desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def bg_desc(self) -> str:
         if self._excel.item_bg_desc is None:
             return ""
@@ -69,7 +69,7 @@ class ItemConfig(View[excel.ItemConfig]):
     def use_method(self) -> item.UseMethod | None:
         return self._excel.use_method
 
-    @functools.cached_property
+    @slotted.cached_property
     def __purpose(self) -> ItemPurpose | None:
         if self._excel.purpose_type is None:
             return None
@@ -80,14 +80,14 @@ class ItemConfig(View[excel.ItemConfig]):
     def purpose(self) -> ItemPurpose | None:
         return None if self.__purpose is None else ItemPurpose(self._game, self.__purpose._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __use_data(self) -> ItemUseData | None:
         return self._game.item_use_data(self._excel.id)
 
     def use_data(self) -> ItemUseData | None:
         return None if self.__use_data is None else ItemUseData(self._game, self.__use_data._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __cure_info_data(self) -> ItemCureInfoData | None:
         return self._game.item_cure_info_data(self._excel.id)
 
@@ -98,11 +98,11 @@ class ItemConfig(View[excel.ItemConfig]):
 class ItemCureInfoData(View[excel.ItemCureInfoData]):
     ExcelOutput: typing.Final = excel.ItemCureInfoData
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.cure_info_title)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.cure_info_desc)
 
@@ -129,7 +129,7 @@ class ItemPurpose(View[excel.ItemPurpose]):
     def id(self) -> int:
         return self._excel.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def text(self) -> str:
         return self._game.text(self._excel.purpose_text)
 
@@ -137,7 +137,7 @@ class ItemPurpose(View[excel.ItemPurpose]):
 class ItemUseData(View[excel.ItemUseData]):
     ExcelOutput: typing.Final = excel.ItemUseData
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rewards(self) -> list[RewardData]:
         return list(self._game.reward_data(self._excel.use_param))
 
@@ -8,7 +8,9 @@ import io
 import typing
 
 import typing_extensions
+import xxhash
 
+from ... import slotted
 from .. import excel
 from ..excel import message
 from .base import View
@@ -117,7 +119,7 @@ class EmojiConfig(View[excel.EmojiConfig]):
         30034: "24-05",
     }
 
-    @functools.cached_property
+    @slotted.cached_property
     def keywords(self) -> str:
         return self._game.text(self._excel.key_words)
 
@@ -184,7 +186,7 @@ class EmojiGroup(View[excel.EmojiGroup]):
 class MessageContactsCamp(View[excel.MessageContactsCamp]):
     ExcelOutput: typing.Final = excel.MessageContactsCamp
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -196,15 +198,15 @@ class MessageContactsConfig(View[excel.MessageContactsConfig]):
     def id(self) -> int:
         return self._excel.id
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def signature(self) -> str:
         return "" if self._excel.signature_text is None else self._game.text(self._excel.signature_text)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __camp(self) -> MessageContactsCamp | None:
         return (
             None if self._excel.contacts_camp is None else self._game.message_contacts_camp(self._excel.contacts_camp)
@@ -213,7 +215,7 @@ class MessageContactsConfig(View[excel.MessageContactsConfig]):
     def camp(self) -> MessageContactsCamp | None:
         return None if self.__camp is None else MessageContactsCamp(self._game, self.__camp._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __type(self) -> MessageContactsType | None:
         return (
             None if self._excel.contacts_type is None else self._game.message_contacts_type(self._excel.contacts_type)
@@ -222,7 +224,7 @@ class MessageContactsConfig(View[excel.MessageContactsConfig]):
     def type(self) -> MessageContactsType | None:
         return None if self.__type is None else MessageContactsType(self._game, self.__type._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __sections(self) -> list[MessageSectionConfig]:
         sections = [
             MessageSectionConfig(self._game, section)
@@ -283,7 +285,7 @@ class MessageContactsConfig(View[excel.MessageContactsConfig]):
 class MessageContactsType(View[excel.MessageContactsType]):
     ExcelOutput: typing.Final = excel.MessageContactsType
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -303,18 +305,18 @@ class MessageItemConfig(View[excel.MessageItemConfig]):
     def section_id(self) -> int | None:
         return self._excel.section_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def __section(self) -> MessageSectionConfig | None:
         return None if self._excel.section_id is None else self._game.message_section_config(self._excel.section_id)
 
     def section(self) -> MessageSectionConfig | None:
         return None if self.__section is None else MessageSectionConfig(self._game, self.__section._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def main_text(self) -> str:
         return "" if self._excel.main_text is None else self._game.text(self._excel.main_text)
 
-    @functools.cached_property
+    @slotted.cached_property
     def option_text(self) -> str:
         return "" if self._excel.option_text is None else self._game.text(self._excel.option_text)
 
@@ -322,7 +324,7 @@ class MessageItemConfig(View[excel.MessageItemConfig]):
     def type(self) -> message.ItemType:
         return self._excel.item_type
 
-    @functools.cached_property
+    @slotted.cached_property
     def next_ids(self) -> tuple[int, ...]:
         return tuple(self._excel.next_item_id_list)
 
@@ -348,7 +350,7 @@ class MessageItemConfig(View[excel.MessageItemConfig]):
             else f"{main_text}<!-- Image: 穹 {image.image_path} 星 {image.female_image_path} -->"
         )
 
-    @functools.cached_property
+    @slotted.cached_property
     def _contacts(self) -> MessageContactsConfig | None:
         return None if self._excel.contacts_id is None else self._game.message_contacts_config(self._excel.contacts_id)
 
@@ -468,6 +470,7 @@ class _Node(metaclass=abc.ABCMeta):
 
     def __init__(self):
         self.confluence: MessageItemConfig | _Uninit | None = _uninit
+        self._digest: bytes | None = None
 
     @property
     @abc.abstractmethod
@@ -487,6 +490,106 @@ class _Node(metaclass=abc.ABCMeta):
         对于 main_text_half 的节点的后继那就是 _option_half == True 的同一个对象
         """
 
+    @abc.abstractmethod
+    def _shallow_key(self) -> tuple[object, ...]:
+        """节点自身（不含后继）参与判等的内容"""
+
+    @property
+    def digest(self) -> bytes:
+        """
+        节点自身和所有后继的内容摘要（Merkle 哈希）
+        内容和结构都相同的子对话摘要相同，可以直接用摘要判等、去重
+        """
+        return self._digest if self._digest is not None else _digest(self)
+
+
+def _digest(root: _Node) -> bytes:
+    """
+    迭代地计算 root 能到达的所有未计算节点的摘要，每个节点只计算一次
+    摘要由节点自身内容和后继的摘要拼接后哈希得到
+
+    对话中可能存在环（比如选项回到之前的问题），用 Tarjan 算法按逆拓扑序找出强连通分量，分量外的后继都已经算好
+    环上节点的摘要见 _component_digests，只和从节点自身出发能看到的结构有关，和从哪个节点开始计算无关
+    """
+    # 栈上每一项是节点和下一个要访问的后继下标
+    stack: list[tuple[_Node, int]] = [(root, 0)]
+    index: dict[int, int] = {id(root): 0}
+    lowlink: dict[int, int] = {id(root): 0}
+    component: list[_Node] = [root]
+    on_component: set[int] = {id(root)}
+    while len(stack) != 0:
+        node, position = stack[-1]
+        successors = node._successors
+        if position < len(successors):
+            stack[-1] = (node, position + 1)
+            successor = successors[position]
+            if successor._digest is not None:
+                continue
+            if id(successor) not in index:
+                index[id(successor)] = lowlink[id(successor)] = len(index)
+                component.append(successor)
+                on_component.add(id(successor))
+                stack.append((successor, 0))
+            elif id(successor) in on_component:
+                lowlink[id(node)] = min(lowlink[id(node)], index[id(successor)])
+            continue
+        _ = stack.pop()
+        if len(stack) != 0:
+            parent = stack[-1][0]
+            lowlink[id(parent)] = min(lowlink[id(parent)], lowlink[id(node)])
+        if lowlink[id(node)] == index[id(node)]:
+            # node 和栈上在它之后的节点组成一个强连通分量，_Message 重载了 __eq__，只能按 is 比较
+            members: list[_Node] = []
+            while len(members) == 0 or members[-1] is not node:
+                members.append(component.pop())
+            ids = set(map(id, members))
+            on_component -= ids
+            for member, digest in zip(members, _component_digests(members), strict=True):
+                member._digest = digest
+    assert root._digest is not None
+    return root._digest
+
+
+def _component_digests(members: list[_Node]) -> list[bytes]:
+    """
+    强连通分量中每个节点的摘要：从该节点出发按后继顺序广度优先遍历分量，依次编号
+    分量内的后继用编号代替摘要，分量外的后继用已经算好的摘要，所有节点的内容按编号顺序拼接后哈希
+    节点内容和后继只取一次，之后每个节点的遍历只处理整数下标
+
+    每个节点的摘要要和从哪个节点开始计算无关，目前只能每个节点各遍历一次，分量有 k 个节点、e 条边时为 O(k * e)
+    对话里的环只是几句话（选项回到之前的问题），不在环上的节点分量只有自身，结果就是自身内容和后继摘要的哈希，整体仍是线性的
+    """
+    local = {id(member): position for position, member in enumerate(members)}
+    keys = [member._shallow_key() for member in members]
+    # 分量内的后继为下标，分量外的后继为摘要
+    links: list[list[bytes | int]] = []
+    for member in members:
+        successors: list[bytes | int] = []
+        for successor in member._successors:
+            if id(successor) in local:
+                successors.append(local[id(successor)])
+            else:
+                assert successor._digest is not None
+                successors.append(successor._digest)
+        links.append(successors)
+    digests: list[bytes] = []
+    for start in range(len(members)):
+        order: dict[int, int] = {start: 0}
+        queue: list[int] = [start]
+        parts: list[tuple[tuple[object, ...], tuple[bytes | int, ...]]] = []
+        for node in queue:  # 遍历时 queue 继续增长
+            renumbered: list[bytes | int] = []
+            for link in links[node]:
+                if isinstance(link, int):
+                    if link not in order:
+                        order[link] = len(queue)
+                        queue.append(link)
+                    link = order[link]  # noqa: PLW2901
+                renumbered.append(link)
+            parts.append((keys[node], tuple(renumbered)))
+        digests.append(xxhash.xxh3_128_digest(repr(parts).encode()))
+    return digests
+
 
 class _Uninit: ...
 
@@ -494,7 +597,11 @@ class _Uninit: ...
 _uninit = _Uninit()
 
 
-class _Message(MessageItemConfig, _Node):  # pyright: ignore[reportUnsafeMultipleInheritance]
+class _NodeMeta(slotted.Meta, abc.ABCMeta):
+    """视图和 _Node 多继承时的元类，_Node 没有 __slots__，这两个类的实例仍带有 __dict__"""
+
+
+class _Message(MessageItemConfig, _Node, metaclass=_NodeMeta):  # pyright: ignore[reportUnsafeMultipleInheritance]
     # 反正是非导出对象，这里就搞一堆后置初始化了
     # message_dict 和 neighbour 是需要由 MessageSectionConfig 初始化
     # 这是因为这些数据上挂了 functools，为了避免对同一条消息反反复复计算文案和后置所以都放到一起
@@ -508,7 +615,7 @@ class _Message(MessageItemConfig, _Node):  # pyright: ignore[reportUnsafeMultipl
         self.neighbour: _Message | None = None  # 依赖外部手动初始化
         """neighbour 表示当自己不是 option_half 时候的后继"""
 
-    @functools.cached_property
+    @slotted.cached_property
     def _successors(self) -> tuple[_Message, ...]:
         if len(self._excel.next_item_id_list) == 0:
             return ()
@@ -526,65 +633,33 @@ class _Message(MessageItemConfig, _Node):  # pyright: ignore[reportUnsafeMultipl
     def _option_half(self) -> bool:
         return self.__is_option
 
-    def shallow_eq(self, other: _Message) -> bool:  # noqa: PLR0911
-        """
-        当自身数据一样时，判断为相等
-        需要注意的是，对于选项来说，它的「自身」是包含 NextItem 的 OptionText 的，也就是我们要多找一层
-        """
-        if self is other:
-            return True
-        if self._game is not other._game:
-            return False
-        if self._excel is other._excel or self._excel.id_ == other._excel.id_:
-            return True
+    @typing_extensions.override
+    def _shallow_key(self) -> tuple[object, ...]:
+        # 对于选项来说，它的「自身」是后继们的 OptionText，也就是要多找一层
         if self._option_half:
-            # 是 option 的情况只需要判断后继们的 OptionText 是否相等
-            this_options = [message.option_text for message in self._successors]
-            that_options = [message.option_text for message in other._successors]
-            return this_options == that_options
-        this_contacts = None if self._contacts is None else self._contacts.name
-        that_contacts = None if other._contacts is None else other._contacts.name
-        return (
-            this_contacts == that_contacts and self.content_id == other.content_id and self.main_text == other.main_text
-        )
+            return ("option", *(message.option_text for message in self._successors))
+        contacts_name = None if self._contacts is None else self._contacts.name
+        return ("text", contacts_name, self.content_id, self.main_text)
 
     @typing_extensions.override
     def __eq__(self, other: object) -> bool:
-        """
-        当且仅当所有自身和所有后继都相等时，才判断为相等
-        需要注意的是最后一步判断后继是否相等存在递归，可能会导致性能劣化。
-        目前经测试影响不大，可能是提前用 ID 判等跳出的数据比较多，也就是 ID 不同内容相同的极端数据比较少
-        """
+        """当且仅当自身和所有后继都相等时，才判断为相等，即摘要相等"""
         if not isinstance(other, _Message):
             return False
         if self is other:
             return True
-        if self._option_half != other._option_half:
+        if self._option_half != other._option_half or self._game is not other._game:
             return False
         if self._excel is other._excel or self._excel.id_ == other._excel.id_:
             return True  # 因为上面已经过滤了选择和非选择不一样的情况，所以这里肯定是 True
-        if not self.shallow_eq(other):
-            return False
-        return self._successors == other._successors
-
-    @functools.cached_property
-    def __hash_cache(self) -> int:
-        """
-        计算并缓存 hash 值
-        需要注意的是最后一项包含了后继 hash 会导致递归，所以需要缓存
-        没有缓存会导致性能劣化，目前看全部短信算一次加起来总共从 3s 劣化到 5s 左右
-        """
-        if self._option_half:
-            return hash((*(message.option_text for message in self._successors), *self._successors))
-        contacts_name = "" if self._contacts is None else self._contacts.name
-        return hash((contacts_name, self.content_id, self.main_text, *self._successors))
+        return self.digest == other.digest
 
     @typing_extensions.override
     def __hash__(self) -> int:
-        return self.__hash_cache
+        return hash(self.digest)
 
 
-class MessageSectionConfig(View[excel.MessageSectionConfig], _Node):  # pyright: ignore[reportUnsafeMultipleInheritance]
+class MessageSectionConfig(View[excel.MessageSectionConfig], _Node, metaclass=_NodeMeta):  # pyright: ignore[reportUnsafeMultipleInheritance]
     ExcelOutput: typing.Final = excel.MessageSectionConfig
 
     def __init__(self, game: GameData, excel: excel.MessageSectionConfig):
@@ -596,7 +671,7 @@ class MessageSectionConfig(View[excel.MessageSectionConfig], _Node):  # pyright:
     def id(self) -> int:
         return self._excel.id
 
-    @functools.cached_property
+    @slotted.cached_property
     def __contacts(self) -> MessageContactsConfig:
         return MessageContactsConfig(self._game, self._game._message_section_contacts[self.id])  # pyright: ignore[reportPrivateUsage]
 
@@ -608,10 +683,14 @@ class MessageSectionConfig(View[excel.MessageSectionConfig], _Node):  # pyright:
     def _option_half(self) -> bool:
         return True  # MessageSection 不会有正文，总是要找后继，所以这里 option_half 只能是 True
 
-    @functools.cached_property
+    @slotted.cached_property
     def _successors(self) -> tuple[_Message, ...]:
         return tuple(self.__message_dict[id] for id in self._excel.start_message_item_id_list)
 
+    @typing_extensions.override
+    def _shallow_key(self) -> tuple[object, ...]:
+        return ("section",)
+
     def __find_confluence(self, current: _Node) -> _Message | None:
         """找到公共后继，主要为了找到选项终点合并后续重复项"""
         if current.confluence is not _uninit:
@@ -730,7 +809,7 @@ class MessageSectionConfig(View[excel.MessageSectionConfig], _Node):  # pyright:
         if next_confluence is not None:
             self.wiki_iter_message(wiki, indent, next_confluence, confluence)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __main_mission(self) -> MainMission | None:
         return None if self._excel.main_mission_link is None else self._game.main_mission(self._excel.main_mission_link)
 
@@ -739,7 +818,7 @@ class MessageSectionConfig(View[excel.MessageSectionConfig], _Node):  # pyright:
 
         return None if self.__main_mission is None else MainMission(self._game, self.__main_mission._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __message_dict(self) -> dict[int, _Message]:
         # 逻辑是这样的
         # 进入 wiki_iter_message 之后，立刻就会执行 self.__find_confluence(self)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -18,11 +18,11 @@ class ExtraEffectConfig(View[excel.ExtraEffectConfig]):
 
     ExcelOutput: typing.Final = excel.ExtraEffectConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.extra_effect_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.extra_effect_desc)
 
@@ -46,7 +46,7 @@ class MazeBuff(View[excel.MazeBuff]):
     def id(self) -> int:
         return self._excel.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.buff_name)
 
@@ -58,15 +58,15 @@ class MazeBuff(View[excel.MazeBuff]):
     def level_max(self) -> int:
         return self._excel.lv_max
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.buff_desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def simple_desc(self) -> str:
         return "" if self._excel.buff_simple_desc is None else self._game.text(self._excel.buff_simple_desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def param_list(self) -> tuple[float, ...]:
         return tuple(param.value for param in self._excel.param_list)
 
@@ -74,7 +74,7 @@ class MazeBuff(View[excel.MazeBuff]):
 class RewardData(View[excel.RewardData]):
     ExcelOutput: typing.Final = excel.RewardData
 
-    @functools.cached_property
+    @slotted.cached_property
     def __items(self) -> list[ItemConfig | None]:
         if self._excel.item_id is None:
             return []
@@ -112,13 +112,13 @@ class ScheduleData(View[excel.ScheduleData]):
 class TextJoinConfig(View[excel.TextJoinConfig]):
     ExcelOutput: typing.Final = excel.TextJoinConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def default_item(self) -> TextJoinItem:
         item = self._game.text_join_item(self._excel.default_item)
         assert item is not None
         return item
 
-    @functools.cached_property
+    @slotted.cached_property
     def item_list(self) -> list[TextJoinItem]:
         return list(self._game.text_join_item(self._excel.text_join_item_list))
 
@@ -130,7 +130,7 @@ class TextJoinItem(View[excel.TextJoinItem]):
     def id(self) -> int:
         return self._excel.id
 
-    @functools.cached_property
+    @slotted.cached_property
     def text(self) -> str:
         if self._excel.text_join_text is None:
             return ""
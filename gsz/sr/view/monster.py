@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import functools
 import itertools
 import typing
 
+from ... import slotted
 from .. import excel
 from ..excel import monster
 from .base import View
@@ -74,7 +74,7 @@ class MonsterCamp(View[excel.MonsterCamp]):
 
     ExcelOutput: typing.Final = excel.MonsterCamp
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -94,15 +94,15 @@ class MonsterConfig(View[excel.MonsterConfig]):
     def id(self) -> int:
         return self._excel.monster_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.monster_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def wiki_name(self) -> str:
         return wiki_name(self.name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __template(self) -> MonsterTemplateConfig | None:
         template = self._game.monster_template_config(self._excel.monster_template_id)
         if template is None:
@@ -112,7 +112,7 @@ class MonsterConfig(View[excel.MonsterConfig]):
     def template(self) -> MonsterTemplateConfig | None:
         return None if self.__template is None else MonsterTemplateConfig(self._game, self.__template._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def wiki_rank(self) -> str:  # noqa: PLR0911
         """无法判断是否为末日幻影首领，需要填写的时候注意"""
         if self.__template is None:
@@ -133,7 +133,7 @@ class MonsterConfig(View[excel.MonsterConfig]):
                     return "召唤物"
                 return "普通"
 
-    @functools.cached_property
+    @slotted.cached_property
     def __prototype(self) -> MonsterConfig:
         if self.__template is None:
             return self  # 除了全部迭代，正常处理逻辑不会到这个分支，这个分支是处理一些数据错误的
@@ -229,11 +229,11 @@ class MonsterConfig(View[excel.MonsterConfig]):
             self.__template.stance_base * self._excel.stance_modify_ratio.value + self._excel.stance_modify_value.value
         ) // 3
 
-    @functools.cached_property
+    @slotted.cached_property
     def introduction(self) -> str:
         return self._game.text(self._excel.monster_introduction) if self._excel.monster_introduction is not None else ""
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skills(self) -> list[MonsterSkillConfig]:
         return list(
             self._game.monster_skill_config(
@@ -244,7 +244,7 @@ class MonsterConfig(View[excel.MonsterConfig]):
     def skills(self) -> collections.abc.Iterable[MonsterSkillConfig]:
         return (MonsterSkillConfig(self._game, skill._excel) for skill in self.__skills)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __damage_types(self) -> list[Element]:
         """所有可能的伤害属性，有些敌人可能不同技能有不同的伤害属性"""
         dedup_damage_types: set[Element] = set()
@@ -260,12 +260,12 @@ class MonsterConfig(View[excel.MonsterConfig]):
     def damage_type_resistance(self) -> dict[Element, float]:
         return {damage.damage_type: damage.value.value for damage in self._excel.damage_type_resistance}
 
-    @functools.cached_property
+    @slotted.cached_property
     def phase(self) -> int:
         """敌人总共有多少阶段，只能从技能里找最大的那个 phase"""
         return max(itertools.chain.from_iterable(skill.phase_list for skill in self.__skills), default=1)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __summons(self) -> list[MonsterConfig]:
         """召唤物"""
         dedup_summons = set[str]()
@@ -314,7 +314,7 @@ class MonsterConfig(View[excel.MonsterConfig]):
         """在 phase 阶段的大招数，phase 从 1 开始计数"""
         return sum(skill.is_threat for skill in self.skills_at_phase(phase))
 
-    @functools.cached_property
+    @slotted.cached_property
     def __guide(self) -> MonsterGuideConfig | None:
         return self._game.monster_guide_config(self._excel.monster_id)
 
@@ -356,7 +356,7 @@ class MonsterConfig(View[excel.MonsterConfig]):
 class MonsterSkillConfig(View[excel.MonsterSkillConfig]):
     ExcelOutput: typing.Final = excel.MonsterSkillConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.skill_name)
 
@@ -380,15 +380,15 @@ class MonsterSkillConfig(View[excel.MonsterSkillConfig]):
             return None
         return self._excel.sp_hit_base.value
 
-    @functools.cached_property
+    @slotted.cached_property
     def tag(self) -> str:
         return "" if self._excel.skill_tag is None else self._game.text(self._excel.skill_tag)
 
-    @functools.cached_property
+    @slotted.cached_property
     def param_list(self) -> tuple[float, ...]:
         return tuple(param.value for param in self._excel.param_list)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.skill_desc)
 
@@ -400,11 +400,11 @@ class MonsterTemplateConfig(View[excel.MonsterTemplateConfig]):
     def id(self) -> int:
         return self._excel.monster_template_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.monster_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def wiki_name(self) -> str:
         return wiki_name(self.name)
 
@@ -424,7 +424,7 @@ class MonsterTemplateConfig(View[excel.MonsterTemplateConfig]):
     def group_id(self) -> int | None:
         return self._excel.template_group_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def __group(self) -> list[MonsterTemplateConfig]:
         if self.group_id is None:
             return [self]
@@ -437,7 +437,7 @@ class MonsterTemplateConfig(View[excel.MonsterTemplateConfig]):
     def rank(self) -> monster.Rank:
         return self._excel.rank
 
-    @functools.cached_property
+    @slotted.cached_property
     def __camp(self) -> MonsterCamp | None:
         camp_id = self._excel.monster_camp_id
         if camp_id is None:
@@ -456,7 +456,7 @@ class MonsterTemplateConfig(View[excel.MonsterTemplateConfig]):
     }
     # fmt: on
 
-    @functools.cached_property
+    @slotted.cached_property
     def __npc_monsters(self) -> list[NPCMonsterData]:
         return list(
             self._game.npc_monster_data(
@@ -471,7 +471,7 @@ class MonsterTemplateConfig(View[excel.MonsterTemplateConfig]):
 class NPCMonsterData(View[excel.NPCMonsterData]):
     ExcelOutput: typing.Final = excel.NPCMonsterData
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         if self._excel.npc_name is None:
             return ""
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -16,7 +16,7 @@ if typing.TYPE_CHECKING:
 class MonsterDifficultyGuide(View[excel.MonsterDifficultyGuide]):
     ExcelOutput: typing.Final = excel.MonsterDifficultyGuide
 
-    @functools.cached_property
+    @slotted.cached_property
     def description(self) -> str:
         return self._game.text(self._excel.difficulty_guide_description)
 
@@ -32,28 +32,28 @@ class MonsterGuideConfig(View[excel.MonsterGuideConfig]):
     def id(self) -> int:
         return self._excel.monster_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def __difficulties(self) -> list[MonsterDifficultyGuide]:
         return list(self._game.monster_difficulty_guide(self._excel.difficulty_guide_list))
 
     def difficulties(self) -> collections.abc.Iterable[MonsterDifficultyGuide]:
         return (MonsterDifficultyGuide(self._game, difficulty._excel) for difficulty in self.__difficulties)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __texts(self) -> list[MonsterTextGuide]:
         return list(self._game.monster_text_guide(self._excel.text_guide_list))
 
     def texts(self) -> collections.abc.Iterable[MonsterTextGuide]:
         return (MonsterTextGuide(self._game, text._excel) for text in self.__texts)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __tags(self) -> list[MonsterGuideTag]:
         return list(self._game.monster_guide_tag(self._excel.tag_list))
 
     def tags(self) -> collections.abc.Iterable[MonsterGuideTag]:
         return (MonsterGuideTag(self._game, tag._excel) for tag in self.__tags)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __phases(self) -> list[MonsterGuidePhase]:
         return list(self._game.monster_guide_phase(self._excel.phase_list))
 
@@ -64,15 +64,15 @@ class MonsterGuideConfig(View[excel.MonsterGuideConfig]):
 class MonsterGuidePhase(View[excel.MonsterGuidePhase]):
     ExcelOutput: typing.Final = excel.MonsterGuidePhase
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.phase_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def answer(self) -> str:
         return self._game.text(self._excel.phase_answer)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skills(self) -> list[MonsterGuideSkill]:
         return list(self._game.monster_guide_skill(self._excel.skill_list))
 
@@ -83,11 +83,11 @@ class MonsterGuidePhase(View[excel.MonsterGuidePhase]):
 class MonsterGuideSkill(View[excel.MonsterGuideSkill]):
     ExcelOutput: typing.Final = excel.MonsterGuideSkill
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.skill_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __texts(self) -> list[MonsterGuideSkillText]:
         return list(self._game.monster_guide_skill_text(self._excel.skill_text_id_list))
 
@@ -98,7 +98,7 @@ class MonsterGuideSkill(View[excel.MonsterGuideSkill]):
 class MonsterGuideSkillText(View[excel.MonsterGuideSkillText]):
     ExcelOutput: typing.Final = excel.MonsterGuideSkillText
 
-    @functools.cached_property
+    @slotted.cached_property
     def description(self) -> str:
         return self._game.text(self._excel.skill_description)
 
@@ -110,15 +110,15 @@ class MonsterGuideSkillText(View[excel.MonsterGuideSkillText]):
 class MonsterGuideTag(View[excel.MonsterGuideTag]):
     ExcelOutput: typing.Final = excel.MonsterGuideTag
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.tag_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def brief_description(self) -> str:
         return self._game.text(self._excel.tag_brief_description)
 
-    @functools.cached_property
+    @slotted.cached_property
     def detail_description(self) -> str | None:
         return (
             None if self._excel.tag_detail_description is None else self._game.text(self._excel.tag_detail_description)
@@ -128,7 +128,7 @@ class MonsterGuideTag(View[excel.MonsterGuideTag]):
     def parameter_list(self) -> tuple[float, ...]:
         return tuple(self._excel.parameter_list)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skill(self) -> MonsterSkillConfig | None:
         if self._excel.skill_id is None:
             return None
@@ -141,7 +141,7 @@ class MonsterGuideTag(View[excel.MonsterGuideTag]):
 
         return None if self.__skill is None else MonsterSkillConfig(self._game, self.__skill._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __effects(self) -> list[ExtraEffectConfig]:
         return list(self._game.extra_effect_config(self._excel.effect_id))
 
@@ -154,7 +154,7 @@ class MonsterGuideTag(View[excel.MonsterGuideTag]):
 class MonsterTextGuide(View[excel.MonsterTextGuide]):
     ExcelOutput: typing.Final = excel.MonsterTextGuide
 
-    @functools.cached_property
+    @slotted.cached_property
     def description(self) -> str:
         return self._game.text(self._excel.text_guide_description)
 
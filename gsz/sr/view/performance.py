@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -16,14 +16,13 @@ if typing.TYPE_CHECKING:
 class CutSceneConfig(View[excel.CutSceneConfig]):
     ExcelOutput: typing.Final = excel.CutSceneConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def __captions(self) -> list[act.model.caption.CaptionSentence]:
         from .. import act
 
         if self._excel.caption_path == "":
             return []
-        path = self._game.base.joinpath(self._excel.caption_path)
-        caption = act.model.caption.Caption.model_validate_json(path.read_bytes())
+        caption = self._game.load_json(act.model.caption.Caption, self._excel.caption_path)
         return caption.caption_list
 
     def captions(self) -> collections.abc.Iterable[act.CaptionSentence]:
@@ -41,7 +40,7 @@ class Performance(View[excel.Performance]):
             return None
         return self._game.base.joinpath(self._excel.performance_path.strip())
 
-    @functools.cached_property
+    @slotted.cached_property
     def __performance(self) -> act.Act | None:
         from ..act import Act
 
@@ -60,14 +59,13 @@ class Performance(View[excel.Performance]):
 class VideoConfig(View[excel.VideoConfig]):
     ExcelOutput: typing.Final = excel.VideoConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def __captions(self) -> list[act.model.caption.CaptionSentence]:
         from .. import act
 
         if self._excel.caption_path == "":
             return []
-        path = self._game.base.joinpath(self._excel.caption_path)
-        caption = act.model.caption.Caption.model_validate_json(path.read_bytes())
+        caption = self._game.load_json(act.model.caption.Caption, self._excel.caption_path)
         return caption.caption_list
 
     def captions(self) -> collections.abc.Iterable[act.CaptionSentence]:
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from ..excel import planet_fes
 from .base import View
@@ -21,11 +21,11 @@ class PlanetFesAvatar(View[excel.PlanetFesAvatar]):
     def id(self) -> int:
         return self._excel.id
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rarity(self) -> PlanetFesAvatarRarity:
         rarity = self._game.planet_fes_avatar_rarity(self._excel.rarity.value)
         assert rarity is not None
@@ -42,7 +42,7 @@ class PlanetFesAvatar(View[excel.PlanetFesAvatar]):
     def planet_type(self) -> planet_fes.LandType:
         return self._excel.planet_type
 
-    @functools.cached_property
+    @slotted.cached_property
     def __item(self) -> ItemConfig:
         item = self._game.item_config(self._excel.item_id)
         assert item is not None
@@ -53,14 +53,14 @@ class PlanetFesAvatar(View[excel.PlanetFesAvatar]):
 
         return ItemConfig(self._game, self.__item._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skills_1(self) -> list[PlanetFesBuff]:
         return list(self._game.planet_fes_avatar_buff(self._excel.skill_1_list))
 
     def skills_1(self) -> collections.abc.Iterable[PlanetFesBuff]:
         return (PlanetFesBuff(self._game, skill._excel) for skill in self.__skills_1)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __skills_2(self) -> list[PlanetFesBuff]:
         return list(self._game.planet_fes_avatar_buff(self._excel.skill_2_list))
 
@@ -71,11 +71,11 @@ class PlanetFesAvatar(View[excel.PlanetFesAvatar]):
 class PlanetFesAvatarEvent(View[excel.PlanetFesAvatarEvent]):
     ExcelOutput: typing.Final = excel.PlanetFesAvatarEvent
 
-    @functools.cached_property
+    @slotted.cached_property
     def event_content(self) -> str:
         return self._game.text(self._excel.event_content)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __avatar(self) -> AvatarConfig | None:
         if self._excel.avatar_id is None:
             return None
@@ -88,7 +88,7 @@ class PlanetFesAvatarEvent(View[excel.PlanetFesAvatarEvent]):
 
         return None if self.__avatar is None else AvatarConfig(self._game, self.__avatar._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __options(self) -> list[PlanetFesAvatarEventOption]:
         return list(self._game.planet_fes_avatar_event_option(self._excel.event_option_id_list))
 
@@ -99,26 +99,26 @@ class PlanetFesAvatarEvent(View[excel.PlanetFesAvatarEvent]):
 class PlanetFesAvatarEventOption(View[excel.PlanetFesAvatarEventOption]):
     ExcelOutput: typing.Final = excel.PlanetFesAvatarEventOption
 
-    @functools.cached_property
+    @slotted.cached_property
     def reward_pool_id(self) -> int | None:
         return self._excel.reward_pool_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def event_content(self) -> str:
         return self._game.text(self._excel.event_content)
 
-    @functools.cached_property
+    @slotted.cached_property
     def option_bubble_talk(self) -> str:
         return self._game.text(self._excel.option_bubble_talk)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __next_options(self) -> list[PlanetFesAvatarEventOption]:
         return list(self._game.planet_fes_avatar_event_option(self._excel.next_option_list))
 
     def next_options(self) -> collections.abc.Iterable[PlanetFesAvatarEventOption]:
         return (PlanetFesAvatarEventOption(self._game, option._excel) for option in self.__next_options)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __reward(self) -> PlanetFesGameReward | None:
         if self._excel.activity_reward_id is None:
             return None
@@ -157,7 +157,7 @@ class PlanetFesAvatarLevel(View[excel.PlanetFesAvatarLevel]):
 class PlanetFesAvatarRarity(View[excel.PlanetFesAvatarRarity]):
     ExcelOutput: typing.Final = excel.PlanetFesAvatarRarity
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -169,7 +169,7 @@ class PlanetFesAvatarRarity(View[excel.PlanetFesAvatarRarity]):
 class PlanetFesBuff(View[excel.PlanetFesBuff]):
     ExcelOutput: typing.Final = excel.PlanetFesBuff
 
-    @functools.cached_property
+    @slotted.cached_property
     def __type(self) -> PlanetFesBuffType:
         typ = self._game.planet_fes_buff_type(self._excel.type.value)
         assert typ is not None
@@ -201,7 +201,7 @@ class PlanetFesBuff(View[excel.PlanetFesBuff]):
 class PlanetFesBuffType(View[excel.PlanetFesBuffType]):
     ExcelOutput: typing.Final = excel.PlanetFesBuffType
 
-    @functools.cached_property
+    @slotted.cached_property
     def description(self) -> str:
         return self._game.text(self._excel.decription)
 
@@ -209,7 +209,7 @@ class PlanetFesBuffType(View[excel.PlanetFesBuffType]):
 class PlanetFesCard(View[excel.PlanetFesCard]):
     ExcelOutput: typing.Final = excel.PlanetFesCard
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -217,11 +217,11 @@ class PlanetFesCard(View[excel.PlanetFesCard]):
     def rarity(self) -> typing.Literal[1, 2]:
         return self._excel.rarity
 
-    @functools.cached_property
+    @slotted.cached_property
     def description(self) -> str:
         return self._game.text(self._excel.description)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __buffs(self) -> list[PlanetFesBuff]:
         return list(self._game.planet_fes_buff(self._excel.buff_id_list))
 
@@ -232,11 +232,11 @@ class PlanetFesCard(View[excel.PlanetFesCard]):
 class PlanetFesCardTheme(View[excel.PlanetFesCardTheme]):
     ExcelOutput: typing.Final = excel.PlanetFesCardTheme
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __cards(self) -> list[PlanetFesCard]:
         return list(self._game.planet_fes_card(self._excel.card_id_list))
 
@@ -310,7 +310,7 @@ class PlanetFesGameReward(View[excel.PlanetFesGameReward]):
     def gold_num(self) -> int | None:
         return self._excel.gold_num
 
-    @functools.cached_property
+    @slotted.cached_property
     def __items(self) -> list[tuple[ItemConfig, int]]:
         items: list[tuple[ItemConfig, int]] = []
         for item_id, num in self._excel.item_list.items():
@@ -328,7 +328,7 @@ class PlanetFesGameReward(View[excel.PlanetFesGameReward]):
 class PlanetFesGameRewardPool(View[excel.PlanetFesGameRewardPool]):
     ExcelOutput: typing.Final = excel.PlanetFesGameRewardPool
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rewards(self) -> list[PlanetFesGameReward]:
         return list(self._game.planet_fes_game_reward(self._excel.reward_param.values()))
 
@@ -339,7 +339,7 @@ class PlanetFesGameRewardPool(View[excel.PlanetFesGameRewardPool]):
 class PlanetFesLandType(View[excel.PlanetFesLandType]):
     ExcelOutput: typing.Final = excel.PlanetFesLandType
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -347,7 +347,7 @@ class PlanetFesLandType(View[excel.PlanetFesLandType]):
 class PlanetFesQuest(View[excel.PlanetFesQuest]):
     ExcelOutput: typing.Final = excel.PlanetFesQuest
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str | None:
         return None if self._excel.name is None else self._game.text(self._excel.name)
 
@@ -355,11 +355,11 @@ class PlanetFesQuest(View[excel.PlanetFesQuest]):
     def type(self) -> planet_fes.QuestType:
         return self._excel.quest_type
 
-    @functools.cached_property
+    @slotted.cached_property
     def description(self) -> str:
         return self._game.text(self._excel.description)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __finishway(self) -> PlanetFesFinishway:
         finishway = self._game.planet_fes_finishway(self._excel.finishway_id)
         assert finishway is not None
@@ -368,7 +368,7 @@ class PlanetFesQuest(View[excel.PlanetFesQuest]):
     def finishway(self) -> PlanetFesFinishway:
         return PlanetFesFinishway(self._game, self.__finishway._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __reward_items(self) -> list[tuple[ItemConfig, int]]:
         rewards: list[tuple[ItemConfig, int]] = []
         for element in self._excel.reward_item_list:
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import functools
 import itertools
 import typing
 
+from ... import slotted
 from .. import excel
 from ..excel import rogue
 from .base import View
@@ -20,11 +20,11 @@ if typing.TYPE_CHECKING:
 class RogueBonus(View[excel.RogueBonus]):
     ExcelOutput: typing.Final = excel.RogueBonus
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.bonus_title)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._excel.bonus_desc)
 
@@ -60,7 +60,7 @@ class RogueBuff(View[excel.RogueBuff]):
     def tag(self) -> int:
         return self._excel.rogue_buff_tag
 
-    @functools.cached_property
+    @slotted.cached_property
     def __maze_buff(self) -> MazeBuff:
         maze_buff = (
             None
@@ -75,22 +75,22 @@ class RogueBuff(View[excel.RogueBuff]):
 
         return MazeBuff(self._game, self.__maze_buff._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_buff_group(self) -> list[RogueBuffGroup]:
         groups = self._game._rogue_buff_tag_groups.get(self.tag)  # pyright: ignore[reportPrivateUsage]
         if groups is None:
             return []
         return [RogueBuffGroup(self._game, group) for group in groups]
 
-    @functools.cached_property
+    @slotted.cached_property
     def __tag_drops(self) -> list[RogueBuff]:
         return list(itertools.chain.from_iterable(group.drops() for group in self.__rogue_buff_group))
 
-    @functools.cached_property
+    @slotted.cached_property
     def tag_drops(self) -> collections.abc.Iterable[RogueBuff]:
         return [RogueBuff(self._game, member._excel) for member in self.__tag_drops]
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_buff_type(self) -> RogueBuffType:
         typ = self._game.rogue_buff_type(self._excel.rogue_buff_type)
         assert typ is not None
@@ -99,7 +99,7 @@ class RogueBuff(View[excel.RogueBuff]):
     def type(self) -> RogueBuffType:
         return RogueBuffType(self._game, self.__rogue_buff_type._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_tourn_buffs(self) -> list[RogueTournBuff]:
         return list(self._game.rogue_tourn_buff_name(self.name))
 
@@ -122,7 +122,7 @@ class RogueBuff(View[excel.RogueBuff]):
             case None:
                 return None  # 无尽活动存在无稀有度祝福
 
-    @functools.cached_property
+    @slotted.cached_property
     def __upgrade(self) -> RogueBuff | None:
         if self.__maze_buff.level_max == 1:
             return None
@@ -133,7 +133,7 @@ class RogueBuff(View[excel.RogueBuff]):
     def upgrade(self) -> RogueBuff | None:
         return None if self.__upgrade is None else RogueBuff(self._game, self.__upgrade._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __degrade(self) -> RogueBuff:
         if self._excel.maze_buff_level == 1:
             return self
@@ -194,7 +194,7 @@ class RogueBuffGroup(View[excel.RogueBuffGroup]):
     def rogue_buff_drop(self) -> list[int]:
         return self._excel.rogue_buff_drop
 
-    @functools.cached_property
+    @slotted.cached_property
     def __drops(self) -> list[RogueBuff]:
         members: list[RogueBuff] = []
         for member_tag in self.rogue_buff_drop:
@@ -211,15 +211,15 @@ class RogueBuffGroup(View[excel.RogueBuffGroup]):
 class RogueBuffType(View[excel.RogueBuffType]):
     ExcelOutput: typing.Final = excel.RogueBuffType
 
-    @functools.cached_property
+    @slotted.cached_property
     def text(self) -> str:
         return self._game.text(self._excel.rogue_buff_type_textmap_id)
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.rogue_buff_type_title)
 
-    @functools.cached_property
+    @slotted.cached_property
     def subtitle(self) -> str:
         if self._excel.rogue_buff_type_sub_title is None:
             return ""
@@ -229,7 +229,7 @@ class RogueBuffType(View[excel.RogueBuffType]):
 class RogueDialogueDynamicDisplay(View[excel.RogueDialogueDynamicDisplay]):
     ExcelOutput: typing.Final = excel.RogueDialogueDynamicDisplay
 
-    @functools.cached_property
+    @slotted.cached_property
     def content(self) -> str:
         return self._game.text(self._excel.content_text)
 
@@ -237,13 +237,13 @@ class RogueDialogueDynamicDisplay(View[excel.RogueDialogueDynamicDisplay]):
 class RogueDialogueOptionDisplay(View[excel.RogueDialogueOptionDisplay]):
     ExcelOutput: typing.Final = excel.RogueDialogueOptionDisplay
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         if self._excel.option_title is None:
             return ""
         return self._game.text(self._excel.option_title)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         if self._excel.option_desc is None:
             return ""
@@ -293,22 +293,22 @@ class RogueHandBookEvent(View[excel.RogueHandBookEvent]):
     def name(self) -> str:
         return self.title
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.event_title)
 
-    @functools.cached_property
+    @slotted.cached_property
     def type(self) -> str:
         return self._game.text(self._excel.event_type)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __types(self) -> list[RogueHandBookEventType]:
         return list(self._game.rogue_hand_book_event_type(self._excel.event_type_list))
 
     def types(self) -> collections.abc.Iterable[RogueHandBookEventType]:
         return (RogueHandBookEventType(self._game, typ._excel) for typ in self.__types)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __npcs(self) -> list[RogueNPC]:
         npcs: list[RogueNPC] = []
         for npc_progress_id in self._excel.unlock_npc_progress_id_list:
@@ -322,7 +322,7 @@ class RogueHandBookEvent(View[excel.RogueHandBookEvent]):
     def npcs(self) -> collections.abc.Iterable[RogueNPC]:
         return (RogueNPC(self._game, npc._excel) for npc in self.__npcs)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __dialogues(self) -> list[act.Dialogue]:
         dialogues: list[act.Dialogue] = []
         for prog_id, npc in zip(self._excel.unlock_npc_progress_id_list, self.__npcs, strict=True):
@@ -337,7 +337,7 @@ class RogueHandBookEvent(View[excel.RogueHandBookEvent]):
 
         return (Dialogue(self._game, dialogue._dialogue) for dialogue in self.__dialogues)  # pyright: ignore[reportPrivateUsage]
 
-    @functools.cached_property
+    @slotted.cached_property
     def __reward(self) -> RewardData:
         reward = self._game.reward_data(self._excel.event_reward)
         assert reward is not None
@@ -352,7 +352,7 @@ class RogueHandBookEvent(View[excel.RogueHandBookEvent]):
 class RogueHandBookEventType(View[excel.RogueHandBookEventType]):
     ExcelOutput: typing.Final = excel.RogueHandBookEventType
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.rogue_event_type_title)
 
@@ -368,7 +368,7 @@ class RogueHandbookMiracle(View[excel.RogueHandbookMiracle]):
             return self.__rogue_miracle_display.name
         return ""
 
-    @functools.cached_property
+    @slotted.cached_property
     def wiki_name(self) -> str:
         return self._game._mw_formatter.format(self.name.replace("#", "＃"))  # pyright: ignore[reportPrivateUsage]
 
@@ -400,11 +400,11 @@ class RogueHandbookMiracle(View[excel.RogueHandbookMiracle]):
             return self.__rogue_miracle_display.bg_desc
         return ""
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_handbook_miracle_type(self) -> list[RogueHandbookMiracleType]:
         return list(self._game.rogue_handbook_miracle_type(self._excel.miracle_type_list))
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_magic_miracle(self) -> RogueMiracle | None:
         if self._excel.miracle_id_for_effect_display is None:
             return None
@@ -415,7 +415,7 @@ class RogueHandbookMiracle(View[excel.RogueHandbookMiracle]):
     def types(self) -> collections.abc.Iterable[RogueHandbookMiracleType]:
         return (RogueHandbookMiracleType(self._game, typ._excel) for typ in self.__rogue_handbook_miracle_type)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_miracle_display(self) -> RogueMiracleDisplay | None:
         # 不可知域 2.7 ~ 3.0 版本的奇物都没有正确的 RogueMiracleDisplay，索引到 RogueTournMiracleDisplay 去了
         display = self._game.rogue_miracle_display(self._excel.miracle_display_id)
@@ -424,7 +424,7 @@ class RogueHandbookMiracle(View[excel.RogueHandbookMiracle]):
         assert display is not None
         return display
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_miracle_effect_display(self) -> RogueMiracleEffectDisplay | None:
         if self._excel.miracle_effect_display_id is None:
             return None
@@ -432,7 +432,7 @@ class RogueHandbookMiracle(View[excel.RogueHandbookMiracle]):
         assert display is not None
         return display
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_miracles(self) -> list[RogueMiracle]:
         miracles = self._game._rogue_handbook_miracle_miracles.get(self._excel.id)  # pyright: ignore[reportPrivateUsage]
         if miracles is None:
@@ -442,7 +442,7 @@ class RogueHandbookMiracle(View[excel.RogueHandbookMiracle]):
     def rogue_miracles(self) -> collections.abc.Iterable[RogueMiracle]:
         return (RogueMiracle(self._game, miracle._excel) for miracle in self.__rogue_miracles)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_tourn_handbook_miracle(self) -> RogueTournHandbookMiracle | None:
         handbook = [
             handbook
@@ -451,7 +451,7 @@ class RogueHandbookMiracle(View[excel.RogueHandbookMiracle]):
         ]
         return None if len(handbook) == 0 else handbook[-1]
 
-    @functools.cached_property
+    @slotted.cached_property
     def __same_name_rogue_tourn_miracles(self) -> list[RogueTournMiracle]:
         return self._game.rogue_tourn_miracle_name(self.name)
 
@@ -473,7 +473,7 @@ class RogueHandbookMiracle(View[excel.RogueHandbookMiracle]):
 class RogueHandbookMiracleType(View[excel.RogueHandbookMiracleType]):
     ExcelOutput: typing.Final = excel.RogueHandbookMiracleType
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.rogue_miracle_type_title)
 
@@ -481,7 +481,7 @@ class RogueHandbookMiracleType(View[excel.RogueHandbookMiracleType]):
 class RogueMiracle(View[excel.RogueMiracle]):
     ExcelOutput: typing.Final = excel.RogueMiracle
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         if self._excel.miracle_name is not None:
             return self._game.text(self._excel.miracle_name)
@@ -489,7 +489,7 @@ class RogueMiracle(View[excel.RogueMiracle]):
             return self.__rogue_miracle_display.name
         return ""
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         """效果"""
         if self._excel.miracle_desc is not None:
@@ -502,7 +502,7 @@ class RogueMiracle(View[excel.RogueMiracle]):
             return self.__rogue_miracle_display.desc
         return ""
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc_param_list(self) -> tuple[float, ...]:
         if self._excel.desc_param_list is not None:
             return tuple(param.value for param in self._excel.desc_param_list)
@@ -512,7 +512,7 @@ class RogueMiracle(View[excel.RogueMiracle]):
             return self.__rogue_miracle_display.desc_param_list
         return ()
 
-    @functools.cached_property
+    @slotted.cached_property
     def bg_desc(self) -> str:
         """奇物背景故事"""
         if self._excel.miracle_bg_desc is not None:
@@ -527,7 +527,7 @@ class RogueMiracle(View[excel.RogueMiracle]):
             return self.__rogue_miracle_display.tag
         return ""
 
-    @functools.cached_property
+    @slotted.cached_property
     def __same_name_rogue_miracles(self) -> list[RogueMiracle]:
         return self._game.rogue_miracle_name(self.name)
 
@@ -535,7 +535,7 @@ class RogueMiracle(View[excel.RogueMiracle]):
         """同名模拟宇宙奇物"""
         return (RogueMiracle(self._game, miracle._excel) for miracle in self.__same_name_rogue_miracles)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __same_name_tourn_miracles(self) -> list[RogueTournMiracle]:
         return self._game.rogue_tourn_miracle_name(self.name)
 
@@ -545,7 +545,7 @@ class RogueMiracle(View[excel.RogueMiracle]):
 
         return (RogueTournMiracle(self._game, miracle._excel) for miracle in self.__same_name_tourn_miracles)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_miracle_display(self) -> RogueMiracleDisplay | None:
         if self._excel.miracle_display_id is None:
             # 兼容 1.2 老数据
@@ -578,7 +578,7 @@ class RogueMiracle(View[excel.RogueMiracle]):
             return None
         return RogueMiracleDisplay(self._game, self.__rogue_miracle_display._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_miracle_effect_display(self) -> RogueMiracleEffectDisplay | None:
         if self._excel.miracle_effect_display_id is None:
             return None
@@ -592,7 +592,7 @@ class RogueMiracle(View[excel.RogueMiracle]):
             return None
         return RogueMiracleEffectDisplay(self._game, self.__rogue_miracle_effect_display._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_handbook_miracle(self) -> RogueHandbookMiracle | None:
         if self._excel.unlock_handbook_miracle_id is None:
             return None
@@ -610,29 +610,29 @@ class RogueMiracle(View[excel.RogueMiracle]):
 class RogueMiracleDisplay(View[excel.RogueMiracleDisplay]):
     ExcelOutput: typing.Final = excel.RogueMiracleDisplay
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.miracle_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         if self._excel.miracle_desc is None:
             return ""
         return self._game.text(self._excel.miracle_desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc_param_list(self) -> tuple[float, ...]:
         if self._excel.desc_param_list is None:
             return ()
         return tuple(param.value for param in self._excel.desc_param_list)
 
-    @functools.cached_property
+    @slotted.cached_property
     def bg_desc(self) -> str:
         if self._excel.miracle_bg_desc is None:
             return ""
         return self._game.text(self._excel.miracle_bg_desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def tag(self) -> str:
         if self._excel.miracle_tag is None:
             return ""
@@ -642,19 +642,19 @@ class RogueMiracleDisplay(View[excel.RogueMiracleDisplay]):
 class RogueMiracleEffectDisplay(View[excel.RogueMiracleEffectDisplay]):
     ExcelOutput: typing.Final = excel.RogueMiracleEffectDisplay
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         if self._excel.miracle_desc is None:
             return ""
         return self._game.text(self._excel.miracle_desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def simple_desc(self) -> str:
         if self._excel.miracle_simple_desc is None:
             return ""
         return self._game.text(self._excel.miracle_simple_desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc_param_list(self) -> tuple[float, ...]:
         return tuple(param.value for param in self._excel.desc_param_list)
 
@@ -670,7 +670,7 @@ class RogueMonster(View[excel.RogueMonster]):
     def wiki_name(self) -> str:
         return self.__monster.wiki_name
 
-    @functools.cached_property
+    @slotted.cached_property
     def __monster(self) -> NPCMonsterData:
         monster = self._game.npc_monster_data(self._excel.npc_monster_id)
         assert monster is not None
@@ -697,19 +697,18 @@ class RogueMonsterGroup(View[excel.RogueMonsterGroup]):
 class RogueNPC(View[excel.RogueNPC]):
     ExcelOutput: typing.Final = excel.RogueNPC
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         talk = self._game.rogue_talk_name_config(self._excel.id)
         if talk is None:
             return ""
         return talk.name
 
-    @functools.cached_property
+    @slotted.cached_property
     def __dialogue_list(self) -> list[act.model.Dialogue]:
         from .. import act
 
-        npc_json_path = self._game.base / self._excel.npc_json_path
-        npc = act.model.RogueNPC.model_validate_json(npc_json_path.read_bytes())
+        npc = self._game.load_json(act.model.RogueNPC, self._excel.npc_json_path)
         return npc.dialogue_list
 
     def dialogue_list(self) -> collections.abc.Iterable[act.Dialogue]:
@@ -721,10 +720,10 @@ class RogueNPC(View[excel.RogueNPC]):
 class RogueTalkNameConfig(View[excel.RogueTalkNameConfig]):
     ExcelOutput: typing.Final = excel.RogueTalkNameConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def sub_name(self) -> str:
         return self._game.text(self._excel.sub_name)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import datetime
-import functools
 import itertools
 import typing
 
+from ... import slotted
 from .. import excel
 from ..excel import rogue, rogue_tourn
 from .base import View
@@ -29,7 +29,7 @@ if typing.TYPE_CHECKING:
 class RoguePersonaStyle(View[excel.RoguePersonaStyle]):
     ExcelOutput: typing.Final = excel.RoguePersonaStyle
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.name)
 
@@ -45,7 +45,7 @@ class RogueTournBuff(View[excel.RogueTournBuff]):
     def name(self) -> str:
         return self.__maze_buff.name
 
-    @functools.cached_property
+    @slotted.cached_property
     def wiki_name(self) -> str:
         return self._game._mw_formatter.format(self.__maze_buff.name.replace("\xa0", ""))  # pyright: ignore[reportPrivateUsage]
 
@@ -73,7 +73,7 @@ class RogueTournBuff(View[excel.RogueTournBuff]):
     def tag(self) -> int:
         return self._excel.rogue_buff_tag
 
-    @functools.cached_property
+    @slotted.cached_property
     def __maze_buff(self) -> MazeBuff:
         buff = self._game.rogue_maze_buff(self._excel.maze_buff_id, self._excel.maze_buff_level)
         assert buff is not None
@@ -84,7 +84,7 @@ class RogueTournBuff(View[excel.RogueTournBuff]):
 
         return MazeBuff(self._game, self.__maze_buff._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_buffs(self) -> list[RogueBuff]:
         return list(self._game.rogue_buff_name(self.name))
 
@@ -93,7 +93,7 @@ class RogueTournBuff(View[excel.RogueTournBuff]):
 
         return (RogueBuff(self._game, buff._excel) for buff in self.__rogue_buffs)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_tourn_buff_type(self) -> RogueTournBuffType:
         typ = self._game.rogue_tourn_buff_type(self._excel.rogue_buff_type)
         assert typ is not None
@@ -104,7 +104,7 @@ class RogueTournBuff(View[excel.RogueTournBuff]):
 
         return RogueTournBuffType(self._game, self.__rogue_tourn_buff_type._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_tourn_buff_group(self) -> list[RogueTournBuffGroup]:
         groups = self._game._rogue_tourn_buff_tag_groups.get(self.tag)  # pyright: ignore[reportPrivateUsage]
         if groups is None:
@@ -114,21 +114,21 @@ class RogueTournBuff(View[excel.RogueTournBuff]):
     def tag_group(self) -> collections.abc.Iterable[RogueTournBuffGroup]:
         return (RogueTournBuffGroup(self._game, group._excel) for group in self.__rogue_tourn_buff_group)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __tag_drops(self) -> list[RogueTournBuff]:
         return list(itertools.chain.from_iterable(group.drops() for group in self.__rogue_tourn_buff_group))
 
     def tag_drops(self) -> collections.abc.Iterable[RogueTournBuff]:
         return (RogueTournBuff(self._game, drop._excel) for drop in self.__tag_drops)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_tourn_buffs(self) -> list[RogueTournBuff]:
         return self._game.rogue_tourn_buff_name(self.name)
 
     def tourn_buffs(self) -> collections.abc.Iterable[RogueTournBuff]:
         return (RogueTournBuff(self._game, buff._excel) for buff in self.__rogue_tourn_buffs)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __degrade(self) -> RogueTournBuff:
         if self._excel.maze_buff_level == 1:
             return self
@@ -136,7 +136,7 @@ class RogueTournBuff(View[excel.RogueTournBuff]):
         assert buff is not None
         return buff
 
-    @functools.cached_property
+    @slotted.cached_property
     def __upgrade(self) -> RogueTournBuff | None:
         if self.__maze_buff.level_max == 1:
             return None
@@ -194,7 +194,7 @@ class RogueTournBuffGroup(View[excel.RogueTournBuffGroup]):
     def mode(self) -> rogue_tourn.Mode | None:
         return self._excel.tourn_mode
 
-    @functools.cached_property
+    @slotted.cached_property
     def __drops(self) -> list[RogueTournBuff]:
         drops: list[RogueTournBuff] = []
         for drop in self.rogue_buff_drop:
@@ -211,15 +211,15 @@ class RogueTournBuffGroup(View[excel.RogueTournBuffGroup]):
 class RogueTournBuffType(View[excel.RogueTournBuffType]):
     ExcelOutput: typing.Final = excel.RogueTournBuffType
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.rogue_buff_type_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return "" if self._excel.rogue_buff_type_title is None else self._game.text(self._excel.rogue_buff_type_title)
 
-    @functools.cached_property
+    @slotted.cached_property
     def subtitle(self) -> str:
         return (
             ""
@@ -235,7 +235,7 @@ class RogueTournFormula(View[excel.RogueTournFormula]):
     def name(self) -> str:
         return self.__maze_buff.name
 
-    @functools.cached_property
+    @slotted.cached_property
     def wiki_name(self) -> str:
         name = self._game._mw_formatter.format(self.name)  # pyright: ignore[reportPrivateUsage]
         if self.category is rogue_tourn.FormulaCategory.PathEcho and self.mode is rogue_tourn.Mode.Tourn1:
@@ -266,7 +266,7 @@ class RogueTournFormula(View[excel.RogueTournFormula]):
         """
         return self._excel.tourn_mode
 
-    @functools.cached_property
+    @slotted.cached_property
     def __main_buff_type(self) -> RogueTournBuffType:
         buff_type = self._game.rogue_tourn_buff_type(self._excel.main_buff_type_id)
         assert buff_type is not None
@@ -279,7 +279,7 @@ class RogueTournFormula(View[excel.RogueTournFormula]):
     def main_buff_type(self) -> RogueTournBuffType:
         return RogueTournBuffType(self._game, self.__main_buff_type._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __sub_buff_type(self) -> RogueTournBuffType | None:
         if self._excel.sub_buff_type_id is None:
             return None
@@ -294,7 +294,7 @@ class RogueTournFormula(View[excel.RogueTournFormula]):
     def sub_buff_num(self) -> int | None:
         return self._excel.sub_buff_num
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_tourn_formula_display(self) -> RogueTournFormulaDisplay:
         display = self._game.rogue_tourn_formula_display(self._excel.formula_display_id)
         assert display is not None
@@ -304,7 +304,7 @@ class RogueTournFormula(View[excel.RogueTournFormula]):
         """方程效果和演绎"""
         return RogueTournFormulaDisplay(self._game, self.__rogue_tourn_formula_display._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __story(self) -> act.Act | None:
         from ..act import Act
 
@@ -318,7 +318,7 @@ class RogueTournFormula(View[excel.RogueTournFormula]):
 
         return None if self.__story is None else Act(self._game, self.__story._act)  # pyright: ignore[reportPrivateUsage]
 
-    @functools.cached_property
+    @slotted.cached_property
     def __maze_buff(self) -> MazeBuff:
         maze_buff = self._game.rogue_maze_buff(self._excel.maze_buff_id, 1)
         assert maze_buff is not None
@@ -336,7 +336,7 @@ class RogueTournFormula(View[excel.RogueTournFormula]):
 class RogueTournFormulaDisplay(View[excel.RogueTournFormulaDisplay]):
     ExcelOutput: typing.Final = excel.RogueTournFormulaDisplay
 
-    @functools.cached_property
+    @slotted.cached_property
     def story(self) -> str:
         return self._game.text(self._excel.formula_story)
 
@@ -348,11 +348,11 @@ class RogueTournHandBookEvent(View[excel.RogueTournHandBookEvent]):
     def name(self) -> str:
         return self.title
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._excel.event_title)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __npcs(self) -> list[RogueNPC]:
         npcs: list[RogueNPC] = []
         for npc_progress_id in self._excel.unlock_npc_progress_id_list:
@@ -366,7 +366,7 @@ class RogueTournHandBookEvent(View[excel.RogueTournHandBookEvent]):
 
         return (RogueNPC(self._game, npc._excel) for npc in self.__npcs)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __dialogues(self) -> list[act.Dialogue]:
         try:
             dialogues: list[act.Dialogue] = []
@@ -418,7 +418,7 @@ class RogueTournHandbookMiracle(View[excel.RogueTournHandbookMiracle]):
     def category(self) -> rogue_tourn.MiracleCategory:
         return self._excel.miracle_category
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_tourn_miracle_display(self) -> RogueMiracleDisplay:
         display = self._game.rogue_miracle_display(self._excel.miracle_display_id)
         if display is None:
@@ -426,7 +426,7 @@ class RogueTournHandbookMiracle(View[excel.RogueTournHandbookMiracle]):
         assert display is not None
         return display
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_tourn_miracle_effect_display(self) -> RogueMiracleEffectDisplay | None:
         return (
             None
@@ -434,20 +434,20 @@ class RogueTournHandbookMiracle(View[excel.RogueTournHandbookMiracle]):
             else self._game.rogue_miracle_effect_display(self._excel.miracle_effect_display_id)
         )
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_handbook_miracle(self) -> RogueHandbookMiracle | None:
         handbook = self._game.rogue_handbook_miracle_name(self.name)
         assert len(handbook) in (0, 1)
         return None if len(handbook) == 0 else handbook[0]
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_tourn_miracles(self) -> list[RogueTournMiracle]:
         miracles = self._game._rogue_tourn_handbook_miracle_miracles.get(self._excel.id)  # pyright: ignore[reportPrivateUsage]
         if miracles is None:
             return []
         return [RogueTournMiracle(self._game, miracle) for miracle in miracles]
 
-    @functools.cached_property
+    @slotted.cached_property
     def __same_name_rogue_tourn_miracles(self) -> list[RogueTournMiracle]:
         return self._game.rogue_tourn_miracle_name(self.name)
 
@@ -490,7 +490,7 @@ class RogueTournMiracle(View[excel.RogueTournMiracle]):
             return self.__rogue_tourn_miracle_display.name
         return ""
 
-    @functools.cached_property
+    @slotted.cached_property
     def wiki_name(self) -> str:
         return self._game._mw_formatter.format(self.name.replace("#", "＃"))  # pyright: ignore[reportPrivateUsage]
 
@@ -526,7 +526,7 @@ class RogueTournMiracle(View[excel.RogueTournMiracle]):
     def tag(self) -> str:
         return self.__rogue_tourn_miracle_display.tag
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_tourn_miracle_display(self) -> RogueMiracleDisplay:
         display = self._game.rogue_miracle_display(self._excel.miracle_display_id)
         if display is None:
@@ -540,7 +540,7 @@ class RogueTournMiracle(View[excel.RogueTournMiracle]):
 
         return RogueMiracleDisplay(self._game, self.__rogue_tourn_miracle_display._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __rogue_miracle_effect_display(self) -> RogueMiracleEffectDisplay | None:
         if self._excel.miracle_effect_display_id is None:
             return None
@@ -556,7 +556,7 @@ class RogueTournMiracle(View[excel.RogueTournMiracle]):
             return None
         return RogueMiracleEffectDisplay(self._game, self.__rogue_miracle_effect_display._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __same_name_rogue_miracles(self) -> list[RogueMiracle]:
         return self._game.rogue_miracle_name(self.name)
 
@@ -566,7 +566,7 @@ class RogueTournMiracle(View[excel.RogueTournMiracle]):
 
         return (RogueMiracle(self._game, miracle._excel) for miracle in self.__same_name_rogue_miracles)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __same_name_rogue_tourn_miracles(self) -> list[RogueTournMiracle]:
         return self._game.rogue_tourn_miracle_name(self.name)
 
@@ -596,7 +596,7 @@ class RogueTournTitanBless(View[excel.RogueTournTitanBless]):
     def level(self) -> int:
         return self._excel.titan_bless_level
 
-    @functools.cached_property
+    @slotted.cached_property
     def __maze_buff(self) -> MazeBuff:
         buff = self._game.rogue_maze_buff(self._excel.maze_buff_id, 1)
         assert buff is not None
@@ -615,7 +615,7 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
     def id(self) -> int:
         return self._excel.challenge_id
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.weekly_name)
 
@@ -626,7 +626,7 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
     V42_CHALLENGE_MONDAY: datetime.datetime = datetime.datetime(2026, 4, 20, 4, tzinfo=ASIA_SHANGHAI)
     """4.2 版本开始，周期演算变回一周一次，和货币战争共享周期"""
 
-    @functools.cached_property
+    @slotted.cached_property
     def begin_time(self) -> datetime.datetime:
         if self.id == 1:
             return self.FIRST_CHALLENGE_MONDAY + datetime.timedelta(days=2, hours=7)
@@ -643,7 +643,7 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
     def begin_date(self) -> datetime.date:
         return self.begin_time.date()
 
-    @functools.cached_property
+    @slotted.cached_property
     def end_time(self) -> datetime.datetime:
         if self.id < 73:
             return self.FIRST_CHALLENGE_MONDAY + datetime.timedelta(weeks=self.id, milliseconds=-1)
@@ -654,14 +654,14 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
     def end_date(self) -> datetime.date:
         return self.end_time.date() - datetime.timedelta(days=1)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __contents(self) -> list[RogueTournWeeklyDisplay]:
         return list(self._game.rogue_tourn_weekly_display(self._excel.weekly_content_list))
 
     def contents(self) -> collections.abc.Iterable[RogueTournWeeklyDisplay]:
         return (RogueTournWeeklyDisplay(self._game, display._excel) for display in self.__contents)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __details(self) -> list[RogueTournWeeklyDisplay]:
         # 几个不存在的值，据观察不存在直接没展示
         weekly_content_detail_list = (
@@ -697,7 +697,7 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
                 assert bonus is not None
         return bonus
 
-    @functools.cached_property
+    @slotted.cached_property
     def __bonus(self) -> RogueBonus | None:
         if len(self.formulas()) == 0:
             return None
@@ -712,7 +712,7 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
 
         return None if self.__bonus is None else RogueBonus(self._game, self.__bonus._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __monster_1st_plain(self) -> list[RogueMonster]:
         monster_group_id = self._excel.display_monster_groups_1["0"]
         monster_group = self._game.rogue_monster_group(monster_group_id)
@@ -724,7 +724,7 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
 
         return (RogueMonster(self._game, monster._excel) for monster in self.__monster_1st_plain)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __monster_1st_plain_v3(self) -> list[RogueMonster]:
         monster_group_id = self._excel.display_monster_groups_1["3"]
         monster_group = self._game.rogue_monster_group(monster_group_id)
@@ -736,7 +736,7 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
 
         return (RogueMonster(self._game, monster._excel) for monster in self.__monster_1st_plain_v3)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __monster_2nd_plain(self) -> list[RogueMonster]:
         monster_group_id = self._excel.display_monster_groups_2["0"]
         monster_group = self._game.rogue_monster_group(monster_group_id)
@@ -748,7 +748,7 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
 
         return (RogueMonster(self._game, monster._excel) for monster in self.__monster_2nd_plain)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __monster_2nd_plain_v3(self) -> list[RogueMonster]:
         monster_group_id = self._excel.display_monster_groups_2["3"]
         monster_group = self._game.rogue_monster_group(monster_group_id)
@@ -760,7 +760,7 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
 
         return (RogueMonster(self._game, monster._excel) for monster in self.__monster_2nd_plain_v3)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __monster_3rd_plain(self) -> list[RogueMonster]:
         monster_group_id = self._excel.display_monster_groups_3["0"]
         monster_group = self._game.rogue_monster_group(monster_group_id)
@@ -788,11 +788,11 @@ class RogueTournWeeklyChallenge(View[excel.RogueTournWeeklyChallenge]):
 class RogueTournWeeklyDisplay(View[excel.RogueTournWeeklyDisplay]):
     ExcelOutput: typing.Final = excel.RogueTournWeeklyDisplay
 
-    @functools.cached_property
+    @slotted.cached_property
     def content(self) -> str:
         return self._game.text(self._excel.weekly_display_content)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __desc_params(self) -> list[RogueTournFormula | RogueTournMiracle | RogueTournTitanBless | RoguePersonaStyle]:
         params: list[RogueTournFormula | RogueTournMiracle | RogueTournTitanBless | RoguePersonaStyle] = []
         for param in self._excel.desc_params:
@@ -815,12 +815,12 @@ class RogueTournWeeklyDisplay(View[excel.RogueTournWeeklyDisplay]):
                     params.append(value)
         return params
 
-    @functools.cached_property
+    @slotted.cached_property
     def wiki_content(self) -> str:
         desc_params = [param.wiki_name for param in self.__desc_params]
         return self._game._mw_formatter.format(self.content, desc_params)  # pyright: ignore[reportPrivateUsage]
 
-    @functools.cached_property
+    @slotted.cached_property
     def __miracles(self) -> list[RogueTournMiracle]:
         miracle_ids = [
             param.value
@@ -833,7 +833,7 @@ class RogueTournWeeklyDisplay(View[excel.RogueTournWeeklyDisplay]):
     def miracles(self) -> collections.abc.Iterable[RogueTournMiracle]:
         return (RogueTournMiracle(self._game, miracle._excel) for miracle in self.__miracles)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __formulas(self) -> list[RogueTournFormula]:
         formula_ids = [
             param.value for param in self._excel.desc_params if param.type is rogue_tourn.DescParamType.Formula
@@ -843,7 +843,7 @@ class RogueTournWeeklyDisplay(View[excel.RogueTournWeeklyDisplay]):
     def formulas(self) -> collections.abc.Iterable[RogueTournFormula]:
         return (RogueTournFormula(self._game, formula._excel) for formula in self.__formulas)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __titan_blesses(self) -> list[RogueTournTitanBless]:
         titan_blessing_ids = [
             param.value for param in self._excel.desc_params if param.type is rogue_tourn.DescParamType.TitanBless
@@ -853,7 +853,7 @@ class RogueTournWeeklyDisplay(View[excel.RogueTournWeeklyDisplay]):
     def titan_blesses(self) -> collections.abc.Iterable[RogueTournTitanBless]:
         return (RogueTournTitanBless(self._game, titan_bless._excel) for titan_bless in self.__titan_blesses)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __persona_style(self) -> list[RoguePersonaStyle]:
         persona_style_ids = [
             param.value for param in self._excel.desc_params if param.type is rogue_tourn.DescParamType.PersonaStyle
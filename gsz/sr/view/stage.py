@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from ..excel import monster, stage
 from .base import View
@@ -16,15 +16,15 @@ if typing.TYPE_CHECKING:
 class StageConfig(View[excel.StageConfig]):
     ExcelOutput: typing.Final = excel.StageConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._excel.stage_name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def wave(self) -> int | None:
         return next((int(data.val) for data in self._excel.stage_config_data if data.key == stage.DataKey.Wave), None)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __monster_lists(self) -> list[list[MonsterConfig]]:
         monster_lists: list[list[MonsterConfig]] = []
         for monster_list in self._excel.monster_list:
@@ -44,7 +44,7 @@ class StageConfig(View[excel.StageConfig]):
             for monster_list in self.__monster_lists
         ]
 
-    @functools.cached_property
+    @slotted.cached_property
     def __stage_infinite_group(self) -> StageInfiniteGroup | None:
         stage_infinite_group_id = next(
             (int(data.val) for data in self._excel.stage_config_data if data.key == stage.DataKey.StageInfiniteGroup),
@@ -63,7 +63,7 @@ class StageConfig(View[excel.StageConfig]):
             else StageInfiniteGroup(self._game, self.__stage_infinite_group._excel)
         )
 
-    @functools.cached_property
+    @slotted.cached_property
     def __hard_level_group(self) -> HardLevelGroup:
         hard_level_group = self._game.hard_level_group(self._excel.hard_level_group, self._excel.level)
         assert hard_level_group is not None
@@ -78,7 +78,7 @@ class StageConfig(View[excel.StageConfig]):
 class StageInfiniteGroup(View[excel.StageInfiniteGroup]):
     ExcelOutput: typing.Final = excel.StageInfiniteGroup
 
-    @functools.cached_property
+    @slotted.cached_property
     def __waves(self) -> list[StageInfiniteWaveConfig]:
         return list(self._game.stage_infinite_wave_config(self._excel.wave_id_list))
 
@@ -95,7 +95,7 @@ class StageInfiniteGroup(View[excel.StageInfiniteGroup]):
 class StageInfiniteMonsterGroup(View[excel.StageInfiniteMonsterGroup]):
     ExcelOutput: typing.Final = excel.StageInfiniteMonsterGroup
 
-    @functools.cached_property
+    @slotted.cached_property
     def __elite_group(self) -> EliteGroup | None:
         if self._excel.elite_group is None:
             return None
@@ -108,7 +108,7 @@ class StageInfiniteMonsterGroup(View[excel.StageInfiniteMonsterGroup]):
 
         return None if self.__elite_group is None else EliteGroup(self._game, self.__elite_group._excel)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __monsters(self) -> list[MonsterConfig]:
         return list(
             self._game.monster_config(
@@ -130,7 +130,7 @@ class StageInfiniteWaveConfig(View[excel.StageInfiniteWaveConfig]):
         """每一波次场上最多多少敌人"""
         return self._excel.max_teammate_count
 
-    @functools.cached_property
+    @slotted.cached_property
     def __monster_groups(self) -> list[StageInfiniteMonsterGroup]:
         return list(self._game.stage_infinite_monster_group(self._excel.monster_group_id_list))
 
@@ -164,7 +164,7 @@ class StageInfiniteWaveConfig(View[excel.StageInfiniteWaveConfig]):
                     monster_names[enemy.wiki_name] += 1
         return "、".join(f"{name}:{count}" for name, count in monster_names.items())
 
-    @functools.cached_property
+    @slotted.cached_property
     def __elite_groups(self) -> list[EliteGroup]:
         return list(filter(None, (group.elite_group() for group in self.__monster_groups)))
 
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import excel
 from .base import View
 
@@ -10,7 +10,7 @@ from .base import View
 class HeartDialTalk(View[excel.HeartDialTalk]):
     ExcelOutput: typing.Final = excel.HeartDialTalk
 
-    @functools.cached_property
+    @slotted.cached_property
     def sdf_text(self) -> str:
         return self._game.text(self._excel.sdf_text)
 
@@ -18,11 +18,11 @@ class HeartDialTalk(View[excel.HeartDialTalk]):
 class TalkSentenceConfig(View[excel.TalkSentenceConfig]):
     ExcelOutput: typing.Final = excel.TalkSentenceConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def text(self) -> str:
         return "" if self._excel.talk_sentence_text is None else self._game.text(self._excel.talk_sentence_text)
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return (
             ""
@@ -30,7 +30,7 @@ class TalkSentenceConfig(View[excel.TalkSentenceConfig]):
             else self._game._plain_formatter.format(self._game.text(self._excel.textmap_talk_sentence_name))  # pyright: ignore[reportPrivateUsage]
         )
 
-    @functools.cached_property
+    @slotted.cached_property
     def __voice(self) -> VoiceConfig | None:
         return None if self._excel.voice_id is None else self._game.voice_config(self._excel.voice_id)
 
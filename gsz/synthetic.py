@@ -0,0 +1,621 @@
+"""
+合成游戏数据
+
+CI 和性能测试机上没有解包数据，这里根据 pydantic 模型生成一份结构完整、可以被 GameData 正常读取的假数据
+- 星穹铁道：ExcelOutput、TextMap、以及 ExcelOutput 中路径字段引用的剧情 JSON（Config/…）
+- 原神：ExcelBinOutput、TextMap
+- 绝区零：FileCfg（使用最新版本的混淆键名）、TextMap
+
+所有表共用同一个 ID 空间 [ID_BASE, ID_BASE + 行数)，每行的顶层 *_id 字段都取行号对应的 ID
+因此各表之间的 ID 引用（比如 MonsterConfig.monster_template_id）都能找到对应的行
+文本字段会同时生成 TextMap 项，同样的 seed 和 scale 生成的数据完全相同
+
+表名和模型来自各游戏 data 模块的 ACCESSORS，即 GameData 的装饰器在定义时登记的表
+视图中表之间的业务约束（比如祝福对应的战斗增益、角色的行迹）由 Synthesizer.reshape 在生成后调整
+"""
+
+import abc
+import dataclasses
+import json
+import pathlib
+import random
+import typing
+
+import pydantic
+import typing_extensions
+
+from . import gi, sr, zzz
+from .sr import act
+from .zzz.filecfg import aliases
+
+ID_BASE: typing.Final = 1000
+ROWS: typing.Final = 100
+"""scale 为 1 时每张表的行数"""
+MAX_DEPTH: typing.Final = 6
+"""嵌套超过这个深度后，可选字段不再生成、列表为空，避免递归结构（如剧情 Task）无限展开"""
+MAX_ATTEMPTS: typing.Final = 8
+SUBS: typing.Final = 7
+"""ModelMainSubID 表中每个 main_id 的 sub_id 数量（0 ~ 6，覆盖角色晋阶、等级等常见范围）"""
+
+SYLLABLES: typing.Final = (
+    "开拓者星穹列车黑塔空间站雅利洛仙舟罗浮匹诺康尼翁法罗斯提瓦特蒙德璃月稻妻须弥枫丹新艾利都零号空洞"
+)
+
+Game = typing.Literal["sr", "gi", "zzz"]
+
+
+class Unsupported(Exception):
+    """模型中出现了无法从 JSON 构造的类型（比如只接受 Python 对象的 is-instance 校验）"""
+
+
+class Omit:
+    """有默认值的字段不输出"""
+
+
+OMIT: typing.Final = Omit()
+
+
+@dataclasses.dataclass
+class Report:
+    rows: dict[str, int] = dataclasses.field(default_factory=dict)
+    """文件 → 行数"""
+    skipped: dict[str, str] = dataclasses.field(default_factory=dict)
+    """文件 → 无法生成的原因"""
+    texts: int = 0
+    acts: int = 0
+
+
+class Faker(abc.ABC):
+    """
+    按 pydantic-core 的 CoreSchema 生成能通过校验的 JSON 数据
+
+    直接遍历 CoreSchema 而不是类型注解，Annotated、泛型、判别联合、别名等都已经被 pydantic 展开好了
+    具体游戏的差异（文本字段、ID 字段、剧情文件路径）由子类覆盖 int_field / str_field / is_text 处理
+    """
+
+    def __init__(self, rng: random.Random, rows: int):
+        self.rng: random.Random = rng
+        self.rows: int = rows
+        self.row_id: int = ID_BASE
+        self.minimal: bool = False
+        self.texts: dict[typing.Any, str] = {}
+        self.__definitions: dict[str, typing.Any] = {}
+
+    def row(
+        self, model: type[pydantic.BaseModel], row_id: int, *, minimal: bool = False, **overrides: typing.Any
+    ) -> typing.Any:
+        """minimal 为 True 时不生成可选字段、列表为空，结构复杂的模型多次生成失败后用来兜底"""
+        self.row_id = row_id
+        self.minimal = minimal
+        row = self.value(model.__pydantic_core_schema__, "", 0)
+        for name, value in overrides.items():
+            row[self.field_key(model.__pydantic_core_schema__, name)] = value
+        return row
+
+    def field_key(self, schema: typing.Any, name: str) -> str:
+        schema = self.resolve(schema)
+        while schema["type"] != "model-fields":
+            schema = self.resolve(schema["schema"])
+        return self.__alias(schema["fields"][name], name)
+
+    @staticmethod
+    def __alias(field: typing.Any, name: str) -> str:
+        alias = field.get("validation_alias", name)
+        if isinstance(alias, list) and len(alias) != 0 and isinstance(alias[0], list):
+            alias = alias[0]  # AliasChoices，取第一个（最新版本）
+        if isinstance(alias, list):
+            if len(alias) != 1 or not isinstance(alias[0], str):
+                raise Unsupported(f"AliasPath {alias}")
+            alias = alias[0]
+        return alias
+
+    def resolve(self, schema: typing.Any) -> typing.Any:
+        if schema["type"] == "definitions":
+            for definition in schema["definitions"]:
+                self.__definitions[definition["ref"]] = definition
+            return self.resolve(schema["schema"])
+        if schema["type"] == "definition-ref":
+            return self.resolve(self.__definitions[schema["schema_ref"]])
+        return schema
+
+    def is_id(self, field: str) -> bool:
+        return field in ("id", "id_") or field.endswith(("_id", "_id_list", "_ids"))
+
+    def is_id_list(self, field: str) -> bool:
+        """整数列表大多是 ID 列表（skill_list、monster_id_1 等）"""
+        return self.is_id(field) or field.endswith("_list") or "_id_" in field
+
+    def reference(self) -> int:
+        """其他表的 ID"""
+        return self.rng.randrange(ID_BASE, ID_BASE + self.rows)
+
+    def references(self, count: int) -> list[int]:
+        """
+        ID 列表，只引用比当前行 ID 大的行
+
+        很多 ID 列表是同一张表内的后继关系（比如短信的 next_item_ids），这样生成的引用关系一定没有环
+        """
+        candidates = range(self.row_id + 1, ID_BASE + self.rows)
+        return sorted(self.rng.sample(candidates, min(count, len(candidates))))
+
+    def text(self) -> str:
+        words = (self.rng.choice(SYLLABLES) for _ in range(self.rng.randint(2, 24)))
+        return "".join(words)
+
+    def int_field(self, field: str, depth: int) -> int | None:
+        if self.is_id(field):
+            return self.row_id if depth == 1 else self.reference()
+        return None
+
+    def str_field(self, field: str, depth: int) -> str | None:
+        if self.is_id(field) and depth == 1:
+            return f"{field}_{self.row_id}"
+        if field.endswith("_path"):
+            return f"Synthetic/{field}/{self.rng.randrange(self.rows)}.png"
+        return None
+
+    def before_validator(self, field: str, value: typing.Any) -> typing.Any:  # noqa: ARG002 # pyright: ignore[reportUnusedParameter]
+        """mode="before" 的校验器接受的输入和字段类型不同，在这里把生成的值转换成校验器的输入格式"""
+        return value
+
+    def is_text(self, schema: typing.Any) -> bool:  # noqa: ARG002 # pyright: ignore[reportUnusedParameter]
+        """是否是文本模型（比如星穹铁道的 TextHash），是的话由 text_model 生成"""
+        return False
+
+    @abc.abstractmethod
+    def text_model(self) -> typing.Any:
+        """生成一条文本并登记到 TextMap，返回字段中引用它的值"""
+
+    def value(self, schema: typing.Any, field: str, depth: int) -> typing.Any:  # noqa: PLR0911, PLR0912, PLR0915
+        schema = self.resolve(schema)
+        rng = self.rng
+        deep = self.minimal or depth >= MAX_DEPTH
+        match schema["type"]:
+            case "model":
+                if self.is_text(schema):
+                    return self.text_model()
+                if depth > MAX_DEPTH * 2:
+                    raise Unsupported("too deep")
+                return self.value(schema["schema"], field, depth if schema.get("root_model") else depth + 1)
+            case "model-fields":
+                row: dict[str, typing.Any] = {}
+                for name, info in schema["fields"].items():
+                    value = self.value(info["schema"], name, depth)
+                    if value is not OMIT:
+                        row[self.__alias(info, name)] = value
+                return row
+            case "default":
+                if deep or rng.random() < 0.3:
+                    return OMIT
+                return self.value(schema["schema"], field, depth)
+            case "nullable":
+                if deep or rng.random() < 0.2:
+                    return None
+                return self.value(schema["schema"], field, depth)
+            case "union":
+                choices = [choice[0] if isinstance(choice, tuple) else choice for choice in schema["choices"]]
+                # 文本优先生成 TextHash 而不是字符串
+                for choice in choices:
+                    if self.is_text(self.resolve(choice)):
+                        return self.value(choice, field, depth)
+                rng.shuffle(choices)
+                for choice in choices:
+                    try:
+                        return self.value(choice, field, depth)
+                    except Unsupported:  # noqa: PERF203
+                        continue
+                raise Unsupported(f"union of {field}")
+            case "tagged-union":
+                return self.value(rng.choice(list(schema["choices"].values())), field, depth)
+            case "list" | "set" | "frozenset":
+                if "items_schema" not in schema:
+                    return []
+                if self.is_id_list(field) and self.resolve(schema["items_schema"])["type"] == "int":
+                    return self.references(0 if deep else rng.randint(0, 3))
+                min_length = schema.get("min_length", 0)
+                length = min_length if deep else rng.randint(min_length, max(min_length, schema.get("max_length", 3)))
+                return [self.value(schema["items_schema"], field, depth) for _ in range(length)]
+            case "tuple":
+                items = list(schema["items_schema"])
+                variadic = schema.get("variadic_item_index")
+                if self.is_id_list(field) and variadic == 0 and self.resolve(items[0])["type"] == "int":
+                    return self.references(0 if deep else rng.randint(0, 3))
+                if variadic is not None:
+                    items[variadic : variadic + 1] = [items[variadic]] * (0 if deep else rng.randint(0, 3))
+                return [self.value(item, field, depth) for item in items]
+            case "dict":
+                length = 0 if deep else rng.randint(0, 3)
+                keys = (self.value(schema["keys_schema"], field, depth) for _ in range(length))
+                return {str(key): self.value(schema["values_schema"], field, depth) for key in keys}
+            case "literal":
+                return rng.choice(schema["expected"])
+            case "enum":
+                return rng.choice(schema["members"]).value
+            case "int":
+                value = self.int_field(field, depth)
+                if value is not None:
+                    return value
+                low = schema.get("ge", schema["gt"] + 1 if "gt" in schema else 0)
+                high = schema.get("le", schema["lt"] - 1 if "lt" in schema else max(low, 10))
+                return rng.randint(low, max(low, high))
+            case "float":
+                return round(rng.uniform(schema.get("ge", 0), schema.get("le", 10)), 2)
+            case "bool":
+                return rng.random() < 0.5
+            case "str":
+                value = self.str_field(field, depth)
+                return value if value is not None else f"{field}_{rng.randrange(self.rows)}"
+            case "datetime":
+                return f"2024-{rng.randint(1, 12):02}-{rng.randint(1, 28):02} 12:00:00"
+            case "none" | "any":
+                return None
+            case "function-before":
+                return self.before_validator(field, self.value(schema["schema"], field, depth))
+            case "function-after" | "function-wrap" | "custom-error":
+                return self.value(schema["schema"], field, depth)
+            case "json-or-python":
+                return self.value(schema["json_schema"], field, depth)
+            case "lax-or-strict":
+                return self.value(schema["lax_schema"], field, depth)
+            case "chain":
+                return self.value(schema["steps"][0], field, depth)
+            case typ:
+                raise Unsupported(typ)
+
+
+class Table(typing.NamedTuple):
+    path: str
+    """相对数据根目录的路径"""
+    model: type[pydantic.BaseModel]
+
+
+class Synthesizer(abc.ABC):
+    def __init__(self, faker: Faker, rows: int):
+        self.faker: Faker = faker
+        self.rows: int = rows
+
+    @abc.abstractmethod
+    def tables(self) -> typing.Iterator[Table]: ...
+
+    def dump_table(self, table: Table, rows: list[typing.Any]) -> typing.Any:  # noqa: ARG002 # pyright: ignore[reportUnusedParameter]
+        return rows
+
+    @abc.abstractmethod
+    def dump_text_map(self, directory: pathlib.Path, texts: dict[typing.Any, str]): ...
+
+    def reshape(self, table: Table, rows: list[typing.Any]) -> list[typing.Any]:  # noqa: ARG002 # pyright: ignore[reportUnusedParameter]
+        """调整一张表生成的行，使其满足视图中表之间的业务约束，返回的行会重新校验"""
+        return rows
+
+    def after_table(self, table: Table, models: list[typing.Any]):  # noqa: B027
+        """生成完一张表后的回调，用于生成表引用的其他文件"""
+
+    def extra_files(self) -> typing.Iterator[tuple[str, type[pydantic.BaseModel], dict[str, typing.Any]]]:
+        """(路径, 模型, 覆盖的字段) 表中引用到的其他文件"""
+        return iter(())
+
+    def __row(
+        self, model: type[pydantic.BaseModel], row_id: int, **overrides: typing.Any
+    ) -> tuple[typing.Any, typing.Any]:
+        """生成一行并校验，失败时重新生成，多次失败时抛出最后一次的异常"""
+        adapter = pydantic.TypeAdapter(model)
+        error: Exception = Unsupported("no attempt")
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                row = self.faker.row(model, row_id, minimal=attempt == MAX_ATTEMPTS - 1, **overrides)
+                return row, adapter.validate_python(row)
+            except (Unsupported, pydantic.ValidationError) as exc:  # noqa: PERF203
+                error = exc
+        raise error
+
+    def __sub_key(self, model: type[pydantic.BaseModel], row: dict[str, typing.Any]) -> str | None:
+        """
+        找出 ModelMainSubID 中 sub_id 对应的键：改掉这个键的值之后 sub_id 随之改变
+
+        对应的字段可能有默认值（比如 MazeBuff.lv）而没有生成，所以遍历模型的所有字段而不是生成的行
+        """
+        adapter = pydantic.TypeAdapter(model)
+        probe = SUBS + 2 if adapter.validate_python(row).sub_id == SUBS + 1 else SUBS + 1
+        for name in model.model_fields:
+            try:
+                key = self.faker.field_key(model.__pydantic_core_schema__, name)
+                if adapter.validate_python({**row, key: probe}).sub_id == probe:
+                    return key
+            except (Unsupported, pydantic.ValidationError):  # noqa: PERF203
+                continue
+        return None
+
+    def __table(self, table: Table) -> list[tuple[typing.Any, typing.Any]]:
+        """生成一张表的所有行，主键重复的行只保留第一个"""
+        rows: dict[typing.Any, tuple[typing.Any, typing.Any]] = {}
+        sub_key: str | None = None
+        for index in range(self.rows):
+            row, model = self.__row(table.model, ID_BASE + index)
+            if not hasattr(model, "sub_id"):
+                _ = rows.setdefault(primary_key(model), (row, model))
+                continue
+            # 同一个 main_id 生成多个 sub_id（比如角色的每个晋阶、祝福的每个等级）
+            sub_key = sub_key or self.__sub_key(table.model, row)
+            if sub_key is None:
+                _ = rows.setdefault(primary_key(model), (row, model))
+                continue
+            for sub_id in range(SUBS):
+                sub_row = {**row, sub_key: sub_id}
+                sub_model = pydantic.TypeAdapter(table.model).validate_python(sub_row)
+                _ = rows.setdefault(primary_key(sub_model), (sub_row, sub_model))
+        return list(rows.values())
+
+    def generate(self, directory: pathlib.Path) -> Report:
+        report = Report()
+        for table in self.tables():
+            try:
+                rows = self.reshape(table, [row for row, _ in self.__table(table)])
+                adapter = pydantic.TypeAdapter(table.model)
+                models = [adapter.validate_python(row) for row in rows]
+            except (Unsupported, pydantic.ValidationError) as exc:
+                report.skipped[table.path] = str(exc).splitlines()[0]
+                continue
+            write_json(directory / table.path, self.dump_table(table, rows))
+            report.rows[table.path] = len(rows)
+            self.after_table(table, models)
+        for path, model, overrides in self.extra_files():
+            try:
+                row, _ = self.__row(model, self.faker.reference(), **overrides)
+            except (Unsupported, pydantic.ValidationError):
+                continue
+            write_json(directory / path, row)
+            report.acts += 1
+        self.dump_text_map(directory, self.faker.texts)
+        report.texts = len(self.faker.texts)
+        return report
+
+
+def write_json(path: pathlib.Path, content: typing.Any):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_text(json.dumps(content, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def primary_key(model: typing.Any) -> typing.Any:
+    if hasattr(model, "main_id"):
+        return (model.main_id, model.sub_id)
+    return model.id
+
+
+# ---------------------------------------------------------------- 星穹铁道
+
+
+class SRFaker(Faker):
+    # ExcelOutput 中引用剧情文件的字段 → 剧情文件模型
+    LINKS: typing.ClassVar[dict[str, str]] = {
+        "caption_path": "caption",
+        "performance_path": "act",
+        "formula_story_json": "act",
+        "npc_json_path": "npc",
+        "dialogue_path": "act",
+        "option_path": "option",
+        "mission_json_path": "act",
+        "manikin_json_path": "manikin",
+    }
+
+    # 字段名不以 _id 结尾的 ID 字段（比如 RogueBuffType 表的主键就是 rogue_buff_type）
+    IDS: typing.ClassVar[frozenset[str]] = frozenset(("rogue_buff_type",))
+
+    def __init__(self, rng: random.Random, rows: int):
+        super().__init__(rng, rows)
+        self.links: list[tuple[str, str]] = []
+        """生成的剧情文件路径和模型种类"""
+
+    @typing_extensions.override
+    def is_id(self, field: str) -> bool:
+        return field in self.IDS or super().is_id(field)
+
+    @typing_extensions.override
+    def is_text(self, schema: typing.Any) -> bool:
+        return schema["type"] == "model" and schema["cls"] is sr.excel.base.TextHash
+
+    @typing_extensions.override
+    def text_model(self) -> typing.Any:
+        text_hash = self.rng.getrandbits(62)
+        self.texts[text_hash] = self.sr_text()
+        return {"Hash": text_hash}
+
+    @typing_extensions.override
+    def before_validator(self, field: str, value: typing.Any) -> typing.Any:
+        if field == "monster_list":  # StageConfig
+            return [{f"Monster{index + 1}": monster for index, monster in enumerate(wave)} for wave in value]
+        return value
+
+    def sr_text(self) -> str:
+        text = self.text()
+        match self.rng.randrange(8):
+            case 0:
+                return f"<color=#f29e38ff>{text}</color>"
+            case 1:
+                return f"{{NICKNAME}}，{text}"
+            case 2:
+                return f"{text}<unbreak>#1[i]%</unbreak>"
+            case _:
+                return text
+
+    @typing_extensions.override
+    def str_field(self, field: str, depth: int) -> str | None:
+        kind = self.LINKS.get(field)
+        if kind is not None:
+            path = f"Config/Synthetic/{kind}/{len(self.links)}.json"
+            self.links.append((path, kind))
+            return path
+        return super().str_field(field, depth)
+
+
+class SRSynthesizer(Synthesizer):
+    MISSION_INFO_PATH: typing.Final = "Config/Level/Mission/{main_mission_id}/MissionInfo_{main_mission_id}.json"
+    MATERIALS: typing.Final = ((110113, 3), (110403, 4), (111003, 7), (110002, 2))
+    """(物品 ID, 用途) 行迹材料、周本材料、晋阶的野怪材料和突破材料，行迹和野怪材料的 ID 来自视图中的分类表"""
+    SKILL_TREE: typing.Final = tuple(
+        (anchor, sr.excel.avatar.PointType.Skill if index < 5 else sr.excel.avatar.PointType.BonusAbility)
+        if index < 8
+        else (anchor, sr.excel.avatar.PointType.StatBonus)
+        for index, anchor in enumerate(list(sr.excel.avatar.AnchorType)[:18])
+    )
+    """一个角色的技能树：普攻、战技、终结技、天赋、秘技，三个额外能力，十个属性加成"""
+
+    def __init__(self, faker: SRFaker, rows: int):
+        super().__init__(faker, rows)
+        self.faker: SRFaker = faker
+        self.__main_missions: list[int] = []
+
+    @typing_extensions.override
+    def tables(self) -> typing.Iterator[Table]:
+        return (Table(accessor.path, accessor.model) for accessor in sr.data.ACCESSORS.values())
+
+    @typing_extensions.override
+    def reshape(self, table: Table, rows: list[typing.Any]) -> list[typing.Any]:
+        def key(name: str) -> str:
+            return self.faker.field_key(table.model.__pydantic_core_schema__, name)
+
+        if table.model is sr.excel.ItemConfig:
+            # 角色晋阶、行迹用到的材料，视图按用途和 ID 区分
+            template = rows[0]
+            for item_id, purpose_type in self.MATERIALS:
+                rows.append({**template, key("id_"): item_id, key("purpose_type"): purpose_type})
+        elif table.model is sr.excel.AvatarConfig:
+            for row in rows:  # 六个星魂
+                offset = row[key("avatar_id")] - ID_BASE
+                row[key("rank_id_list")] = [ID_BASE + (offset + rank) % self.rows for rank in range(6)]
+        elif table.model is sr.excel.AvatarPromotionConfig:
+            costs = [
+                {"ItemID": item_id, "ItemNum": 1} for item_id, purpose_type in self.MATERIALS if purpose_type in (2, 7)
+            ]
+            for row in rows:
+                row[key("promotion_cost_list")] = costs
+        elif table.model is sr.excel.AvatarSkillTreeConfig:
+            # 每 len(SKILL_TREE) 个连续的行迹组成一个角色的技能树，ID 空间内的行迹仍然都存在
+            costs = [
+                {"ItemID": item_id, "ItemNum": 1} for item_id, purpose_type in self.MATERIALS if purpose_type in (3, 4)
+            ]
+            skill_tree: list[typing.Any] = []
+            for row in rows:
+                point_id = row[key("point_id")]
+                anchor_type, point_type = self.SKILL_TREE[(point_id - ID_BASE) % len(self.SKILL_TREE)]
+                row[key("avatar_id")] = ID_BASE + (point_id - ID_BASE) // len(self.SKILL_TREE)
+                row[key("anchor_type")] = anchor_type.value
+                row[key("point_type")] = point_type.value
+                row[key("material_list")] = costs
+                row[key("level_up_skill_id")] = [point_id] if point_type is sr.excel.avatar.PointType.Skill else []
+                if point_type is sr.excel.avatar.PointType.StatBonus:
+                    row[key("status_add_list")] = [{"PropertyType": "AttackAddedRatio", "Value": {"Value": 0.04}}]
+                # 只有技能可以升级，额外能力和属性加成只有 1 级
+                if point_type is sr.excel.avatar.PointType.Skill or row.get(key("level")) == 1:
+                    skill_tree.append(row)
+            return skill_tree
+        return rows
+
+    @typing_extensions.override
+    def after_table(self, table: Table, models: list[typing.Any]):
+        if table.model is sr.excel.MainMission:
+            self.__main_missions.extend(model.main_mission_id for model in models)
+
+    @typing_extensions.override
+    def extra_files(self) -> typing.Iterator[tuple[str, type[pydantic.BaseModel], dict[str, typing.Any]]]:
+        models: dict[str, type[pydantic.BaseModel]] = {
+            "act": act.model.Act,
+            "caption": act.model.caption.Caption,
+            "npc": act.model.RogueNPC,
+            "option": act.model.Opt,
+            "manikin": sr.excel.avatar.ManikinCharacterConfig,
+        }
+        for main_mission_id in self.__main_missions:
+            path = self.MISSION_INFO_PATH.format(main_mission_id=main_mission_id)
+            yield path, act.model.MissionInfo, {"main_mission_id": main_mission_id}
+        # 剧情文件内部也可能引用其他剧情文件，生成过程中 links 会继续增长
+        index = 0
+        while index < len(self.faker.links):
+            path, kind = self.faker.links[index]
+            index += 1
+            yield path, models[kind], {}
+
+    @typing_extensions.override
+    def dump_text_map(self, directory: pathlib.Path, texts: dict[typing.Any, str]):
+        write_json(directory / "TextMap" / "TextMapCHS.json", {str(key): val for key, val in texts.items()})
+
+
+# ---------------------------------------------------------------- 原神
+
+
+class GIFaker(Faker):
+    @typing_extensions.override
+    def text_model(self) -> typing.Any:
+        text_hash = self.rng.getrandbits(32)
+        self.texts[text_hash] = self.text()
+        return text_hash
+
+    @typing_extensions.override
+    def int_field(self, field: str, depth: int) -> int | None:
+        if field.endswith("text_map_hash"):
+            return self.text_model()
+        if field.endswith("_hash"):
+            return self.rng.getrandbits(32)
+        return super().int_field(field, depth)
+
+
+class GISynthesizer(Synthesizer):
+    @typing_extensions.override
+    def tables(self) -> typing.Iterator[Table]:
+        return (Table(accessor.path, accessor.model) for accessor in gi.data.ACCESSORS.values())
+
+    @typing_extensions.override
+    def dump_text_map(self, directory: pathlib.Path, texts: dict[typing.Any, str]):
+        write_json(directory / "TextMap" / "TextMapCHS.json", {str(key): val for key, val in texts.items()})
+
+
+# ---------------------------------------------------------------- 绝区零
+
+
+class ZZZFaker(Faker):
+    @typing_extensions.override
+    def text_model(self) -> typing.Any:
+        key = f"Synthetic_{len(self.texts)}"
+        self.texts[key] = self.text()
+        return key
+
+    @typing_extensions.override
+    def str_field(self, field: str, depth: int) -> str | None:
+        value = super().str_field(field, depth)
+        if value is not None or any(word in field for word in ("icon", "image", "path")):
+            return value
+        return self.text_model()  # 文本字段是 TextMap 的键
+
+
+class ZZZSynthesizer(Synthesizer):
+    @typing_extensions.override
+    def tables(self) -> typing.Iterator[Table]:
+        return (Table(accessor.path, accessor.model) for accessor in zzz.data.ACCESSORS.values())
+
+    @typing_extensions.override
+    def dump_table(self, table: Table, rows: list[typing.Any]) -> typing.Any:
+        alias = aliases.EXP_FILE_CONFIG.validation_alias
+        assert isinstance(alias, pydantic.AliasChoices)
+        return {alias.choices[0]: rows}
+
+    @typing_extensions.override
+    def dump_text_map(self, directory: pathlib.Path, texts: dict[typing.Any, str]):
+        write_json(directory / "TextMap" / "TextMapTemplateTb.json", texts)
+
+
+def generate(game: Game, directory: pathlib.Path, *, scale: float = 1.0, seed: int = 0) -> Report:
+    """
+    生成 scale × ROWS 行每表的假数据到 directory
+
+    用法：
+        report = generate("sr", pathlib.Path("/tmp/sr"), scale=0.1)
+        game = gsz.sr.GameData("/tmp/sr")
+    """
+    rng = random.Random(seed)
+    rows = max(1, round(ROWS * scale))
+    match game:
+        case "sr":
+            return SRSynthesizer(SRFaker(rng, rows), rows).generate(directory)
+        case "gi":
+            return GISynthesizer(GIFaker(rng, rows), rows).generate(directory)
+        case "zzz":
+            return ZZZSynthesizer(ZZZFaker(rng, rows), rows).generate(directory)
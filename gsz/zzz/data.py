@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import collections.abc
 import enum
-import functools
 import pathlib
 import typing
 
 import pydantic
 
+from .. import aio, budget, instrument, reload
 from ..format import Formatter, Syntax
 from . import filecfg, view
+from .text_map import TextMap
 
 T_co = typing.TypeVar("T_co", covariant=True)
 
@@ -45,6 +47,22 @@ def file_name_generator(method_name: str) -> str:
     return "".join(word.upper() if word in ABBR_WORDS else word.capitalize() for word in method_name.split("_"))
 
 
+RECORDER: typing.Final = instrument.Recorder()
+"""所有 GameData 共享的加载统计，是进程级别的，表的缓存在各个 GameData 上"""
+
+LOADERS: typing.Final[dict[str, typing.Callable[[GameData], collections.abc.Awaitable[None]]]] = {}
+"""访问方法名到异步加载整张表，由装饰器在定义时注册，用于 GameData.aload"""
+
+ACCESSORS: typing.Final[dict[str, reload.Accessor]] = {}
+"""访问方法名到装饰器，由装饰器在定义时注册，用于 GameData.invalidate 检查表名和 gsz.synthetic 生成数据"""
+
+
+def find_file(path: pathlib.Path, file_names: tuple[str, ...]) -> pathlib.Path | None:
+    """第一个文件名加上 TemplateTb 后缀，之后的按原样，按顺序返回第一个存在的"""
+    candidates = [path / f"{file_names[0]}TemplateTb.json", *(path / f"{name}.json" for name in file_names[1:])]
+    return next((candidate for candidate in candidates if candidate.exists()), None)
+
+
 V = typing.TypeVar("V", bound="view.IView[filecfg.ModelID]")
 
 
@@ -77,11 +95,19 @@ class file_cfg(typing.Generic[V]):
     def __init__(self, typ: type[V], *file_names: str):
         self.__type = typ
         self.__file_names: tuple[str, ...] = file_names
-        self.__filecfg: dict[int, filecfg.ModelID] | None = None
+
+    @property
+    def model(self) -> type[filecfg.ModelID]:
+        return self.__type.FileCfg
+
+    @property
+    def path(self) -> str:
+        return f"FileCfg/{self.__file_names[0]}TemplateTb.json"
 
     def __call__(self, method: typing.Callable[..., None]) -> GameDataFunction[V]:
         if len(self.__file_names) == 0:
             self.__file_names = (file_name_generator(method.__name__),)
+        self.__stats = RECORDER.accessor(method.__name__)
 
         @typing.overload
         def fn(game: GameData) -> collections.abc.Iterable[V]: ...
@@ -92,31 +118,59 @@ class file_cfg(typing.Generic[V]):
         def fn(
             game: GameData, id: int | collections.abc.Iterable[int] | None = None
         ) -> V | collections.abc.Iterable[V] | None:
-            if self.__filecfg is None:
-                path = game.base / "FileCfg"
-                file_names = iter(self.__file_names)
-                file_path = path / (next(file_names) + "TemplateTb.json")
-                try:
-                    while not file_path.exists():
-                        file_path = path / (next(file_names) + ".json")
-                except StopIteration:
-                    self.__filecfg = {}
-                    return iter(()) if id is None or isinstance(id, collections.abc.Iterable) else None
-                finally:
-                    del self.__file_names  # 清理一下方便 GC
-                filecfgs = filecfg.ExpFileCfg[self.__type.FileCfg].model_validate_json(file_path.read_bytes())
-                self.__filecfg = {filecfg.id: filecfg for filecfg in filecfgs.exp_filecfg}
+            self.__stats.calls += 1
+            table = game._tables.get(self.__stats.name)
+            if table is None:
+                table = game._tables.store(self.__stats.name, self.__load(game))
+            filecfgs = table.data
             if id is None:
-                return (self.__type(game, cfg) for cfg in self.__filecfg.values())
+                return (self.__type(game, cfg) for cfg in filecfgs.values())
             if isinstance(id, collections.abc.Iterable):
-                return (self.__type(game, self.__filecfg[k]) for k in id)
-            cfg = self.__filecfg.get(id)
+                return (self.__type(game, filecfgs[k]) for k in id)
+            cfg = filecfgs.get(id)
             return None if cfg is None else self.__type(game, cfg)
 
+        LOADERS[method.__name__] = self.aload
+        ACCESSORS[method.__name__] = self
         return fn
 
+    def __load(self, game: GameData) -> reload.Table[dict[int, filecfg.ModelID]]:
+        file_path = find_file(game.base / "FileCfg", self.__file_names)
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        timer = instrument.Timer()
+        content = file_path.read_bytes()
+        self.__stats.decode += timer()
+        return reload.Table(self.__parse(file_path, content), source)
+
+    async def aload(self, game: GameData):
+        """异步加载整张表，见 gsz.aio"""
+        if game._tables.get(self.__stats.name) is None:
+            table = await aio.COALESCER.run((game, self.__stats.name), lambda: self.__aload(game))
+            _ = game._tables.store(self.__stats.name, table)
+
+    async def __aload(self, game: GameData) -> reload.Table[dict[int, filecfg.ModelID]]:
+        file_path = find_file(game.base / "FileCfg", self.__file_names)
+        if file_path is None:
+            return reload.Table({})
+        source = file_path, reload.signature(file_path)
+        timer = instrument.Timer()
+        content = await aio.read_bytes(file_path)
+        self.__stats.decode += timer()
+        return reload.Table(await asyncio.to_thread(self.__parse, file_path, content), source)
+
+    def __parse(self, file_path: pathlib.Path, content: bytes) -> dict[int, filecfg.ModelID]:
+        timer = instrument.Timer()
+        filecfgs = filecfg.load_file_cfg(self.__type.FileCfg, content)
+        configs = {filecfg.id: filecfg for filecfg in filecfgs}
+        self.__stats.validate += timer()
+        self.__stats.add_table(file_path, len(content), configs)
+        return configs
+
 
 class Language(enum.Enum):
+    CHS = ""
     CHT = "_CHT"
     DE = "_DE"
     EN = "_EN"
@@ -134,15 +188,121 @@ class Language(enum.Enum):
 class GameData:
     def __init__(self, base: str | pathlib.Path, *, language: Language | None = None):
         self.base: pathlib.Path = pathlib.Path(base)
-        lang = language.value if language is not None else ""
-        text_map_path = self.base / "TextMap" / f"TextMap{lang}TemplateTb.json"
-        text_map = text_map_path.read_bytes()
-        self.__text_map = pydantic.TypeAdapter(dict[str, str]).validate_json(text_map)
-
-    def text(self, text: str) -> str:
-        return self.__text_map.get(text, "")
-
-    @functools.cached_property
+        self.__default_language: Language = language or Language.CHS
+        # TextMap 很大，用到哪个语言时才加载
+        self.__text_map: dict[Language, tuple[TextMap, instrument.TableStats]] = {}
+        self._tables: reload.Tables = reload.Tables()
+        """装饰器加载的表，按访问方法名存放"""
+        # 已经加载的 TextMap 和加载时的文件状态，用于 watch
+        self.__text_map_files: dict[Language, tuple[pathlib.Path, reload.Signature | None]] = {}
+
+    def __text_map_path(self, language: Language) -> pathlib.Path:
+        return self.base / "TextMap" / f"TextMap{language.value}TemplateTb.json"
+
+    @staticmethod
+    def __parse_text_map(path: pathlib.Path, content: bytes, stats: instrument.TableStats) -> TextMap:
+        timer = instrument.Timer()
+        text_map = TextMap(pydantic.TypeAdapter(dict[str, str]).validate_json(content))
+        stats.validate += timer()
+        stats.add_file(path, len(content))
+        stats.loaded(len(text_map), text_map.nbytes())
+        return text_map
+
+    def __load_text_map(self, language: Language) -> tuple[TextMap, instrument.TableStats]:
+        path = self.__text_map_path(language)
+        self.__text_map_files[language] = path, reload.signature(path)
+        stats = RECORDER.table(f"TextMap{language.name}")
+        timer = instrument.Timer()
+        content = path.read_bytes()
+        stats.decode += timer()
+        return self.__parse_text_map(path, content, stats), stats
+
+    async def __aload_text_map(self, language: Language) -> tuple[TextMap, instrument.TableStats]:
+        path = self.__text_map_path(language)
+        self.__text_map_files[language] = path, reload.signature(path)
+        stats = RECORDER.table(f"TextMap{language.name}")
+        timer = instrument.Timer()
+        content = await aio.read_bytes(path)
+        stats.decode += timer()
+        return await asyncio.to_thread(self.__parse_text_map, path, content, stats), stats
+
+    def load_stats(self) -> list[instrument.TableStats]:
+        """
+        各表、各语言 TextMap 的加载统计，按加载耗时从高到低排序
+        统计是进程级别的，包含所有 ZZZ GameData 的加载
+        """
+        return RECORDER.snapshot()
+
+    def watched_files(self) -> dict[pathlib.Path, reload.Signature | None]:
+        """已经加载的表、TextMap 和加载时的文件状态，供 watch 轮询"""
+        files = self._tables.sources()
+        files.update(list(self.__text_map_files.values()))
+        return files
+
+    def invalidate(
+        self, paths: collections.abc.Iterable[str | pathlib.Path] = (), tables: collections.abc.Iterable[str] = ()
+    ) -> list[str]:
+        """
+        丢弃从 paths（相对路径相对于 base）加载的表和 TextMap，以及 tables（访问方法名）中的表
+        有缓存被丢弃时由它们计算出的索引也一并丢弃，下次访问时重新加载，返回丢弃的缓存，见 gsz.reload
+        """
+        changed = {self.base.joinpath(path).resolve() for path in paths}
+        invalidated = self._tables.invalidate(ACCESSORS.keys(), changed, tables)
+        for language, (path, _) in list(self.__text_map_files.items()):
+            if path.resolve() in changed:
+                _ = self.__text_map.pop(language, None)
+                del self.__text_map_files[language]
+                budget.BUDGET.discard(self, f"TextMap{language.name}")
+                invalidated.append(f"TextMap{language.name}")
+        if len(invalidated) != 0:
+            reload.drop_cached_properties(self)
+        return invalidated
+
+    def watch(self, interval: float = 1.0) -> reload.Watcher:
+        """在后台线程中每 interval 秒检查一次已经加载的文件，有变化时调用 invalidate，用返回值 stop"""
+        return reload.Watcher(self, interval).start()
+
+    async def aload(self, table: str) -> list[typing.Any]:
+        """异步加载整张表并返回全部行，table 为访问方法名，见 gsz.aio"""
+        loader = LOADERS.get(table)
+        if loader is None:
+            raise ValueError(f"unknown table {table!r}")
+        await loader(self)
+        return list(getattr(self, table)())
+
+    async def atext(self, text: str, *, language: Language | None = None) -> str:
+        """同 text，TextMap 未加载时异步加载"""
+        language = language or self.__default_language
+        if language not in self.__text_map:
+            loaded = await aio.COALESCER.run((self, language), lambda: self.__aload_text_map(language))
+            _ = self.__store_text_map(language, loaded)
+        return self.text(text, language=language)
+
+    def __store_text_map(
+        self, language: Language, loaded: tuple[TextMap, instrument.TableStats]
+    ) -> tuple[TextMap, instrument.TableStats]:
+        loaded = self.__text_map.setdefault(language, loaded)
+        budget.BUDGET.add(
+            self, f"TextMap{language.name}", loaded[0], lambda game: game.__evict_text_map(language), loaded[0].nbytes()
+        )
+        return loaded
+
+    def __evict_text_map(self, language: Language):
+        _ = self.__text_map.pop(language, None)
+        _ = self.__text_map_files.pop(language, None)
+
+    def text(self, text: str, *, language: Language | None = None) -> str:
+        language = language or self.__default_language
+        loaded = self.__text_map.get(language)
+        if loaded is None:
+            loaded = self.__store_text_map(language, self.__load_text_map(language))
+        else:
+            budget.BUDGET.touch(self, f"TextMap{language.name}")
+        text_map, stats = loaded
+        stats.calls += 1
+        return text_map.get(text)
+
+    @budget.cached_property
     def _mw_formatter(self) -> Formatter:
         return Formatter(syntax=Syntax.MediaWiki, game=self)
 
@@ -160,7 +320,7 @@ class GameData:
     def message_group_config(self):
         """一次 knock knock 聊天"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _messages_of_group(self) -> dict[int, list[filecfg.MessageConfig]]:
         groups: dict[int, list[filecfg.MessageConfig]] = {}
         for message in self.message_config():
@@ -175,7 +335,7 @@ class GameData:
     def message_npc(self):
         """knock knock 中的非自机角色联系人"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _message_group_of_contact(self) -> dict[int, list[filecfg.MessageGroupConfig]]:
         """按 NPC 分类短信"""
         groups: dict[int, list[filecfg.MessageGroupConfig]] = {}
@@ -203,7 +363,7 @@ class GameData:
     def post_comment_config(self):
         """绳网帖子回复"""
 
-    @functools.cached_property
+    @budget.cached_property
     def _comments_under_post(self) -> dict[int, list[filecfg.PostCommentConfig]]:
         comments: dict[int, list[filecfg.PostCommentConfig]] = {}
         for comment in self.post_comment_config():
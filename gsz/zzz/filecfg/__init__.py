@@ -1,4 +1,4 @@
-from .base import ExpFileCfg, ModelID
+from .base import ExpFileCfg, ModelID, load_file_cfg
 from .message import DirectoryConfig, MessageConfig, MessageGroupConfig, MessageNPC
 from .partner import PartnerConfig
 from .post import InterKnotConfig, PostCommentConfig
@@ -8,6 +8,7 @@ __all__ = (
     # bases
     "ModelID",
     "ExpFileCfg",
+    "load_file_cfg",
     # message
     "DirectoryConfig",
     "MessageConfig",
@@ -1,7 +1,10 @@
 import abc
+import copy
+import functools
 import typing
 
 import pydantic
+import pydantic_core
 
 from . import aliases
 
@@ -27,3 +30,90 @@ T = typing.TypeVar("T")
 
 class ExpFileCfg(Model, typing.Generic[T]):
     exp_filecfg: typing.Annotated[list[T], aliases.EXP_FILE_CONFIG]
+
+
+M = typing.TypeVar("M", bound=Model)
+
+
+def field_aliases(model: type[Model]) -> dict[str, tuple[str, ...]]:
+    """字段名 → 可能的混淆键名（按版本从新到旧），字段名本身放在最后"""
+    fields: dict[str, tuple[str, ...]] = {}
+    for name, info in model.model_fields.items():
+        alias = info.validation_alias
+        choices = alias.choices if isinstance(alias, pydantic.AliasChoices) else (alias,) if alias else ()
+        fields[name] = (*(choice for choice in choices if isinstance(choice, str)), name)
+    return fields
+
+
+def first_row(content: bytes) -> dict[str, typing.Any]:
+    """只解析数组的第一项，FileCfg 的每一行都是不含嵌套 Object 的扁平结构"""
+    start = content.find(b"{", content.find(b"["))
+    end = content.find(b"}", start)
+    while start != -1 and end != -1:
+        try:
+            return pydantic_core.from_json(content[start : end + 1])
+        except ValueError:  # noqa: PERF203 字符串中出现了 }
+            end = content.find(b"}", end + 1)
+    return {}
+
+
+def resolve_keys(model: type[Model], content: bytes) -> dict[str, str]:
+    """
+    根据第一行的键判断文件使用的是哪个版本的混淆键，返回字段名 → 混淆键
+
+    导出的数据会省略默认值，第一行未必包含所有字段，找不到的字段再在整个文件中查找
+    """
+    keys = first_row(content).keys()
+    mapping: dict[str, str] = {}
+    for name, choices in field_aliases(model).items():
+        key = next((choice for choice in choices if choice in keys), None)
+        if key is None:
+            key = next((choice for choice in choices if f'"{choice}":'.encode() in content), None)
+        if key is not None:
+            mapping[name] = key
+    return mapping
+
+
+@functools.cache
+def fixed_key_model(model: type[M], keys: tuple[tuple[str, str], ...]) -> type[M]:
+    """
+    每个字段只有一个确定键名的子类
+
+    AliasChoices 会让 pydantic 对每一行、每一个字段逐个尝试所有混淆键，检测出文件使用的键名后每个字段只需要查一次
+    子类继承了原类型的属性、校验器，isinstance 判断也不受影响
+    """
+    fields: dict[str, typing.Any] = {}
+    for name, key in keys:
+        info = copy.copy(model.model_fields[name])
+        info.validation_alias = key
+        fields[name] = (info.annotation, info)
+    return pydantic.create_model(model.__name__, __base__=model, __module__=model.__module__, **fields)
+
+
+@functools.cache
+def _file_cfg_adapter(
+    model: type[M], array_key: str, keys: tuple[tuple[str, str], ...]
+) -> pydantic.TypeAdapter[typing.Any]:
+    fixed = fixed_key_model(model, keys)
+    document = pydantic.create_model(
+        "ExpFileCfg",
+        __base__=Model,
+        exp_filecfg=(list[fixed], pydantic.Field(validation_alias=array_key)),
+    )
+    return pydantic.TypeAdapter(document)
+
+
+def load_file_cfg(model: type[M], content: bytes) -> list[M]:
+    """
+    解析 FileCfg 文件
+
+    先确定顶层数组和每一行用的是哪一组混淆键，再按确定的键名整体校验，解析仍然在 pydantic 中完成
+    检测只看第一行和少量子串查找，比对整个文件求哈希还快，所以不缓存检测结果；按键名生成的模型按混淆键的组合缓存
+    """
+    array_key = next(
+        (key for key in field_aliases(ExpFileCfg)["exp_filecfg"] if f'"{key}":'.encode() in content[:64]),
+        "exp_filecfg",
+    )
+    keys = tuple(resolve_keys(model, content).items())
+    document = _file_cfg_adapter(model, array_key, keys).validate_json(content)
+    return document.exp_filecfg
@@ -0,0 +1,50 @@
+import array
+import bisect
+import itertools
+import pathlib
+
+import pydantic
+import xxhash
+
+
+class TextMap:
+    """
+    紧凑存储的 TextMap
+
+    原始文件的键是很长的字符串 ID，直接用 dict[str, str] 存储时每一项都要两个 str 对象和一个哈希表槽位
+    这里把键换成 xxh64 整数并排序存放在 array 中，值按 UTF-8 拼接成一整块 bytes，另存每一项的起始偏移
+    查询时二分查找键，再从 bytes 中切出对应的文本解码
+    """
+
+    def __init__(self, text_map: dict[str, str]):
+        entries = sorted((xxhash.xxh64_intdigest(key.encode()), val.encode()) for key, val in text_map.items())
+        self.__keys = array.array("Q", (key for key, _ in entries))
+        self.__offsets = array.array("Q", itertools.accumulate((len(val) for _, val in entries), initial=0))
+        self.__blob = b"".join(val for _, val in entries)
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "TextMap":
+        return cls(pydantic.TypeAdapter(dict[str, str]).validate_json(path.read_bytes()))
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __contains__(self, key: str) -> bool:
+        return self.__index(key) is not None
+
+    def __index(self, key: str) -> int | None:
+        hashed = xxhash.xxh64_intdigest(key.encode())
+        index = bisect.bisect_left(self.__keys, hashed)
+        return index if index != len(self.__keys) and self.__keys[index] == hashed else None
+
+    def get(self, key: str, default: str = "") -> str:
+        index = self.__index(key)
+        if index is None:
+            return default
+        return self.__blob[self.__offsets[index] : self.__offsets[index + 1]].decode()
+
+    def nbytes(self) -> int:
+        """占用的内存（不含对象头）"""
+        return (
+            self.__keys.itemsize * len(self.__keys) + self.__offsets.itemsize * len(self.__offsets) + len(self.__blob)
+        )
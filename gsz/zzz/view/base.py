@@ -1,5 +1,6 @@
 import typing
 
+from ... import slotted
 from ..filecfg import ModelID
 
 if typing.TYPE_CHECKING:
@@ -15,7 +16,9 @@ class IView(typing.Protocol[E_co]):  # pyright: ignore[reportInvalidTypeVarUse]
     def __init__(self, game: "GameData", filecfg: E_co): ...
 
 
-class View(typing.Generic[E_co]):
+class View(slotted.Slotted, typing.Generic[E_co]):
+    __slots__ = ("_game", "_filecfg")
+
     def __init__(self, game: "GameData", filecfg: E_co):
         self._game: GameData = game
         self._filecfg: E_co = filecfg
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import collections.abc
-import functools
 import io
 import re
 import typing
 
 import typing_extensions
 
+from ... import slotted
 from .. import filecfg
 from ..filecfg import message
 from .base import View
@@ -22,7 +22,7 @@ if typing.TYPE_CHECKING:
 class DirectoryConfig(View[filecfg.DirectoryConfig]):
     FileCfg: typing.Final = filecfg.DirectoryConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def __partner(self) -> PartnerConfig:
         partner = self._game.partner_config(self._filecfg.partner_id)
         assert partner is not None
@@ -41,17 +41,17 @@ class MessageConfig(View[filecfg.MessageConfig]):
     def id(self) -> int:
         return self._filecfg.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def text(self) -> str | None:
         """文本消息，保证有文本时无选项，有选项时无文本"""
         return self._game.text(self._filecfg.text) if self._filecfg.text != "" else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def image(self) -> str | None:
         """文本消息，保证有文本时无选项，有选项时无文本"""
         return self._filecfg.image if self._filecfg.image != "" else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def voice(self) -> str | None:
         return self._filecfg.voice if self._filecfg.voice != "" else None
 
@@ -59,33 +59,33 @@ class MessageConfig(View[filecfg.MessageConfig]):
     def segment(self) -> int:
         return self._filecfg.segment
 
-    @functools.cached_property
+    @slotted.cached_property
     def option_1(self) -> str | None:
         return self._game.text(self._filecfg.option_1) if self._filecfg.option_1 != "" else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def option_2(self) -> str | None:
         return self._game.text(self._filecfg.option_2) if self._filecfg.option_2 != "" else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def option_long_1(self) -> str | None:
         """选择对应选项后实际回复的消息正文，可能和选项本身文本相同"""
         return self._game.text(self._filecfg.option_long_1) if self._filecfg.option_long_1 != "" else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def option_long_2(self) -> str | None:
         """选择对应选项后实际回复的消息正文，可能和选项本身文本相同"""
         return self._game.text(self._filecfg.option_long_2) if self._filecfg.option_long_2 != "" else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def option_successor_1(self) -> int | None:
         return self._filecfg.option_successor_1 if self._filecfg.option_successor_1 != 0 else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def option_successor_2(self) -> int | None:
         return self._filecfg.option_successor_2 if self._filecfg.option_successor_2 != 0 else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def __directory(self) -> DirectoryConfig | None:
         return self._game.directory_config(self._filecfg.sender_id)
 
@@ -93,14 +93,14 @@ class MessageConfig(View[filecfg.MessageConfig]):
         """自机角色特有的短信联系人页面，包含一些角色性格的备忘录"""
         return DirectoryConfig(self._game, self.__directory._filecfg) if self.__directory is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def __npc(self) -> MessageNPC | None:
         return self._game.message_npc(self._filecfg.sender_id)
 
     def npc(self) -> MessageNPC | None:
         return MessageNPC(self._game, self.__npc._filecfg) if self.__npc is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def sender_name(self) -> str | None:
         if self._filecfg.sender_id == 998:
             return "匿名"
@@ -108,7 +108,7 @@ class MessageConfig(View[filecfg.MessageConfig]):
             return "兄妹"
         return self.__npc.name if self.__npc is not None else None
 
-    @functools.cached_property
+    @slotted.cached_property
     def sender_icon(self) -> str | None:
         if self._filecfg.sender_id == 998:
             return "匿名"
@@ -126,14 +126,16 @@ _uninit = _Uninit()
 class _Message(MessageConfig):
     """将选项和内容拆成两条 Message 以方便寻找公共后继"""
 
+    __slots__ = ("confluence", "index", "neighbours", "option_index")
+
     # 反正是非导出对象，这里就搞一堆后置初始化了
-    # group 和 neighbours 是需要由 MessageGroupConfig 初始化
+    # index 和 neighbours 是需要由 MessageGroupConfig 初始化
     # 这是因为这些数据上挂了 functools，为了避免对同一条消息反反复复计算文案和后置所以都放到一起
     def __init__(self, game: GameData, message: filecfg.MessageConfig, option_index: int | None = None):
         super().__init__(game, message)
         self.confluence: _Message | _Uninit | None = _uninit
         self.option_index: int = option_index or 0
-        self.group: collections.abc.Sequence[_Message] = ()  # 依赖外部手动初始化
+        self.index: _MessageIndex | None = None  # 依赖外部手动初始化
         self.neighbours: tuple[_Message, ...] | None = None
         """如果是选项根则非空，表示的是选项根的后继，由外部初始化"""
 
@@ -149,33 +151,35 @@ class _Message(MessageConfig):
     def is_option_root(self) -> bool:
         return self.is_option and self.option_index == 0
 
-    @functools.cached_property
+    @slotted.cached_property
     def successors(self) -> tuple[_Message, ...]:
         if self.is_option_root:
             assert self.neighbours is not None
             return self.neighbours
+        assert self.index is not None
         successor: _Message | None = None
         if not self.is_option and self._filecfg.successor == 0:
             # 非选项且 successor == 0 的情况，就是找同一个 segment 更后一条 Message
-            segment = [message for message in self.group if message.segment == self.segment]
-            index = next(k for k, msg in enumerate(segment) if msg._filecfg.id_ == self._filecfg.id_)
-            successor = segment[index + 1] if index < len(segment) - 1 else None
+            successor = self.index.next(self)
         else:
             successors = (self._filecfg.successor, self._filecfg.option_successor_1, self._filecfg.option_successor_2)
             successor_segment = successors[self.option_index]
             if successor_segment != 0:
                 # 仍然有可能为空，也许是测试数据
-                successor = next((message for message in self.group if successor_segment == message.segment), None)
+                successor = self.index.head(successor_segment)
         return (successor,) if successor is not None else ()
 
-    @functools.cached_property
+    @slotted.cached_property
     @typing_extensions.override
     def text(self) -> str | None:
         if self.is_option_root:
             return None
-        this = super()
-        texts = (this.text, this.option_long_1 or this.option_1, this.option_long_2 or this.option_2)
-        return texts[self.option_index]
+        if self.option_index == 1:
+            return self.option_long_1 or self.option_1
+        if self.option_index == 2:
+            return self.option_long_2 or self.option_2
+        # 和 MessageConfig.text 共用一个槽，不能通过 super() 读取
+        return self._game.text(self._filecfg.text) if self._filecfg.text != "" else None
 
     def shallow_eq(self, other: _Message) -> bool:  # noqa: PLR0911
         """判断自身是否相同，比如是否均为选项根，是否文案相同"""
@@ -204,21 +208,31 @@ class _Message(MessageConfig):
         return self.text == other.text  # 都是正文，直接比较文案
 
     @typing_extensions.override
-    def __eq__(self, other: object) -> bool:  # noqa: PLR0911
+    def __eq__(self, other: object) -> bool:
         """不仅要求自身相同，也要求后继相同"""
         if self is other:
             return True
         if not isinstance(other, _Message):
             return False
-        if self._game is not other._game:
-            return False
-        if not self.shallow_eq(other):
-            return False  # 自身不同
-        # shallow_eq 中已经过滤了一个是选项根、一个非选项根的情况
-        # 于是可以避免这种情况：self 是选项且只有一个后继，other 是正文，且他们后继相同
-        return self.successors == other.successors
-
-    @functools.cached_property
+        # 长对话的后继链很长，递归比较会超出最大递归深度，这里用栈逐对比较
+        # 哈希已经包含了后继，哈希不同的一对可以直接排除
+        stack: list[tuple[_Message, _Message]] = [(self, other)]
+        seen: set[tuple[int, int]] = set()
+        while len(stack) != 0:
+            lhs, rhs = stack.pop()
+            if lhs is rhs or (id(lhs), id(rhs)) in seen:
+                continue
+            seen.add((id(lhs), id(rhs)))
+            if hash(lhs) != hash(rhs) or not lhs.shallow_eq(rhs):
+                return False  # 自身不同
+            # shallow_eq 中已经过滤了一个是选项根、一个非选项根的情况
+            # 于是可以避免这种情况：self 是选项且只有一个后继，other 是正文，且他们后继相同
+            if len(lhs.successors) != len(rhs.successors):
+                return False
+            stack.extend(zip(lhs.successors, rhs.successors, strict=True))
+        return True
+
+    @slotted.cached_property
     def __hash_cache(self) -> int:
         if self.is_option_root and self._filecfg.option_2 == "":
             return hash((self.option_1, self.successors[0]))
@@ -234,6 +248,95 @@ class _Message(MessageConfig):
         return self.__hash_cache
 
 
+class _MessageIndex:
+    """
+    一组短信的索引，由 MessageGroupConfig 构建一次，组内所有 _Message 共享
+    按段号和消息 ID 查找后继都是 O(1)，不用每条消息都扫描整组
+    """
+
+    def __init__(self, messages: collections.abc.Sequence[_Message]):
+        self.messages: collections.abc.Sequence[_Message] = messages
+        self.segments: dict[int, list[_Message]] = {}
+        """段号到段内按顺序排列的消息"""
+        self.positions: dict[int, int] = {}
+        """消息 ID 到段内位置，ID 重复时取第一条"""
+        for msg in messages:
+            segment = self.segments.setdefault(msg.segment, [])
+            _ = self.positions.setdefault(msg.id, len(segment))
+            segment.append(msg)
+            msg.index = self
+            for neighbour in msg.neighbours or ():
+                neighbour.index = self
+
+    def head(self, segment: int) -> _Message | None:
+        """分段的第一条消息"""
+        messages = self.segments.get(segment)
+        return messages[0] if messages is not None else None
+
+    def next(self, message: _Message) -> _Message | None:
+        """同一分段的下一条消息"""
+        segment = self.segments[message.segment]
+        position = self.positions[message.id] + 1
+        return segment[position] if position < len(segment) else None
+
+    def resolve(self):
+        """
+        按后序（后继先于前驱）计算所有消息的哈希和汇聚点
+
+        选项根的广搜沿着分支的汇聚点往后走，后序保证走到的汇聚点都已经算好，
+        相当于自底向上求后支配点，不会出现递归求汇聚点、递归求哈希过深的情况
+        """
+        done: set[int] = set()
+        stack: list[tuple[_Message, bool]] = [(msg, False) for msg in reversed(self.messages)]
+        while len(stack) != 0:
+            msg, expanded = stack.pop()
+            if expanded:
+                _ = hash(msg)
+                _ = self.confluence(msg)
+                continue
+            if id(msg) in done:
+                continue
+            done.add(id(msg))
+            stack.append((msg, True))
+            stack.extend((successor, False) for successor in reversed(msg.successors) if id(successor) not in done)
+
+    def confluence(self, message: _Message) -> _Message | None:  # noqa: PLR0911
+        """找到公共后继，主要为了找到选项终点合并后续重复项"""
+        if message.confluence is not _uninit:
+            return message.confluence  # pyright: ignore[reportReturnType]
+        if message._filecfg.option_1 == "":  # 非选项短信，直接找 successor 字段，若无则找同段下一个
+            if message._filecfg.successor != 0:
+                message.confluence = self.head(message._filecfg.successor)
+                return message.confluence
+            message.confluence = self.next(message)
+            return message.confluence
+        if message.option_index != 0:  # 含选项选择，且已经走到了选项对话处，找 successor 字段
+            successors = (message._filecfg.option_successor_1, message._filecfg.option_successor_2)
+            successor = successors[message.option_index - 1]
+            if successor == 0:
+                return None
+            message.confluence = self.head(successor)
+            return message.confluence
+        if message._filecfg.option_2 == "":  # 单选项选择，直接将选项对话作为下一个
+            assert message.neighbours is not None
+            message.confluence = message.neighbours[0]
+            return message.confluence
+        # 多选项字段，开始广搜找汇聚点
+        queue: list[_Message | None] = list(message.successors)
+        visit: dict[_Message, int] = collections.defaultdict(int)
+        while any(msg is not None for msg in queue):
+            for index, queue_msg in enumerate(queue):
+                if queue_msg is None:
+                    continue
+                visit[queue_msg] += 1
+                if visit[queue_msg] == len(queue):
+                    message.confluence = queue_msg
+                    return message.confluence
+                queue[index] = self.confluence(queue_msg)
+        message.confluence = None
+        return message.confluence
+
+
 class MessageGroupConfig(View[filecfg.MessageGroupConfig]):
     FileCfg: typing.Final = filecfg.MessageGroupConfig
 
@@ -241,25 +344,25 @@ class MessageGroupConfig(View[filecfg.MessageGroupConfig]):
     def id(self) -> int:
         return self._filecfg.id
 
-    @functools.cached_property
+    @slotted.cached_property
     def __directory(self) -> DirectoryConfig | None:
         return self._game.directory_config(self._filecfg.contact_id)
 
     def directory(self) -> DirectoryConfig | None:
         return None if self.__directory is None else DirectoryConfig(self._game, self.__directory._filecfg)
 
-    @functools.cached_property
+    @slotted.cached_property
     def __npc(self) -> MessageNPC | None:
         return self._game.message_npc(self._filecfg.contact_id)
 
-    @functools.cached_property
+    @slotted.cached_property
     def contact_name(self) -> str:
         contact = self.__directory.partner() if self.__directory is not None else self.__npc
         assert contact is not None
         return contact.name
 
-    @functools.cached_property
-    def __messages(self) -> list[_Message]:
+    @slotted.cached_property
+    def __index(self) -> _MessageIndex:
         messages: list[_Message] = []
         for msg in self._game._messages_of_group.get(self._filecfg.id, ()):  # pyright: ignore[reportPrivateUsage]
             node = _Message(self._game, msg)
@@ -270,13 +373,11 @@ class MessageGroupConfig(View[filecfg.MessageGroupConfig]):
                 neighbours.append(_Message(self._game, msg, 2))
             node.neighbours = tuple(neighbours)
             messages.append(node)
-        for msg in messages:
-            msg.group = messages
-        return messages
+        return _MessageIndex(messages)
 
     __MISSING_QUEST = {1203550109, 12080101, 12080102, 1300301210, 1303013135}
 
-    @functools.cached_property
+    @slotted.cached_property
     def __quests(self) -> list[QuestConfig]:
         return list(
             self._game.quest_config(
@@ -293,58 +394,6 @@ class MessageGroupConfig(View[filecfg.MessageGroupConfig]):
     def __formatter(self) -> Formatter:
         return self._game._mw_formatter  # pyright: ignore[reportPrivateUsage]
 
-    @functools.cached_property
-    def __segments(self) -> dict[int, list[_Message]]:
-        segments: dict[int, list[_Message]] = {}
-        for msg in self.__messages:
-            segment = msg._filecfg.segment
-            if segment in segments:
-                segments[segment].append(msg)
-            else:
-                segments[segment] = [msg]
-        return segments
-
-    def __find_confluence(self, message: _Message) -> _Message | None:  # noqa: PLR0911
-        """找到公共后继，主要为了找到选项终点合并后续重复项"""
-        if message.confluence is not _uninit:
-            return message.confluence  # pyright: ignore[reportReturnType]
-        if message._filecfg.option_1 == "":  # 非选项短信，直接找 successor 字段，若无则找同段下一个
-            if message._filecfg.successor != 0:
-                confluence = self.__segments.get(message._filecfg.successor)
-                message.confluence = confluence[0] if confluence is not None else None
-                return message.confluence
-            segments = self.__segments[message._filecfg.segment]
-            index = next(index for index, msg in enumerate(segments) if msg.id == message.id)
-            message.confluence = segments[index + 1] if index < len(segments) - 1 else None
-            return message.confluence
-        if message.option_index != 0:  # 含选项选择，且已经走到了选项对话处，找 successor 字段
-            successors = (message._filecfg.option_successor_1, message._filecfg.option_successor_2)
-            successor = successors[message.option_index - 1]
-            if successor == 0:
-                return None
-            successor_segment = self.__segments.get(successor)
-            message.confluence = successor_segment[0] if successor_segment is not None else None
-            return message.confluence
-        if message._filecfg.option_2 == "":  # 单选项选择，直接将选项对话作为下一个
-            assert message.neighbours is not None
-            message.confluence = message.neighbours[0]
-            return message.confluence
-        # 多选项字段，开始广搜找汇聚点
-        queue: list[_Message | None] = list(message.successors)
-        visit: dict[_Message, int] = collections.defaultdict(int)
-        while any(msg is not None for msg in queue):
-            for index, queue_msg in enumerate(queue):
-                if queue_msg is None:
-                    continue
-                visit[queue_msg] += 1
-                # self.__debug_visit(message, queue, visit)
-                if visit[queue_msg] == len(queue):
-                    message.confluence = queue_msg
-                    return message.confluence
-                queue[index] = self.__find_confluence(queue_msg)
-        message.confluence = None
-        return message.confluence
-
     def __wiki_write_message_mission(self, wiki: typing.IO[str], indent: str):
         _ = wiki.write(indent)
         _ = wiki.write("{{敲敲对话|右|玩家|任务|")
@@ -417,31 +466,26 @@ class MessageGroupConfig(View[filecfg.MessageGroupConfig]):
         _ = wiki.write("}}")
 
     def __wiki_iter_message(self, wiki: typing.IO[str], indent: str, message: _Message, confluence: _Message | None):
-        if message == confluence:
-            return
-        next_confluence = self.__find_confluence(message)
-        if message.is_mission:
-            self.__wiki_write_message_mission(wiki, indent)
-        elif not message.is_option_root:
-            self.__wiki_write_message_single(wiki, indent, message)
-        else:
-            self.__wiki_write_message_select(wiki, indent, message, next_confluence)
-        if next_confluence is not None:
-            self.__wiki_iter_message(wiki, indent, next_confluence, confluence)
+        # 沿汇聚点往后走，用循环而不是尾递归，长对话不会超出最大递归深度
+        current: _Message | None = message
+        while current is not None and current != confluence:
+            next_confluence = self.__index.confluence(current)
+            if current.is_mission:
+                self.__wiki_write_message_mission(wiki, indent)
+            elif not current.is_option_root:
+                self.__wiki_write_message_single(wiki, indent, current)
+            else:
+                self.__wiki_write_message_select(wiki, indent, current, next_confluence)
+            current = next_confluence
 
     def wiki_write_content(self, wiki: typing.IO[str], indent: str):
         # 寻找入口的过程
         # 应该有个字段，之后找找
-        if len(self.__segments) == 0:
-            return
-        segments = sorted(self.__segments.keys())
-        entry = segments[0]
-        for entry in segments:
-            if len(self.__segments[entry]) != 0:
-                break
-        else:
+        segments = self.__index.segments
+        if len(segments) == 0:
             return
-        message = self.__segments[entry][0]
+        self.__index.resolve()
+        message = segments[min(segments)][0]
         self.__wiki_iter_message(wiki, indent, message, None)
 
     def wiki(self) -> str:
@@ -464,7 +508,7 @@ class MessageGroupConfig(View[filecfg.MessageGroupConfig]):
 class MessageNPC(View[filecfg.MessageNPC]):
     FileCfg: typing.Final = filecfg.MessageNPC
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._filecfg.name)
 
@@ -472,7 +516,7 @@ class MessageNPC(View[filecfg.MessageNPC]):
     def icon(self) -> str:
         return self._filecfg.icon
 
-    @functools.cached_property
+    @slotted.cached_property
     def __groups(self) -> collections.abc.Sequence[MessageGroupConfig]:
         groups = self._game._message_group_of_contact.get(self._filecfg.id_)  # pyright: ignore[reportPrivateUsage]
         if groups is None:
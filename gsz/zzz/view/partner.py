@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import filecfg
 from .base import View
 
@@ -10,7 +10,7 @@ from .base import View
 class PartnerConfig(View[filecfg.PartnerConfig]):
     FileCfg: typing.Final = filecfg.PartnerConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._filecfg.name)
 
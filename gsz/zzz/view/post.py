@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import functools
 import typing
 
+from ... import slotted
 from .. import filecfg
 from .base import View
 
@@ -19,15 +19,15 @@ class InterKnotConfig(View[filecfg.InterKnotConfig]):
     def id(self) -> int:
         return self._filecfg.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def poster(self) -> str:
         return self._game.text(self._filecfg.poster)
 
-    @functools.cached_property
+    @slotted.cached_property
     def title(self) -> str:
         return self._game.text(self._filecfg.title)
 
-    @functools.cached_property
+    @slotted.cached_property
     def text(self) -> str:
         return self._game.text(self._filecfg.text)
 
@@ -35,18 +35,18 @@ class InterKnotConfig(View[filecfg.InterKnotConfig]):
     def image(self) -> str:
         return self._filecfg.image
 
-    @functools.cached_property
+    @slotted.cached_property
     def __comments(self) -> list[filecfg.PostCommentConfig]:
         return self._game._comments_under_post.get(self._filecfg.comment_id, [])  # pyright: ignore[reportPrivateUsage]
 
     def comments(self) -> collections.abc.Iterable[PostCommentConfig]:
         return (PostCommentConfig(self._game, comment) for comment in self.__comments)
 
-    @functools.cached_property
+    @slotted.cached_property
     def post_script(self) -> str:
         return self._game.text(self._filecfg.script)
 
-    @functools.cached_property
+    @slotted.cached_property
     def replies(self) -> tuple[str, str] | None:
         if self._filecfg.reply_1 == "" and self._filecfg.reply_2 == "":
             return None
@@ -60,7 +60,7 @@ class InterKnotConfig(View[filecfg.InterKnotConfig]):
     def same_follow_up(self) -> bool:
         return self._filecfg.follow_up_1 == self._filecfg.follow_up_2
 
-    @functools.cached_property
+    @slotted.cached_property
     def __follow_up(self) -> tuple[list[filecfg.PostCommentConfig], list[filecfg.PostCommentConfig]] | None:
         if self._filecfg.follow_up_1 == 0 and self._filecfg.follow_up_2 == 0:
             return None
@@ -88,10 +88,10 @@ class InterKnotConfig(View[filecfg.InterKnotConfig]):
 class PostCommentConfig(View[filecfg.PostCommentConfig]):
     FileCfg: typing.Final = filecfg.PostCommentConfig
 
-    @functools.cached_property
+    @slotted.cached_property
     def commentator(self) -> str:
         return self._game.text(self._filecfg.commentator)
 
-    @functools.cached_property
+    @slotted.cached_property
     def text(self) -> str:
         return self._game.text(self._filecfg.text)
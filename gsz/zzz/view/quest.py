@@ -1,6 +1,6 @@
-import functools
 import typing
 
+from ... import slotted
 from .. import filecfg
 from .base import View
 
@@ -12,18 +12,18 @@ class QuestConfig(View[filecfg.QuestConfig]):
     def id(self) -> int:
         return self._filecfg.id_
 
-    @functools.cached_property
+    @slotted.cached_property
     def name(self) -> str:
         return self._game.text(self._filecfg.name)
 
-    @functools.cached_property
+    @slotted.cached_property
     def desc(self) -> str:
         return self._game.text(self._filecfg.desc)
 
-    @functools.cached_property
+    @slotted.cached_property
     def target(self) -> str:
         return self._game.text(self._filecfg.target)
 
-    @functools.cached_property
+    @slotted.cached_property
     def finish_desc(self) -> str:
         return self._game.text(self._filecfg.finish_dec)
@@ -1,11 +1,24 @@
+import sys
+
+import gsz.client
+
+if __name__ == "__main__":
+    # 客户端模式在导入下面的模块之前就转发给常驻服务，见 gsz.serve
+    gsz.client.forward_if_connected("main", sys.argv[1:])
+
+import asyncio
+import atexit
 import collections
+import collections.abc
+import dataclasses
 import datetime
-import difflib
 import io
 import itertools
+import json
 import logging
 import pathlib
 import re
+import shlex
 import textwrap
 import typing
 import zoneinfo
@@ -15,11 +28,17 @@ import aiofiles.os
 import fire
 
 import gsz.bbs
+import gsz.budget
 import gsz.format
 import gsz.gi
+import gsz.instrument
+import gsz.profiling
+import gsz.serve
 import gsz.sr
 import gsz.sr.excel
+import gsz.sr.sqlite
 import gsz.sr.view
+import gsz.synthetic
 import gsz.zzz
 
 
@@ -35,20 +54,28 @@ def confirm_excel_objects_validate_no_error(game: gsz.sr.GameData):
         getattr(game, val)()
 
 
+def dump_profile(profiler: gsz.profiling.Profiler, path: pathlib.Path, top: int):
+    profiler.dump(path)
+    print(profiler.summary(top), file=sys.stderr)
+
+
 @typing.final
 class Main:
-    def __init__(self, base: pathlib.Path | str | None = None):
+    def __init__(self, base: pathlib.Path | str | None = None, profile: str | None = None, profile_top: int = 20):
+        """
+        指定 profile 时记录 wiki()、格式化、模板渲染和数据访问的耗时，
+        退出时把 collapsed stack 写入 profile 文件（可用于生成火焰图），并在 stderr 打印耗时最多的 profile_top 项
+        """
         self.__game = None
+        if profile is not None:
+            profiler = gsz.profiling.enable()
+            _ = atexit.register(dump_profile, profiler, pathlib.Path(profile), profile_top)
         if base is None:
             return  # 可能是下载社媒，不需要提供 GameData 路径
         assert isinstance(base, pathlib.Path | str)
         self.base = pathlib.Path(base)
-        if self.base.joinpath("ExcelBinOutput").exists():  # Genshin Impact
-            self.__game = gsz.gi.GameData(base)
-        if self.base.joinpath("ExcelOutput").exists():
-            self.__game = gsz.sr.GameData(base)
-        if self.base.joinpath("FileCfg").exists():
-            self.__game = gsz.zzz.GameData(base)
+        # 常驻服务中同一数据目录的命令共用已经加载的 GameData
+        self.__game = gsz.serve.GAMES.open(self.base)
         self.__formatter = gsz.format.Formatter(game=self.__game, syntax=gsz.format.Syntax.Terminal)
         self.__mwformatter = gsz.format.Formatter(game=self.__game, syntax=gsz.format.Syntax.MediaWiki)
 
@@ -59,6 +86,16 @@ class Main:
                 continue
             print(avatar.wiki(), end="\n\n")
 
+    def avatar_stat(self, output: typing.Literal["csv", "jsonl"] = "csv"):
+        """所有角色 1~80 级基础属性，导出为 CSV 或 JSON Lines"""
+        assert isinstance(self.__game, gsz.sr.GameData), "`--base <TurnBasedGameData> avatar-stat` required"
+        assert output in ("csv", "jsonl")
+        curves = self.__game.avatar_stat_curves()
+        if output == "csv":
+            curves.to_csv(sys.stdout)
+        else:
+            curves.to_jsonl(sys.stdout)
+
     def monster(self, name: str | None = None):
         assert isinstance(self.__game, gsz.sr.GameData), "`--base <TurnBasedGameData> monster` required"
         monster_name_dedup = set[str]()
@@ -204,12 +241,12 @@ class Main:
             case gsz.sr.GameData():
                 for hash in hashes:
                     assert isinstance(hash, int), "SR TextMap only allow int"
-                hashes = typing.cast(tuple[int, ...], hashes)
+                hashes = typing.cast("tuple[int, ...]", hashes)
                 print("\n".join(self.__game.text(gsz.sr.excel.base.TextHash(hash=hash)) for hash in hashes))
             case gsz.zzz.GameData():
                 for hash in hashes:
                     assert isinstance(hash, str), "ZZZ TextMap only allow str"
-                hashes = typing.cast(tuple[str, ...], hashes)
+                hashes = typing.cast("tuple[str, ...]", hashes)
                 print("\n".join(self.__game.text(hash) for hash in hashes))
             case None:
                 raise ValueError("`--base <GameData> text` required")
@@ -321,87 +358,145 @@ class Main:
         "OP",
         "PV",
     ]
+    SOCIAL_MEDIA_AMBIGUOUS_SCORE = 0.05
+    """最佳匹配和次佳匹配的相似度相差不到该值时，打印日志以便人工确认"""
     SOCIAL_MEDIA_IMAGE_KEYWORDS = ["星旅留影", "帕姆展览馆 | 光锥故事", "帕姆展览馆 | 表情包", "帕姆展览馆"]
 
-    async def social_media(self):  # noqa: PLR0915
+    async def __bilibili_videos(self, session: gsz.bbs.Session) -> list[gsz.bbs.bilibili.Video]:
+        async def search(space: gsz.bbs.bilibili.Space) -> list[gsz.bbs.bilibili.Video]:
+            return [video async for video in space.search()]
+
+        async with gsz.bbs.bilibili.Client(session=session) as client:
+            # 三个频道同时搜索，共享同一个 Client 的并发上限
+            spaces = await asyncio.gather(
+                search(client.space(self.BILIBILI_SR_OFFICIAL)),
+                search(client.space(self.BILIBILI_SR_POM_POM)),
+                search(client.space(self.BILIBILI_SR_WUBBABOO)),
+            )
+        return list(itertools.chain.from_iterable(spaces))
+
+    async def social_media(  # noqa: PLR0912, PLR0915
+        self, cache_dir: pathlib.Path | str | None = pathlib.Path.home() / ".cache" / "gsz", download: bool = False
+    ):
+        """
+        cache_dir 为 WBI key、cookie 和旧帖子页面的磁盘缓存目录，传空则不缓存
+        download 为 True 时，把新帖子中的图片和封面下载到「文件」目录
+        """
         TRIM_CATEGORY = re.compile(r"^[^|丨]+[\|丨]\s*")
         DIRECTORY = pathlib.Path("崩坏：星穹铁道媒体")
         await aiofiles.os.makedirs(DIRECTORY, exist_ok=True)
-        async with gsz.bbs.bilibili.Client() as client:
-            videos = itertools.chain(
-                [video async for video in client.space(self.BILIBILI_SR_OFFICIAL).search()],
-                [video async for video in client.space(self.BILIBILI_SR_POM_POM).search()],
-                [video async for video in client.space(self.BILIBILI_SR_WUBBABOO).search()],
-            )
-        video_titles_revmap = {video.title.removeprefix("《崩坏：星穹铁道》"): video for video in videos}
-        video_titles = list(video_titles_revmap.keys())
-        streams = {
-            keyword: io.BytesIO()
-            for keyword in itertools.chain(
-                self.SOCIAL_MEDIA_VIDEO_KEYWORDS,
-                self.SOCIAL_MEDIA_IMAGE_KEYWORDS,
-                ("未分类",),
-            )
-        }
-        async with gsz.bbs.Client() as client:
-            async for post in client.user_post_list(self.MIYOUSHE_SR_OFFICIAL):
+        # 已抓取过的帖子，米游社只需要翻到上次抓取的位置即可
+        store = await gsz.bbs.PostStore.open(DIRECTORY / "posts.jsonl")
+        # 米游社、B 站和媒体下载共用连接池和磁盘缓存
+        async with gsz.bbs.Session(pathlib.Path(cache_dir) if cache_dir else None) as session:
+            async with gsz.bbs.Client(session=session) as client:
+                posts = [post async for post in client.user_post_list(self.MIYOUSHE_SR_OFFICIAL, seen=store)]
+            # 只有新帖子中有视频时才需要去 B 站搜索
+            has_video = any(content.video_cover for post in posts for content in post.structured_content())
+            videos = await self.__bilibili_videos(session) if has_video else []
+            if len(posts) == 0:
+                logging.info("no new posts since last crawl")
+                return
+            video_matcher = gsz.bbs.TitleMatcher((video.title, video) for video in videos)
+            stored_posts: list[gsz.bbs.StoredPost] = []
+            media: list[str] = []
+            for post in posts:
                 # subject 偶尔会多敲空格，需要把空格都去掉再比较
                 subject = post.subject.strip().replace("\xa0", "").removeprefix("《崩坏：星穹铁道》")
                 video_covers = [content.video_cover for content in post.structured_content()]
+                stream = io.StringIO()
                 if any(video_covers):  # 有视频
                     category = next(
                         (keyword for keyword in self.SOCIAL_MEDIA_VIDEO_KEYWORDS if keyword in subject), "未分类"
                     )
                     description = "".join(filter(None, (content.text for content in post.structured_content())))
                     description = description.strip().replace("\n", "<br />")
-                    # 通过最长公共子序列来判断视频是否匹配
-                    video_title = difflib.get_close_matches(subject, video_titles)
-                    if len(video_title) == 0:
+                    # 先按三元组筛出候选，再通过最长公共子序列来判断视频是否匹配
+                    matches = video_matcher.match(subject, n=2)
+                    if len(matches) == 0:
                         logging.warning("%s not found on bilibili", subject)
-                    video = video_titles_revmap[video_title[0]] if len(video_title) != 0 else None
+                    elif len(matches) > 1 and matches[0].score - matches[1].score < self.SOCIAL_MEDIA_AMBIGUOUS_SCORE:
+                        logging.warning(
+                            "%s ambiguous on bilibili: %s (%.3f) / %s (%.3f)",
+                            subject,
+                            matches[0].title,
+                            matches[0].score,
+                            matches[1].title,
+                            matches[1].score,
+                        )
+                    video = matches[0].value if len(matches) != 0 else None
                     title = video.title if video is not None else post.subject
                     title = title.replace("|", "")
                     bvid = str(video.bvid) if video is not None else ""
-                    stream = streams[category]
-                    _ = stream.write("{{视频|标题=".encode())
-                    _ = stream.write(title.encode())
-                    _ = stream.write(f"|BV号={bvid}|简介={description}".encode())
-                    _ = stream.write("|角色=}}".encode())
-                    _ = stream.write(f"\n<!-- https://www.miyoushe.com/sr/article/{post.id} -->".encode())
+                    _ = stream.write("{{视频|标题=")
+                    _ = stream.write(title)
+                    _ = stream.write(f"|BV号={bvid}|简介={description}")
+                    _ = stream.write("|角色=}}")
+                    _ = stream.write(f"\n<!-- https://www.miyoushe.com/sr/article/{post.id} -->")
                     if video is not None:
-                        _ = stream.write(f"\n<!-- https://www.bilibili.com/video/{bvid} -->".encode())
-                    _ = stream.writelines(f"\n<!-- 米封面 {cover} -->".encode() for cover in video_covers if cover)
+                        _ = stream.write(f"\n<!-- https://www.bilibili.com/video/{bvid} -->")
+                    stream.writelines(f"\n<!-- 米封面 {cover} -->" for cover in video_covers if cover)
+                    media.extend(cover for cover in video_covers if cover)
                     if video is not None:
-                        _ = stream.write(f"\n<!-- 哔封面 {video.cover} -->".encode())
-                    _ = stream.write(b"\n\n")
-                    continue
-                category = next((keyword for keyword in self.SOCIAL_MEDIA_IMAGE_KEYWORDS if keyword in subject), None)
-                if category is not None:  # 角色贺图
-                    stream = streams[category]
-                    _ = stream.write(f"<!-- https://www.miyoushe.com/sr/article/{post.id} -->\n".encode())
-                    _ = stream.write(f"'''{TRIM_CATEGORY.sub('', subject)}'''\n".encode())
-                    structured_texts = (
-                        content.text.strip() for content in post.structured_content() if content.text is not None
+                        _ = stream.write(f"\n<!-- 哔封面 {video.cover} -->")
+                        media.append(video.cover)
+                    _ = stream.write("\n\n")
+                else:
+                    category = next(
+                        (keyword for keyword in self.SOCIAL_MEDIA_IMAGE_KEYWORDS if keyword in subject), None
                     )
-                    _ = stream.write("<br />\n".join(structured_texts).encode())
-                    for content in post.structured_content():
-                        if content.image is not None:
-                            _ = stream.write(f"\n[[文件:<!-- {content.image} -->|500px]]".encode())
-                    _ = stream.write(b"\n\n")
-        # 整合信息，判断是否和旧文件相同，如不同则备份旧文件后写入
-        localtz = zoneinfo.ZoneInfo("localtime")
-        for category, stream in streams.items():
-            file_path = DIRECTORY / re.sub(r"\W", "", category)
-            if await aiofiles.os.path.exists(file_path):
-                size = await aiofiles.os.path.getsize(file_path)
-                # 文件长度是单调递增的，因为媒体只会越来越多（除非崩铁删视频），所以可以用长度判断
-                if len(stream.getvalue()) == size:
-                    continue
-                ctime = await aiofiles.os.path.getctime(file_path)
-                cdate = datetime.datetime.fromtimestamp(ctime, tz=localtz).date()
-                await aiofiles.os.replace(file_path, f"{file_path}-{cdate}")
-            async with aiofiles.open(file_path, "wb") as file:
-                _ = await file.write(stream.getvalue())
+                    if category is not None:  # 角色贺图
+                        _ = stream.write(f"<!-- https://www.miyoushe.com/sr/article/{post.id} -->\n")
+                        _ = stream.write(f"'''{TRIM_CATEGORY.sub('', subject)}'''\n")
+                        structured_texts = (
+                            content.text.strip() for content in post.structured_content() if content.text is not None
+                        )
+                        _ = stream.write("<br />\n".join(structured_texts))
+                        for content in post.structured_content():
+                            if content.image is not None:
+                                _ = stream.write(f"\n[[文件:<!-- {content.image} -->|500px]]")
+                                media.append(content.image)
+                        _ = stream.write("\n\n")
+                stored_posts.append(
+                    gsz.bbs.StoredPost(
+                        id=post.id,
+                        subject=post.subject,
+                        created_at=post.created_at,
+                        category=category,
+                        entry=stream.getvalue(),
+                    )
+                )
+            # 新帖子在前，旧文件内容接在后面，旧帖子不需要重新渲染
+            # 第一次抓取时本地没有记录，直接覆盖旧文件，避免同一个帖子写两遍
+            incremental = len(store) != 0
+            streams: dict[str, io.BytesIO] = collections.defaultdict(io.BytesIO)
+            for stored_post in stored_posts:
+                if stored_post.category is not None:
+                    _ = streams[stored_post.category].write(stored_post.entry.encode())
+            localtz = zoneinfo.ZoneInfo("localtime")
+            # 先把所有分类文件写到临时文件，中途失败时旧文件和记录都不变，下次重新抓取这些帖子
+            temps: list[tuple[pathlib.Path, pathlib.Path]] = []
+            for category, stream in streams.items():
+                file_path = DIRECTORY / re.sub(r"\W", "", category)
+                if incremental and await aiofiles.os.path.exists(file_path):
+                    async with aiofiles.open(file_path, "rb") as file:
+                        _ = stream.write(await file.read())
+                temp = file_path.with_name(f".{file_path.name}.tmp")
+                async with aiofiles.open(temp, "wb") as file:
+                    _ = await file.write(stream.getvalue())
+                temps.append((temp, file_path))
+            # 替换文件和记录帖子之间没有其他可能失败的步骤，避免文件已更新而帖子未记录，下次重复写入
+            for temp, file_path in temps:
+                if await aiofiles.os.path.exists(file_path):
+                    ctime = await aiofiles.os.path.getctime(file_path)
+                    cdate = datetime.datetime.fromtimestamp(ctime, tz=localtz).date()
+                    await aiofiles.os.replace(file_path, f"{file_path}-{cdate}")
+                await aiofiles.os.replace(temp, file_path)
+            await store.extend(stored_posts)
+            # 帖子已经记录，下载失败时下次运行不会把这些帖子重复写入分类文件
+            if download:
+                async with gsz.bbs.Downloader(DIRECTORY / "文件", session=session) as downloader:
+                    _ = await downloader.download(media)
 
     def inter_knot(self):  # noqa: PLR0912
         """TODO: 结构化、完成 ZZZ BWiki 补充后改为模板"""
@@ -444,9 +539,82 @@ class Main:
                         for comment in comments[1]:
                             print(f"    - \x1b[1m{comment.commentator}\x1b[m:", comment.text)
 
+    def synthetic(self, output: str, game: typing.Literal["sr", "gi", "zzz"] = "sr", scale: float = 1.0, seed: int = 0):
+        """生成假数据到 output 目录，用于没有解包数据时的离线性能测试"""
+        assert game in ("sr", "gi", "zzz")
+        report = gsz.synthetic.generate(game, pathlib.Path(output), scale=scale, seed=seed)
+        print(
+            f"{len(report.rows)} 张表，{sum(report.rows.values())} 行，{report.texts} 条文本，{report.acts} 个剧情文件"
+        )
+        for path, reason in report.skipped.items():
+            print(f"跳过 {path}: {reason}")
+
+    def sqlite(self, output: str):
+        """
+        把 ExcelOutput 和 TextMap 导出为 SQLite 文件，之后可以用 `--base <output>` 直接打开
+        比如 `--base <TurnBasedGameData> sqlite sr.sqlite`
+        """
+        assert isinstance(self.__game, gsz.sr.GameData), "`--base <TurnBasedGameData> sqlite` required"
+        path = gsz.sr.sqlite.export(self.__game, output)
+        print(f"{path}: {gsz.instrument.human_size(path.stat().st_size)}")
+
+    def stats(self, command: str = "", top: int = 20, output: str | None = None):
+        """
+        运行一条命令，然后打印加载耗时最多的表、TextMap 和剧情文件，command 为空时加载所有表
+        命令本身的输出仍在 stdout，统计输出到 stderr，指定 output 时同时导出完整统计为 JSON
+
+        比如 `--base <GameData> stats "monster --name 卡芙卡" --output stats.json`
+        """
+        match self.__game:
+            case gsz.sr.GameData():
+                recorder = gsz.sr.data.RECORDER
+            case gsz.gi.GameData():
+                recorder = gsz.gi.data.RECORDER
+            case gsz.zzz.GameData():
+                recorder = gsz.zzz.data.RECORDER
+            case None:
+                raise ValueError("`--base <GameData> stats` required")
+        if command == "":
+            for accessor in recorder.accessors():
+                _ = list(getattr(self.__game, accessor)())
+        else:
+            fire.Fire(self, shlex.split(command), name="main.py")  # pyright: ignore[reportUnknownMemberType]
+        stats = self.__game.load_stats()
+        print(gsz.instrument.report(stats, top=top), file=sys.stderr)
+        if output is not None:
+            content = json.dumps(
+                [dataclasses.asdict(table) for table in stats], default=str, ensure_ascii=False, indent=2
+            )
+            _ = pathlib.Path(output).write_text(content, encoding="utf-8")
+
     def main(self):
         """调试代码可以放到这里"""
 
 
+def run(argv: list[str]):
+    fire.Fire(Main, argv, name="main.py")  # pyright: ignore[reportUnknownMemberType]
+
+
+def serve(socket: str, max_pending: int = 16, watch: float = 0.0, memory_budget: int = 0):
+    """
+    常驻服务，之后的 main.py 和 achievement.py 命令加上 --connect <socket> 即在服务进程中执行
+    比如 `main.py serve /tmp/gsz.sock`，然后 `main.py --connect /tmp/gsz.sock --base <GameData> monster`
+    watch 大于 0 时每 watch 秒检查一次已经加载的数据文件，数据更新后不用重启服务
+    memory_budget 大于 0 时缓存的表、TextMap 和索引总共最多占用约 memory_budget MiB，超出时丢弃最久没用的
+    """
+    import achievement  # noqa: PLC0415 # 只有常驻服务要用，achievement.py 是单独的脚本，其他命令启动时不导入
+
+    if watch > 0:
+        gsz.serve.GAMES.watch(watch)
+    if memory_budget > 0:
+        gsz.budget.configure(memory_budget << 20)
+    programs = {"main": run, "achievement": achievement.main}
+    server = gsz.serve.Server(socket, programs, max_pending=max_pending)
+    asyncio.run(server.serve(lambda: print(f"listening on {server.path}", file=sys.stderr)))
+
+
 if __name__ == "__main__":
-    fire.Fire(Main)  # pyright: ignore[reportUnknownMemberType]
+    if sys.argv[1:2] == ["serve"]:
+        fire.Fire(serve, sys.argv[2:], name="main.py serve")  # pyright: ignore[reportUnknownMemberType]
+    else:
+        run(sys.argv[1:])
@@ -0,0 +1,66 @@
+import asyncio
+import pathlib
+
+import pytest
+
+import gsz.sr
+import gsz.zzz
+from gsz import aio, synthetic
+from gsz.sr import sqlite
+
+
+def test_coalescer():
+    loads = 0
+
+    async def load() -> int:
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return loads
+
+    async def main():
+        coalescer = aio.Coalescer()
+        results = await asyncio.gather(*(coalescer.run("key", load) for _ in range(8)))
+        assert len(coalescer) == 0
+        return results, await coalescer.run("key", load)
+
+    results, again = asyncio.run(main())
+    assert results == [1] * 8
+    assert again == 2
+
+
+def test_aload(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path / "data", scale=0.05)
+    game = gsz.sr.GameData(tmp_path / "data")
+    database = sqlite.GameData(sqlite.export(game, tmp_path / "sr.sqlite"))
+    tables = ("monster_config", "avatar_promotion_config", "cut_scene_config")
+
+    async def main():
+        monsters = await asyncio.gather(*(game.aload("monster_config") for _ in range(4)))
+        for name in tables:
+            expected = [view._excel for view in getattr(game, name)()]  # pyright: ignore[reportPrivateUsage]
+            for actual in await asyncio.gather(game.aload(name), database.aload(name)):
+                assert [view._excel for view in actual] == expected, name  # pyright: ignore[reportPrivateUsage]
+        with pytest.raises(ValueError, match="unknown table"):
+            _ = await game.aload("missing")
+        monster = monsters[0][0]
+        name = monster._excel.monster_name  # pyright: ignore[reportPrivateUsage]
+        texts = await asyncio.gather(game.atext(name), database.atext(name))
+        return monsters, monster, texts
+
+    monsters, monster, texts = asyncio.run(main())
+    assert all(len(loaded) == len(monsters[0]) for loaded in monsters)
+    assert texts == [monster.name, monster.name]
+
+
+def test_zzz(tmp_path: pathlib.Path):
+    _ = synthetic.generate("zzz", tmp_path / "data", scale=0.05)
+    game = gsz.zzz.GameData(tmp_path / "data")
+
+    async def main():
+        messages = await game.aload("message_config")
+        return messages, await game.atext(messages[0]._filecfg.text)  # pyright: ignore[reportPrivateUsage]
+
+    messages, text = asyncio.run(main())
+    assert len(messages) == len(list(game.message_config()))
+    assert text == messages[0].text
@@ -0,0 +1,31 @@
+import pathlib
+
+import benchmarks
+
+
+def test_compare_per_item():
+    baseline = {
+        "a": benchmarks.Result(median=1.0, min=1.0, items=100),
+        "b": benchmarks.Result(median=1.0, min=1.0, items=100),
+        "removed": benchmarks.Result(median=1.0, min=1.0, items=1),
+    }
+    current = {
+        # 数据规模翻倍，每项耗时不变
+        "a": benchmarks.Result(median=2.0, min=2.0, items=200),
+        # 每项耗时慢了 50%，但用例自己的阈值更宽松
+        "b": benchmarks.Result(median=1.5, min=1.5, items=100, threshold=0.6),
+        "new": benchmarks.Result(median=1.0, min=1.0, items=1),
+    }
+    assert benchmarks.compare(baseline, current, threshold=0.2) == []
+    current["b"].threshold = None
+    (regression,) = benchmarks.compare(baseline, current, threshold=0.2)
+    assert regression.name == "b"
+    assert regression.ratio == 1.5
+
+
+def test_dump_load(tmp_path: pathlib.Path):
+    results = {"a": benchmarks.measure(lambda: sum(range(100)), 100, repeat=2)}
+    assert results["a"].min <= results["a"].median
+    path = tmp_path / "results.json"
+    benchmarks.dump(path, benchmarks.metadata(), results, {"b": "skipped"})
+    assert benchmarks.load(path) == results
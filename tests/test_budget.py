@@ -0,0 +1,108 @@
+import array
+import gc
+import pathlib
+import sys
+import weakref
+
+import gsz.sr
+from gsz import budget, synthetic
+from gsz.sr.excel.base import TextHash
+
+
+class Owner:
+    def __init__(self):
+        self.evicted: list[str] = []
+
+
+def test_lru():
+    lru = budget.Budget(100)
+    owner = Owner()
+    for name, size in (("a", 40), ("b", 40)):
+        lru.add(owner, name, None, lambda owner, name=name: owner.evicted.append(name), size)
+    lru.touch(owner, "a")
+    lru.add(owner, "c", None, lambda owner: owner.evicted.append("c"), 40)
+    assert owner.evicted == ["b"]
+    lru.add(owner, "b", None, lambda owner: owner.evicted.append("b"), 200)  # 最新登记的即使超过预算也保留
+    assert owner.evicted == ["b", "a", "c"]
+    stats = lru.stats()
+    assert (stats.used, stats.entries, stats.evictions, stats.evicted, stats.reloads) == (200, 1, 3, 120, 1)
+    assert stats.names == {"a": 1, "b": 1, "c": 1}
+    lru.discard(owner, "b")
+    assert lru.stats().used == 0
+
+
+class Curves:
+    __slots__ = ("owner", "values")
+
+    def __init__(self, owner: Owner):
+        self.owner = owner
+        self.values = array.array("d", range(10000))
+
+
+def test_size_of():
+    owner = Owner()
+    curves = Curves(owner)
+    # 普通对象按属性递归计算，不会只算对象本身，也不计入 seen 中的 owner
+    assert budget.size_of(curves, {id(owner)}) >= sys.getsizeof(curves.values)
+    assert budget.size_of(curves, {id(owner)}) < budget.size_of(curves)
+    lru = budget.Budget(1 << 30)
+    lru.add(owner, "curves", curves, lambda owner: owner.evicted.append("curves"))
+    assert lru.stats().used >= sys.getsizeof(curves.values)
+
+
+def test_weak_owner():
+    lru = budget.Budget(100)
+    owners = [Owner(), Owner()]
+    for owner in owners:
+        lru.add(owner, "table", None, lambda owner: owner.evicted.append("table"), 30)
+    assert lru.stats().entries == 2  # 同名缓存按对象区分
+    owner = weakref.ref(owners.pop())
+    gc.collect()
+    assert owner() is None  # 登记不阻止回收
+    stats = lru.stats()
+    assert (stats.used, stats.entries) == (30, 1)
+
+
+def test_game(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path, scale=0.05)
+    expected = gsz.sr.GameData(tmp_path)
+    monsters = [monster._excel for monster in expected.monster_config()]  # pyright: ignore[reportPrivateUsage]
+    name = next(iter(expected.monster_config())).name
+    achievements = expected._achievement_series_achievements  # pyright: ignore[reportPrivateUsage]
+    series = {series: [view.id for view in views] for series, views in achievements.items()}
+    game = gsz.sr.GameData(tmp_path)
+    _ = game.invalidate(tables=["monster_config", "item_config"])  # 设置预算之前加载的不登记
+    budget.configure(1)
+    try:
+        for _ in range(2):
+            assert [monster._excel for monster in game.monster_config()] == monsters  # pyright: ignore[reportPrivateUsage]
+            _ = list(game.item_config())
+            achievements = game._achievement_series_achievements  # pyright: ignore[reportPrivateUsage]
+            assert {series: [view.id for view in views] for series, views in achievements.items()} == series
+            assert game.text(TextHash(hash=monsters[0].monster_name.hash)) == name
+        stats = budget.stats()
+        assert stats.limit == 1
+        assert stats.entries == 1
+        assert stats.evictions > 0
+        assert stats.reloads > 0
+        assert {"monster_config", "TextMapCHS", "_achievement_series_achievements"} <= stats.names.keys()
+    finally:
+        budget.configure(None)
+    assert budget.stats().entries == 0
+
+
+def test_game_collected(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path, scale=0.05)
+    budget.configure(1 << 30)
+    try:
+        game = gsz.sr.GameData(tmp_path)
+        _ = game.text(TextHash(hash=0))
+        assert len(game._achievement_series_achievements) != 0  # pyright: ignore[reportPrivateUsage]
+        assert budget.stats().entries >= 2
+        collected = weakref.ref(game)
+        del game
+        _ = gc.collect()
+        assert collected() is None
+        assert budget.stats().entries == 0
+    finally:
+        budget.configure(None)
@@ -0,0 +1,92 @@
+import array
+import enum
+
+import pytest
+
+from gsz import columnar, instrument
+from gsz.sr.excel.base import Model, TextHash, Value
+
+
+class Kind(enum.Enum):
+    A = "A"
+    B = "B"
+
+
+class Row(Model):
+    id: int
+    kind: Kind
+    name: TextHash
+    desc: TextHash | None = None
+    ratio: Value[float]
+    visible: bool = False
+    icon: str
+    tags: tuple[int, ...]
+    items: list[int]
+    legacy: int = 1
+
+
+def rows(count: int) -> dict[int, Row]:
+    result: dict[int, Row] = {}
+    for index in range(count):
+        key = (index * 7919) % count  # 打乱顺序
+        fields = {
+            "ID": key,
+            "Kind": "A" if key % 3 else "B",
+            "Name": {"Hash": key * 1000003 - 2**40},
+            "Ratio": {"Value": key / 4},
+            "Icon": f"icon/{key % 5}.png",
+            "Tags": [key % 2],
+            "Items": [key],
+        }
+        if key % 2 == 0:
+            fields["Desc"] = {"Hash": key}
+            fields["Visible"] = True
+        result[key] = Row.model_validate(fields)
+    return result
+
+
+def test_round_trip():
+    source = rows(200)
+    table = columnar.Table(Row, source)
+    assert list(table) == list(source)
+    assert list(table.values()) == list(source.values())
+    for key, row in source.items():
+        assert table[key] == row
+        assert table[key].model_fields_set == row.model_fields_set
+    assert 200 not in table
+    assert table.get(-1) is None
+    with pytest.raises(KeyError):
+        _ = table[200]
+
+
+def test_columns():
+    table = columnar.Table(Row, rows(200))
+    kind, name, desc = table.column("kind"), table.column("name"), table.column("desc")
+    assert isinstance(kind.raw, array.array)
+    assert isinstance(name.raw, array.array)
+    assert isinstance(table.column("legacy"), columnar.ConstColumn)
+    # 扫描时直接比较 array，不构造模型
+    code_b = list(Kind).index(Kind.B)
+    matches = [table.key(row) for row, code in enumerate(kind.raw) if code == code_b]
+    assert matches == [key for key, row in table.items() if row.kind is Kind.B]
+    assert [desc[row] is None for row in range(3)] == [table.key(row) % 2 == 1 for row in range(3)]
+    assert len({id(icon) for icon in table.column("icon").raw}) == 5  # 驻留后相同的字符串是同一个对象
+
+
+def test_wrapped_overflow():
+    source = {
+        key: Row.model_validate({**row.model_dump(by_alias=True), "Name": {"Hash": 2**63 + key}})
+        for key, row in rows(20).items()
+    }
+    table = columnar.Table(Row, source)
+    assert isinstance(table.column("name"), columnar.ObjectColumn)  # 超出 int64，不能放入 array
+    assert list(table.values()) == list(source.values())
+    with pytest.raises(TypeError):
+        columnar.Column()  # pyright: ignore[reportAbstractUsage]
+
+
+def test_memory():
+    source = rows(2000)
+    table = columnar.Table(Row, source)
+    assert instrument.estimate(table) == table.memory()
+    assert table.memory() * 3 < instrument.sizeof(source)
@@ -0,0 +1,19 @@
+import json
+
+from gsz.zzz import filecfg
+from gsz.zzz.filecfg.base import field_aliases, load_file_cfg
+
+
+def test_load_file_cfg_old_aliases():
+    aliases = {name: keys[-2] for name, keys in field_aliases(filecfg.PartnerConfig).items()}  # v1.1 的键名
+    rows = [
+        {aliases["partner_id"]: 1, aliases["avatar_id"]: 1011, aliases["name"]: "{a}", aliases["icon"]: "x", "_": 0},
+        {aliases["partner_id"]: 2, aliases["avatar_id"]: 1021, aliases["name"]: "b", aliases["icon"]: "y", "_": 0},
+    ]
+    content = json.dumps({field_aliases(filecfg.ExpFileCfg)["exp_filecfg"][-2]: rows}).encode()
+    expected = filecfg.ExpFileCfg[filecfg.PartnerConfig].model_validate_json(content).exp_filecfg
+    partners = load_file_cfg(filecfg.PartnerConfig, content)
+    assert [partner.model_dump() for partner in partners] == [partner.model_dump() for partner in expected]
+    assert isinstance(partners[0], filecfg.PartnerConfig)
+    assert partners[0].name == "{a}"
+    assert load_file_cfg(filecfg.PartnerConfig, content)[1].id == 2
@@ -0,0 +1,49 @@
+import json
+import pathlib
+import time
+
+from gsz import instrument
+from gsz.gi import stream
+from gsz.gi.excel.base import TextHash
+
+
+def test_recorder(tmp_path: pathlib.Path):
+    recorder = instrument.Recorder()
+    table = recorder.accessor("text_hash")
+    _ = recorder.accessor("unused")
+    assert recorder.accessors() == ("text_hash", "unused")
+    path = tmp_path / "TextHash.json"
+    _ = path.write_text(json.dumps({"hash": 1}))
+    assert recorder.load_json(TextHash, path) == TextHash(hash=1)
+    assert recorder.load_json(TextHash, path) == TextHash(hash=1)
+    rows = {key: TextHash(hash=key) for key in range(1000)}
+    table.add_table(path, 1 << 20, rows)
+    table.decode, table.calls = 1.0, 3
+    # 没有访问过的表不出现在统计中，加载耗时最多的排在最前
+    first, second = recorder.snapshot()
+    assert first.name == "text_hash"
+    assert first.rows == 1000
+    assert instrument.sizeof(rows) / 2 < first.memory < instrument.sizeof(rows) * 2
+    assert (second.name, second.files, second.calls, second.rows) == ("TextHash", 2, 2, 2)
+    # 重新加载时行数和内存替换而不是累加
+    memory = first.memory
+    table.add_table(path, 1 << 20, rows)
+    first = recorder.snapshot()[0]
+    assert (first.loads, first.files, first.rows, first.memory) == (2, 2, 1000, memory)
+    assert "text_hash" in instrument.report(recorder.snapshot(), top=1)
+    assert "TextHash " not in instrument.report(recorder.snapshot(), top=1)
+
+
+def test_stream_stats_exclude_consumer(tmp_path: pathlib.Path):
+    path = tmp_path / "TextHashExcelConfigData.json"
+    _ = path.write_text(json.dumps([{"hash": key} for key in range(10)]))
+    stats = instrument.TableStats("text_hash")
+    consumer = 0.0
+    start = time.perf_counter()
+    for _ in stream.load(TextHash, path, stats):
+        sleep = time.perf_counter()
+        time.sleep(0.01)
+        consumer += time.perf_counter() - sleep
+    total = time.perf_counter() - start
+    # 统计的耗时只来自消费者之外的时间段
+    assert 0 < stats.decode + stats.validate <= total - consumer
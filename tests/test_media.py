@@ -0,0 +1,115 @@
+import asyncio
+import http.server
+import pathlib
+import threading
+import typing
+
+import httpx
+import pytest
+
+from gsz.bbs.media import Downloader
+
+
+def test_media_downloader(tmp_path: pathlib.Path):
+    requests: list[str] = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            requests.append(self.path)
+            body = b"same" if self.path.startswith("/same") else self.path.encode()
+            self.send_response(200)
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            _ = self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/same/a.png", f"{base}/same/b.png", f"{base}/x/cover.jpg", f"{base}/y/cover.jpg"]
+
+    async def run() -> dict[str, pathlib.Path]:
+        async with Downloader(tmp_path, concurrency=2) as downloader:
+            return await downloader.download([*urls, urls[0]])
+
+    try:
+        paths = asyncio.run(run())
+        assert len(requests) == 4
+        # 内容相同只保留一份，文件名相同的不同 URL 不会互相覆盖
+        assert paths[urls[0]] == paths[urls[1]]
+        assert paths[urls[2]] != paths[urls[3]]
+        assert paths[urls[3]].read_bytes() == b"/y/cover.jpg"
+        assert sorted(path.name for path in tmp_path.iterdir() if path.name != "index.json") == sorted(
+            {path.name for path in paths.values()}
+        )
+        # 再次运行时跳过已下载的文件
+        assert asyncio.run(run()) == paths
+        assert len(requests) == 4
+    finally:
+        server.shutdown()
+
+
+def test_media_downloader_failure(tmp_path: pathlib.Path):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            # 声明的长度比实际发送的长，连接中途断开
+            self.send_response(200)
+            self.send_header("content-length", "100")
+            self.end_headers()
+            _ = self.wfile.write(b"part")
+            self.close_connection = True
+
+        def log_message(self, format: str, *args: object):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    async def run():
+        async with Downloader(tmp_path) as downloader:
+            _ = await downloader.get(f"http://127.0.0.1:{server.server_address[1]}/broken.png")
+
+    try:
+        with pytest.raises(httpx.TransportError):
+            asyncio.run(run())
+        assert [path.name for path in tmp_path.iterdir()] == ["index.json"]
+    finally:
+        server.shutdown()
+
+
+def test_media_downloader_cancel(tmp_path: pathlib.Path):
+    release = threading.Event()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            if self.path == "/missing.png":
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("content-length", "8")
+            self.end_headers()
+            _ = self.wfile.write(b"slow")
+            self.wfile.flush()
+            _ = release.wait(5)  # 另一个下载失败时这个还没有下载完
+
+        def log_message(self, format: str, *args: object):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    async def run() -> set[asyncio.Task[typing.Any]]:
+        async with Downloader(tmp_path) as downloader:
+            with pytest.raises(httpx.HTTPStatusError):
+                _ = await downloader.download([f"{base}/slow.png", f"{base}/missing.png"])
+            return asyncio.all_tasks() - {asyncio.current_task()}
+
+    try:
+        assert asyncio.run(run()) == set()  # 失败时其他下载已经取消并结束
+        assert [path.name for path in tmp_path.iterdir()] == ["index.json"]
+    finally:
+        release.set()
+        server.shutdown()
@@ -0,0 +1,60 @@
+import pathlib
+
+import pytest
+
+import gsz.sr
+from gsz import synthetic
+from gsz.mention import Entity, EntityMatcher
+
+
+def test_mention_overlapping():
+    matcher = EntityMatcher(
+        [
+            (Entity("avatar", 1001), "三月七"),
+            (Entity("avatar", 1224), "三月七•仙舟"),
+            (Entity("monster", 8001), "七"),
+            (Entity("monster", 8002), "七"),
+            (Entity("aeon", "岚"), "岚"),
+            (Entity("item", 1), ""),
+        ]
+    )
+    assert len(matcher) == 4
+    mentions = list(matcher.finditer("三月七•仙舟与岚"))
+    assert [(mention.start, mention.end, mention.name) for mention in mentions] == [
+        (0, 3, "三月七"),
+        (2, 3, "七"),
+        (0, 6, "三月七•仙舟"),
+        (7, 8, "岚"),
+    ]
+    assert mentions[1].entities == (Entity("monster", 8001), Entity("monster", 8002))
+
+
+def test_mention_search():
+    matcher = EntityMatcher(
+        [
+            (Entity("avatar", 1), "he"),
+            (Entity("avatar", 2), "she"),
+            (Entity("avatar", 3), "his"),
+            (Entity("monster", 4), "hers"),
+        ]
+    )
+    assert matcher.search("ushers") == {Entity("avatar", 1), Entity("avatar", 2), Entity("monster", 4)}
+    assert matcher.search("ushers", "monster") == {Entity("monster", 4)}
+    assert matcher.names("ahishers", "avatar") == {"he", "she", "his"}
+    assert matcher.search("nothing") == set()
+
+
+def test_mention_matcher_kinds(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    _ = synthetic.generate("sr", tmp_path, scale=0.05)
+    game = gsz.sr.GameData(tmp_path)
+
+    def unexpected():
+        raise AssertionError("道具表不应被加载")
+
+    monkeypatch.setattr(game, "item_config", unexpected)
+    matcher = game.mention_matcher(("avatar", "monster"))
+    assert game.mention_matcher(["monster", "avatar"]) is matcher
+    monster = next(monster for monster in game.monster_config() if monster.name != "")
+    assert Entity("monster", monster.id) in matcher.search(monster.name)
+    with pytest.raises(ValueError, match="unknown entity kinds"):
+        _ = game.mention_matcher(("npc",))
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import functools
+import itertools
+import typing
+
+import gsz.sr
+from gsz import synthetic
+from gsz.sr import excel
+from gsz.sr.view.message import _Message, _Node  # pyright: ignore[reportPrivateUsage]
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+
+class Node(_Node):
+    def __init__(self, text: str, *successors: Node):
+        super().__init__()
+        self.text = text
+        self.next: list[Node] = list(successors)
+
+    @property
+    def id(self) -> int:
+        return id(self)
+
+    @property
+    def _option_half(self) -> bool:
+        return False
+
+    @functools.cached_property
+    def _successors(self) -> tuple[Node, ...]:
+        return tuple(self.next)
+
+    def _shallow_key(self) -> tuple[object, ...]:
+        return (self.text,)
+
+
+def chain(*texts: str) -> Node:
+    node = Node(texts[-1])
+    for text in reversed(texts[:-1]):
+        node = Node(text, node)
+    return node
+
+
+def test_digest_structural():
+    # 菱形：两个分支内容相同、对象不同，汇合后继续
+    tail = chain("c", "d")
+    left, right = Node("b", tail), Node("b", chain("c", "d"))
+    assert left.digest == right.digest
+    assert Node("a", left, right).digest == Node("a", right, left).digest
+    assert Node("a", left).digest != Node("a", left, left).digest
+    assert chain("a", "b").digest != chain("a", "c").digest
+    assert chain("ab").digest != chain("a", "b").digest
+
+
+def test_digest_deep_and_cyclic():
+    # 递归实现会超出最大递归深度
+    assert chain(*map(str, range(100000))).digest == chain(*map(str, range(100000))).digest
+    loop, other = chain("a", "b"), chain("a", "b")
+    loop.next[0].next.append(loop)
+    other.next[0].next.append(other)
+    assert loop.digest == other.digest
+    assert loop.digest != chain("a", "b").digest
+
+
+def test_digest_cycle_entry():
+    # 环上节点的摘要和从哪个节点开始计算无关
+    first, second = chain("a", "b", "c"), chain("a", "b", "c")
+    first.next[0].next[0].next.append(first.next[0])
+    second.next[0].next[0].next.append(second.next[0])
+    _ = first.next[0].next[0].digest  # 从环上的 c 开始
+    assert first.digest == second.digest
+    assert first.next[0].digest == second.next[0].digest
+    assert first.next[0].next[0].digest == second.next[0].next[0].digest
+    assert first.next[0].digest != first.next[0].next[0].digest
+
+
+def test_message_views(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path, scale=0.05)
+    game = gsz.sr.GameData(tmp_path)
+    first, second, third = itertools.islice(game.text_map(), 3)
+
+    def section(base: int, *texts: int) -> list[_Message]:
+        # 依次相连并回到开头的环
+        messages: dict[int, _Message] = {}
+        for offset, text in enumerate(texts):
+            item = excel.MessageItemConfig.model_validate(
+                {
+                    "ID": base + offset,
+                    "Sender": "NPC",
+                    "ItemType": "Text",
+                    "MainText": {"Hash": text},
+                    "NextItemIDList": [base + (offset + 1) % len(texts)],
+                }
+            )
+            messages[item.id] = _Message(game, item)
+        for message in messages.values():
+            message.message_dict = messages
+        return list(messages.values())
+
+    a, b, c = section(100, first, second), section(200, first, second), section(300, first, third)
+    # 不同对话中内容和结构都相同的消息相等，可以用作字典的键去重
+    assert a[0] == b[0]
+    assert hash(a[0]) == hash(b[0])
+    assert a[0] != c[0]
+    assert a[0] != a[1]
+    assert len({a[0], b[0], c[0]}) == 2
+    assert len({*a, *b}) == 2
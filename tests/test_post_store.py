@@ -0,0 +1,28 @@
+import asyncio
+import datetime
+import pathlib
+
+from gsz.bbs import PostStore, StoredPost
+
+
+def test_post_store_append(tmp_path: pathlib.Path):
+    path = tmp_path / "posts.jsonl"
+    created_at = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+    async def run():
+        store = await PostStore.open(path)
+        assert len(store) == 0
+        await store.extend([StoredPost(id=1, subject="a", created_at=created_at, category=None, entry="")])
+        await store.extend(
+            [
+                StoredPost(id=1, subject="a", created_at=created_at, category=None, entry=""),
+                StoredPost(id=2, subject="b", created_at=created_at, category="PV", entry="{{视频}}\n"),
+            ]
+        )
+        return await PostStore.open(path)
+
+    store = asyncio.run(run())
+    assert len(path.read_text().splitlines()) == 2
+    assert 1 in store
+    assert 3 not in store
+    assert store[2].entry == "{{视频}}\n"
@@ -0,0 +1,32 @@
+import pathlib
+
+import jinja2
+
+from gsz import profiling, sr
+from gsz.format import Formatter
+
+
+def test_profiling(tmp_path: pathlib.Path):
+    original = Formatter.format
+    profiler = profiling.enable()
+    try:
+        assert profiling.enable() is profiler
+        assert sr.view.MonsterConfig.wiki.__wrapped__ is not None  # pyright: ignore[reportFunctionMemberAccess]
+        with profiler.span("export"):
+            template = jinja2.Environment().from_string("{{ format(text) }}")
+            assert template.render(format=Formatter().format, text="<b>加粗</b>") == "加粗"
+            _ = Formatter().format("纯文本")
+    finally:
+        assert profiling.disable() is profiler
+    assert Formatter.format is original
+    assert profiling.disable() is None
+
+    totals = profiler.totals()
+    assert totals["format"].calls == 2
+    assert totals["template:None"].calls == 1
+    assert totals["export"].inclusive >= totals["template:None"].inclusive + totals["format"].exclusive
+    path = tmp_path / "profile.folded"
+    profiler.dump(path)
+    stacks = [line.rsplit(" ", 1)[0] for line in path.read_text().splitlines()]
+    assert stacks == ["export", "export;format", "export;template:None", "export;template:None;format"]
+    assert "export" in profiler.summary(top=1)
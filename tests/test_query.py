@@ -0,0 +1,101 @@
+import pathlib
+import typing
+
+import pytest
+
+import gsz.sr
+from gsz import columnar, query, synthetic
+from gsz.sr.excel.base import Element, Model, TextHash, Value
+
+
+class Row(Model):
+    id: int
+    element: Element | None = None
+    ratio: Value[float]
+    name: TextHash
+    weak: tuple[Element, ...]
+    tag: str
+
+
+ELEMENTS = list(Element)
+
+
+def table() -> columnar.Table[Row]:
+    rows: dict[int, Row] = {}
+    for key in range(100):
+        element = ELEMENTS[key % len(ELEMENTS)].value if key % 4 else None
+        rows[key] = Row.model_validate(
+            {
+                "ID": key,
+                "Element": element,
+                "Ratio": {"Value": key / 10},
+                "Name": {"Hash": key * 31},
+                "Weak": [ELEMENTS[key % 3].value, ELEMENTS[key % 5].value],
+                "Tag": f"tag{key % 2}",
+            }
+        )
+    return columnar.Table(Row, rows, indexes=("element",))
+
+
+def expect(rows: columnar.Table[Row], predicate: typing.Callable[[Row], bool]) -> list[int]:
+    return [row.id for row in rows.values() if predicate(row)]
+
+
+def test_where():
+    rows = table()
+    cases = {
+        "element": ({"element": Element.Fire}, lambda row: row.element is Element.Fire),
+        "element_in": (
+            {"element__in": [Element.Ice, Element.Wind]},
+            lambda row: row.element in {Element.Ice, Element.Wind},
+        ),
+        "isnull": ({"element": None}, lambda row: row.element is None),
+        "ne": ({"element__ne": None}, lambda row: row.element is not None),
+        "ratio": ({"ratio__value__gt": 2.5}, lambda row: row.ratio.value > 2.5),
+        "ratio_model": ({"ratio": Value[float](value=1.0)}, lambda row: row.ratio.value == 1.0),
+        "name": ({"name__hash__le": 310}, lambda row: row.name.hash <= 310),
+        "contains": ({"weak__contains": Element.Fire}, lambda row: Element.Fire in row.weak),
+        "tag": ({"tag": "tag1", "id__lt": 50}, lambda row: row.tag == "tag1" and row.id < 50),
+    }
+    for name, (conditions, predicate) in cases.items():
+        assert [row.id for row in query.Query(rows).where(**conditions)] == expect(rows, predicate), name
+    # 多次 where 之间是且的关系，原查询不变
+    fire = query.Query(rows).where(element=Element.Fire)
+    assert fire.where(ratio__value__ge=5).count() == len(
+        expect(rows, lambda row: row.element is Element.Fire and row.ratio.value >= 5)
+    )
+    assert fire.count() == len(expect(rows, lambda row: row.element is Element.Fire))
+
+
+def test_const_column():
+    rows = columnar.Table(
+        Row, {key: row.model_copy(update={"ratio": Value[float](value=2.0)}) for key, row in table().items()}
+    )
+    assert isinstance(rows.column("ratio"), columnar.ConstColumn)
+    assert query.Query(rows).where(ratio__value=2.0).count() == 100
+    assert query.Query(rows).where(ratio__value__gt=1.5, id__lt=5).count() == 5
+    assert query.Query(rows).where(ratio__value__lt=1.5).count() == 0
+
+
+def test_select():
+    rows = table()
+    selected = query.Query(rows).where(id__lt=3).select("id", "ratio__value", "element")
+    assert selected == [(0, 0.0, None), (1, 0.1, ELEMENTS[1]), (2, 0.2, ELEMENTS[2])]
+    counts = query.Query(rows).count_by("tag")
+    assert counts == {("tag0",): 50, ("tag1",): 50}
+    with pytest.raises(ValueError, match="unknown field"):
+        _ = query.Query(rows).where(missing=1)
+
+
+def test_game_data_query(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path, scale=0.05)
+    game = gsz.sr.GameData(tmp_path)
+    # 表的缓存是进程级别的，这里只和同一个 GameData 上遍历视图的结果比较
+    monsters = [monster._excel for monster in game.monster_config()]  # pyright: ignore[reportPrivateUsage]
+    fire = game.query("monster_config").where(stance_weak_list__contains=Element.Fire)
+    assert [row.monster_id for row in fire] == [
+        row.monster_id for row in monsters if Element.Fire in row.stance_weak_list
+    ]
+    assert game.query("rogue_buff").count() == len(list(game.rogue_buff()))
+    with pytest.raises(ValueError, match="unknown table"):
+        _ = game.query("missing")
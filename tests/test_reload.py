@@ -0,0 +1,106 @@
+import json
+import pathlib
+import time
+
+import pytest
+
+import gsz.sr
+import gsz.zzz
+from gsz import reload, synthetic
+from gsz.sr import sqlite
+
+
+def test_invalidate(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path, scale=0.05)
+    game = gsz.sr.GameData(tmp_path)
+    monsters = list(game.monster_config())
+    _ = game.monster_config_name(monsters[0].name)
+    _ = game._achievement_series_achievements  # pyright: ignore[reportPrivateUsage]
+    watcher = reload.Watcher(game)
+    assert watcher.poll() == []
+
+    path = tmp_path / "ExcelOutput" / "MonsterConfig.json"
+    path.write_text(json.dumps(json.loads(path.read_bytes())[1:]))
+    assert watcher.poll() == ["monster_config"]
+    assert "_achievement_series_achievements" not in vars(game)
+    assert game.monster_config(monsters[0].id) is None
+    assert game.monster_config_name(monsters[0].name) == []
+    assert len(list(game.monster_config())) == len(monsters) - 1
+
+    text_map = tmp_path / "TextMap" / "TextMapCHS.json"
+    texts = json.loads(text_map.read_bytes())
+    hash_ = next(iter(texts))
+    assert game.text(gsz.sr.excel.base.TextHash(hash=int(hash_))) == texts[hash_]
+    text_map.write_text(json.dumps(texts | {hash_: "新的文本"}, ensure_ascii=False))
+    assert watcher.poll() == ["TextMapCHS"]
+    assert game.text(gsz.sr.excel.base.TextHash(hash=int(hash_))) == "新的文本"
+
+    assert game.invalidate(paths=["ExcelOutput/MonsterConfig.json"]) == ["monster_config"]
+    with pytest.raises(ValueError, match="unknown tables"):
+        _ = game.invalidate(tables=["missing"])
+
+
+def test_text_map_merge(tmp_path: pathlib.Path):
+    (tmp_path / "TextMap").mkdir()
+    cn, chs = tmp_path / "TextMap" / "TextMapCN.json", tmp_path / "TextMap" / "TextMapCHS.json"
+    _ = cn.write_text(json.dumps({"1": "一", "2": "二"}, ensure_ascii=False))
+    _ = chs.write_text(json.dumps({"2": "贰", "3": "三"}, ensure_ascii=False))
+    game = gsz.sr.GameData(tmp_path)
+    # 两个文件都合并，后面的覆盖前面的
+    assert dict(game.text_map()) == {1: "一", 2: "贰", 3: "三"}
+    assert set(game.watched_files()) == {cn, chs}
+    watcher = reload.Watcher(game)
+    _ = chs.write_text(json.dumps({"3": "叁"}, ensure_ascii=False))
+    assert watcher.poll() == ["TextMapCHS"]
+    assert dict(game.text_map()) == {1: "一", 2: "二", 3: "叁"}
+
+
+def test_sqlite(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path / "data", scale=0.05)
+    game = gsz.sr.GameData(tmp_path / "data")
+    path = sqlite.export(game, tmp_path / "sr.sqlite")
+    database = sqlite.GameData(path)
+    monster = next(iter(database.monster_config()))
+    assert reload.Watcher(database).poll() == []
+    data = tmp_path / "data" / "ExcelOutput" / "MonsterConfig.json"
+    data.write_text(json.dumps(json.loads(data.read_bytes())[1:]))
+    assert reload.Watcher(game).poll() == ["monster_config"]
+    _ = sqlite.export(game, path)
+    assert reload.Watcher(database).poll() == ["sr.sqlite"]
+    assert database.monster_config(monster.id) is None
+
+
+def test_separate_bases(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path / "a", scale=0.05)
+    _ = synthetic.generate("sr", tmp_path / "b", scale=0.05)
+    path = tmp_path / "b" / "ExcelOutput" / "MonsterConfig.json"
+    path.write_text(json.dumps(json.loads(path.read_bytes())[1:]))
+    a, b = gsz.sr.GameData(tmp_path / "a"), gsz.sr.GameData(tmp_path / "b")
+    count = len(list(a.monster_config()))
+    assert len(list(b.monster_config())) == count - 1
+    assert a.invalidate(tables=["monster_config"]) == ["monster_config"]
+    assert list(b.watched_files()) == [path]
+    assert len(list(a.monster_config())) == count
+
+    path.write_text(json.dumps(json.loads(path.read_bytes())[1:]))
+    assert reload.Watcher(a).poll() == []
+    assert len(list(b.monster_config())) == count - 1
+    assert reload.Watcher(b).poll() == ["monster_config"]
+    assert len(list(b.monster_config())) == count - 2
+    assert list(a.watched_files()) == [tmp_path / "a" / "ExcelOutput" / "MonsterConfig.json"]
+
+
+def test_watch(tmp_path: pathlib.Path):
+    _ = synthetic.generate("zzz", tmp_path, scale=0.05)
+    game = gsz.zzz.GameData(tmp_path)
+    keys = (message._filecfg.text for message in game.message_config())  # pyright: ignore[reportPrivateUsage]
+    key = next(key for key in keys if key != "")
+    text = game.text(key)
+    path = tmp_path / "TextMap" / "TextMapTemplateTb.json"
+    with game.watch(0.01):
+        content = json.loads(path.read_bytes())
+        path.write_text(json.dumps(dict.fromkeys(content, "新的文本"), ensure_ascii=False))
+        deadline = time.monotonic() + 5
+        while game.text(key) == text and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert game.text(key) == "新的文本"
@@ -0,0 +1,68 @@
+import asyncio
+import pathlib
+import sys
+import threading
+
+import pytest
+
+from gsz import client, serve, synthetic
+
+
+def echo(argv: list[str]):
+    print(" ".join(argv))
+    print(pathlib.Path.cwd().name, file=sys.stderr)
+    if argv[:1] == ["fail"]:
+        sys.exit(3)
+
+
+def start(path: pathlib.Path, **kwargs: int) -> threading.Thread:
+    ready = threading.Event()
+    server = serve.Server(path, {"echo": echo}, games=serve.Games(), **kwargs)
+    thread = threading.Thread(target=asyncio.run, args=(server.serve(ready.set),), daemon=True)
+    thread.start()
+    assert ready.wait(10)
+    return thread
+
+
+def test_run(tmp_path: pathlib.Path):
+    path = tmp_path / "gsz.sock"
+    thread = start(path)
+    with client.Client(path) as remote:
+        result = remote.run("echo", ["a", "b"])
+        assert (result.stdout, result.status) == ("a b\n", 0)
+        assert result.stderr == pathlib.Path.cwd().name + "\n"
+        assert remote.run("echo", ["fail"]).status == 3
+        with pytest.raises(client.RemoteError, match="unknown program"):
+            _ = remote.run("missing", [])
+        with pytest.raises(client.RemoteError, match="unknown method"):
+            _ = remote.call("missing")
+        status = remote.call("status")
+        assert status["pending"] == 0
+        assert status["requests"] == 5
+        _ = remote.call("shutdown")
+    thread.join(10)
+    assert not path.exists()
+
+
+def test_busy(tmp_path: pathlib.Path):
+    path = tmp_path / "gsz.sock"
+    thread = start(path, max_pending=0)
+    with client.Client(path) as remote:
+        with pytest.raises(client.RemoteError) as exc:
+            _ = remote.run("echo", [])
+        assert exc.value.code == client.BUSY
+        _ = remote.call("shutdown")
+    thread.join(10)
+
+
+def test_games(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path / "data", scale=0.05)
+    games = serve.Games()
+    game = games.open(tmp_path / "data")
+    assert game is not None
+    assert games.open(str(tmp_path / "data" / ".." / "data")) is game
+    assert games.open(tmp_path) is None
+    assert [base for base, _ in games.items()] == [(tmp_path / "data").resolve()]
+    assert client.connect_argument(["--connect", "s", "monster"]) == ("s", ["monster"])
+    assert client.connect_argument(["--connect=s"]) == ("s", [])
+    assert client.connect_argument(["monster"]) == (None, ["monster"])
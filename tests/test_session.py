@@ -0,0 +1,60 @@
+import asyncio
+import datetime
+import pathlib
+
+import httpx
+
+from gsz.bbs.session import CACHE_TTL, CachingTransport, DiskCache
+
+
+def test_caching_transport(tmp_path: pathlib.Path):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"retcode": 0}, headers={"etag": '"v1"'})
+
+    cache = DiskCache(tmp_path)
+    transport = CachingTransport(httpx.MockTransport(handler), cache)
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            ttl = {CACHE_TTL: datetime.timedelta(hours=1)}
+            first = await client.get("https://example.com/api", params={"a": 1, "wts": 1}, extensions=ttl)
+            second = await client.get("https://example.com/api", params={"a": 1, "wts": 2}, extensions=ttl)
+            assert len(requests) == 1
+            # 过期后带校验头重新验证
+            cache.set(
+                CachingTransport.key(first.request), cache.get(CachingTransport.key(first.request)), -ttl[CACHE_TTL]
+            )
+            third = await client.get("https://example.com/api", params={"a": 1}, extensions=ttl)
+            assert len(requests) == 2
+            assert requests[-1].headers["if-none-match"] == '"v1"'
+            _ = await client.get("https://example.com/api", params={"a": 1})
+            assert len(requests) == 3
+            return first.json(), second.json(), third.json()
+
+    assert asyncio.run(run()) == ({"retcode": 0},) * 3
+
+
+def test_caching_transport_failure(tmp_path: pathlib.Path):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        # B 站被限流时 HTTP 状态码仍是 200
+        return httpx.Response(200, json={"code": -799, "message": "请求过于频繁"})
+
+    transport = CachingTransport(httpx.MockTransport(handler), DiskCache(tmp_path))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            ttl = {CACHE_TTL: datetime.timedelta(hours=1)}
+            for _ in range(2):
+                res = await client.get("https://example.com/api", extensions=ttl)
+                assert res.json()["code"] == -799
+
+    asyncio.run(run())
+    assert len(requests) == 2
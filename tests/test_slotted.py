@@ -0,0 +1,77 @@
+import pathlib
+
+import pytest
+
+import gsz.sr
+from gsz import slotted, synthetic
+
+
+class Base(slotted.Slotted):
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = 0
+
+    @slotted.cached_property
+    def value(self) -> int:
+        self.calls += 1
+        return self.calls
+
+    @slotted.cached_property
+    def other(self) -> str:
+        return "base"
+
+
+class Derived(Base):
+    @slotted.cached_property
+    def value(self) -> int:
+        return -1
+
+    @property
+    def other(self) -> str:
+        return "derived"
+
+
+def test_cached_property():
+    base = Base()
+    assert (base.value, base.value, base.calls) == (1, 1, 1)
+    assert not hasattr(base, "__dict__")
+    assert Base.__slots__ == {"calls": None, "value": None, "other": None}
+    derived = Derived()
+    assert (derived.value, derived.other, derived.calls) == (-1, "derived", 0)
+    assert Derived.__slots__ == {}  # 覆盖的 cached_property 沿用基类的槽
+    with pytest.raises(AttributeError, match="missing"):
+        _ = base.missing  # pyright: ignore[reportAttributeAccessIssue]
+
+
+class Broken(slotted.Slotted):
+    @property
+    def inner(self) -> int:
+        return self.missing  # pyright: ignore[reportAttributeAccessIssue]
+
+    @slotted.cached_property
+    def value(self) -> int:
+        return self.inner
+
+
+class Super(Base):
+    @slotted.cached_property
+    def value(self) -> int:
+        return super().value + 10
+
+
+def test_errors_and_super():
+    with pytest.raises(AttributeError, match="missing"):
+        _ = Broken().inner  # 属性内部的 AttributeError 原样传出，不会被当成属性不存在
+    with pytest.raises(AttributeError, match="missing"):
+        _ = Broken().value
+    derived = Super()
+    assert (derived.value, derived.value, derived.calls) == (11, 11, 1)  # super() 只计算，不占用子类的槽
+
+
+def test_view(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path, scale=0.05)
+    game = gsz.sr.GameData(tmp_path)
+    monster = next(iter(game.monster_config()))
+    assert not hasattr(monster, "__dict__")
+    assert monster.name is monster.name
@@ -0,0 +1,65 @@
+import pathlib
+import typing
+
+import pytest
+
+import gsz.sr
+from gsz import synthetic
+from gsz.sr import data, sqlite
+from gsz.sr.excel.base import Element
+
+
+def test_round_trip(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path / "data", scale=0.05)
+    game = gsz.sr.GameData(tmp_path / "data")
+    path = sqlite.export(game, tmp_path / "sr.sqlite")
+    database = sqlite.GameData(path)
+    assert database.base == (tmp_path / "data").resolve()
+    for name in data.TABLES:
+        expected = [view._excel for view in getattr(game, name)()]  # pyright: ignore[reportPrivateUsage]
+        actual = [view._excel for view in getattr(database, name)()]  # pyright: ignore[reportPrivateUsage]
+        assert actual == expected, name
+        if name == "reward_data":
+            continue  # 自定义的 model_serializer 会去掉 null 字段，只比较值
+        assert [row.model_fields_set for row in actual] == [row.model_fields_set for row in expected], name
+    for language in gsz.sr.Language:
+        assert dict(database.text_map(language)) == dict(game.text_map(language))
+
+
+def test_lookup(tmp_path: pathlib.Path):
+    _ = synthetic.generate("sr", tmp_path / "data", scale=0.05)
+    game = gsz.sr.GameData(tmp_path / "data")
+    database = sqlite.GameData(sqlite.export(game, tmp_path / "sr.sqlite"))
+    monster = next(iter(game.monster_config()))
+    found = database.monster_config(monster.id)
+    assert found is not None
+    assert found.name == monster.name
+    assert database.monster_config(-1) is None
+    with pytest.raises(KeyError):
+        _ = list(database.monster_config([-1]))
+    avatar = next(iter(game.avatar_config())).id
+    expected = [level._excel for level in game.avatar_promotion_config(avatar)]  # pyright: ignore[reportPrivateUsage]
+    assert [level._excel for level in database.avatar_promotion_config(avatar)] == expected  # pyright: ignore[reportPrivateUsage]
+    fire = database.query("monster_config").where(stance_weak_list__contains=Element.Fire)
+    assert fire.count() == game.query("monster_config").where(stance_weak_list__contains=Element.Fire).count()
+
+
+def test_columns_single_query(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    _ = synthetic.generate("sr", tmp_path / "data", scale=0.05)
+    game = gsz.sr.GameData(tmp_path / "data")
+    database = sqlite.GameData(sqlite.export(game, tmp_path / "sr.sqlite"))
+    queries: list[str] = []
+    select = sqlite.Database.select
+
+    def counted(self: sqlite.Database, table: str, *args: typing.Any) -> typing.Any:
+        queries.append(table)
+        return select(self, table, *args)
+
+    monkeypatch.setattr(sqlite.Database, "select", counted)
+    assert database.query("monster_config").count() == len(list(game.monster_config()))
+    assert queries == ["monster_config"]  # 整表一次读出，不逐行查询
+
+
+def test_schema(tmp_path: pathlib.Path):
+    with pytest.raises(FileNotFoundError):
+        _ = sqlite.GameData(tmp_path / "missing.sqlite")
@@ -0,0 +1,94 @@
+import io
+import json
+import math
+
+import pytest
+
+from gsz.sr import excel
+from gsz.sr.stat import AvatarStatCurves
+
+
+def promotion(avatar_id: int, index: int, max_level: int) -> excel.AvatarPromotionConfig:
+    def value(v: float):
+        return {"Value": v}
+
+    return excel.AvatarPromotionConfig.model_validate(
+        {
+            "AvatarID": avatar_id,
+            "Promotion": index or None,
+            "PromotionCostList": [],
+            "MaxLevel": max_level,
+            "AttackBase": value(50.0 + 10 * index),
+            "AttackAdd": value(2.5),
+            "DefenceBase": value(40.0 + 8 * index),
+            "DefenceAdd": value(2.0),
+            "HPBase": value(100.0 + 20 * index),
+            "HPAdd": value(5.0),
+            "SpeedBase": value(100 + index),
+            "CriticalChance": value(0.05),
+            "CriticalDamage": value(0.5),
+            "BaseAggro": value(100),
+        }
+    )
+
+
+PROMOTIONS = [promotion(1001, index, max_level) for index, max_level in enumerate((20, 30, 40, 50, 60, 70, 80))]
+
+
+def reference_hp(promotions: list[excel.AvatarPromotionConfig], level: int, ascended: bool) -> float:
+    """逐级计算的旧实现"""
+    index = 0
+    max_level = 0
+    hp = 0
+    while level > promotions[index].max_level or ascended and level >= promotions[index].max_level:
+        hp += (promotions[index].max_level - max_level) * promotions[index].hp_add.value
+        max_level = promotions[index].max_level
+        index += 1
+    return promotions[index].hp_base.value + hp + (level - max_level - 1) * promotions[index].hp_add.value
+
+
+def test_stat_curves_match_reference():
+    curves = AvatarStatCurves([(1001, PROMOTIONS)])
+    for level in range(1, 81):
+        assert curves.hp(1001, level) == reference_hp(PROMOTIONS, level, False)
+        if level != 80:
+            assert curves.hp(1001, level, True) == reference_hp(PROMOTIONS, level, True)
+    assert curves.hp(1001, 20) != curves.hp(1001, 20, True)
+    assert curves.hp(1001, 21) == curves.hp(1001, 21, True)
+    assert curves.speed(1001, 20, True) == 101
+
+
+def test_stat_curves_invalid_level():
+    curves = AvatarStatCurves([(1001, PROMOTIONS)])
+    with pytest.raises(ValueError, match="80"):
+        _ = curves.hp(1001, 80, True)
+    with pytest.raises(ValueError, match="80"):
+        _ = curves.attack(1001, 0)
+    with pytest.raises(KeyError):
+        _ = curves.defence(1002, 1)
+
+
+def test_stat_curves_export():
+    curves = AvatarStatCurves([(1001, PROMOTIONS), (1002, [promotion(1002, 0, 80)])])
+    hp, _attack, _defence, _speed = curves.curve(1001)
+    assert len(hp) == 160
+    assert math.isnan(hp[-1])
+
+    csv = io.StringIO()
+    curves.to_csv(csv)
+    lines = csv.getvalue().splitlines()
+    assert lines[0] == "avatar_id,level,ascended,hp,attack,defence,speed"
+    assert len(lines) == 1 + 2 * 159
+
+    jsonl = io.StringIO()
+    curves.to_jsonl(jsonl)
+    rows = [json.loads(line) for line in jsonl.getvalue().splitlines()]
+    assert rows[-1] == {
+        "avatar_id": 1002,
+        "level": 80,
+        "ascended": False,
+        "hp": 100.0 + 79 * 5.0,
+        "attack": 50.0 + 79 * 2.5,
+        "defence": 40.0 + 79 * 2.0,
+        "speed": 100,
+    }
@@ -0,0 +1,24 @@
+import io
+import json
+import pathlib
+
+import pytest
+
+from gsz.gi import stream
+from gsz.gi.excel.base import TextHash
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 20])
+def test_iter_array_chunk_boundaries(chunk_size: int):
+    content = '﻿ [1, 22 ,{"a":"}]中"}, [3],null, -4.5e1 ] '.encode()
+    assert list(stream.iter_array(io.BytesIO(content), chunk_size)) == [1, 22, {"a": "}]中"}, [3], None, -45.0]
+    with pytest.raises(ValueError, match="array"):
+        _ = list(stream.iter_array(io.BytesIO(b'{"1": {}}')))
+
+
+def test_load_projected(tmp_path: pathlib.Path):
+    path = tmp_path / "TextHashExcelConfigData.json"
+    _ = path.write_text(json.dumps([{"hash": 1, "unused": list(range(100))}, None, {"hash": 2}]))
+    assert stream.projected_keys(TextHash) == {"hash"}
+    assert list(stream.load(TextHash, path)) == [TextHash(hash=1), None, TextHash(hash=2)]
+    assert stream.is_array(path)
@@ -0,0 +1,65 @@
+import pathlib
+import random
+
+import pytest
+
+import gsz.gi
+import gsz.sr
+import gsz.zzz
+from gsz import synthetic
+
+
+def test_synthetic_game_data(tmp_path: pathlib.Path):
+    reports = {game: synthetic.generate(game, tmp_path / game, scale=0.05) for game in ("sr", "gi", "zzz")}
+    for report in reports.values():
+        assert report.skipped == {}
+        assert len(report.rows) != 0
+        assert report.texts != 0
+    assert reports["sr"].acts != 0
+
+    # 相同 seed 生成相同的数据
+    _ = synthetic.generate("zzz", tmp_path / "again", scale=0.05)
+    for path in (tmp_path / "zzz").rglob("*.json"):
+        assert path.read_bytes() == (tmp_path / "again" / path.relative_to(tmp_path / "zzz")).read_bytes()
+
+    sr = gsz.sr.GameData(tmp_path / "sr")
+    avatars = list(sr.avatar_config())
+    assert len(avatars) == reports["sr"].rows["ExcelOutput/AvatarConfig.json"]
+    assert all(avatar.name != "" for avatar in avatars)
+    # 顶层 ID 字段都取行号对应的 ID，跨表引用可以找到对应的行
+    for monster in sr.monster_config():
+        assert sr.monster_template_config(monster._excel.monster_template_id) is not None  # pyright: ignore[reportPrivateUsage]
+    # 每个 main_id 有多个 sub_id
+    assert len(list(sr.avatar_promotion_config(avatars[0]._excel.avatar_id))) == synthetic.SUBS  # pyright: ignore[reportPrivateUsage]
+    # ExcelOutput 中引用的剧情文件存在
+    for performance in sr.performance_c():
+        assert performance.path is not None
+        assert performance.path.is_file()
+
+    gi = gsz.gi.GameData(tmp_path / "gi")
+    assert all(avatar.name != "" for avatar in gi.avatar())
+
+    zzz = gsz.zzz.GameData(tmp_path / "zzz")
+    partners = list(zzz.partner_config())
+    assert len(partners) != 0
+    assert all(partner.name != "" for partner in partners)
+
+
+def test_synthetic_views(tmp_path: pathlib.Path):
+    # 视图中表之间的业务约束：祝福对应的战斗增益、角色的技能树和材料
+    _ = synthetic.generate("sr", tmp_path, scale=0.2)  # 至少生成一个角色完整的技能树
+    sr = gsz.sr.GameData(tmp_path)
+    for buff in sr.rogue_buff():
+        assert buff.wiki() != ""
+    for buff in sr.rogue_tourn_buff():
+        assert buff.wiki() != ""
+    avatar = sr.avatar_config(synthetic.ID_BASE)
+    assert avatar is not None
+    assert avatar.wiki() != ""
+
+
+def test_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+        _ = synthetic.Synthesizer(synthetic.SRFaker(random.Random(0), 1), 1)  # pyright: ignore[reportAbstractUsage]
+    with pytest.raises(TypeError, match="abstract"):
+        _ = synthetic.Faker(random.Random(0), 1)  # pyright: ignore[reportAbstractUsage]
@@ -0,0 +1,26 @@
+import json
+import pathlib
+
+from gsz.zzz import GameData, Language
+from gsz.zzz.text_map import TextMap
+
+
+def test_text_map_lookup():
+    entries = {f"Item_Name_{index:06}": f"物品 {index}" for index in range(1000)}
+    entries["Empty"] = ""
+    text_map = TextMap(entries)
+    assert len(text_map) == 1001
+    assert all(text_map.get(key) == val for key, val in entries.items())
+    assert "Item_Name_000001" in text_map
+    assert text_map.get("Missing", "?") == "?"
+    assert text_map.get("Empty", "?") == ""
+
+
+def test_text_map_lazy_languages(tmp_path: pathlib.Path):
+    (tmp_path / "TextMap").mkdir()
+    _ = (tmp_path / "TextMap" / "TextMapTemplateTb.json").write_text(json.dumps({"Key": "中文"}))
+    _ = (tmp_path / "TextMap" / "TextMap_ENTemplateTb.json").write_text(json.dumps({"Key": "English"}))
+    game = GameData(tmp_path)  # 不会读取 TextMap
+    assert game.text("Key") == "中文"
+    assert game.text("Key", language=Language.EN) == "English"
+    assert GameData(tmp_path, language=Language.EN).text("Key") == "English"
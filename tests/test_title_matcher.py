@@ -0,0 +1,23 @@
+from gsz.bbs.title_matcher import TitleMatcher, normalize
+
+
+def test_title_normalize():
+    assert normalize("《崩坏：星穹铁道》角色PV丨三月七 「 冰 」") == "三月七「冰」"
+    assert normalize("角色ＰＶ | 三月七「冰」") == "三月七「冰」"
+
+
+def test_title_matcher():
+    matcher = TitleMatcher(
+        [
+            ("《崩坏：星穹铁道》角色PV——「三月七：冰」", 1),
+            ("《崩坏：星穹铁道》角色PV——「丹恒：龙」", 2),
+            ("《崩坏：星穹铁道》角色PV——「三月七：仙舟」", 3),
+            ("《崩坏：星穹铁道》黄金的时刻", 4),
+        ]
+    )
+    assert len(matcher) == 4
+    matches = matcher.match("角色PV——「三月七：冰」", n=2)
+    assert [match.value for match in matches] == [1, 3]
+    assert matches[0].score == 1.0
+    assert matches[0].score > matches[1].score
+    assert matcher.match("完全无关的标题") == []
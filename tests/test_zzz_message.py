@@ -0,0 +1,93 @@
+import io
+import types
+
+from gsz.zzz import filecfg, view
+from gsz.zzz.filecfg.message import Type
+
+
+def message(id_: int, segment: int, text: str = "", **kwargs: object) -> filecfg.MessageConfig:
+    fields: dict[str, object] = {
+        "group_id": 1,
+        "id_": id_,
+        "sender_id": 0,
+        "voice": "",
+        "text": text,
+        "image": "",
+        "segment": segment,
+        "type": Type.Text,
+        "successor": 0,
+        "option_1": "",
+        "option_long_1": "",
+        "option_successor_1": 0,
+        "option_2": "",
+        "option_long_2": "",
+        "option_successor_2": 0,
+    }
+    return filecfg.MessageConfig.model_construct(**(fields | kwargs))
+
+
+class Game:
+    """只提供 MessageGroupConfig 渲染用到的接口，文本 ID 即文本"""
+
+    def __init__(self, messages: list[filecfg.MessageConfig]):
+        self._messages_of_group = {1: messages}
+        self._mw_formatter = types.SimpleNamespace(format=lambda text: text)
+
+    def text(self, text: str) -> str:
+        return text
+
+
+def render(messages: list[filecfg.MessageConfig]) -> list[str]:
+    group = filecfg.MessageGroupConfig.model_construct(group_id=1, contact_id=0, quest_ids=[])
+    wiki = io.StringIO()
+    view.MessageGroupConfig(Game(messages), group).wiki_write_content(wiki, "\n")  # pyright: ignore[reportArgumentType]
+    return wiki.getvalue().splitlines()[1:]
+
+
+def test_option_confluence():
+    messages = [
+        message(1, 1, "a"),
+        message(2, 1, type=Type.Option, option_1="x", option_successor_1=2, option_2="y", option_successor_2=3),
+        message(3, 2, "c", successor=4),
+        message(4, 3, "d", successor=4),
+        message(5, 4, "e"),
+    ]
+    assert render(messages) == [
+        "{{敲敲对话|左|兄妹|文本|a}}",
+        "{{敲敲选项",
+        "|选项1=x",
+        "|剧情1=",
+        "  {{敲敲对话|右|玩家|文本|x}}",
+        "  {{敲敲对话|左|兄妹|文本|c}}",
+        "|选项2=y",
+        "|剧情2=",
+        "  {{敲敲对话|右|玩家|文本|y}}",
+        "  {{敲敲对话|左|兄妹|文本|d}}",
+        "}}",
+        "{{敲敲对话|左|兄妹|文本|e}}",
+    ]
+
+
+def test_long_group():
+    # 一个分段内很长的对话，以及很多组连续的选项，之前会超出最大递归深度
+    assert len(render([message(id_, 1, str(id_ % 7)) for id_ in range(5000)])) == 5000
+    messages: list[filecfg.MessageConfig] = []
+    for k in range(1000):
+        base = k * 3 + 1
+        messages.append(
+            message(
+                base,
+                base,
+                type=Type.Option,
+                option_1=f"x{k}",
+                option_successor_1=base + 1,
+                option_2=f"y{k}",
+                option_successor_2=base + 2,
+            )
+        )
+        messages.append(message(base + 1, base + 1, "c", successor=base + 3))
+        messages.append(message(base + 2, base + 2, "d", successor=base + 3))
+    messages.append(message(3001, 3001, "end"))
+    lines = render(messages)
+    assert len(lines) == 1000 * 10 + 1
+    assert lines[-1] == "{{敲敲对话|左|兄妹|文本|end}}"